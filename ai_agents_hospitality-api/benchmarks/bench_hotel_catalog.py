@@ -0,0 +1,173 @@
+"""
+Micro-benchmark of the hotel catalog.
+
+Compares the latency of ``HotelCatalog`` lookups with a linear scan of the hotel list
+of hotels.json, on synthetic catalogs of increasing size. The synthetic hotels copy
+the hotels of hotels.json (rooms included) with new keys, names and addresses, about
+20 hotels per city and 50 countries.
+
+Lookups:
+
+- ``hotel by key``: one hotel
+- ``hotels in city``: the hotels of a city
+- ``rooms in city``: the rooms of a type and category in the hotels of a city
+- ``room stats``: room count and price ranges per room type and category of a hotel
+
+Usage (from ai_agents_hospitality-api/):
+    python benchmarks/bench_hotel_catalog.py
+    python benchmarks/bench_hotel_catalog.py --sizes 200,100000 --queries 500
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+API_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_HOTELS_FILE = (API_ROOT.parent / "bookings-db" / "output_files" / "hotels"
+                       / "hotels.json")
+
+sys.path.insert(0, str(API_ROOT))
+
+from util.hotel_catalog import HotelCatalog  # noqa: E402
+
+
+def make_hotels(templates, size):
+    """Build ``size`` hotels from the template hotels, sharing their room lists."""
+    cities = max(1, size // 20)
+    hotels = []
+    for i in range(size):
+        template = templates[i % len(templates)]
+        hotels.append({
+            **template,
+            "hotelkey": str(100000 + i),
+            "Name": f"{template['Name']} {i}",
+            "Address": {**template["Address"], "City": f"City {i % cities}",
+                        "Country": f"Country {i % cities % 50}"},
+        })
+    return hotels
+
+
+def scan_room_stats(hotels, args):
+    """Room count and price ranges of a hotel per room type and category, by scan."""
+    hotel = next(hotel for hotel in hotels if hotel["hotelkey"] == args[0])
+    stats = {}
+    for room in hotel["Rooms"]:
+        prices = stats.setdefault((room["Type"], room["Category"]), ([], []))
+        prices[0].append(room["PriceOffSeason"])
+        prices[1].append(room["PricePeakSeason"])
+    return {group: (len(off), min(off), max(off), min(peak), max(peak))
+            for group, (off, peak) in stats.items()}
+
+
+LOOKUPS = {
+    "hotel by key": (
+        lambda catalog, args: [catalog.hotel(args[0])],
+        lambda hotels, args: [next(hotel for hotel in hotels if hotel["hotelkey"] == args[0])],
+    ),
+    "hotels in city": (
+        lambda catalog, args: catalog.find_hotels(city=args[1]),
+        lambda hotels, args: [hotel for hotel in hotels
+                              if hotel["Address"]["City"].lower() == args[1].lower()],
+    ),
+    "rooms in city": (
+        lambda catalog, args: catalog.rooms(city=args[1], room_type=args[2], category=args[3]),
+        lambda hotels, args: [room for hotel in hotels
+                              if hotel["Address"]["City"].lower() == args[1].lower()
+                              for room in hotel["Rooms"]
+                              if room["Type"] == args[2] and room["Category"] == args[3]],
+    ),
+    "room stats": (
+        lambda catalog, args: catalog.room_stats(args[0]),
+        scan_room_stats,
+    ),
+}
+
+
+def time_lookups(lookup, queries, min_time):
+    """Time ``lookup`` on the queries, stopping early after min_time seconds."""
+    latencies = []
+    start = time.perf_counter()
+    for query in queries:
+        query_start = time.perf_counter()
+        lookup(query)
+        latencies.append(time.perf_counter() - query_start)
+        if time.perf_counter() - start > min_time and len(latencies) >= 5:
+            break
+    latencies.sort()
+    return {
+        "queries": len(latencies),
+        "mean_us": statistics.fmean(latencies) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p95_us": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1e6,
+    }
+
+
+def main(argv=None):
+    """Run the benchmark and print one line per lookup, method and catalog size."""
+    parser = argparse.ArgumentParser(description="Benchmark the hotel catalog.")
+    parser.add_argument("--hotels-file", default=str(DEFAULT_HOTELS_FILE))
+    parser.add_argument("--sizes", default="200,10000,100000",
+                        help="Comma separated numbers of hotels (default: 200,10000,100000)")
+    parser.add_argument("--queries", type=int, default=200,
+                        help="Lookups per kind and catalog size (default: 200)")
+    parser.add_argument("--max-time", type=float, default=2.0,
+                        help="Time budget in seconds of the linear scan per lookup kind "
+                             "(default: 2)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--memory", action="store_true",
+                        help="Also report the memory of the catalog (builds it twice, "
+                             "once under tracemalloc)")
+    args = parser.parse_args(argv)
+
+    with open(args.hotels_file, encoding="utf-8") as file:
+        templates = json.load(file)["Hotels"]
+
+    print(f"{'hotels':>7} {'lookup':<15} {'method':<12} {'queries':>7} "
+          f"{'mean (us)':>10} {'p50 (us)':>10} {'p95 (us)':>10}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        rng = random.Random(args.seed)
+        hotels = make_hotels(templates, size)
+
+        build_start = time.perf_counter()
+        catalog = HotelCatalog(hotels)
+        build_s = time.perf_counter() - build_start
+        memory = ""
+        if args.memory:
+            tracemalloc.start()
+            HotelCatalog(hotels)
+            memory = f", {tracemalloc.get_traced_memory()[1] / 2**20:.1f} MiB"
+            tracemalloc.stop()
+        print(f"{size:>7} catalog of {catalog.room_count} rooms built in {build_s:.2f} s"
+              f"{memory}")
+
+        queries = []
+        for _ in range(args.queries):
+            hotel = rng.choice(hotels)
+            queries.append((hotel["hotelkey"], hotel["Address"]["City"].upper(),
+                            rng.choice(catalog.room_types), rng.choice(catalog.categories)))
+
+        for name, (indexed, scan) in LOOKUPS.items():
+            # Both methods find the same number of results
+            for query in queries[:5]:
+                if len(indexed(catalog, query)) != len(scan(hotels, query)):
+                    raise RuntimeError(f"Catalog and scan disagree on {name} {query!r}")
+            for method, lookup, max_time in (
+                ("linear scan", lambda query, scan=scan, hotels=hotels: scan(hotels, query),
+                 args.max_time),
+                ("catalog",
+                 lambda query, indexed=indexed, catalog=catalog: indexed(catalog, query),
+                 float("inf")),
+            ):
+                stats = time_lookups(lookup, queries, max_time)
+                print(f"{size:>7} {name:<15} {method:<12} {stats['queries']:>7} "
+                      f"{stats['mean_us']:>10.1f} {stats['p50_us']:>10.1f} "
+                      f"{stats['p95_us']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Micro-benchmark of the knowledge index.
+
+Copies the Markdown files of the bookings-db generator to a temporary directory
+(hotel_bookings.md ``--copies`` times, with renamed hotels, to grow the corpus) and
+measures:
+
+- ``build``: building the index from scratch
+- ``open``: opening the built index in a new process state (every segment reused)
+- ``update (one file)``: updating the index after appending a section to one file
+- search latency of the index, against chunking and scoring the whole files per
+  query (what a request does without an index)
+
+Both search methods return the same scores.
+
+Usage (from ai_agents_hospitality-api/):
+    python benchmarks/bench_knowledge_index.py
+    python benchmarks/bench_knowledge_index.py --copies 20 --queries 100
+"""
+
+import argparse
+import math
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+API_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_HOTELS_DIR = API_ROOT.parent / "bookings-db" / "output_files" / "hotels"
+MARKDOWN_FILES = ("hotel_details.md", "hotel_rooms.md", "hotel_bookings.md")
+
+sys.path.insert(0, str(API_ROOT))
+
+from util.knowledge_index import (  # noqa: E402
+    BM25_B,
+    BM25_K1,
+    KnowledgeIndex,
+    chunk_markdown,
+    tokenize,
+)
+
+QUERY_TEMPLATES = (
+    "{hotel} address and zip code",
+    "{hotel} {category} {room_type} rooms price peak season",
+    "bookings of guests from {city} at {hotel}",
+    "{meal_plan} bookings {month}",
+    "room {room} {hotel}",
+)
+CATEGORIES = ("Standard", "Premium")
+ROOM_TYPES = ("Single", "Double", "Triple")
+MEAL_PLANS = ("Room Only", "Room and Breakfast", "Half Board", "Full Board",
+              "All Inclusive")
+CITIES = ("Rome", "Paris", "Madrid", "Berlin", "Zurich", "Amsterdam", "Vienna")
+
+
+def scan_search(files, query, k):
+    """Chunk, tokenize and score the whole files for one query (no index)."""
+    chunks = []
+    for path in files:
+        chunks.extend((str(path), chunk)
+                      for chunk in chunk_markdown(path.read_text(encoding="utf-8")))
+    terms = [Counter(tokenize(chunk.heading) + tokenize(chunk.text)) for _, chunk in chunks]
+    avg_length = sum(sum(counts.values()) for counts in terms) / len(terms)
+    scores = [0.0] * len(chunks)
+    for term in set(tokenize(query)):
+        df = sum(1 for counts in terms if term in counts)
+        if not df:
+            continue
+        idf = math.log(1 + (len(chunks) - df + 0.5) / (df + 0.5))
+        for number, counts in enumerate(terms):
+            frequency = counts.get(term)
+            if frequency:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * sum(counts.values()) / avg_length)
+                scores[number] += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+    best = sorted((number for number in range(len(chunks)) if scores[number]),
+                  key=lambda number: -scores[number])[:k]
+    return [(scores[number], chunks[number][0], chunks[number][1].heading) for number in best]
+
+
+def copy_files(source_dir, target_dir, copies):
+    """Copy the Markdown files, with copies of hotel_bookings.md under other hotel names."""
+    files = []
+    for name in MARKDOWN_FILES:
+        shutil.copy(source_dir / name, target_dir / name)
+        files.append(target_dir / name)
+    bookings = (source_dir / "hotel_bookings.md").read_text(encoding="utf-8")
+    for copy in range(1, copies):
+        path = target_dir / f"hotel_bookings_{copy}.md"
+        path.write_text(bookings.replace("# HOTEL - Name: ", f"# HOTEL - Name: Copy {copy} "),
+                        encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def timed(function):
+    """Run function, returning its result and its duration in seconds."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    """Run the benchmark and print the index timings and the search latencies."""
+    parser = argparse.ArgumentParser(description="Benchmark the knowledge index.")
+    parser.add_argument("--hotels-dir", default=str(DEFAULT_HOTELS_DIR),
+                        help="Directory of the generated Markdown files")
+    parser.add_argument("--copies", type=int, default=1,
+                        help="Copies of hotel_bookings.md in the corpus (default: 1)")
+    parser.add_argument("--queries", type=int, default=50,
+                        help="Queries per search method (default: 50)")
+    parser.add_argument("--k", type=int, default=5, help="Results per query (default: 5)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        work_dir = Path(work_dir)
+        corpus_dir = work_dir / "corpus"
+        corpus_dir.mkdir()
+        files = copy_files(Path(args.hotels_dir), corpus_dir, max(1, args.copies))
+        size = sum(path.stat().st_size for path in files)
+        index_dir = work_dir / "index"
+
+        index = KnowledgeIndex(str(index_dir), files)
+        _, build_s = timed(index.update)
+        index.close()
+        index = KnowledgeIndex(str(index_dir), files)
+        _, open_s = timed(index.update)
+        with open(files[1], "a", encoding="utf-8") as file:
+            file.write("\n# Benchmark Hotel\n\nAn extra section.\n")
+        status, update_s = timed(index.update)
+        rebuilt = sum(1 for state in status.values() if state == "built")
+
+        print(f"corpus: {len(files)} files, {size / 2**20:.1f} MiB, {len(index)} chunks")
+        print(f"{'build':<20} {build_s * 1e3:>10.1f} ms")
+        print(f"{'open':<20} {open_s * 1e3:>10.1f} ms")
+        print(f"{'update (one file)':<20} {update_s * 1e3:>10.1f} ms "
+              f"({rebuilt} of {len(files)} files rebuilt)")
+
+        rng = random.Random(args.seed)
+        hotels = sorted({chunk.heading.split(" > ")[0] for path in files[:1]
+                         for chunk in chunk_markdown(path.read_text(encoding="utf-8"))})
+        queries = [rng.choice(QUERY_TEMPLATES).format(
+            hotel=rng.choice(hotels), category=rng.choice(CATEGORIES),
+            room_type=rng.choice(ROOM_TYPES), meal_plan=rng.choice(MEAL_PLANS),
+            city=rng.choice(CITIES), month=f"2025-{rng.randint(1, 12):02d}",
+            room=f"{rng.randint(1, 5):02d}-{rng.randint(1, 20):03d}",
+        ) for _ in range(args.queries)]
+
+        # Both methods find chunks with the same scores (ties may pick other chunks)
+        for query in queries[:3]:
+            indexed = [round(result.score, 9) for result in index.search(query, args.k)]
+            scanned = [round(score, 9) for score, _, _ in scan_search(files, query, args.k)]
+            if indexed != scanned:
+                raise RuntimeError(f"Index and scan disagree on {query!r}")
+
+        print(f"\n{'method':<12} {'queries':>7} {'mean (ms)':>10} {'p50 (ms)':>10} "
+              f"{'p95 (ms)':>10}")
+        for method, search, count in (
+            ("whole files", lambda query: scan_search(files, query, args.k),
+             min(len(queries), 10)),
+            ("index", lambda query: index.search(query, args.k), len(queries)),
+        ):
+            latencies = sorted(timed(lambda query=query, search=search: search(query))[1]
+                               for query in queries[:count])
+            print(f"{method:<12} {count:>7} {statistics.fmean(latencies) * 1e3:>10.2f} "
+                  f"{latencies[len(latencies) // 2] * 1e3:>10.2f} "
+                  f"{latencies[min(count - 1, int(count * 0.95))] * 1e3:>10.2f}")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
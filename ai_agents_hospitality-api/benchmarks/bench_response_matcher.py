@@ -0,0 +1,127 @@
+"""
+Micro-benchmark of the response matcher.
+
+Compares the latency of ``ResponseMatcher`` with the linear scan it replaced
+(every key split and intersected with the query) on synthetic response sets of
+increasing size. Keys draw their words from a Zipf-like vocabulary, so common
+words ("the", "in"...) are shared by many keys as in real FAQ sets.
+
+Usage (from ai_agents_hospitality-api/):
+    python benchmarks/bench_response_matcher.py
+    python benchmarks/bench_response_matcher.py --sizes 10,1000,100000 --queries 500
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from util.response_matcher import DEFAULT_MATCH_THRESHOLD, ResponseMatcher
+
+COMMON_WORDS = ["the", "in", "for", "of", "a", "at", "and", "room", "price", "hotel",
+                "hotels", "rooms", "tell", "me", "season", "paris", "nice", "with"]
+
+
+def linear_scan_match(responses, query, threshold=DEFAULT_MATCH_THRESHOLD):
+    """Return the first response whose key words are in the query (previous matcher)."""
+    query_lower = query.lower().strip()
+    if query_lower in responses:
+        return responses[query_lower]
+    for key, response in responses.items():
+        key_words = set(key.split())
+        query_words = set(query_lower.split())
+        if len(key_words.intersection(query_words)) / len(key_words) >= threshold:
+            return response
+    return None
+
+
+def make_responses(size, rng):
+    """Build ``size`` synthetic responses keyed by unique queries of 4 to 14 words."""
+    vocabulary = COMMON_WORDS + [f"word{i}" for i in range(max(1000, size // 5))]
+    # Zipf-like weights: the first words of the vocabulary are the most frequent
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    responses = {}
+    while len(responses) < size:
+        key = " ".join(rng.choices(vocabulary, weights, k=rng.randint(4, 14)))
+        responses[key] = f"Response {len(responses)}"
+    return responses
+
+
+def make_queries(responses, count, rng):
+    """Build queries: half rephrase a key, half share only common words with the keys."""
+    keys = list(responses)
+    queries = []
+    for i in range(count):
+        if i % 2 == 0:
+            words = rng.choice(keys).split()
+            kept = words[: max(1, int(len(words) * 0.8))]
+            queries.append(" ".join(["tell", "me"] + kept + ["please"]))
+        else:
+            queries.append(" ".join(rng.choices(COMMON_WORDS, k=8) + ["unknownword"]))
+    return queries
+
+
+def time_queries(match, queries, min_time):
+    """Time ``match`` on the queries, stopping early after min_time seconds."""
+    latencies = []
+    start = time.perf_counter()
+    for query in queries:
+        query_start = time.perf_counter()
+        match(query)
+        latencies.append(time.perf_counter() - query_start)
+        if time.perf_counter() - start > min_time and len(latencies) >= 5:
+            break
+    latencies.sort()
+    return {
+        "queries": len(latencies),
+        "mean_us": statistics.fmean(latencies) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p95_us": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1e6,
+    }
+
+
+def main(argv=None):
+    """Run the benchmark and print one line per matcher and response set size."""
+    parser = argparse.ArgumentParser(description="Benchmark the response matcher.")
+    parser.add_argument("--sizes", default="10,1000,100000",
+                        help="Comma separated numbers of responses (default: 10,1000,100000)")
+    parser.add_argument("--queries", type=int, default=200,
+                        help="Queries per response set (default: 200)")
+    parser.add_argument("--max-time", type=float, default=5.0,
+                        help="Time budget in seconds of the linear scan per size (default: 5)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args(argv)
+
+    print(f"{'responses':>9} {'matcher':<12} {'queries':>7} {'build (ms)':>10} "
+          f"{'mean (us)':>10} {'p50 (us)':>10} {'p95 (us)':>10}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        rng = random.Random(args.seed)
+        responses = make_responses(size, rng)
+        queries = make_queries(responses, args.queries, rng)
+
+        build_start = time.perf_counter()
+        matcher = ResponseMatcher(responses)
+        build_ms = (time.perf_counter() - build_start) * 1e3
+
+        # Both matchers find a response for the same queries
+        for query in queries[:20]:
+            if (matcher.match(query) is None) != (linear_scan_match(responses, query) is None):
+                raise RuntimeError(f"Matchers disagree on query: {query!r}")
+
+        for name, match, build, max_time in (
+            ("linear scan",
+             lambda query, responses=responses: linear_scan_match(responses, query), 0.0,
+             args.max_time),
+            ("index", matcher.match, build_ms, float("inf")),
+        ):
+            stats = time_queries(match, queries, max_time)
+            print(f"{size:>9} {name:<12} {stats['queries']:>7} {build:>10.1f} "
+                  f"{stats['mean_us']:>10.1f} {stats['p50_us']:>10.1f} {stats['p95_us']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
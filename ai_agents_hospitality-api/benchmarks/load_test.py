@@ -0,0 +1,317 @@
+"""
+WebSocket load test of the chat endpoint.
+
+Opens N concurrent WebSocket clients on ``/ws/{uuid}``, each sending queries replayed
+from the hotel room queries generated by the bookings-db generator
+(``hotel_room_queries.csv``), and reports latency percentiles, throughput and errors.
+Both the single frame and the streamed (chunk/final frames) response modes are
+supported; in streaming mode the time to the first frame is reported as well.
+
+The test runs against a running server (``--url``) or starts the app in-process with
+uvicorn (default). Thresholds turn it into a regression gate: the exit status is 1
+when one is exceeded.
+
+Usage (from ai_agents_hospitality-api/):
+    python benchmarks/load_test.py --clients 50 --messages 20
+    python benchmarks/load_test.py --url ws://localhost:8001 --clients 200 --duration 30
+    python benchmarks/load_test.py --max-p95-ms 50 --max-error-rate 0 --output load.json
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import socket
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import websockets
+
+API_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_QUERIES_FILE = (
+    API_ROOT.parent / "bookings-db" / "output_files" / "hotels" / "hotel_room_queries.csv"
+)
+
+
+class LoadTestStats:
+    """Latencies and errors collected by the clients of a load test."""
+
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.first_frame_latencies: list[float] = []
+        self.errors: dict[str, int] = {}
+        self.connections = 0
+
+    def add_error(self, error: BaseException) -> None:
+        """Count an error by exception type."""
+        name = type(error).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    @property
+    def num_errors(self) -> int:
+        return sum(self.errors.values())
+
+
+def load_queries(path: Path) -> list[str]:
+    """
+    Read the queries to replay.
+
+    Args:
+        path: CSV file with a 'Query' column (as written by hotel_query_writer)
+
+    Returns:
+        The queries of the file
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file has no query
+    """
+    if not path.exists():
+        raise FileNotFoundError(
+            f"The queries file '{path}' does not exist. Generate it with "
+            "bookings-db/src/gen_synthetic_hotels.py or pass --queries."
+        )
+    with open(path, newline="", encoding="utf-8") as file:
+        queries = [row["Query"] for row in csv.DictReader(file) if row.get("Query")]
+    if not queries:
+        raise ValueError(f"The queries file '{path}' has no query.")
+    return queries
+
+
+def parse_frame(frame: str) -> dict:
+    """
+    Extract the JSON message of a JSONSTART...JSONEND frame.
+
+    Raises:
+        ValueError: If the frame is malformed
+    """
+    start, end = frame.find("JSONSTART"), frame.rfind("JSONEND")
+    if start < 0 or end < start:
+        raise ValueError(f"Malformed frame: {frame[:80]!r}")
+    return json.loads(frame[start + len("JSONSTART"):end])
+
+
+async def receive_response(websocket) -> float:
+    """
+    Receive the frames of one response.
+
+    Returns:
+        The arrival time of the first frame
+    """
+    first_frame_at = None
+    while True:
+        message = parse_frame(await websocket.recv())
+        if first_frame_at is None:
+            first_frame_at = time.perf_counter()
+        if message.get("type") != "chunk":
+            # A complete message, or the final frame of a streamed one
+            return first_frame_at
+
+
+async def run_client(client_id: int, url: str, queries: list[str], args,
+                     stats: LoadTestStats, deadline: float | None) -> None:
+    """Send queries on one WebSocket connection, one at a time, recording each latency."""
+    try:
+        async with websockets.connect(f"{url}/ws/loadtest-{client_id}-{uuid4().hex[:8]}",
+                                      open_timeout=args.timeout) as websocket:
+            stats.connections += 1
+            sent = 0
+            while (deadline is None and sent < args.messages) or (
+                    deadline is not None and time.perf_counter() < deadline):
+                query = queries[(client_id + sent * args.clients) % len(queries)]
+                sent += 1
+                start = time.perf_counter()
+                try:
+                    await websocket.send(json.dumps({"content": query,
+                                                     "timestamp": int(time.time())}))
+                    first_frame_at = await asyncio.wait_for(receive_response(websocket),
+                                                            args.timeout)
+                except (asyncio.TimeoutError, ValueError) as error:
+                    # The connection may still be usable after a slow or malformed response
+                    stats.add_error(error)
+                    continue
+                stats.latencies.append(time.perf_counter() - start)
+                stats.first_frame_latencies.append(first_frame_at - start)
+                if args.think_time:
+                    await asyncio.sleep(args.think_time)
+    except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as error:
+        stats.add_error(error)
+
+
+def percentile(values: list[float], share: float) -> float | None:
+    """Return the nearest-rank percentile of a list of values, or None if it is empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(share * len(ordered))) - 1))]
+
+
+def summarize(stats: LoadTestStats, elapsed: float, args) -> dict:
+    """Build the report of a load test."""
+    def milliseconds(value):
+        return None if value is None else value * 1e3
+
+    num_messages = len(stats.latencies)
+    attempts = num_messages + stats.num_errors
+    return {
+        "clients": args.clients,
+        "connections": stats.connections,
+        "messages": num_messages,
+        "errors": stats.errors,
+        "error_rate": stats.num_errors / attempts if attempts else 0.0,
+        "elapsed_s": elapsed,
+        "messages_per_s": num_messages / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "mean": milliseconds(statistics.fmean(stats.latencies)) if stats.latencies else None,
+            "p50": milliseconds(percentile(stats.latencies, 0.50)),
+            "p95": milliseconds(percentile(stats.latencies, 0.95)),
+            "p99": milliseconds(percentile(stats.latencies, 0.99)),
+            "max": milliseconds(max(stats.latencies, default=None)),
+        },
+        "first_frame_ms": {
+            "p50": milliseconds(percentile(stats.first_frame_latencies, 0.50)),
+            "p95": milliseconds(percentile(stats.first_frame_latencies, 0.95)),
+            "p99": milliseconds(percentile(stats.first_frame_latencies, 0.99)),
+        },
+    }
+
+
+def check_thresholds(report: dict, args) -> list[str]:
+    """List the thresholds exceeded by a load test report."""
+    if not report["messages"]:
+        return ["no query was answered"]
+    failures = []
+    latency = report["latency_ms"]
+    for name, limit in (("p95", args.max_p95_ms), ("p99", args.max_p99_ms)):
+        if limit is not None and latency[name] > limit:
+            failures.append(f"latency {name} {latency[name]:.2f} ms > {limit} ms")
+    if args.max_error_rate is not None and report["error_rate"] > args.max_error_rate:
+        failures.append(f"error rate {report['error_rate']:.2%} > {args.max_error_rate:.2%}")
+    if args.min_throughput is not None and report["messages_per_s"] < args.min_throughput:
+        failures.append(
+            f"throughput {report['messages_per_s']:.1f} msg/s < {args.min_throughput} msg/s"
+        )
+    return failures
+
+
+async def start_in_process_server():
+    """
+    Start the app with uvicorn in this process, on a free local port.
+
+    Returns:
+        The uvicorn server and the WebSocket base URL
+    """
+    import uvicorn
+
+    sys.path.insert(0, str(API_ROOT))
+    from main import app
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port,
+                                           log_level="warning", lifespan="on"))
+    server.task = asyncio.create_task(server.serve())
+    while not server.started:
+        if server.task.done():
+            server.task.result()
+            raise RuntimeError("The in-process server stopped during startup.")
+        await asyncio.sleep(0.05)
+    return server, f"ws://127.0.0.1:{port}"
+
+
+async def run_load_test(args) -> dict:
+    """Run the clients of a load test and return its report."""
+    queries = load_queries(Path(args.queries))
+    server = None
+    url = args.url
+    if url is None:
+        server, url = await start_in_process_server()
+    try:
+        stats = LoadTestStats()
+        start = time.perf_counter()
+        deadline = start + args.duration if args.duration else None
+        await asyncio.gather(*(
+            run_client(client_id, url.rstrip("/"), queries, args, stats, deadline)
+            for client_id in range(args.clients)
+        ))
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.should_exit = True
+            await server.task
+    return summarize(stats, elapsed, args)
+
+
+def print_report(report: dict) -> None:
+    """Print a load test report."""
+    def fmt(value):
+        return "-" if value is None else f"{value:.2f}"
+
+    latency, first_frame = report["latency_ms"], report["first_frame_ms"]
+    print(f"clients: {report['clients']} (connected: {report['connections']})")
+    print(f"messages: {report['messages']} in {report['elapsed_s']:.2f} s "
+          f"({report['messages_per_s']:.1f} msg/s)")
+    print(f"latency ms: p50 {fmt(latency['p50'])}  p95 {fmt(latency['p95'])}  "
+          f"p99 {fmt(latency['p99'])}  max {fmt(latency['max'])}")
+    print(f"first frame ms: p50 {fmt(first_frame['p50'])}  p95 {fmt(first_frame['p95'])}  "
+          f"p99 {fmt(first_frame['p99'])}")
+    errors = ", ".join(f"{name}: {count}" for name, count in report["errors"].items())
+    print(f"errors: {sum(report['errors'].values())} (rate {report['error_rate']:.2%})"
+          + (f" {errors}" if errors else ""))
+
+
+def parse_args(argv=None):
+    """Parse the command line arguments of the load test."""
+    parser = argparse.ArgumentParser(description="Load test the chat WebSocket endpoint.")
+    parser.add_argument("--url", default=None,
+                        help="WebSocket base URL of a running server, e.g. ws://localhost:8001 "
+                             "(default: start the app in-process)")
+    parser.add_argument("--clients", type=int, default=50,
+                        help="Concurrent WebSocket clients (default: 50)")
+    parser.add_argument("--messages", type=int, default=20,
+                        help="Queries sent by each client (default: 20)")
+    parser.add_argument("--duration", type=float, default=None,
+                        help="Send queries for this many seconds instead of --messages")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Seconds a client waits between a response and its next query")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="Seconds to wait for a connection or a response (default: 10)")
+    parser.add_argument("--queries", default=str(DEFAULT_QUERIES_FILE),
+                        help="CSV file of queries to replay (default: hotel_room_queries.csv)")
+    parser.add_argument("--output", default=None, help="Write the report to this JSON file")
+    parser.add_argument("--max-p95-ms", type=float, default=None,
+                        help="Fail if the p95 latency exceeds this value")
+    parser.add_argument("--max-p99-ms", type=float, default=None,
+                        help="Fail if the p99 latency exceeds this value")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="Fail if the share of failed queries exceeds this value")
+    parser.add_argument("--min-throughput", type=float, default=None,
+                        help="Fail if fewer messages per second are answered")
+    args = parser.parse_args(argv)
+    if args.clients < 1 or args.messages < 1:
+        parser.error("--clients and --messages must be positive integers")
+    return args
+
+
+def main(argv=None) -> int:
+    """Run the load test and return the process exit code."""
+    args = parse_args(argv)
+    report = asyncio.run(run_load_test(args))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Report written to: {args.output}")
+
+    failures = check_thresholds(report, args)
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,16 +8,33 @@ and handling WebSocket connections for chat interactions with hardcoded response
 This is a starter template for a workshop to implement LangChain agents.
 """
 
+import asyncio
 import json
 import re
+import time
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import NamedTuple
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.requests import Request
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from util.logger_config import logger
+from util.logger_config import logger, should_log_payload, truncate_payload
 from util.configuration import settings, PROJECT_ROOT
+from util.hotel_catalog import get_hotel_catalog
+from util.message_protocol import (
+    chunk_frame,
+    final_frame,
+    frame_message,
+    new_message_id,
+    split_text_chunks,
+)
+from util.metrics import SIZE_BUCKETS, MetricsRegistry
+from util.response_cache import ResponseCache
+from util.response_matcher import ResponseMatcher
+from util.sql_answer_engine import DATABASE_ERRORS, SqlAnswerEngine, create_backend
 
 
 # Hardcoded responses for demo queries
@@ -106,10 +123,14 @@ Difference: €100/night (35.7% discount in off season)""",
 }
 
 
+response_matcher = ResponseMatcher(HARDCODED_RESPONSES)
+
+
 def find_matching_response(query: str) -> str:
     """
     Find a matching hardcoded response based on the query.
-    Uses fuzzy matching to find similar queries.
+    Uses fuzzy matching to find the most similar query: the response whose query
+    has the largest share of its words (at least 60%) in the user query.
     
     Args:
         query: User query string
@@ -117,21 +138,10 @@ def find_matching_response(query: str) -> str:
     Returns:
         Matching response or default message
     """
-    query_lower = query.lower().strip()
-    
-    # Try exact match first
-    if query_lower in HARDCODED_RESPONSES:
-        return HARDCODED_RESPONSES[query_lower]
-    
-    # Try partial matching
-    for key, response in HARDCODED_RESPONSES.items():
-        # Check if key words are present
-        key_words = set(key.split())
-        query_words = set(query_lower.split())
-        
-        # If 60% or more of the key words are in the query
-        if len(key_words.intersection(query_words)) / len(key_words) >= 0.6:
-            return response
+    with matcher_latency.time():
+        response = response_matcher.match(query)
+    if response is not None:
+        return response
     
     # Default response if no match
     return """I'm a demo API with hardcoded responses. 
@@ -147,13 +157,203 @@ Example: "list the hotels in France" or "tell me the prices for triple premium r
 *This is a workshop starter - implement your LangChain agent here!*"""
 
 
+# Answers the hotel questions from the bookings database when ANSWER_ENGINE is "sql";
+# the hardcoded responses answer the other queries
+answer_engine = SqlAnswerEngine(create_backend(
+    settings.ANSWER_DB_URL, settings.ANSWER_DB_POOL_MIN_SIZE, settings.ANSWER_DB_POOL_MAX_SIZE
+)) if settings.ANSWER_ENGINE == "sql" else None
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL_SECONDS)
+# Kinds of the response cache entries: framed message, or answer text sent in chunks
+FRAMED_PAYLOAD = "framed"
+ANSWER_TEXT = "text"
+
+# In-process metrics, served on /metrics
+metrics = MetricsRegistry()
+sessions_active = metrics.gauge("hospitality_websocket_sessions_active",
+                                "Open WebSocket sessions")
+sessions_total = metrics.counter("hospitality_websocket_sessions_total",
+                                 "WebSocket sessions opened")
+messages_received = metrics.counter("hospitality_websocket_messages_received_total",
+                                    "Messages received from the clients")
+messages_sent = metrics.counter("hospitality_websocket_messages_sent_total",
+                                "Frames sent to the clients")
+websocket_errors = metrics.counter("hospitality_websocket_errors_total",
+                                   "WebSocket sessions ended by an error")
+received_bytes = metrics.histogram("hospitality_websocket_received_bytes",
+                                   "Size of the messages received", SIZE_BUCKETS)
+sent_bytes = metrics.histogram("hospitality_websocket_sent_bytes",
+                               "Size of the frames sent", SIZE_BUCKETS)
+response_latency = metrics.histogram("hospitality_response_latency_seconds",
+                                     "Time from receiving a query to sending its response")
+matcher_latency = metrics.histogram("hospitality_matcher_latency_seconds",
+                                    "Time to match a query against the hardcoded responses")
+answer_engine_latency = metrics.histogram("hospitality_answer_engine_latency_seconds",
+                                          "Time to answer a query from the bookings database")
+answer_engine_errors = metrics.counter("hospitality_answer_engine_errors_total",
+                                       "Bookings database queries failed")
+metrics.gauge("hospitality_response_cache_entries", "Entries in the response cache",
+              lambda: len(response_cache))
+metrics.counter("hospitality_response_cache_hits_total", "Response cache hits",
+                lambda: response_cache.hits)
+metrics.counter("hospitality_response_cache_misses_total", "Response cache misses",
+                lambda: response_cache.misses)
+metrics.gauge("hospitality_response_cache_hit_ratio", "Share of response cache lookups hit",
+              lambda: response_cache.stats()["hit_ratio"])
+
+
+async def send_frame(websocket: WebSocket, frame: str) -> None:
+    """
+    Send a frame to the client and record it in the metrics.
+
+    Args:
+        websocket: The WebSocket connection
+        frame: Framed message
+    """
+    await websocket.send_text(frame)
+    messages_sent.inc()
+    # Frames are ASCII (json.dumps escapes other characters): characters are bytes
+    sent_bytes.observe(len(frame))
+
+
+class Answer(NamedTuple):
+    """The answer to a query, and whether it may be served again from the cache."""
+
+    text: str
+    cacheable: bool
+
+
+async def answer_query(query: str) -> Answer:
+    """
+    Answer a query from the bookings database, or else from the hardcoded responses.
+
+    Args:
+        query: User query string
+
+    Returns:
+        The answer. It is not cacheable when the bookings database failed or is not
+        available: the hardcoded response then stands in for the answer the database
+        gives once it is back.
+    """
+    cacheable = True
+    if answer_engine is not None:
+        answer = None
+        try:
+            if answer_engine.started:
+                with answer_engine_latency.time():
+                    answer = await answer_engine.answer(query)
+            else:
+                cacheable = False
+        except DATABASE_ERRORS as e:
+            answer_engine_errors.inc()
+            logger.error("Error answering from the bookings database: %s", str(e))
+            cacheable = False
+        if answer is not None:
+            return Answer(answer, cacheable)
+    return Answer(find_matching_response(query), cacheable)
+
+
+async def get_response_payload(query: str) -> str:
+    """
+    Get the framed WebSocket payload answering a query.
+
+    Repeated queries are served from the response cache, skipping both the answer
+    lookup and the serialization. The answer engine (``answer_query``, or an agent
+    later on) is only called on cache misses.
+
+    Args:
+        query: User query string
+
+    Returns:
+        The assistant message framed as JSONSTART...JSONEND
+    """
+    payload = response_cache.get(query, FRAMED_PAYLOAD)
+    if payload is not None:
+        return payload
+
+    answer = await answer_query(query)
+    agent_message = {
+        "role": "assistant",
+        "content": answer.text
+    }
+    payload = frame_message(agent_message)
+    if answer.cacheable:
+        response_cache.put(query, payload, FRAMED_PAYLOAD)
+    return payload
+
+
+async def stream_response(answer: Answer) -> AsyncIterator[str]:
+    """
+    Yield an answer in chunks, as soon as each one is available.
+
+    The hardcoded responder splits its answer into chunks of a few words. An
+    agent backend would yield its tokens here as they are generated, instead of
+    splitting a complete answer.
+
+    Args:
+        answer: Answer to the query
+
+    Yields:
+        Consecutive parts of the answer
+    """
+    for chunk in split_text_chunks(answer.text, settings.RESPONSE_STREAM_CHUNK_WORDS):
+        yield chunk
+        # Let the event loop flush the frame and serve other connections
+        await asyncio.sleep(0)
+
+
+async def send_streamed_response(websocket: WebSocket, query: str) -> None:
+    """
+    Send the answer to a query as chunk frames followed by a final frame.
+
+    The final frame carries the complete answer text and the number of chunks.
+    In streaming mode the response cache holds the complete answer text: a cached
+    answer is sent as a single chunk.
+
+    Args:
+        websocket: The WebSocket connection
+        query: User query string
+    """
+    message_id = new_message_id()
+    content = response_cache.get(query, ANSWER_TEXT)
+    if content is not None:
+        chunks = [content]
+        await send_frame(websocket, chunk_frame(message_id, content))
+    else:
+        answer = await answer_query(query)
+        chunks = []
+        async for chunk in stream_response(answer):
+            chunks.append(chunk)
+            await send_frame(websocket, chunk_frame(message_id, chunk))
+        content = "".join(chunks)
+        if answer.cacheable:
+            response_cache.put(query, content, ANSWER_TEXT)
+    await send_frame(websocket, final_frame(message_id, content, len(chunks)))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan event handler for startup and shutdown logic.
     """
     logger.info("Starting AI Hospitality API...")
+    if answer_engine is not None:
+        try:
+            answer_engine.catalog = get_hotel_catalog(settings.HOTELS_FILE)
+        except FileNotFoundError:
+            logger.warning("Hotel catalog %s not found, reading the rooms from the database",
+                           settings.HOTELS_FILE)
+        try:
+            await answer_engine.start()
+            logger.info("Answering from the bookings database%s",
+                        " and the hotel catalog" if answer_engine.uses_catalog else "")
+        except DATABASE_ERRORS as e:
+            logger.error("Bookings database unavailable, using the hardcoded responses: %s",
+                         str(e))
     yield
+    if answer_engine is not None:
+        await answer_engine.close()
+    logger.info("Response cache statistics: %s", response_cache.stats())
     logger.info("Shutting down AI Hospitality API...")
 
 
@@ -176,6 +376,19 @@ async def get(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def get_metrics():
+        """
+        Serve the in-process metrics of this worker.
+
+        Returns:
+            PlainTextResponse: Metrics in the Prometheus text exposition format.
+        """
+        return PlainTextResponse(metrics.render(),
+                                 media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.websocket("/ws/{uuid}")
 async def websocket_endpoint(websocket: WebSocket, uuid: str):
     """
@@ -191,13 +404,20 @@ async def websocket_endpoint(websocket: WebSocket, uuid: str):
     """
     await websocket.accept()
     logger.info("WebSocket connection opened for %s", uuid)
+    sessions_active.inc()
+    sessions_total.inc()
 
     try:
         while True:
             try:
                 # Receive message from client
                 data = await websocket.receive_text()
-                logger.info(f"Received from {uuid}: {data}")
+                received_at = time.perf_counter()
+                messages_received.inc()
+                received_bytes.observe(len(data.encode("utf-8")))
+                log_message = should_log_payload()
+                if log_message:
+                    logger.info("Received from %s: %s", uuid, truncate_payload(data))
                 
                 # Parse the query
                 try:
@@ -206,35 +426,33 @@ async def websocket_endpoint(websocket: WebSocket, uuid: str):
                 except json.JSONDecodeError:
                     user_query = data
                 
-                # Get hardcoded response
-                response_content = find_matching_response(user_query)
-                
-                # Send response back to client
-                agent_message = {
-                    "role": "assistant",
-                    "content": response_content
-                }
-                
-                await websocket.send_text(
-                    f"JSONSTART{json.dumps(agent_message)}JSONEND"
-                )
-                logger.info(f"Sent response to {uuid}")
+                # Send the response back to client (cached for repeated queries)
+                if settings.RESPONSE_STREAMING:
+                    await send_streamed_response(websocket, user_query)
+                else:
+                    await send_frame(websocket, await get_response_payload(user_query))
+                response_latency.observe(time.perf_counter() - received_at)
+                if log_message:
+                    logger.info("Sent response to %s", uuid)
                 
             except WebSocketDisconnect:
                 logger.info("WebSocket connection closed for %s", uuid)
                 break
             except (RuntimeError, ConnectionError) as e:
+                websocket_errors.inc()
                 logger.error(
                     "Error in WebSocket connection for %s: %s", 
                     uuid, str(e)
                 )
                 break
     except Exception as e:
+        websocket_errors.inc()
         logger.error(
             "Unexpected error in WebSocket for %s: %s", 
             uuid, str(e)
         )
     finally:
+        sessions_active.dec()
         try:
             await websocket.close()
         except (RuntimeError, ConnectionError) as e:
@@ -246,9 +464,14 @@ async def websocket_endpoint(websocket: WebSocket, uuid: str):
 
 if __name__ == "__main__":
     import uvicorn
-    
-    logger.info(f"Starting server on {settings.API_HOST}:{settings.API_PORT}")
-    uvicorn.run("main:app", host=settings.API_HOST, port=settings.API_PORT, reload=True)
+    from util.server_config import get_uvicorn_options, parse_server_args
+
+    settings = parse_server_args(settings)
+    server_options = get_uvicorn_options(settings)
+    logger.info("Starting server on %s:%s with %s worker(s)%s",
+                settings.API_HOST, settings.API_PORT, server_options.get("workers", 1),
+                " and reload" if server_options.get("reload") else "")
+    uvicorn.run("main:app", **server_options)
 
 
 
@@ -1,12 +1,7 @@
 #!/bin/bash
-# Shell wrapper for uvicorn to ensure proper signal handling
-# This allows environment variable expansion while maintaining JSON form for CMD
-
-exec uvicorn main:app \
-    --host "${API_HOST}" \
-    --port "${API_PORT}" \
-    --reload \
-    "$@"
-
-
+# Shell wrapper for the server to ensure proper signal handling
+# The server options (workers, reload, event loop, WebSocket limits...) are read from the
+# environment by util/configuration.py; the uvicorn options given to this script (--port,
+# --workers, --reload...) override them. See util/server_config.py
 
+exec python main.py "$@"
@@ -1,49 +1,76 @@
 let previousTimestamp = null;  
 const ws = new WebSocket("ws://0.0.0.0:8001/ws/fdfb8545-c177-48a2-bdce-b06af2032092_test_poc");
   
-ws.onmessage = function(event) {  
-    const messages = document.getElementById('messages');  
+// Streamed messages being received, by message id: their element and content so far
+const streamedMessages = {};
+const md = window.markdownit();
+
+ws.onmessage = function(event) {
     const data = event.data;
     const jsonStr = data.substring(data.indexOf("JSONSTART") + 9, data.indexOf("JSONEND"));
     const messageData = JSON.parse(jsonStr);
-    
+
     console.log('Received message:', messageData);
-    const currentTimestamp = messageData.timestamp;  
-    const showTimestamp = previousTimestamp  
-        ? (currentTimestamp - previousTimestamp >= 300)  
-        : true;  
-  
-    if (showTimestamp && currentTimestamp) {
-        previousTimestamp = currentTimestamp;  
-        const timestampDiv = document.createElement('div');  
-        timestampDiv.classList.add('timestamp');  
-        timestampDiv.textContent = formatTime(currentTimestamp);  
-        messages.appendChild(timestampDiv);  
-    }  
-  
-    const messageWrapper = document.createElement('div');  
-    messageWrapper.classList.add('message-wrapper');  
-  
-    const role = document.createElement('div');  
-    role.classList.add('role');  
-    role.textContent = messageData.role;  
-  
-    const icon = document.createElement('div');  
-    icon.classList.add('icon');  
-    icon.textContent = getInitials(messageData.role);  
-    icon.style.background = getGradient(messageData.role);  
-  
-    const message = document.createElement('li');  
-    message.classList.add('server-message');  
-    const md = window.markdownit();  
-    message.innerHTML = md.render(messageData.content);  
-    messageWrapper.appendChild(icon);  
-    messageWrapper.appendChild(role);  
-    messageWrapper.appendChild(message);  
-    messages.appendChild(messageWrapper);  
-    scrollToBottom();  
+    if (messageData.type === 'chunk') {
+        // Streaming: append the chunk to its message, creating it on the first chunk
+        let streamed = streamedMessages[messageData.message_id];
+        if (!streamed) {
+            streamed = {element: appendServerMessage(messageData), content: ''};
+            streamedMessages[messageData.message_id] = streamed;
+        }
+        streamed.content += messageData.content;
+        streamed.element.innerHTML = md.render(streamed.content);
+        scrollToBottom();
+    } else if (messageData.type === 'final') {
+        // The final frame carries the complete text: render it, even if no chunk was received
+        const streamed = streamedMessages[messageData.message_id];
+        const message = streamed ? streamed.element : appendServerMessage(messageData);
+        message.innerHTML = md.render(messageData.content);
+        delete streamedMessages[messageData.message_id];
+        scrollToBottom();
+    } else {
+        const message = appendServerMessage(messageData);
+        message.innerHTML = md.render(messageData.content);
+        scrollToBottom();
+    }
 };
-  
+
+function appendServerMessage(messageData) {
+    const messages = document.getElementById('messages');
+    const currentTimestamp = messageData.timestamp;
+    const showTimestamp = previousTimestamp
+        ? (currentTimestamp - previousTimestamp >= 300)
+        : true;
+
+    if (showTimestamp && currentTimestamp) {
+        previousTimestamp = currentTimestamp;
+        const timestampDiv = document.createElement('div');
+        timestampDiv.classList.add('timestamp');
+        timestampDiv.textContent = formatTime(currentTimestamp);
+        messages.appendChild(timestampDiv);
+    }
+
+    const messageWrapper = document.createElement('div');
+    messageWrapper.classList.add('message-wrapper');
+
+    const role = document.createElement('div');
+    role.classList.add('role');
+    role.textContent = messageData.role;
+
+    const icon = document.createElement('div');
+    icon.classList.add('icon');
+    icon.textContent = getInitials(messageData.role);
+    icon.style.background = getGradient(messageData.role);
+
+    const message = document.createElement('li');
+    message.classList.add('server-message');
+    messageWrapper.appendChild(icon);
+    messageWrapper.appendChild(role);
+    messageWrapper.appendChild(message);
+    messages.appendChild(messageWrapper);
+    return message;
+}
+
 function sendMessage(event) {  
     const input = document.getElementById("messageText");  
     const messages = document.getElementById('messages');  
@@ -0,0 +1,388 @@
+"""
+Hotel Catalog Module
+
+This module loads the hotels of ``hotels.json`` (written by the bookings-db
+generator) once into compact in-memory structures, with secondary indexes for the
+lookups of the hotel questions: hotels by key, name, city or country, and rooms by
+room type and category.
+
+The rooms of all the hotels are stored column by column in typed arrays, sorted by
+hotel, room type and category, so that the rooms of a hotel of a given type and
+category are one contiguous range. The room count and the price ranges of every
+hotel, room type and category are precomputed. A lookup costs the size of its
+result, not the size of the catalog.
+
+The module only uses the standard library, so the generator scripts can build a
+catalog from the hotel list they generate as well.
+"""
+
+import json
+from array import array
+from collections.abc import Iterable, Iterator
+from functools import cache
+from itertools import product
+from sys import intern
+from typing import NamedTuple
+
+
+class Hotel(NamedTuple):
+    """A hotel of the catalog."""
+
+    key: str
+    name: str
+    country: str
+    city: str
+    zip_code: str
+    address: str
+    rooms: int
+
+
+class Room(NamedTuple):
+    """A room of a hotel of the catalog."""
+
+    hotel_key: str
+    room_id: str
+    floor: int
+    room_type: str
+    category: str
+    guests: int
+    price_off_season: float
+    price_peak_season: float
+
+
+class RoomStats(NamedTuple):
+    """Room count and price ranges of the rooms of a hotel, room type and category."""
+
+    rooms: int
+    min_price_off_season: float
+    max_price_off_season: float
+    avg_price_off_season: float
+    min_price_peak_season: float
+    max_price_peak_season: float
+    avg_price_peak_season: float
+
+
+def _fold(value: str) -> str:
+    """Normalize a name for the case-insensitive indexes."""
+    return " ".join(value.lower().split())
+
+
+class HotelCatalog:
+    """
+    Indexed, read-only catalog of hotels and rooms.
+
+    Hotels are looked up by key (exact) and by name, city and country (case
+    insensitive). Every room lookup accepts the same hotel filters plus a room
+    type and a category.
+    """
+
+    def __init__(self, hotels: Iterable[dict]):
+        """
+        Build the catalog.
+
+        Args:
+            hotels: Hotels as in the 'Hotels' list of hotels.json (or as returned by
+                the generator's generate_hotels)
+
+        Raises:
+            ValueError: If two hotels have the same key
+        """
+        hotels = list(hotels)
+        self.room_types: list[str] = sorted({room["Type"] for hotel in hotels
+                                             for room in hotel["Rooms"]})
+        self.categories: list[str] = sorted({room["Category"] for hotel in hotels
+                                             for room in hotel["Rooms"]})
+        self._type_codes = {name: code for code, name in enumerate(self.room_types)}
+        self._category_codes = {name: code for code, name in enumerate(self.categories)}
+        # Room groups (room type x category) of a hotel, in storage order
+        self._groups = list(product(range(len(self.room_types)), range(len(self.categories))))
+        groups = len(self._groups)
+
+        # Hotel columns
+        self._keys: list[str] = []
+        self._names: list[str] = []
+        self._countries: list[str] = []
+        self._cities: list[str] = []
+        self._zip_codes: list[str] = []
+        self._addresses: list[str] = []
+        # Room columns, sorted by hotel, room type and category
+        self._room_hotels = array("I")
+        self._room_ids: list[str] = []
+        self._floors = array("H")
+        self._guests = array("B")
+        self._prices_off = array("d")
+        self._prices_peak = array("d")
+        # Rooms of group g of hotel h: [_offsets[h * groups + g], _offsets[h * groups + g + 1])
+        self._offsets = array("I", [0])
+        # Precomputed price ranges of every group of every hotel
+        self._min_off, self._max_off, self._sum_off = array("d"), array("d"), array("d")
+        self._min_peak, self._max_peak, self._sum_peak = array("d"), array("d"), array("d")
+
+        # Secondary indexes
+        self._by_key: dict[str, int] = {}
+        self._by_name: dict[str, array] = {}
+        self._by_city: dict[str, array] = {}
+        self._by_country: dict[str, array] = {}
+        # Hotels having rooms of each group, and rooms of each group
+        self._by_group: dict[int, array] = {group: array("I") for group in range(groups)}
+        self._group_rooms = array("I", [0] * groups)
+
+        for hotel in hotels:
+            self._add_hotel(hotel)
+
+    @classmethod
+    def from_file(cls, path: str) -> "HotelCatalog":
+        """
+        Load a catalog from a hotels.json file.
+
+        Args:
+            path: Path to the hotels.json file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file)["Hotels"])
+
+    def _add_hotel(self, hotel: dict) -> None:
+        """Append a hotel and its rooms to the columns and the indexes."""
+        key = str(hotel["hotelkey"])
+        if key in self._by_key:
+            raise ValueError(f"Duplicate hotel key '{key}' in the hotel catalog.")
+        index = len(self._keys)
+        address = hotel["Address"]
+        self._by_key[key] = index
+        self._keys.append(key)
+        self._names.append(hotel["Name"])
+        self._countries.append(intern(address["Country"]))
+        self._cities.append(intern(address["City"]))
+        self._zip_codes.append(str(address["ZipCode"]))
+        self._addresses.append(address["Address"])
+        for index_map, value in ((self._by_name, hotel["Name"]),
+                                 (self._by_city, address["City"]),
+                                 (self._by_country, address["Country"])):
+            index_map.setdefault(_fold(value), array("I")).append(index)
+
+        grouped: dict[tuple[int, int], list[dict]] = {}
+        for room in hotel["Rooms"]:
+            group_key = (self._type_codes[room["Type"]], self._category_codes[room["Category"]])
+            grouped.setdefault(group_key, []).append(room)
+        for group, group_key in enumerate(self._groups):
+            rooms = grouped.get(group_key, [])
+            prices_off = [float(room["PriceOffSeason"]) for room in rooms]
+            prices_peak = [float(room["PricePeakSeason"]) for room in rooms]
+            self._room_hotels.extend([index] * len(rooms))
+            # Room ids repeat from hotel to hotel ("01-001"...): store them once
+            self._room_ids.extend([intern(room["RoomId"]) for room in rooms])
+            self._floors.extend([int(room["Floor"]) for room in rooms])
+            self._guests.extend([int(room["Guests"]) for room in rooms])
+            self._prices_off.extend(prices_off)
+            self._prices_peak.extend(prices_peak)
+            self._offsets.append(len(self._room_ids))
+            if rooms:
+                self._by_group[group].append(index)
+                self._group_rooms[group] += len(rooms)
+            self._min_off.append(min(prices_off, default=0.0))
+            self._max_off.append(max(prices_off, default=0.0))
+            self._sum_off.append(sum(prices_off))
+            self._min_peak.append(min(prices_peak, default=0.0))
+            self._max_peak.append(max(prices_peak, default=0.0))
+            self._sum_peak.append(sum(prices_peak))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._by_key
+
+    @property
+    def room_count(self) -> int:
+        """Number of rooms of all the hotels."""
+        return len(self._room_ids)
+
+    def _hotel(self, index: int) -> Hotel:
+        groups = len(self._groups)
+        return Hotel(self._keys[index], self._names[index], self._countries[index],
+                     self._cities[index], self._zip_codes[index], self._addresses[index],
+                     self._offsets[(index + 1) * groups] - self._offsets[index * groups])
+
+    def _rooms_in(self, group: int, positions: range) -> list[Room]:
+        """Build the rooms of a range of positions, all of one hotel and room group."""
+        if not positions:
+            return []
+        start, stop = positions.start, positions.stop
+        type_code, category_code = self._groups[group]
+        hotel_key = self._keys[self._room_hotels[start]]
+        room_type, category = self.room_types[type_code], self.categories[category_code]
+        return [Room(hotel_key, room_id, floor, room_type, category, guests, off, peak)
+                for room_id, floor, guests, off, peak in zip(
+                    self._room_ids[start:stop], self._floors[start:stop],
+                    self._guests[start:stop], self._prices_off[start:stop],
+                    self._prices_peak[start:stop], strict=True)]
+
+    def _matching_groups(self, room_type: str | None, category: str | None) -> list[int]:
+        """Return the room groups of a room type and category (None matches any)."""
+        type_code = self._type_codes.get(room_type) if room_type is not None else None
+        category_code = self._category_codes.get(category) if category is not None else None
+        if (room_type is not None and type_code is None) or \
+                (category is not None and category_code is None):
+            return []
+        return [group for group, (group_type, group_category) in enumerate(self._groups)
+                if type_code in (None, group_type) and category_code in (None, group_category)]
+
+    def _hotel_indexes(self, key: str | None = None, name: str | None = None,
+                       city: str | None = None, country: str | None = None,
+                       groups: list[int] | None = None) -> Iterable[int]:
+        """Return the indexes of the hotels matching every given filter, in catalog order."""
+        width = len(self._groups)
+        # (candidate hotels, test of a hotel) of each filter
+        filters = []
+        if key is not None:
+            key = str(key)
+            index = self._by_key.get(key)
+            filters.append((array("I") if index is None else array("I", [index]),
+                            lambda i: self._keys[i] == key))
+        for index_map, column, value in ((self._by_name, self._names, name),
+                                         (self._by_city, self._cities, city),
+                                         (self._by_country, self._countries, country)):
+            if value is not None:
+                folded = _fold(value)
+                filters.append((
+                    index_map.get(folded, array("I")),
+                    lambda i, column=column, folded=folded: _fold(column[i]) == folded
+                ))
+        if groups is not None and len(groups) == 1:
+            group = groups[0]
+            filters.append((self._by_group[group],
+                            lambda i: self._offsets[i * width + group + 1]
+                            > self._offsets[i * width + group]))
+        if not filters:
+            return range(len(self._keys))
+        # Scan the smallest candidate list, testing the other filters on each hotel
+        filters.sort(key=lambda item: len(item[0]))
+        candidates, tests = filters[0][0], [test for _, test in filters[1:]]
+        if not tests:
+            return candidates
+        return [index for index in candidates if all(test(index) for test in tests)]
+
+    def hotel(self, key: str) -> Hotel | None:
+        """
+        Get a hotel by key.
+
+        Args:
+            key: Hotel key (the hotelkey of hotels.json)
+
+        Returns:
+            The hotel, or None if the catalog has no hotel with this key
+        """
+        index = self._by_key.get(str(key))
+        return None if index is None else self._hotel(index)
+
+    def find_hotels(self, name: str | None = None, city: str | None = None,
+                    country: str | None = None) -> list[Hotel]:
+        """
+        Find the hotels matching every given filter (no filter: every hotel).
+
+        Args:
+            name: Hotel name (case insensitive)
+            city: City (case insensitive)
+            country: Country (case insensitive)
+
+        Returns:
+            The matching hotels, in the order of the catalog
+        """
+        return [self._hotel(index) for index in self._hotel_indexes(None, name, city, country)]
+
+    def _positions(self, key, name, city, country, room_type,
+                   category) -> Iterator[tuple[int, range]]:
+        """Yield the room group and the range of positions of the matching rooms."""
+        groups = self._matching_groups(room_type, category)
+        if not groups:
+            return
+        width = len(self._groups)
+        for index in self._hotel_indexes(key, name, city, country, groups):
+            for group in groups:
+                base = index * width + group
+                yield group, range(self._offsets[base], self._offsets[base + 1])
+
+    def rooms(self, hotel_key: str | None = None, name: str | None = None,
+              city: str | None = None, country: str | None = None,
+              room_type: str | None = None, category: str | None = None) -> list[Room]:
+        """
+        Find the rooms matching every given filter.
+
+        Args:
+            hotel_key: Key of the hotel
+            name: Hotel name (case insensitive)
+            city: City of the hotels (case insensitive)
+            country: Country of the hotels (case insensitive)
+            room_type: Room type ("Single", "Double"...)
+            category: Room category ("Standard", "Premium"...)
+
+        Returns:
+            The matching rooms, by hotel, room type and category
+        """
+        rooms = []
+        for group, positions in self._positions(hotel_key, name, city, country, room_type,
+                                                category):
+            rooms.extend(self._rooms_in(group, positions))
+        return rooms
+
+    def count_rooms(self, hotel_key: str | None = None, name: str | None = None,
+                    city: str | None = None, country: str | None = None,
+                    room_type: str | None = None, category: str | None = None) -> int:
+        """Count the rooms matching every given filter (see rooms), without building them."""
+        if hotel_key is None and name is None and city is None and country is None:
+            return sum(self._group_rooms[group]
+                       for group in self._matching_groups(room_type, category))
+        return sum(len(positions) for _, positions in self._positions(
+            hotel_key, name, city, country, room_type, category))
+
+    def room_stats(self, hotel_key: str, room_type: str | None = None,
+                   category: str | None = None) -> dict[tuple[str, str], RoomStats]:
+        """
+        Get the precomputed room count and price ranges of a hotel.
+
+        Args:
+            hotel_key: Key of the hotel
+            room_type: Only this room type
+            category: Only this room category
+
+        Returns:
+            The statistics of every (room type, category) of the hotel having rooms
+        """
+        index = self._by_key.get(str(hotel_key))
+        if index is None:
+            return {}
+        width = len(self._groups)
+        stats = {}
+        for group in self._matching_groups(room_type, category):
+            base = index * width + group
+            rooms = self._offsets[base + 1] - self._offsets[base]
+            if not rooms:
+                continue
+            type_code, category_code = self._groups[group]
+            stats[(self.room_types[type_code], self.categories[category_code])] = RoomStats(
+                rooms=rooms,
+                min_price_off_season=self._min_off[base],
+                max_price_off_season=self._max_off[base],
+                avg_price_off_season=self._sum_off[base] / rooms,
+                min_price_peak_season=self._min_peak[base],
+                max_price_peak_season=self._max_peak[base],
+                avg_price_peak_season=self._sum_peak[base] / rooms,
+            )
+        return stats
+
+
+@cache
+def get_hotel_catalog(path: str) -> HotelCatalog:
+    """
+    Get the catalog of a hotels.json file, loading it on the first call only.
+
+    Args:
+        path: Path to the hotels.json file
+
+    Returns:
+        The shared catalog of the file
+    """
+    return HotelCatalog.from_file(path)
@@ -0,0 +1,465 @@
+"""
+Knowledge Index Module
+
+This module keeps a BM25 retrieval index over the Markdown files written by the
+bookings-db generator (hotel_details.md, hotel_rooms.md and hotel_bookings.md), so
+that the relevant hotel, room and booking chunks can be retrieved for a question
+instead of loading whole files per request.
+
+The files are split into chunks at their headings; tables are split into groups of
+rows that repeat the table header. Every chunk is indexed with the path of its
+headings, so a chunk of bookings still matches the name of its hotel.
+
+The index is persisted in a directory with one segment per Markdown file:
+
+- ``<segment>.json``: lexicon (term -> postings offset and document frequency),
+  chunk headings, token counts and text offsets
+- ``<segment>.post``: postings, (chunk, term frequency) pairs of uint32, memory-mapped
+- ``<segment>.text``: UTF-8 text of the chunks, memory-mapped
+- ``manifest.json``: size, modification time and SHA-256 of every indexed file
+
+``update`` only rebuilds the segments of the files that changed since the last
+build (same size and modification time, or same content hash, reuse the segment)
+and drops the segments of the files no longer indexed. Files are written to a
+temporary name and renamed into place, so a reader never sees a partial segment.
+Only the segment files of the directory are ever deleted.
+
+The module only uses the standard library. The API does not answer from the index
+yet: it is the retrieval step for the agent that replaces the hardcoded responses.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple
+
+INDEX_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+# Files of a segment: <file stem>-<first 16 hex digits of its SHA-256>.<json|post|text>
+SEGMENT_SUFFIXES = (".json", ".post", ".text")
+SEGMENT_NAME_PATTERN = re.compile(r".+-[0-9a-f]{16}")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Data rows of a table per chunk, and characters of text per chunk
+TABLE_ROWS_PER_CHUNK = 20
+MAX_CHUNK_CHARS = 2000
+
+TOKEN_PATTERN = re.compile(r"\w+(?:[-.']\w+)*")
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+STOPWORDS = frozenset(
+    "a an and are as at be by de del el en for from how in is it la las los of on or "
+    "the to was what when where which who with y".split()
+)
+
+
+class Chunk(NamedTuple):
+    """A chunk of a Markdown file."""
+
+    heading: str
+    text: str
+
+
+class SearchResult(NamedTuple):
+    """A chunk found by a search, with its BM25 score."""
+
+    score: float
+    source: str
+    heading: str
+    text: str
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split a text into index terms.
+
+    Terms are lowercase words; hyphens, dots and apostrophes inside a word are kept,
+    so room ids (01-001), dates (2025-01-31) and prices (115.5) are single terms.
+    Stopwords are dropped.
+    """
+    return [token for token in TOKEN_PATTERN.findall(text.lower().replace("_", " "))
+            if token not in STOPWORDS]
+
+
+def _is_table_row(line: str) -> bool:
+    return line.startswith("|")
+
+
+def _is_table_separator(line: str) -> bool:
+    return _is_table_row(line) and not line.strip("|-: \t")
+
+
+def _text_chunks(lines: list[str]) -> Iterator[str]:
+    """Group non-table lines into chunks of at most MAX_CHUNK_CHARS, at blank lines."""
+    text: list[str] = []
+    size = 0
+    for line in lines:
+        if not line.strip() and size >= MAX_CHUNK_CHARS:
+            yield "\n".join(text).strip()
+            text, size = [], 0
+        text.append(line)
+        size += len(line) + 1
+    if "".join(text).strip():
+        yield "\n".join(text).strip()
+
+
+def _table_chunks(lines: list[str]) -> Iterator[str]:
+    """Split a table into chunks of TABLE_ROWS_PER_CHUNK rows, repeating its header."""
+    header: list[str] = []
+    if len(lines) > 1 and _is_table_separator(lines[1]):
+        header, lines = lines[:2], lines[2:]
+    for start in range(0, len(lines), TABLE_ROWS_PER_CHUNK):
+        yield "\n".join(header + lines[start:start + TABLE_ROWS_PER_CHUNK])
+    if not lines and header:
+        yield "\n".join(header)
+
+
+def _block_chunks(lines: list[str]) -> Iterator[str]:
+    """Chunks of the lines of a section, tables apart from the text around them."""
+    block: list[str] = []
+    in_table = False
+    for line in lines + [""]:
+        if _is_table_row(line) != in_table:
+            if in_table:
+                yield from _table_chunks(block)
+            else:
+                yield from _text_chunks(block)
+            block, in_table = [], not in_table
+        block.append(line)
+    if block:
+        yield from _text_chunks(block)
+
+
+def chunk_markdown(text: str) -> list[Chunk]:
+    """
+    Split a Markdown document into chunks.
+
+    Every section (the lines below a heading, up to the next heading) is a chunk,
+    split further when it holds a table (TABLE_ROWS_PER_CHUNK rows per chunk, with
+    the table header) or more than MAX_CHUNK_CHARS characters of text. Horizontal
+    rules are dropped.
+
+    Args:
+        text: Markdown document
+
+    Returns:
+        The chunks, with the path of their headings (e.g. "Obsidian Tower > Rooms >
+        Room 01-001")
+    """
+    chunks: list[Chunk] = []
+    headings: list[tuple[int, str]] = []
+    section: list[str] = []
+
+    def flush():
+        heading = " > ".join(title for _, title in headings)
+        chunks.extend(Chunk(heading, chunk) for chunk in _block_chunks(section) if chunk)
+
+    for line in text.splitlines():
+        match = HEADING_PATTERN.match(line)
+        if match is None:
+            if line.strip() not in ("---", "***", "___"):
+                section.append(line.rstrip())
+            continue
+        flush()
+        section = []
+        level = len(match.group(1))
+        while headings and headings[-1][0] >= level:
+            headings.pop()
+        headings.append((level, match.group(2)))
+    flush()
+    return chunks
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file under a temporary name, then rename it into place."""
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, path)
+
+
+def build_segment(source: Path, index_dir: Path, name: str) -> None:
+    """
+    Chunk and index a Markdown file into the segment files ``name.*`` of index_dir.
+
+    Args:
+        source: Markdown file
+        index_dir: Directory of the index
+        name: Name of the segment
+    """
+    chunks = chunk_markdown(source.read_text(encoding="utf-8"))
+    postings: dict[str, list[int]] = {}
+    lengths = []
+    text_offsets = [0]
+    texts = bytearray()
+    for number, chunk in enumerate(chunks):
+        terms = Counter(tokenize(chunk.heading))
+        terms.update(tokenize(chunk.text))
+        lengths.append(sum(terms.values()))
+        for term, frequency in terms.items():
+            postings.setdefault(term, []).extend((number, frequency))
+        texts += chunk.text.encode("utf-8")
+        text_offsets.append(len(texts))
+
+    lexicon = {}
+    data = array("I")
+    for term in sorted(postings):
+        lexicon[term] = (len(data) // 2, len(postings[term]) // 2)
+        data.extend(postings[term])
+
+    _write_atomic(index_dir / f"{name}.post", data.tobytes())
+    _write_atomic(index_dir / f"{name}.text", bytes(texts))
+    _write_atomic(index_dir / f"{name}.json", json.dumps({
+        "version": INDEX_VERSION,
+        "byteorder": sys.byteorder,
+        "source": str(source),
+        "headings": [chunk.heading for chunk in chunks],
+        "lengths": lengths,
+        "text_offsets": text_offsets,
+        "terms": lexicon,
+    }, separators=(",", ":")).encode("utf-8"))
+
+
+class _Segment:
+    """The memory-mapped index of one Markdown file."""
+
+    def __init__(self, index_dir: Path, name: str):
+        with open(index_dir / f"{name}.json", encoding="utf-8") as file:
+            meta = json.load(file)
+        if meta["version"] != INDEX_VERSION or meta["byteorder"] != sys.byteorder:
+            raise ValueError(f"Segment {name} was written by another index version")
+        self.name = name
+        self.source = meta["source"]
+        self.headings: list[str] = meta["headings"]
+        self.lengths = array("I", meta["lengths"])
+        self.text_offsets: list[int] = meta["text_offsets"]
+        self.terms: dict[str, list[int]] = meta["terms"]
+        self._maps = []
+        self.postings = self._map(index_dir / f"{name}.post").cast("I")
+        self.texts = self._map(index_dir / f"{name}.text")
+
+    def _map(self, path: Path) -> memoryview:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return memoryview(b"")
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped)
+
+    def text(self, chunk: int) -> str:
+        start, end = self.text_offsets[chunk], self.text_offsets[chunk + 1]
+        return str(self.texts[start:end], "utf-8")
+
+    def close(self) -> None:
+        self.postings.release()
+        self.texts.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+
+
+class KnowledgeIndex:
+    """
+    Persisted BM25 index over a set of Markdown files.
+
+    The index is brought up to date with ``update`` (``get_knowledge_index`` does it
+    on its first call) and searched with ``search``. Document frequencies and
+    lengths are global to all the files, so scores are comparable across files.
+    """
+
+    def __init__(self, index_dir: str, files: Iterable[str]):
+        """
+        Open the index of a set of files, without building it.
+
+        Args:
+            index_dir: Directory of the index, created on the first update
+            files: Markdown files to index
+        """
+        self.index_dir = Path(index_dir)
+        self.files = [Path(file).resolve() for file in files]
+        self._segments: list[_Segment] = []
+        self._norms: list[array] = []
+        self._chunks = 0
+        self._avg_length = 0.0
+
+    def __enter__(self) -> "KnowledgeIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of indexed chunks."""
+        return self._chunks
+
+    def _read_manifest(self) -> dict:
+        try:
+            with open(self.index_dir / MANIFEST_FILE, encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if manifest.get("version") != INDEX_VERSION:
+            return {}
+        return manifest["files"]
+
+    def update(self) -> dict[str, str]:
+        """
+        Bring the index up to date with the files, rebuilding only what changed.
+
+        Returns:
+            The status of every file: "built", "reused" or "removed"
+
+        Raises:
+            FileNotFoundError: If a file to index does not exist
+        """
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        previous = self._read_manifest()
+        entries = {}
+        status = {}
+        for path in self.files:
+            stat = path.stat()
+            entry = previous.get(str(path))
+            if entry is not None and (entry["size"], entry["mtime_ns"]) == (
+                    stat.st_size, stat.st_mtime_ns) and self._has_segment(entry["segment"]):
+                entries[str(path)] = entry
+                status[str(path)] = "reused"
+                continue
+            sha256 = _file_sha256(path)
+            segment = f"{path.stem}-{sha256[:16]}"
+            if entry is None or entry["sha256"] != sha256 or not self._has_segment(segment):
+                build_segment(path, self.index_dir, segment)
+                status[str(path)] = "built"
+            else:
+                status[str(path)] = "reused"
+            entries[str(path)] = {"segment": segment, "size": stat.st_size,
+                                  "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+        for path in previous.keys() - entries.keys():
+            status[path] = "removed"
+
+        _write_atomic(self.index_dir / MANIFEST_FILE, json.dumps(
+            {"version": INDEX_VERSION, "files": entries}, indent=2).encode("utf-8"))
+        self._open([entry["segment"] for entry in entries.values()])
+        self._remove_stale_segments({entry["segment"] for entry in entries.values()})
+        return status
+
+    def _has_segment(self, name: str) -> bool:
+        return all((self.index_dir / f"{name}{suffix}").exists()
+                   for suffix in SEGMENT_SUFFIXES)
+
+    def _remove_stale_segments(self, live: set) -> None:
+        """Delete the segment files of the index directory not in use (other files stay)."""
+        for path in self.index_dir.iterdir():
+            if path.suffix in SEGMENT_SUFFIXES and SEGMENT_NAME_PATTERN.fullmatch(path.stem) \
+                    and path.stem not in live:
+                path.unlink(missing_ok=True)
+
+    def _open(self, names: list[str]) -> None:
+        """Map the segments and precompute the BM25 length norms of their chunks."""
+        self.close()
+        self._segments = [_Segment(self.index_dir, name) for name in names]
+        self._chunks = sum(len(segment.lengths) for segment in self._segments)
+        total = sum(sum(segment.lengths) for segment in self._segments)
+        self._avg_length = total / self._chunks if self._chunks else 0.0
+        scale = BM25_B / self._avg_length if self._avg_length else 0.0
+        self._norms = [array("d", (BM25_K1 * (1 - BM25_B + scale * length)
+                                   for length in segment.lengths))
+                       for segment in self._segments]
+
+    def close(self) -> None:
+        """Unmap the segments."""
+        for segment in self._segments:
+            segment.close()
+        self._segments, self._norms = [], []
+        self._chunks = 0
+
+    def search(self, query: str, k: int = 5) -> list[SearchResult]:
+        """
+        Find the chunks that best match a query.
+
+        Args:
+            query: Free text query
+            k: Maximum number of results
+
+        Returns:
+            The k chunks with the highest BM25 score, best first (no chunk when no
+            term of the query is indexed)
+        """
+        terms = set(tokenize(query))
+        scores: dict[tuple[int, int], float] = {}
+        for term in terms:
+            df = sum(segment.terms[term][1] for segment in self._segments
+                     if term in segment.terms)
+            if not df:
+                continue
+            idf = math.log(1 + (self._chunks - df + 0.5) / (df + 0.5))
+            for number, segment in enumerate(self._segments):
+                entry = segment.terms.get(term)
+                if entry is None:
+                    continue
+                offset, count = entry
+                postings = segment.postings[2 * offset:2 * (offset + count)]
+                norms = self._norms[number]
+                for chunk, frequency in zip(postings[::2], postings[1::2], strict=True):
+                    key = (number, chunk)
+                    scores[key] = scores.get(key, 0.0) + idf * frequency * (BM25_K1 + 1) / (
+                        frequency + norms[chunk])
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [SearchResult(score, self._segments[number].source,
+                             self._segments[number].headings[chunk],
+                             self._segments[number].text(chunk))
+                for (number, chunk), score in best]
+
+
+@cache
+def get_knowledge_index(index_dir: str, files: tuple[str, ...]) -> KnowledgeIndex:
+    """
+    Get the index of a set of files, updating it on the first call only.
+
+    Args:
+        index_dir: Directory of the index
+        files: Markdown files to index
+
+    Returns:
+        The shared, up to date index of the files
+    """
+    index = KnowledgeIndex(index_dir, files)
+    index.update()
+    return index
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Update an index and run a search: knowledge_index.py INDEX_DIR QUERY FILE..."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 3:
+        raise SystemExit("Usage: python -m util.knowledge_index INDEX_DIR QUERY FILE...")
+    with KnowledgeIndex(argv[0], argv[2:]) as index:
+        for path, state in index.update().items():
+            print(f"{state:<8} {path}")
+        for result in index.search(argv[1]):
+            print(f"\n[{result.score:.2f}] {Path(result.source).name}: {result.heading}")
+            print(result.text)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,44 @@ Logger Configuration Module
 This module provides functionality for configuring and managing logging in the application.
 It sets up a logger with appropriate formatting, handlers, and log levels to ensure
 consistent and informative logging throughout the application.
+
+The logger does not write to the console or the log file itself: it puts the records on a
+queue, and a QueueListener thread formats and writes them. Logging from the event loop
+therefore never waits for disk writes or log file rotation.
 """
 
+import atexit
 import logging
+import os
+import queue
+import random
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+from util.configuration import settings
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    Queue handler leaving the formatting of the records to the listener thread.
+
+    The standard QueueHandler merges the message with its arguments before queuing the
+    record; this one queues the record as is, so only the enqueue runs on the caller's
+    thread. Log arguments must not be mutated after the logging call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 # Create logs directory if it doesn't exist
 log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
 
 # Configure the logger
 logger = logging.getLogger("hospitality_api")
-logger.setLevel(logging.INFO)
+logger.setLevel(settings.LOG_LEVEL)
 
 # Create formatters
 console_formatter = logging.Formatter(
@@ -30,17 +54,59 @@ file_formatter = logging.Formatter(
 # Create handlers
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setFormatter(console_formatter)
-logger.addHandler(console_handler)
 
-# Configure file handler with rotation
+# Configure file handler with rotation. Rotating a file shared by several processes
+# loses records, so each worker process writes its own log file.
+log_file = (
+    f"logs/hospitality_api.{os.getpid()}.log" if settings.API_WORKERS > 1
+    and not settings.API_RELOAD else "logs/hospitality_api.log"
+)
 file_handler = RotatingFileHandler(
-    "logs/hospitality_api.log",
+    log_file,
     maxBytes=10 * 1024 * 1024,  # 10MB
     backupCount=5,
     encoding="utf-8",
 )
 file_handler.setFormatter(file_formatter)
-logger.addHandler(file_handler)
 
+# The logger only enqueues records; the listener thread runs the handlers
+log_queue = queue.SimpleQueue()
+logger.addHandler(DeferredFormatQueueHandler(log_queue))
+log_listener = QueueListener(log_queue, console_handler, file_handler)
+log_listener.start()
+
+# Flush the queued records on exit
+atexit.register(log_listener.stop)
+
+
+def should_log_payload(level: int = logging.INFO) -> bool:
+    """
+    Decide whether the payloads of a message are logged.
+
+    Args:
+        level: Level of the payload log records
+
+    Returns:
+        True for a LOG_PAYLOAD_SAMPLE_RATE share of the calls, if the level is enabled
+    """
+    if not logger.isEnabledFor(level):
+        return False
+    rate = settings.LOG_PAYLOAD_SAMPLE_RATE
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+def truncate_payload(payload: str) -> str:
+    """
+    Shorten a message payload for logging.
 
+    Args:
+        payload: Message payload
 
+    Returns:
+        The payload cut to LOG_PAYLOAD_MAX_CHARS characters, with the number of characters
+        left out
+    """
+    max_chars = settings.LOG_PAYLOAD_MAX_CHARS
+    if len(payload) <= max_chars:
+        return payload
+    return f"{payload[:max_chars]}... [{len(payload) - max_chars} more chars]"
@@ -0,0 +1,116 @@
+"""
+Message Protocol Module
+
+This module builds the frames sent to the client on the WebSocket. Every frame is
+a JSON message wrapped in JSONSTART...JSONEND markers.
+
+A response is sent either as one complete message::
+
+    {"role": "assistant", "content": "..."}
+
+or, in streaming mode, as chunk frames followed by a final frame, all carrying the
+same message id. The client appends the content of the chunks in order; the final
+frame closes the message with its complete content and number of chunks, so that
+the client renders the whole text even if it received no chunk (empty response)::
+
+    {"type": "chunk", "message_id": "...", "role": "assistant", "content": "..."}
+    {"type": "final", "message_id": "...", "role": "assistant", "content": "...", "chunks": 2}
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from uuid import uuid4
+
+# A word with the whitespace around it, so that joining the tokens restores the text
+_TOKEN_PATTERN = re.compile(r"\s*\S+\s*")
+
+
+def frame_message(message: dict) -> str:
+    """
+    Serialize a message and wrap it in the frame markers.
+
+    Args:
+        message: JSON-serializable message
+
+    Returns:
+        The framed message
+    """
+    return f"JSONSTART{json.dumps(message)}JSONEND"
+
+
+def new_message_id() -> str:
+    """
+    Create the id shared by the frames of a streamed message.
+
+    Returns:
+        A unique message id
+    """
+    return uuid4().hex
+
+
+def chunk_frame(message_id: str, content: str, role: str = "assistant") -> str:
+    """
+    Build a chunk frame of a streamed message.
+
+    Args:
+        message_id: Id of the streamed message
+        content: Partial content, appended by the client to the previous chunks
+        role: Role of the message author
+
+    Returns:
+        The framed chunk
+    """
+    return frame_message({
+        "type": "chunk",
+        "message_id": message_id,
+        "role": role,
+        "content": content
+    })
+
+
+def final_frame(message_id: str, content: str, chunks: int, role: str = "assistant") -> str:
+    """
+    Build the final frame closing a streamed message.
+
+    Args:
+        message_id: Id of the streamed message
+        content: Complete content of the message, the chunks joined
+        chunks: Number of chunk frames sent before
+        role: Role of the message author
+
+    Returns:
+        The framed end of message
+    """
+    return frame_message({
+        "type": "final",
+        "message_id": message_id,
+        "role": role,
+        "content": content,
+        "chunks": chunks
+    })
+
+
+def split_text_chunks(text: str, words_per_chunk: int) -> Iterator[str]:
+    """
+    Split a text into chunks of a few words, keeping its whitespace.
+
+    Args:
+        text: Text to split
+        words_per_chunk: Number of words per chunk
+
+    Yields:
+        Consecutive chunks of the text; joined, they restore it
+
+    Raises:
+        ValueError: If words_per_chunk is not positive
+    """
+    if words_per_chunk < 1:
+        raise ValueError("The number of words per chunk must be a positive integer.")
+    tokens = _TOKEN_PATTERN.findall(text)
+    if not tokens:
+        if text:
+            yield text
+        return
+    for start in range(0, len(tokens), words_per_chunk):
+        yield "".join(tokens[start:start + words_per_chunk])
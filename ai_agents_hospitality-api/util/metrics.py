@@ -0,0 +1,186 @@
+"""
+Metrics Module
+
+This module provides minimal in-process metrics (counters, gauges and histograms) and
+renders them in the Prometheus text exposition format for the /metrics endpoint.
+
+Updating a metric is a few attribute updates, with no lock: metrics are updated from the
+event loop thread. Each worker process has its own metrics.
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+
+# Default histogram buckets for latencies, in seconds
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Default histogram buckets for payload sizes, in bytes
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as in the Prometheus text format."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing value, or read from a function when collected."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str,
+                 function: Callable[[], float] | None = None):
+        """
+        Args:
+            name: Metric name
+            documentation: Help text
+            function: Function returning the (never decreasing) value, called when the
+                metrics are rendered
+        """
+        self.name = name
+        self.documentation = documentation
+        self.value = 0.0
+        self._function = function
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter."""
+        self.value += amount
+
+    def samples(self) -> list[str]:
+        value = self._function() if self._function is not None else self.value
+        return [f"{self.name} {_format_value(value)}"]
+
+
+class Gauge:
+    """Value that goes up and down, or is read from a function when collected."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str,
+                 function: Callable[[], float] | None = None):
+        """
+        Args:
+            name: Metric name
+            documentation: Help text
+            function: Function returning the value, called when the metrics are rendered
+        """
+        self.name = name
+        self.documentation = documentation
+        self.value = 0.0
+        self._function = function
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        """Set the gauge value."""
+        self.value = value
+
+    def samples(self) -> list[str]:
+        value = self._function() if self._function is not None else self.value
+        return [f"{self.name} {_format_value(value)}"]
+
+
+class Histogram:
+    """Distribution of observed values, counted in fixed buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float]):
+        """
+        Args:
+            name: Metric name
+            documentation: Help text
+            buckets: Upper bounds of the buckets, in increasing order
+
+        Raises:
+            ValueError: If the buckets are empty or not sorted
+        """
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("Histogram buckets must be a non-empty increasing sequence.")
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        # One count per bucket plus the +Inf bucket; made cumulative when rendered
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Record the duration of the block, in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def samples(self) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self._counts, strict=True):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {_format_value(self.sum)}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Set of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str,
+                function: Callable[[], float] | None = None) -> Counter:
+        """Create and register a counter, optionally read from a function."""
+        return self._register(Counter(name, documentation, function))
+
+    def gauge(self, name: str, documentation: str,
+              function: Callable[[], float] | None = None) -> Gauge:
+        """Create and register a gauge, optionally read from a function."""
+        return self._register(Gauge(name, documentation, function))
+
+    def histogram(self, name: str, documentation: str,
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        """Create and register a histogram."""
+        return self._register(Histogram(name, documentation, buckets))
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            The metrics text
+        """
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
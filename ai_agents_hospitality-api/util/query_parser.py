@@ -0,0 +1,240 @@
+"""
+Query Parser Module
+
+This module recognizes the hotel questions answered from the bookings database: the
+query shapes of the bookings-db query generator (room prices per type and season,
+rooms per type, meal plan charges, hotel details) and hotel occupancy.
+
+A query is parsed into a QueryIntent: the kind of question, the hotels, cities or
+countries it is about (matched against the hotels of the database) and its filters.
+"""
+
+import calendar
+import difflib
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+ROOM_TYPES = ("Single", "Double", "Triple")
+ROOM_CATEGORIES = ("Standard", "Premium")
+
+# Meal plan names as written in the queries, and the meal plan of the data they refer to
+MEAL_PLAN_ALIASES = {
+    "room only": "Room Only",
+    "no meal plan": "Room Only",
+    "bed & breakfast": "Room and Breakfast",
+    "bed and breakfast": "Room and Breakfast",
+    "room and breakfast": "Room and Breakfast",
+    "half board": "Half Board",
+    "full board": "Full Board",
+    "all inclusive": "All Inclusive",
+    "all-inclusive": "All Inclusive",
+}
+
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+_YEAR_PATTERN = re.compile(r"\b(20\d{2})\b")
+_WORD_PATTERN = re.compile(r"[a-z]+")
+
+# Stands for a recognized hotel, city or country name in the remainder of a query
+_NAME_PLACEHOLDER = "@"
+
+# First word after "in" or "at" (and an article), where a query names its place
+_PLACE_PATTERN = re.compile(r"\b(?:in|at)\s+['\"]?(?:(?:the|a|an)\s+)?([a-z@]+)")
+
+# Words following "in" or "at" that do not name a place
+_NOT_PLACE_WORDS = {
+    "hotel", "hotels", "each", "all", "every", "any", "total", "general", "average",
+    "peak", "off", "high", "low", "season", "seasons", "price", "prices", "number",
+    "terms", "comparison", "particular", "this", "that", "these", "those", "our", "your",
+    "their", "its", "both", "which", "what", "order", "addition", "case", "euros", "euro",
+    "detail", "details", "room", "rooms", "floor", "floors", "year", "month", "week",
+    *_MONTHS,
+}
+
+# Minimum similarity of a misspelled room type or category (e.g. "sigle") to its name
+_MISSPELLING_CUTOFF = 0.8
+
+
+@dataclass
+class QueryIntent:
+    """
+    A recognized question about the hotels.
+
+    ``kind`` is one of ``room_prices``, ``room_counts``, ``meal_charges``,
+    ``hotel_details`` and ``occupancy``. The hotels, cities and countries hold the
+    names of the database; when all are empty the question is about every hotel.
+    ``unresolved`` holds the words of the query that seem to name a place, a room
+    type or a room category but match none of the data (e.g. "g victoria", "sigle").
+    """
+
+    kind: str
+    hotels: list[str] = field(default_factory=list)
+    cities: list[str] = field(default_factory=list)
+    countries: list[str] = field(default_factory=list)
+    room_type: str | None = None
+    room_category: str | None = None
+    season: str | None = None
+    meal_plan: str | None = None
+    by_floor: bool = False
+    month: int | None = None
+    year: int | None = None
+    unresolved: list[str] = field(default_factory=list)
+
+
+def _names_pattern(names: Iterable[str]) -> re.Pattern | None:
+    """Build a case-insensitive pattern matching any of the names as whole words."""
+    names = sorted({name for name in names if name}, key=len, reverse=True)
+    if not names:
+        return None
+    alternation = "|".join(re.escape(name) for name in names)
+    return re.compile(rf"(?<!\w)({alternation})(?!\w)", re.IGNORECASE)
+
+
+def _find_names(pattern: re.Pattern | None, canonical: dict, text: str) -> list[str]:
+    """Return the canonical names found in a text, in order of appearance, once each."""
+    if pattern is None:
+        return []
+    found = []
+    for match in pattern.finditer(text):
+        name = canonical[match.group(1).lower()]
+        if name not in found:
+            found.append(name)
+    return found
+
+
+def _single(values: Iterable[str], words: set) -> str | None:
+    """Return the only value named in the words (or its plural), or None if none or several are."""
+    named = [value for value in values if {value.lower(), value.lower() + "s"} & words]
+    return named[0] if len(named) == 1 else None
+
+
+def _misspelled(values: Iterable[str], words: set) -> list[str]:
+    """Return the words that are close to one of the values, without being one of them."""
+    names = [value.lower() for value in values]
+    known = set(names) | {name + "s" for name in names}
+    return sorted(word for word in words - known
+                  if difflib.get_close_matches(word, names, n=1, cutoff=_MISSPELLING_CUTOFF))
+
+
+class QueryParser:
+    """Parser of hotel questions, knowing the hotels, cities and countries of the data."""
+
+    def __init__(self, hotels: Iterable[tuple[str, str, str]]):
+        """
+        Args:
+            hotels: Name, city and country of every hotel
+        """
+        self.hotels = [tuple(hotel) for hotel in hotels]
+        self._canonical = {}
+        names, cities, countries = set(), set(), set()
+        for name, city, country in self.hotels:
+            names.add(name)
+            cities.add(city)
+            countries.add(country)
+        for value in names | cities | countries:
+            if value:
+                self._canonical[value.lower()] = value
+        self._hotel_pattern = _names_pattern(names)
+        self._city_pattern = _names_pattern(cities)
+        self._country_pattern = _names_pattern(countries)
+        # Words of the names, found in a query whose names are not all recognized
+        self._name_words = {word for value in self._canonical
+                            for word in _WORD_PATTERN.findall(value)
+                            if len(word) > 2} - _NOT_PLACE_WORDS
+
+    def parse(self, query: str) -> QueryIntent | None:
+        """
+        Recognize a question.
+
+        Args:
+            query: User query string
+
+        Returns:
+            The intent of the question, or None if it is not one the database answers
+        """
+        text = " ".join(query.lower().split())
+        words = set(_WORD_PATTERN.findall(text))
+        kind = self._kind(text, words)
+        if kind is None:
+            return None
+
+        # Hotel names are matched first, so that a city in a hotel name is not a city
+        hotels = _find_names(self._hotel_pattern, self._canonical, text)
+        remainder = self._remove_names(self._hotel_pattern, text)
+        intent = QueryIntent(
+            kind=kind,
+            hotels=hotels,
+            cities=_find_names(self._city_pattern, self._canonical, remainder),
+            countries=_find_names(self._country_pattern, self._canonical, remainder),
+            room_type=_single(ROOM_TYPES, words),
+            room_category=_single(ROOM_CATEGORIES, words),
+            season=self._season(text, words),
+            meal_plan=next((plan for alias, plan in MEAL_PLAN_ALIASES.items()
+                            if alias in text), None),
+            by_floor="floor" in words or "floors" in words,
+        )
+        for pattern in (self._city_pattern, self._country_pattern):
+            remainder = self._remove_names(pattern, remainder)
+        intent.unresolved = self._unresolved(remainder, words)
+        if kind == "occupancy":
+            months = [_MONTHS[word] for word in _WORD_PATTERN.findall(text) if word in _MONTHS]
+            intent.month = months[0] if months else None
+            year = _YEAR_PATTERN.search(text)
+            intent.year = int(year.group(1)) if year else None
+        return intent
+
+    @staticmethod
+    def _remove_names(pattern: re.Pattern | None, text: str) -> str:
+        """Replace the names a pattern matches in a text with a placeholder."""
+        return pattern.sub(f" {_NAME_PLACEHOLDER} ", text) if pattern else text
+
+    def _unresolved(self, remainder: str, words: set) -> list[str]:
+        """
+        Find the words of a query naming a place, a room type or a category of no data.
+
+        Args:
+            remainder: Normalized query, its recognized names replaced by a placeholder
+            words: Words of the normalized query
+
+        Returns:
+            Words of the names of the data outside a recognized name, first words of
+            places after "in" or "at" that are not recognized, and misspelled room types
+            and categories
+        """
+        remainder_words = set(_WORD_PATTERN.findall(remainder))
+        unresolved = sorted(remainder_words & self._name_words)
+        for match in _PLACE_PATTERN.finditer(remainder):
+            word = match.group(1)
+            if (word != _NAME_PLACEHOLDER and word not in _NOT_PLACE_WORDS
+                    and word not in unresolved):
+                unresolved.append(word)
+        return unresolved + _misspelled(ROOM_TYPES + ROOM_CATEGORIES, words)
+
+    @staticmethod
+    def _kind(text: str, words: set) -> str | None:
+        """Classify a normalized query, or return None if it is not a hotel question."""
+        price_words = {"price", "prices", "cost", "costs", "rate", "rates"}
+        if words & {"occupancy", "occupied", "occupation"}:
+            return "occupancy"
+        if "meal" in words and not words & price_words:
+            return "meal_charges"
+        if (words & {"address", "addresses", "promotion", "discount"} or "extra bed" in text
+                or ("hotels" in words and words & {"list", "which"})):
+            return "hotel_details"
+        if not words & {"room", "rooms", "hotels"}:
+            return None
+        if words & price_words:
+            return "room_prices"
+        if (words & {"many", "number", "distribution", "ratio", "common", "floor", "floors"}
+                or "rooms per" in text):
+            return "room_counts"
+        return None
+
+    @staticmethod
+    def _season(text: str, words: set) -> str | None:
+        """Return 'peak' or 'off' if the query names one season only."""
+        peak = "peak" in words or re.search(r"\bhigh season\b", text) is not None
+        off = re.search(r"\b(?:off[ -]|low )season\b", text) is not None
+        if peak == off:
+            return None
+        return "peak" if peak else "off"
@@ -0,0 +1,124 @@
+"""
+Response Cache Module
+
+This module provides a bounded LRU cache with time-to-live for the responses sent
+on the WebSocket. Queries are normalized (case and whitespace) before the lookup,
+so rephrasings differing only in spacing or case share an entry. The entries of a
+query are stored per kind of payload (e.g. a framed message or the answer text), so
+that a payload is only read back by the consumer of its kind.
+"""
+
+import time
+from collections import OrderedDict
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query for the cache lookup.
+
+    Args:
+        query: User query
+
+    Returns:
+        The query lowercased, with runs of whitespace collapsed to one space
+    """
+    return " ".join(query.lower().split())
+
+
+class ResponseCache:
+    """
+    LRU cache of response payloads with time-to-live.
+
+    The cache holds at most ``max_size`` entries: adding an entry to a full
+    cache evicts the least recently used one. Entries older than ``ttl_seconds``
+    are treated as missing. The cache is meant to be used from the event loop
+    and is not thread-safe.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """
+        Create an empty cache.
+
+        Args:
+            max_size: Maximum number of entries (0 disables the cache)
+            ttl_seconds: Seconds an entry stays valid (0 or less: no expiration)
+
+        Raises:
+            ValueError: If max_size is negative
+        """
+        if max_size < 0:
+            raise ValueError("The response cache size must not be negative.")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores entries."""
+        return self.max_size > 0
+
+    def get(self, query: str, kind: str = "") -> str | None:
+        """
+        Get the cached payload of a query.
+
+        Args:
+            query: User query
+            kind: Kind of the payload
+
+        Returns:
+            The cached payload, or None if it is missing or expired
+        """
+        key = (kind, normalize_query(query))
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, payload = entry
+            if self.ttl_seconds <= 0 or time.monotonic() - stored_at < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, query: str, payload: str, kind: str = "") -> None:
+        """
+        Store the payload of a query, evicting the least recently used entry if full.
+
+        Args:
+            query: User query
+            payload: Payload to send for the query
+            kind: Kind of the payload
+        """
+        if not self.enabled:
+            return
+        key = (kind, normalize_query(query))
+        self._entries[key] = (time.monotonic(), payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, float]:
+        """
+        Get the cache statistics.
+
+        Returns:
+            Number of entries, hits, misses and hit ratio
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
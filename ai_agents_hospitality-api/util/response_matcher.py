@@ -0,0 +1,152 @@
+"""
+Response Matcher Module
+
+This module provides an inverted index over the keys of a set of canned responses.
+A query is scored only against the keys sharing one of their rarest words with it,
+so the matching cost depends on the number of candidate keys instead of the number
+of responses.
+"""
+
+import math
+from collections import Counter
+
+# Minimum share of the words of a key that must be present in the query
+DEFAULT_MATCH_THRESHOLD = 0.6
+
+
+class ResponseMatcher:
+    """
+    Match user queries against the keys of canned responses.
+
+    A query matches a key when it contains at least ``threshold`` of the distinct
+    words of the key. A key of ``n`` words therefore needs ``m = ceil(threshold * n)``
+    of them in the query, and a matching query contains at least one of any
+    ``n - m + 1`` words of the key. Each key is indexed under that many of its
+    words, the least frequent ones, so common words ("the", "in"...) rarely
+    bring in candidates. Candidates are then scored with their cached word sets.
+    """
+
+    def __init__(self, responses: dict[str, str], threshold: float = DEFAULT_MATCH_THRESHOLD):
+        """
+        Build the index of the responses.
+
+        Args:
+            responses: Canned responses keyed by query
+            threshold: Minimum share of the words of a key present in a matching query
+
+        Raises:
+            ValueError: If the threshold is not in (0, 1]
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("The match threshold must be greater than 0 and at most 1.")
+        self.threshold = threshold
+        self._keys: list[str] = []
+        self._responses: list[str] = []
+        self._key_ids: dict[str, int] = {}
+        self._key_words: list[frozenset[str]] = []
+        self._postings: dict[str, list[int]] = {}
+        # Number of keys containing each word, used to pick the indexed words
+        self._word_frequency = Counter(
+            word for key in {self._normalize(key) for key in responses}
+            for word in set(key.split())
+        )
+        for key, response in responses.items():
+            self._add(self._normalize(key), response)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return text.lower().strip()
+
+    def _min_shared_words(self, num_words: int) -> int:
+        """Return the number of words a key of num_words words must share with a query."""
+        shared = math.ceil(self.threshold * num_words)
+        # Guard against floating point rounding up (e.g. 0.6 * 5 = 3.0000000000000004)
+        if shared > 1 and (shared - 1) / num_words >= self.threshold:
+            shared -= 1
+        return shared
+
+    def add(self, key: str, response: str) -> None:
+        """
+        Add a response to the index, or replace the response of an existing key.
+
+        Args:
+            key: Query the response answers
+            response: Response text
+        """
+        key = self._normalize(key)
+        if key not in self._key_ids:
+            self._word_frequency.update(set(key.split()))
+        self._add(key, response)
+
+    def _add(self, key: str, response: str) -> None:
+        """Index a normalized key whose words are counted in the word frequencies."""
+        key_id = self._key_ids.get(key)
+        if key_id is not None:
+            self._responses[key_id] = response
+            return
+
+        words = frozenset(key.split())
+        key_id = len(self._keys)
+        self._key_ids[key] = key_id
+        self._keys.append(key)
+        self._responses.append(response)
+        self._key_words.append(words)
+        if not words:
+            return
+        num_indexed = len(words) - self._min_shared_words(len(words)) + 1
+        for word in sorted(words, key=lambda word: (self._word_frequency[word], word))[
+            :num_indexed
+        ]:
+            self._postings.setdefault(word, []).append(key_id)
+
+    def best_match(self, query: str) -> tuple[str, float] | None:
+        """
+        Find the key best matching a query.
+
+        An exact match scores 1.0. Otherwise the score of a key is the share of
+        its distinct words present in the query; ties go to the key added first.
+
+        Args:
+            query: User query
+
+        Returns:
+            The best matching key and its score, or None if no key reaches the threshold
+        """
+        query = self._normalize(query)
+        if query in self._key_ids:
+            return query, 1.0
+
+        query_words = set(query.split())
+        candidates = set()
+        for word in query_words:
+            postings = self._postings.get(word)
+            if postings:
+                candidates.update(postings)
+
+        best_id, best_score = None, 0.0
+        for key_id in candidates:
+            key_words = self._key_words[key_id]
+            score = len(key_words & query_words) / len(key_words)
+            if score > best_score or (score == best_score and key_id < best_id):
+                best_id, best_score = key_id, score
+        if best_id is None or best_score < self.threshold:
+            return None
+        return self._keys[best_id], best_score
+
+    def match(self, query: str) -> str | None:
+        """
+        Find the response of the key best matching a query.
+
+        Args:
+            query: User query
+
+        Returns:
+            The matching response, or None if no key reaches the threshold
+        """
+        best = self.best_match(query)
+        if best is None:
+            return None
+        return self._responses[self._key_ids[best[0]]]
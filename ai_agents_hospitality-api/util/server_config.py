@@ -0,0 +1,97 @@
+"""
+Server Configuration Module
+
+This module translates the application settings into the options of the uvicorn server.
+It is used by the entry point of main.py, in development (one process with reload) and
+in production (several worker processes). The command line options of main.py (and
+start.sh) take the names of the uvicorn options and override the settings.
+"""
+
+import argparse
+from collections.abc import Sequence
+from typing import Any
+
+from util.configuration import Settings
+
+
+def get_uvicorn_options(settings: Settings) -> dict[str, Any]:
+    """
+    Build the keyword arguments of ``uvicorn.run`` from the settings.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Options of the uvicorn server
+
+    Raises:
+        ValueError: If reload is enabled with more than one worker
+    """
+    if settings.API_RELOAD and settings.API_WORKERS > 1:
+        raise ValueError(
+            "API_RELOAD runs a single worker: set API_RELOAD=false to run "
+            f"{settings.API_WORKERS} workers."
+        )
+
+    options = {
+        "host": settings.API_HOST,
+        "port": settings.API_PORT,
+        "loop": settings.API_LOOP,
+        "http": settings.API_HTTP,
+        "backlog": settings.API_BACKLOG,
+        "timeout_keep_alive": settings.API_TIMEOUT_KEEP_ALIVE,
+        "limit_concurrency": settings.API_LIMIT_CONCURRENCY,
+        "ws_ping_interval": settings.API_WS_PING_INTERVAL,
+        "ws_ping_timeout": settings.API_WS_PING_TIMEOUT,
+        "ws_max_size": settings.API_WS_MAX_SIZE,
+    }
+    if settings.API_RELOAD:
+        options["reload"] = True
+    else:
+        options["workers"] = settings.API_WORKERS
+    return options
+
+
+# Command line option of every server setting, named as the uvicorn option
+SERVER_ARGUMENTS = {
+    "--host": ("API_HOST", str),
+    "--port": ("API_PORT", int),
+    "--workers": ("API_WORKERS", int),
+    "--loop": ("API_LOOP", str),
+    "--http": ("API_HTTP", str),
+    "--backlog": ("API_BACKLOG", int),
+    "--timeout-keep-alive": ("API_TIMEOUT_KEEP_ALIVE", int),
+    "--limit-concurrency": ("API_LIMIT_CONCURRENCY", int),
+    "--ws-ping-interval": ("API_WS_PING_INTERVAL", float),
+    "--ws-ping-timeout": ("API_WS_PING_TIMEOUT", float),
+    "--ws-max-size": ("API_WS_MAX_SIZE", int),
+}
+
+
+def parse_server_args(settings: Settings, args: Sequence[str] | None = None) -> Settings:
+    """
+    Override the server settings with the command line options.
+
+    Args:
+        settings: Application settings, read from the environment
+        args: Command line options (default: sys.argv[1:])
+
+    Returns:
+        The settings with the given options replaced
+
+    Raises:
+        SystemExit: If an option is unknown or a value is not valid
+    """
+    parser = argparse.ArgumentParser(description="AI Hospitality API server")
+    for option, (field, value_type) in SERVER_ARGUMENTS.items():
+        parser.add_argument(option, dest=field, type=value_type, default=None,
+                            help=f"Overrides {field}")
+    parser.add_argument("--reload", dest="API_RELOAD", action=argparse.BooleanOptionalAction,
+                        default=None, help="Overrides API_RELOAD")
+    overrides = {field: value for field, value in vars(parser.parse_args(args)).items()
+                 if value is not None}
+    try:
+        # Validated as the environment variables are (allowed values, minimums)
+        return Settings.model_validate({**settings.model_dump(), **overrides})
+    except ValueError as error:
+        parser.error(str(error))
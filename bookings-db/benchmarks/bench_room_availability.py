@@ -0,0 +1,170 @@
+"""Benchmark of the room availability bitmaps against scanning the bookings.
+
+Loads hotels.json and all_bookings.parquet of the generator output, builds the
+``RoomAvailability`` bitmaps of the bookings and runs the same questions on the
+bitmaps and on the bookings DataFrame (filtered with pandas, as a query does
+without the bitmaps), reporting the median time of each. The results of both
+methods are checked to be the same.
+
+The queries:
+
+- ``free_rooms``: rooms of a hotel free over a month (optionally of a room type)
+- ``occupancy``: occupancy rate of a hotel over a month
+- ``monthly``: occupancy rate of every month of every hotel
+
+``--copies`` repeats the hotels (and their bookings) under other names, to
+benchmark more rooms.
+
+Usage (from bookings-db/):
+    python benchmarks/bench_room_availability.py
+    python benchmarks/bench_room_availability.py --copies 50 --repeat 200
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+import pandas as pd
+import yaml
+
+BOOKINGS_DB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BOOKINGS_DB_DIR)
+
+from src.generator.booking_calendar import get_booking_calendar  # noqa: E402
+from src.generator.room_availability import RoomAvailability  # noqa: E402
+
+DEFAULT_CONFIG = os.path.join(BOOKINGS_DB_DIR, "config", "generate_hotels_param.yaml")
+DEFAULT_HOTELS = os.path.join(BOOKINGS_DB_DIR, "output_files", "hotels", "hotels.json")
+DEFAULT_BOOKINGS = os.path.join(BOOKINGS_DB_DIR, "output_files", "bookings",
+                                "all_bookings.parquet")
+ROOM_TYPES = (None, "Single", "Double", "Triple")
+
+
+def load_inputs(hotels_path, bookings_path, copies):
+    """Load the hotels and bookings, repeated copies times under other hotel names."""
+    with open(hotels_path, encoding="utf-8") as file:
+        hotels = json.load(file)["Hotels"]
+    bookings = pd.read_parquet(bookings_path)
+    all_hotels, all_bookings = list(hotels), [bookings]
+    for copy in range(1, copies):
+        all_hotels.extend({**hotel, "Name": f"Copy {copy} {hotel['Name']}",
+                           "hotelkey": f"{hotel['hotelkey']}-{copy}"} for hotel in hotels)
+        all_bookings.append(bookings.assign(**{
+            "Hotel Name": f"Copy {copy} " + bookings["Hotel Name"].astype(str)}))
+    return all_hotels, pd.concat(all_bookings, ignore_index=True)
+
+
+class BookingScan:
+    """The benchmark questions answered by filtering the bookings DataFrame."""
+
+    def __init__(self, hotels, bookings):
+        self.bookings = bookings.assign(**{
+            "Check-in Date": pd.to_datetime(bookings["Check-in Date"]),
+            "Check-out Date": pd.to_datetime(bookings["Check-out Date"])})
+        self.rooms = pd.DataFrame([(hotel["Name"], room["RoomId"], room["Type"])
+                                   for hotel in hotels for room in hotel["Rooms"]],
+                                  columns=["Hotel Name", "Room ID", "Room Type"])
+
+    def _stays(self, hotel, start, end):
+        bookings = self.bookings
+        bookings = bookings[(bookings["Hotel Name"] == hotel)
+                            & (bookings["Check-in Date"] < end)
+                            & (bookings["Check-out Date"] > start)]
+        return (bookings["Check-out Date"].clip(upper=end)
+                - bookings["Check-in Date"].clip(lower=start)).dt.days, bookings
+
+    def free_rooms(self, hotel, start, end, room_type=None):
+        nights, bookings = self._stays(hotel, start, end)
+        rooms = self.rooms[self.rooms["Hotel Name"] == hotel]
+        if room_type is not None:
+            rooms = rooms[rooms["Room Type"] == room_type]
+        busy = set(bookings.loc[nights > 0, "Room ID"])
+        return [room for room in rooms["Room ID"] if room not in busy]
+
+    def occupancy(self, hotel, start, end):
+        nights, _ = self._stays(hotel, start, end)
+        rooms = int((self.rooms["Hotel Name"] == hotel).sum())
+        return nights.clip(lower=0).sum() / (rooms * (end - start).days)
+
+    def monthly(self, months):
+        return {hotel: {month: self.occupancy(hotel, start, end)
+                        for month, start, end in months}
+                for hotel in self.rooms["Hotel Name"].unique()}
+
+
+def median_ms(function, arguments):
+    """Run function on every argument tuple, returning the median time in ms."""
+    times = []
+    for args in arguments:
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e3
+
+
+def main(argv=None):
+    """Run the benchmark and print the median time of each query and method."""
+    parser = argparse.ArgumentParser(description="Benchmark the room availability bitmaps.")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, help="Generation configuration")
+    parser.add_argument("--hotels", default=DEFAULT_HOTELS, help="Path to hotels.json")
+    parser.add_argument("--bookings", default=DEFAULT_BOOKINGS,
+                        help="Path to all_bookings.parquet")
+    parser.add_argument("--copies", type=int, default=1,
+                        help="Copies of the hotels and their bookings (default: 1)")
+    parser.add_argument("--repeat", type=int, default=100,
+                        help="Queries per query type (default: 100)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args(argv)
+
+    with open(args.config, encoding="utf-8") as file:
+        booking_calendar = get_booking_calendar(yaml.safe_load(file))
+    hotels, bookings = load_inputs(args.hotels, args.bookings, max(1, args.copies))
+
+    start = time.perf_counter()
+    availability = RoomAvailability.from_dataframe(hotels, bookings, booking_calendar)
+    build_s = time.perf_counter() - start
+    scan = BookingScan(hotels, bookings)
+    print(f"{len(hotels)} hotels, {len(availability)} rooms, {len(bookings)} bookings: "
+          f"bitmaps built in {build_s * 1e3:.1f} ms ({availability.nbytes / 2**10:.0f} KiB)")
+
+    months = [(month, max(pd.Timestamp(f"{month}-01"), booking_calendar.start_date),
+               min(pd.Timestamp(f"{month}-01") + pd.offsets.MonthBegin(1),
+                   booking_calendar.start_date + pd.Timedelta(days=booking_calendar.num_days)))
+              for month in booking_calendar.months]
+    rng = random.Random(args.seed)
+    queries = [(rng.choice(hotels)["Name"], *rng.choice(months)[1:], rng.choice(ROOM_TYPES))
+               for _ in range(args.repeat)]
+
+    for hotel, month_start, month_end, room_type in queries[:20]:
+        if availability.free_rooms(hotel, month_start, month_end, room_type) \
+                != scan.free_rooms(hotel, month_start, month_end, room_type):
+            raise RuntimeError(f"Bitmaps and scan disagree on the free rooms of {hotel}")
+        if abs(availability.occupancy(month_start, month_end, hotel)
+               - scan.occupancy(hotel, month_start, month_end)) > 1e-12:
+            raise RuntimeError(f"Bitmaps and scan disagree on the occupancy of {hotel}")
+
+    print(f"\n{'query':<12} {'scan (ms)':>10} {'bitmaps (ms)':>13} {'speedup':>9}")
+    benchmarks = (
+        ("free_rooms", scan.free_rooms,
+         lambda hotel, month_start, month_end, room_type: availability.free_rooms(
+             hotel, month_start, month_end, room_type), queries),
+        ("occupancy", lambda hotel, month_start, month_end, _: scan.occupancy(
+            hotel, month_start, month_end),
+         lambda hotel, month_start, month_end, _: availability.occupancy(
+             month_start, month_end, hotel), queries),
+        ("monthly", lambda: scan.monthly(months),
+         lambda: {hotel["Name"]: availability.monthly_occupancy(hotel["Name"])
+                  for hotel in hotels}, [()] * max(1, min(args.repeat, 5))),
+    )
+    for name, scan_query, bitmap_query, arguments in benchmarks:
+        scan_ms = median_ms(scan_query, arguments)
+        bitmap_ms = median_ms(bitmap_query, arguments)
+        print(f"{name:<12} {scan_ms:>10.3f} {bitmap_ms:>13.4f} {scan_ms / bitmap_ms:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,443 @@
+"""Query benchmark of the bookings database schema, before and after normalization.
+
+Loads the generated bookings twice: into the former single ``bookings`` table (no
+index besides its primary key) and into the normalized schema of ``init.sql``
+(hotels, rooms, guests and bookings with foreign keys and indexes). Then runs the
+same questions against both and reports the median time of each query and the
+speedup of the normalized schema. The results of both schemas are checked to be
+the same.
+
+The queries:
+
+- ``hotel_month``: bookings, nights and revenue of a hotel for a month of check-ins
+- ``availability``: rooms of a type of a hotel free over a week
+- ``meal_plans``: bookings, revenue and average night price per meal plan of a hotel
+- ``room_history``: the bookings of a room (through the ``booking_details`` view)
+
+The databases are SQLite files in a temporary directory by default, or schemas of a
+PostgreSQL database with ``--dsn`` (``--partitioned`` then partitions the bookings by
+month of check-in date). ``--copies`` repeats the bookings shifted by 364 days, to
+benchmark a larger table.
+
+Usage (from bookings-db/):
+    python benchmarks/bench_schema_queries.py
+    python benchmarks/bench_schema_queries.py --copies 10 --repeat 20
+    python benchmarks/bench_schema_queries.py --partitioned \\
+        --dsn "host=localhost dbname=bookings_db user=postgres password=postgres"
+"""
+
+import argparse
+import math
+import os
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCHMARKS_DIR)  # bookings-db/
+DB_DIR = os.path.join(PROJECT_ROOT, "src", "db")
+sys.path.insert(0, DB_DIR)
+
+import load_data  # noqa: E402
+
+DEFAULT_HOTELS_FILE = os.path.join(PROJECT_ROOT, "output_files", "hotels", "hotels.json")
+DEFAULT_BOOKINGS_FILE = os.path.join(PROJECT_ROOT, "output_files", "bookings",
+                                     "all_bookings.parquet")
+SCHEMAS = ("legacy", "normalized")
+COPY_SHIFT = timedelta(days=364)
+
+# The bookings table before normalization (init.sql of the first loader)
+LEGACY_DDL = """
+CREATE TABLE IF NOT EXISTS bookings (
+    id SERIAL PRIMARY KEY,
+    hotel_name VARCHAR(255),
+    room_id VARCHAR(50),
+    room_type VARCHAR(100),
+    room_category VARCHAR(100),
+    check_in_date DATE,
+    check_out_date DATE,
+    total_nights INTEGER,
+    guest_first_name VARCHAR(100),
+    guest_last_name VARCHAR(100),
+    guest_email VARCHAR(255),
+    guest_phone VARCHAR(50),
+    guest_country VARCHAR(100),
+    guest_city VARCHAR(100),
+    guest_address TEXT,
+    guest_zip_code VARCHAR(20),
+    meal_plan VARCHAR(50),
+    total_price DECIMAL(10, 2)
+);
+"""
+
+# Columns of the legacy bookings table and the source column they are read from
+LEGACY_COLUMNS = {
+    'hotel_name': 'Hotel Name',
+    'room_id': 'Room ID',
+    'room_type': 'Room Type',
+    'room_category': 'Room Category',
+    'check_in_date': 'Check-in Date',
+    'check_out_date': 'Check-out Date',
+    'total_nights': 'Total Nights',
+    'guest_first_name': 'Guest First Name',
+    'guest_last_name': 'Guest Last Name',
+    'guest_email': 'Guest Email',
+    'guest_phone': 'Guest Phone',
+    'guest_country': 'Guest Country',
+    'guest_city': 'Guest City',
+    'guest_address': 'Guest Address',
+    'guest_zip_code': 'Guest Zip Code',
+    'meal_plan': 'Meal Plan',
+    'total_price': 'Total Price'
+}
+
+# name -> SQL of each schema, with :name parameters
+QUERIES = {
+    "hotel_month": {
+        "legacy": """
+            SELECT COUNT(*), SUM(total_nights), SUM(total_price)
+            FROM bookings
+            WHERE hotel_name = :hotel AND check_in_date >= :start AND check_in_date < :end""",
+        "normalized": """
+            SELECT COUNT(*), SUM(b.total_nights), SUM(b.total_price)
+            FROM bookings b JOIN hotels h ON h.hotel_id = b.hotel_id
+            WHERE h.hotel_name = :hotel
+              AND b.check_in_date >= :start AND b.check_in_date < :end""",
+    },
+    # The legacy schema only knows the rooms that have bookings
+    "availability": {
+        "legacy": """
+            SELECT COUNT(*)
+            FROM (SELECT DISTINCT hotel_name, room_id FROM bookings
+                  WHERE hotel_name = :hotel AND room_type = :room_type) r
+            WHERE NOT EXISTS (
+                  SELECT 1 FROM bookings b
+                  WHERE b.hotel_name = r.hotel_name AND b.room_id = r.room_id
+                    AND b.check_in_date < :end AND b.check_out_date > :start)""",
+        "normalized": """
+            SELECT COUNT(*)
+            FROM rooms r JOIN hotels h ON h.hotel_id = r.hotel_id
+            WHERE h.hotel_name = :hotel AND r.room_type = :room_type
+              AND NOT EXISTS (
+                  SELECT 1 FROM bookings b
+                  WHERE b.room_id = r.room_id
+                    AND b.check_in_date < :end AND b.check_out_date > :start)""",
+    },
+    "meal_plans": {
+        "legacy": """
+            SELECT meal_plan, COUNT(*), SUM(total_price), SUM(total_price) / SUM(total_nights)
+            FROM bookings
+            WHERE hotel_name = :hotel AND check_in_date >= :start AND check_in_date < :end
+            GROUP BY meal_plan
+            ORDER BY meal_plan""",
+        "normalized": """
+            SELECT b.meal_plan, COUNT(*), SUM(b.total_price),
+                   SUM(b.total_price) / SUM(b.total_nights)
+            FROM bookings b JOIN hotels h ON h.hotel_id = b.hotel_id
+            WHERE h.hotel_name = :hotel
+              AND b.check_in_date >= :start AND b.check_in_date < :end
+            GROUP BY b.meal_plan
+            ORDER BY b.meal_plan""",
+    },
+    "room_history": {
+        "legacy": """
+            SELECT check_in_date, check_out_date, guest_last_name, meal_plan, total_price
+            FROM bookings
+            WHERE hotel_name = :hotel AND room_id = :room
+            ORDER BY check_in_date""",
+        "normalized": """
+            SELECT check_in_date, check_out_date, guest_last_name, meal_plan, total_price
+            FROM booking_details
+            WHERE hotel_name = :hotel AND room_id = :room
+            ORDER BY check_in_date""",
+    },
+}
+
+_PARAMETER_PATTERN = re.compile(r":(\w+)")
+
+
+class Database:
+    """One schema of the benchmark: a SQLite file, or a PostgreSQL schema."""
+
+    def __init__(self, name, directory=None, dsn=None):
+        """
+        Args:
+            name (str): Schema name, one of ``SCHEMAS``
+            directory (str): Directory of the SQLite file (SQLite only)
+            dsn (str): psycopg2 connection string (PostgreSQL only)
+        """
+        self.name = name
+        self.postgres = dsn is not None
+        if self.postgres:
+            self.conn = load_data.psycopg2.connect(dsn)
+            with self.conn.cursor() as cursor:
+                cursor.execute(f"DROP SCHEMA IF EXISTS bench_{name} CASCADE;"
+                               f"CREATE SCHEMA bench_{name};"
+                               f"SET search_path TO bench_{name};")
+        else:
+            self.conn = sqlite3.connect(os.path.join(directory, f"{name}.db"))
+
+    def execute_script(self, sql):
+        """Run the statements of a SQL script."""
+        if self.postgres:
+            with self.conn.cursor() as cursor:
+                cursor.execute(sql)
+        else:
+            self.conn.executescript(sql)
+
+    def sql(self, query):
+        """Convert the :name parameters of a query to the driver's parameter style."""
+        return query if not self.postgres else _PARAMETER_PATTERN.sub(r"%(\1)s", query)
+
+    def fetch(self, sql, params):
+        """Run a query converted by ``sql`` and return its rows."""
+        if not self.postgres:
+            # SQLite stores the dates as ISO strings
+            params = {key: value.isoformat() if isinstance(value, date) else value
+                      for key, value in params.items()}
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def analyze(self):
+        """Commit the load and refresh the planner statistics."""
+        self.conn.commit()
+        if self.postgres:
+            self.conn.autocommit = True
+            self.execute_script("VACUUM ANALYZE;")
+        else:
+            self.execute_script("ANALYZE;")
+
+    def close(self):
+        """Drop the PostgreSQL schema and close the connection."""
+        if self.postgres:
+            self.execute_script(f"DROP SCHEMA bench_{self.name} CASCADE;")
+        self.conn.close()
+
+def read_file(path):
+    """Return the contents of a SQL file."""
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+def booking_chunks(bookings_file, copies):
+    """Yield the bookings file in chunks, ``copies`` times, shifted by 364 days each time.
+
+    Args:
+        bookings_file (str): all_bookings Parquet file of the generator
+        copies (int): Number of copies of the bookings
+
+    Yields:
+        pd.DataFrame: Bookings as returned by ``load_data.iter_bookings``
+    """
+    for copy in range(copies):
+        for df in load_data.iter_bookings(bookings_file):
+            if copy:
+                df['Check-in Date'] += COPY_SHIFT * copy
+                df['Check-out Date'] += COPY_SHIFT * copy
+            yield df
+
+def load_legacy(db, bookings_file, copies):
+    """Create and fill the legacy bookings table.
+
+    Returns:
+        int: Number of bookings loaded
+    """
+    db.execute_script(LEGACY_DDL)
+    columns = tuple(LEGACY_COLUMNS)
+    rows = 0
+    for df in booking_chunks(bookings_file, copies):
+        values = [load_data.column_values(df, source) for source in LEGACY_COLUMNS.values()]
+        chunk = list(zip(*values, strict=True))
+        load_data.insert_rows_batched(db.conn, 'bookings', columns, chunk)
+        rows += len(chunk)
+    return rows
+
+def load_normalized(db, hotels_file, bookings_file, copies, partitioned):
+    """Create and fill the normalized schema of init.sql.
+
+    Returns:
+        int: Number of bookings loaded
+    """
+    init_sql = read_file(os.path.join(DB_DIR, "init.sql"))
+    db.execute_script(init_sql)
+    if partitioned:
+        db.execute_script(read_file(os.path.join(DB_DIR, "bookings_partitioned.sql")))
+        db.execute_script(init_sql)
+    load_data.load_hotels(db.conn, hotels_file)
+    keys = load_data.BookingKeys(db.conn)
+    mode = "copy" if db.postgres else "batch"
+    rows = 0
+    for df in booking_chunks(bookings_file, copies):
+        if partitioned:
+            load_data.create_monthly_partitions(db.conn, df['Check-in Date'])
+        rows += load_data.load_bookings(db.conn, df, mode=mode, keys=keys)
+    return rows
+
+def query_cases(db, cases_per_query):
+    """Build the parameters of the queries from the hotels, rooms and dates of the data.
+
+    Args:
+        db (Database): The normalized schema
+        cases_per_query (int): Number of parameter sets per query
+
+    Returns:
+        dict: Parameter sets of each query of ``QUERIES``
+    """
+    hotels = [row[0] for row in db.fetch("SELECT hotel_name FROM hotels ORDER BY hotel_id", {})]
+    rooms = db.fetch(db.sql(
+        "SELECT h.hotel_name, r.room_number, r.room_type FROM rooms r "
+        "JOIN hotels h ON h.hotel_id = r.hotel_id ORDER BY r.room_id"), {})
+    first, last = db.fetch("SELECT MIN(check_in_date), MAX(check_in_date) FROM bookings", {})[0]
+    first, last = date.fromisoformat(str(first)), date.fromisoformat(str(last))
+    months = []
+    month = first.replace(day=1)
+    while month <= last:
+        months.append(month)
+        month = (month + timedelta(days=32)).replace(day=1)
+
+    cases = {name: [] for name in QUERIES}
+    for i in range(cases_per_query):
+        hotel = hotels[i % len(hotels)]
+        month = months[(i * 7) % len(months)]
+        next_month = (month + timedelta(days=32)).replace(day=1)
+        year = date(months[i % len(months)].year, 1, 1)
+        week = month + timedelta(days=(i * 5) % 21)
+        room_hotel, room, room_type = rooms[(i * len(rooms)) // cases_per_query]
+        cases["hotel_month"].append({"hotel": hotel, "start": month, "end": next_month})
+        cases["availability"].append({"hotel": room_hotel, "room_type": room_type,
+                                      "start": week, "end": week + timedelta(days=7)})
+        cases["meal_plans"].append({"hotel": hotel, "start": year,
+                                    "end": year.replace(year=year.year + 1)})
+        cases["room_history"].append({"hotel": room_hotel, "room": room})
+    return cases
+
+def _normalized_rows(rows):
+    """Make the rows of both schemas comparable: plain values and rounded numbers."""
+    normalized = []
+    for row in rows:
+        values = []
+        for value in row:
+            if isinstance(value, (int, str)) or value is None:
+                values.append(value)
+            elif isinstance(value, date):
+                values.append(value.isoformat())
+            else:
+                values.append(round(float(value), 2))
+        normalized.append(tuple(values))
+    return normalized
+
+def run_queries(databases, cases, repeat):
+    """Run every query case on every schema and time it.
+
+    Args:
+        databases (dict): Database of each schema
+        cases (dict): Parameter sets of each query
+        repeat (int): Timed runs of each case
+
+    Returns:
+        tuple: Median time (s) of a case of each query on each schema, and the
+        queries whose results differ between the schemas
+    """
+    timings = {name: {schema: [] for schema in databases} for name in QUERIES}
+    mismatches = set()
+    for name, query in QUERIES.items():
+        for params in cases[name]:
+            results = {}
+            for schema, db in databases.items():
+                sql = db.sql(query[schema])
+                # Untimed warm-up run, also used to compare the results
+                results[schema] = _normalized_rows(db.fetch(sql, params))
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    db.fetch(sql, params)
+                    timings[name][schema].append(time.perf_counter() - start)
+            if len({tuple(rows) for rows in results.values()}) > 1:
+                mismatches.add(name)
+    medians = {name: {schema: statistics.median(values) for schema, values in by_schema.items()}
+               for name, by_schema in timings.items()}
+    return medians, mismatches
+
+def print_report(medians, mismatches, load_times):
+    """Print the load time of each schema and the median time of each query."""
+    for schema, (rows, elapsed) in load_times.items():
+        print(f"{schema:<11} {rows} bookings loaded in {elapsed:.2f} s")
+    print(f"{'query':<14} {'legacy ms':>10} {'normalized ms':>14} {'speedup':>8}")
+    speedups = []
+    for name, by_schema in medians.items():
+        legacy, normalized = by_schema["legacy"], by_schema["normalized"]
+        speedup = legacy / normalized if normalized > 0 else float("inf")
+        speedups.append(speedup)
+        flag = "  (results differ)" if name in mismatches else ""
+        print(f"{name:<14} {legacy * 1e3:>10.3f} {normalized * 1e3:>14.3f} "
+              f"{speedup:>7.1f}x{flag}")
+    geometric_mean = math.exp(statistics.fmean(math.log(value) for value in speedups))
+    print(f"{'geometric mean':<40} {geometric_mean:>7.1f}x")
+
+def parse_args(argv=None):
+    """Parse the command line arguments.
+
+    Args:
+        argv (list): Arguments (default: ``sys.argv[1:]``)
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the bookings queries on the legacy and normalized schemas.")
+    parser.add_argument("--hotels-file", default=DEFAULT_HOTELS_FILE)
+    parser.add_argument("--bookings-file", default=DEFAULT_BOOKINGS_FILE)
+    parser.add_argument("--copies", type=int, default=3,
+                        help="Copies of the bookings, shifted by 364 days (default: 3)")
+    parser.add_argument("--cases", type=int, default=20,
+                        help="Parameter sets per query (default: 20)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timed runs per parameter set (default: 5)")
+    parser.add_argument("--dsn", default=None,
+                        help="psycopg2 connection string of a PostgreSQL database "
+                             "(default: SQLite files in a temporary directory)")
+    parser.add_argument("--partitioned", action="store_true",
+                        help="Partition the normalized bookings by month (PostgreSQL only)")
+    args = parser.parse_args(argv)
+    if min(args.copies, args.cases, args.repeat) < 1:
+        parser.error("--copies, --cases and --repeat must be positive integers")
+    if args.partitioned and args.dsn is None:
+        parser.error("--partitioned needs a PostgreSQL database (--dsn)")
+    return args
+
+def main(argv=None):
+    """Run the benchmark and return the process exit code."""
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as directory:
+        databases = {}
+        try:
+            for schema in SCHEMAS:
+                databases[schema] = Database(schema, directory, args.dsn)
+            load_times = {}
+            for schema, db in databases.items():
+                print(f"Loading the {schema} schema...", flush=True)
+                start = time.perf_counter()
+                if schema == "legacy":
+                    rows = load_legacy(db, args.bookings_file, args.copies)
+                else:
+                    rows = load_normalized(db, args.hotels_file, args.bookings_file,
+                                           args.copies, args.partitioned)
+                db.analyze()
+                load_times[schema] = (rows, time.perf_counter() - start)
+            cases = query_cases(databases["normalized"], args.cases)
+            medians, mismatches = run_queries(databases, cases, args.repeat)
+        finally:
+            for db in databases.values():
+                db.close()
+    print_report(medians, mismatches, load_times)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,616 @@
+"""Benchmark runner for the synthetic hotel and booking data generator.
+
+Every benchmark is run for each combination of number of hotels, rooms per hotel
+and booking years, in a separate process, and reports:
+
+- wall time (median and minimum over the repeats)
+- peak RSS of the process and its increase while the benchmark runs
+- throughput (bookings, slots, rooms... per second)
+
+Results are written to a JSON file and can be compared against a stored
+baseline to flag regressions.
+
+Usage (from bookings-db/):
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --hotels 1,5 --years 1,2 --only slots
+    python benchmarks/run_benchmarks.py --save-baseline
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import yaml
+from faker import Faker
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCHMARKS_DIR)  # bookings-db/
+sys.path.insert(0, PROJECT_ROOT)
+
+# The src package is imported from the project root added to sys.path above
+from src.generator import booking_generator as BG  # noqa: E402
+from src.generator import parametric_utils as ParUt  # noqa: E402
+from src.generator.booking_calendar import get_booking_calendar  # noqa: E402
+from src.generator.guest_pool import get_guest_pool  # noqa: E402
+from src.generator.hotel_generator import generate_hotels, generate_rooms  # noqa: E402
+from src.generator.hotel_query_generator import HotelQueryGenerator  # noqa: E402
+from src.output import booking_output_writer as BW  # noqa: E402
+from src.output import booking_stream_writer as SW  # noqa: E402
+from src.output import hotel_output_writer as HW  # noqa: E402
+from src.output.hotel_query_writer import generate_file_csv_for_queries_room_hotels  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DEFAULT_RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+DEFAULT_THRESHOLD = 0.2
+
+# name -> (function(context) returning the number of processed items, item unit)
+BENCHMARKS = {}
+
+
+def benchmark(name, unit):
+    """Register a benchmark function under ``name``.
+
+    Args:
+        name (str): Benchmark name
+        unit (str): Unit of the items counted by the function (e.g. "bookings")
+    """
+    def register(func):
+        BENCHMARKS[name] = (func, unit)
+        return func
+    return register
+
+
+class BenchmarkContext:
+    """Inputs of the benchmarks of one parameter combination, built lazily.
+
+    Building the inputs is not timed: the benchmark functions only use the
+    attributes, which are cached after their first use.
+    """
+
+    def __init__(self, params, seed, output_path):
+        """
+        Args:
+            params (dict): 'hotels', 'rooms' ("min-max") and 'years'
+            seed (int): Random seed of the generated data
+            output_path (str): Directory for the files written by the writers
+        """
+        self.params = params
+        self.seed = seed
+        self.output_path = output_path if output_path.endswith(os.sep) else output_path + os.sep
+        self.config = load_benchmark_config(params)
+        random.seed(seed)
+        Faker.seed(seed)
+
+    @cached_property
+    def hotels(self):
+        return generate_hotels(self.config)
+
+    @cached_property
+    def rooms(self):
+        return [(hotel, room) for hotel in self.hotels for room in hotel["Rooms"]]
+
+    @cached_property
+    def booking_calendar(self):
+        return get_booking_calendar(self.config)
+
+    @cached_property
+    def guest_pool(self):
+        return get_guest_pool(self.config, seed=self.seed)
+
+    @cached_property
+    def room_slots(self):
+        return [BG.all_date_slots(self.booking_calendar) for _ in self.rooms]
+
+    @cached_property
+    def room_occupancy_slots(self):
+        return [
+            BG.adjust_slots_occupancy(slots, self.booking_calendar,
+                                      hotel["SyntheticParams"]["OccupancyPeakSeasonWeight"],
+                                      hotel["SyntheticParams"]["OccupancyOffSeasonWeight"])
+            for (hotel, _), slots in zip(self.rooms, self.room_slots, strict=True)
+        ]
+
+    @cached_property
+    def booking_slots(self):
+        """(hotel, room, check-in, check-out) of every booking of the forecast slots."""
+        occupancy = self.config["hotel_occupancy"]
+        booking_slots = []
+        for (hotel, room), slots in zip(self.rooms, self.room_occupancy_slots, strict=True):
+            for start_day, end_day in BG.adjust_slots_forecast(
+                    slots, occupancy["current_month"],
+                    occupancy["forecast_reduction_percentage"], self.booking_calendar):
+                booking_slots.append((hotel, room, self.booking_calendar.date(start_day),
+                                      self.booking_calendar.date(end_day)))
+        return booking_slots
+
+    @cached_property
+    def hotel_bookings(self):
+        return BG.generate_all_hotel_bookings(self.hotels, self.config, self.booking_calendar,
+                                              master_seed=self.seed,
+                                              guest_pool=self.guest_pool)
+
+    @cached_property
+    def priced_bookings(self):
+        """(hotel, room, booking) of every generated booking."""
+        rooms = {
+            (hotel["hotelkey"], room["RoomId"]): (hotel, room)
+            for hotel in self.hotels for room in hotel["Rooms"]
+        }
+        return [
+            (*rooms[(hotel_bookings["HotelKey"], booking["RoomAssigned"])], booking)
+            for hotel_bookings in self.hotel_bookings
+            for booking in hotel_bookings["Bookings"]
+        ]
+
+    @cached_property
+    def booking_records(self):
+        return [
+            BG.flatten_booking(hotel_bookings["HotelName"], booking)
+            for hotel_bookings in self.hotel_bookings
+            for booking in hotel_bookings["Bookings"]
+        ]
+
+    @cached_property
+    def booking_table(self):
+        return BG.generate_all_hotel_booking_table(self.hotels, self.config,
+                                                   self.booking_calendar,
+                                                   master_seed=self.seed,
+                                                   guest_pool=self.guest_pool)
+
+    @cached_property
+    def queries(self):
+        with open(os.path.join(PROJECT_ROOT, "config", "hotel_queries.yaml"),
+                  encoding="utf-8") as file:
+            queries_config = yaml.safe_load(file)
+        # Multiple hotel queries pick up to 3 hotels: repeat the names of smaller runs
+        hotel_names = [hotel["Name"] for hotel in self.hotels]
+        hotel_names = (hotel_names * 3)[:max(3, len(hotel_names))]
+        return HotelQueryGenerator(queries_config).get_room_queries(hotel_names)
+
+    def path(self, filename):
+        """Return the path of an output file of the writers."""
+        return os.path.join(self.output_path, filename)
+
+
+def load_benchmark_config(params):
+    """Load the generator configuration and apply the benchmark parameters.
+
+    Args:
+        params (dict): 'hotels', 'rooms' ("min-max") and 'years'
+
+    Returns:
+        dict: Generator configuration
+    """
+    config_path = os.path.join(PROJECT_ROOT, "config", "generate_hotels_param.yaml")
+    with open(config_path, encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+
+    config["num_of_hotels"] = params["hotels"]
+    rooms_min, rooms_max = (int(value) for value in params["rooms"].split("-"))
+    config["rooms_per_hotel"]["number"] = {"min": rooms_min, "max": rooms_max}
+    booking_year = config["hotel_occupancy"]["booking_year"]
+    booking_year["end"] = booking_year["start"] + params["years"] - 1
+    return config
+
+
+# Generator benchmarks
+
+@benchmark("generate_rooms", unit="rooms")
+def bench_generate_rooms(ctx):
+    return sum(len(generate_rooms(ctx.config)) for _ in range(ctx.params["hotels"]))
+
+@benchmark("all_date_slots", unit="slots")
+def bench_all_date_slots(ctx):
+    return sum(len(BG.all_date_slots(ctx.booking_calendar)) for _ in ctx.rooms)
+
+@benchmark("adjust_slots_occupancy", unit="slots")
+def bench_adjust_slots_occupancy(ctx):
+    num_slots = 0
+    for (hotel, _), slots in zip(ctx.rooms, ctx.room_slots, strict=True):
+        params = hotel["SyntheticParams"]
+        BG.adjust_slots_occupancy(list(slots), ctx.booking_calendar,
+                                  params["OccupancyPeakSeasonWeight"],
+                                  params["OccupancyOffSeasonWeight"])
+        num_slots += len(slots)
+    return num_slots
+
+@benchmark("adjust_slots_forecast", unit="slots")
+def bench_adjust_slots_forecast(ctx):
+    occupancy = ctx.config["hotel_occupancy"]
+    num_slots = 0
+    for slots in ctx.room_occupancy_slots:
+        BG.adjust_slots_forecast(list(slots), occupancy["current_month"],
+                                 occupancy["forecast_reduction_percentage"],
+                                 ctx.booking_calendar)
+        num_slots += len(slots)
+    return num_slots
+
+@benchmark("generate_booking", unit="bookings")
+def bench_generate_booking(ctx):
+    for hotel, room, check_in, check_out in ctx.booking_slots:
+        BG.generate_booking(room, check_in, check_out, hotel["SyntheticParams"], ctx.config)
+    return len(ctx.booking_slots)
+
+@benchmark("get_total_price", unit="bookings")
+def bench_get_total_price(ctx):
+    for hotel, room, booking in ctx.priced_bookings:
+        ParUt.get_total_price(booking, room, ctx.config["peak_season_months"],
+                              hotel["SyntheticParams"])
+    return len(ctx.priced_bookings)
+
+@benchmark("get_bookings_total_prices", unit="bookings")
+def bench_get_bookings_total_prices(ctx):
+    for hotel in ctx.hotels:
+        bookings = [(room, booking) for booking_hotel, room, booking in ctx.priced_bookings
+                    if booking_hotel is hotel]
+        ParUt.get_bookings_total_prices([booking for _, booking in bookings],
+                                        [room for room, _ in bookings],
+                                        ctx.config["peak_season_months"],
+                                        hotel["SyntheticParams"])
+    return len(ctx.priced_bookings)
+
+@benchmark("generate_all_hotel_bookings", unit="bookings")
+def bench_generate_all_hotel_bookings(ctx):
+    hotel_bookings = BG.generate_all_hotel_bookings(ctx.hotels, ctx.config, ctx.booking_calendar,
+                                                    master_seed=ctx.seed,
+                                                    guest_pool=ctx.guest_pool)
+    return sum(len(bookings["Bookings"]) for bookings in hotel_bookings)
+
+@benchmark("generate_all_hotel_booking_table", unit="bookings")
+def bench_generate_all_hotel_booking_table(ctx):
+    return len(BG.generate_all_hotel_booking_table(ctx.hotels, ctx.config,
+                                                   ctx.booking_calendar,
+                                                   master_seed=ctx.seed,
+                                                   guest_pool=ctx.guest_pool))
+
+
+# Booking writers (src/output/booking_output_writer.py)
+
+@benchmark("writer.json_for_bookings", unit="bookings")
+def bench_json_for_bookings(ctx):
+    for bookings in ctx.hotel_bookings:
+        BW.generate_file_json_for_bookings(bookings, bookings["HotelKey"], bookings["HotelName"],
+                                           ctx.output_path)
+    return len(ctx.booking_records)
+
+@benchmark("writer.excel_for_bookings", unit="bookings")
+def bench_excel_for_bookings(ctx):
+    for bookings in ctx.hotel_bookings:
+        BW.generate_file_excel_for_bookings(bookings, bookings["HotelKey"],
+                                            bookings["HotelName"], ctx.output_path)
+    return len(ctx.booking_records)
+
+@benchmark("writer.md_hotel_bookings", unit="bookings")
+def bench_md_hotel_bookings(ctx):
+    BW.generate_file_md_hotel_bookings(ctx.hotel_bookings, ctx.output_path)
+    return len(ctx.booking_records)
+
+@benchmark("writer.excel_all_bookings", unit="bookings")
+def bench_excel_all_bookings(ctx):
+    BW.generate_file_excel_all_bookings(ctx.hotel_bookings, ctx.path("all_bookings.xlsx"))
+    return len(ctx.booking_records)
+
+@benchmark("writer.parquet_all_bookings", unit="bookings")
+def bench_parquet_all_bookings(ctx):
+    BW.generate_file_parquet_all_bookings(ctx.hotel_bookings, ctx.path("all_bookings.parquet"))
+    return len(ctx.booking_records)
+
+
+# Booking stream writers (src/output/booking_stream_writer.py)
+
+@benchmark("writer.stream_csv", unit="bookings")
+def bench_stream_csv(ctx):
+    return SW.write_booking_stream(ctx.booking_records,
+                                   [SW.BookingCsvSink(ctx.path("all_bookings.csv"))])
+
+@benchmark("writer.stream_markdown", unit="bookings")
+def bench_stream_markdown(ctx):
+    return SW.write_booking_stream(ctx.booking_records,
+                                   [SW.BookingMarkdownSink(ctx.path("hotel_bookings.md"))])
+
+@benchmark("writer.stream_parquet", unit="bookings")
+def bench_stream_parquet(ctx):
+    return SW.write_booking_stream(ctx.booking_records,
+                                   [SW.BookingParquetSink(ctx.path("all_bookings.parquet"))])
+
+@benchmark("writer.stream_excel", unit="bookings")
+def bench_stream_excel(ctx):
+    return SW.write_booking_stream(ctx.booking_records,
+                                   [SW.BookingExcelSink(ctx.path("all_bookings.xlsx"))])
+
+@benchmark("writer.table_parquet", unit="bookings")
+def bench_table_parquet(ctx):
+    return SW.write_booking_table(ctx.booking_table,
+                                  [SW.BookingParquetSink(ctx.path("all_bookings.parquet"))])
+
+def _bench_table_markdown(**options):
+    def bench(ctx):
+        path = ctx.path("hotel_bookings") if options.get("split_by_hotel") \
+            else ctx.path("hotel_bookings.md")
+        return SW.write_booking_table(ctx.booking_table, [SW.BookingMarkdownSink(path, **options)])
+    return bench
+
+for _name, _options in (
+    ("writer.table_markdown", {}),
+    ("writer.table_markdown_gzip", {"compression": "gzip"}),
+    ("writer.table_markdown_zstd", {"compression": "zstd"}),
+    ("writer.table_markdown_split_gzip",
+     {"compression": "gzip", "split_by_hotel": True, "workers": 4}),
+):
+    benchmark(_name, unit="bookings")(_bench_table_markdown(**_options))
+
+
+# Hotel and query writers (src/output/hotel_output_writer.py, hotel_query_writer.py)
+
+def _bench_hotel_writer(writer):
+    def run(ctx):
+        writer(ctx.hotels, ctx.output_path)
+        return len(ctx.hotels)
+    return run
+
+for _name, _writer in (
+    ("writer.json_for_hotels", HW.generate_file_json_for_hotels),
+    ("writer.excel_for_hotels", HW.generate_file_excel_for_hotels),
+    ("writer.csv_for_hotels", HW.generate_file_csv_for_hotels),
+    ("writer.csv_for_all_hotels", HW.generate_file_csv_for_all_hotels),
+    ("writer.md_hotel_details", HW.generate_file_md_hotel_details),
+    ("writer.md_hotel_rooms", HW.generate_file_md_hotel_rooms),
+):
+    benchmark(_name, unit="hotels")(_bench_hotel_writer(_writer))
+
+@benchmark("writer.csv_for_queries", unit="queries")
+def bench_csv_for_queries(ctx):
+    generate_file_csv_for_queries_room_hotels(ctx.queries, ctx.output_path)
+    return len(ctx.queries)
+
+
+# Runner
+
+def _peak_rss_mb():
+    """Return the peak resident set size of this process in MiB, or None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+def _run_case(name, params, repeat, seed, connection):
+    """Run one benchmark case in a child process and send its result back."""
+    func, unit = BENCHMARKS[name]
+    try:
+        # The generator and the writers report their progress: keep the runner output readable
+        with open(os.devnull, "w", encoding="utf-8") as devnull, \
+                contextlib.redirect_stdout(devnull), \
+                tempfile.TemporaryDirectory() as output_path:
+            ctx = BenchmarkContext(params, seed, output_path)
+            # Untimed warm-up run: builds the cached inputs of the context
+            func(ctx)
+            rss_before = _peak_rss_mb()
+            times = []
+            items = 0
+            for _ in range(repeat):
+                start = time.perf_counter()
+                items = func(ctx)
+                times.append(time.perf_counter() - start)
+            peak_rss = _peak_rss_mb()
+        wall_time = statistics.median(times)
+        connection.send({
+            "benchmark": name,
+            "params": params,
+            "repeat": repeat,
+            "wall_time_s": wall_time,
+            "wall_time_min_s": min(times),
+            "peak_rss_mb": peak_rss,
+            "peak_rss_increase_mb": (
+                None if peak_rss is None else max(peak_rss - rss_before, 0.0)
+            ),
+            "items": items,
+            "unit": unit,
+            "items_per_s": items / wall_time if wall_time > 0 else None
+        })
+    except Exception as error:
+        connection.send({"benchmark": name, "params": params, "error": repr(error)})
+    finally:
+        connection.close()
+
+def run_case(name, params, repeat, seed):
+    """Run one benchmark case in a fresh process, so its peak RSS is its own.
+
+    Args:
+        name (str): Benchmark name
+        params (dict): 'hotels', 'rooms' and 'years'
+        repeat (int): Number of timed runs
+        seed (int): Random seed of the generated data
+
+    Returns:
+        dict: Result of the case ('error' is set if it failed)
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_run_case, args=(name, params, repeat, seed, sender))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {"benchmark": name, "params": params,
+                  "error": f"benchmark process exited with code {process.exitcode}"}
+    process.join()
+    return result
+
+def case_key(result):
+    """Return the key identifying a benchmark case in results and baselines."""
+    params = result["params"]
+    return (result["benchmark"], params["hotels"], params["rooms"], params["years"])
+
+def compare_results(results, baseline, threshold):
+    """Compare results against a baseline and list the regressions.
+
+    A case regresses when its median wall time or its peak RSS increase grows
+    by more than ``threshold`` (a fraction) over the baseline.
+
+    Args:
+        results (list): Benchmark results
+        baseline (dict): Baseline results file content
+        threshold (float): Allowed relative increase
+
+    Returns:
+        list: Regression messages
+    """
+    baseline_cases = {
+        case_key(result): result
+        for result in baseline.get("results", []) if "error" not in result
+    }
+    regressions = []
+    for result in results:
+        previous = baseline_cases.get(case_key(result))
+        if previous is None or "error" in result:
+            continue
+        for metric in ("wall_time_s", "peak_rss_increase_mb"):
+            old, new = previous.get(metric), result.get(metric)
+            # Ignore memory changes below 1 MiB, they are measurement noise
+            if old is None or new is None or (metric.endswith("_mb") and new - old < 1.0):
+                continue
+            if old > 0 and new > old * (1 + threshold):
+                regressions.append(
+                    f"{result['benchmark']} {result['params']}: {metric} "
+                    f"{old:.4g} -> {new:.4g} (+{(new / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+def print_results(results):
+    """Print the benchmark results as a table."""
+    print(f"{'benchmark':<36} {'hotels':>6} {'rooms':>7} {'years':>5} "
+          f"{'time (s)':>9} {'peak RSS':>9} {'throughput':>22}")
+    for result in results:
+        params = result["params"]
+        prefix = (f"{result['benchmark']:<36} {params['hotels']:>6} {params['rooms']:>7} "
+                  f"{params['years']:>5}")
+        if "error" in result:
+            print(f"{prefix} ERROR {result['error']}")
+            continue
+        rss = "-" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.0f} MiB"
+        throughput = (
+            "-" if result["items_per_s"] is None
+            else f"{result['items_per_s']:.0f} {result['unit']}/s"
+        )
+        print(f"{prefix} {result['wall_time_s']:>9.4f} {rss:>9} {throughput:>22}")
+
+def _int_list(value):
+    return [int(item) for item in value.split(",")]
+
+def parse_args(argv=None):
+    """Parse the command line arguments of the benchmark runner.
+
+    Args:
+        argv (list): Arguments to parse (defaults to sys.argv)
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the synthetic data generator.")
+    parser.add_argument("--hotels", type=_int_list, default=[1, 5],
+                        help="Comma separated numbers of hotels (default: 1,5)")
+    parser.add_argument("--rooms", type=lambda value: value.split(","), default=["30-80"],
+                        help="Comma separated 'min-max' rooms per hotel (default: 30-80)")
+    parser.add_argument("--years", type=_int_list, default=[1],
+                        help="Comma separated numbers of booking years (default: 1)")
+    parser.add_argument("--only", action="append", default=[],
+                        help="Run the benchmarks whose name contains this text "
+                             "(may be repeated)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per benchmark case (default: 3)")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="Random seed of the generated data (default: 42)")
+    parser.add_argument("--output", default=None,
+                        help="Results JSON file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", default=None,
+                        help="Baseline JSON file to compare the results against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"Also save the results as the baseline ({DEFAULT_BASELINE})")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative increase flagged as a regression "
+                             f"(default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the benchmarks and return the process exit code."""
+    args = parse_args(argv)
+    if args.list:
+        for name, (_, unit) in BENCHMARKS.items():
+            print(f"{name:<36} {unit}")
+        return 0
+    if args.repeat < 1:
+        raise ValueError("The number of repeats must be a positive integer.")
+
+    names = [
+        name for name in BENCHMARKS
+        if not args.only or any(text in name for text in args.only)
+    ]
+    if not names:
+        raise ValueError(f"No benchmark matches {args.only}.")
+
+    results = []
+    for hotels in args.hotels:
+        for rooms in args.rooms:
+            for years in args.years:
+                params = {"hotels": hotels, "rooms": rooms, "years": years}
+                for name in names:
+                    print(f"Running {name} {params}...", flush=True)
+                    results.append(run_case(name, params, args.repeat, args.seed))
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "results": results
+    }
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    outputs = [output] + ([DEFAULT_BASELINE] if args.save_baseline else [])
+    for path in outputs:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Benchmark results written to: {path}")
+
+    print_results(results)
+    exit_code = 1 if any("error" in result for result in results) else 0
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare_results(results, json.load(file), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%} "
+                  f"against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            exit_code = 1
+        else:
+            print(f"\nNo regression over {args.threshold:.0%} against {args.baseline}.")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
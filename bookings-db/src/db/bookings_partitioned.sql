@@ -0,0 +1,22 @@
+-- Bookings partitioned by month of check-in date (BOOKINGS_PARTITIONING=monthly).
+-- load_data.py runs this file after init.sql while the bookings table is still empty,
+-- then init.sql again to recreate the indexes and the booking_details view on it. The
+-- monthly partitions are created by load_data.py for the months of the loaded bookings.
+DROP TABLE IF EXISTS bookings CASCADE;
+
+CREATE TABLE bookings (
+    id SERIAL,
+    hotel_id INTEGER NOT NULL REFERENCES hotels (hotel_id),
+    room_id INTEGER NOT NULL REFERENCES rooms (room_id),
+    guest_id INTEGER REFERENCES guests (guest_id),
+    check_in_date DATE NOT NULL,
+    check_out_date DATE NOT NULL,
+    total_nights INTEGER,
+    meal_plan VARCHAR(50),
+    total_price DECIMAL(10, 2),
+    PRIMARY KEY (id, check_in_date),
+    FOREIGN KEY (hotel_id, meal_plan) REFERENCES hotel_meal_plans (hotel_id, meal_plan)
+) PARTITION BY RANGE (check_in_date);
+
+-- Bookings outside the monthly partitions
+CREATE TABLE bookings_default PARTITION OF bookings DEFAULT;
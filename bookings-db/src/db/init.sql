@@ -1,21 +1,125 @@
--- Create the bookings table
-CREATE TABLE IF NOT EXISTS bookings (
-    id SERIAL PRIMARY KEY,
-    hotel_name VARCHAR(255),
-    room_id VARCHAR(50),
+-- Hotel reference data, loaded from hotels.json. Room prices, meal plan charges and
+-- the hotel discounts are not in the bookings.
+CREATE TABLE IF NOT EXISTS hotels (
+    hotel_id INTEGER PRIMARY KEY,
+    hotel_key VARCHAR(20) NOT NULL UNIQUE,
+    hotel_name VARCHAR(255) NOT NULL UNIQUE,
+    country VARCHAR(100),
+    city VARCHAR(100),
+    zip_code VARCHAR(20),
+    address TEXT,
+    occupancy_discount_percentage INTEGER,
+    extra_bed_charge_percentage INTEGER,
+    promotion_discount_percentage INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS rooms (
+    room_id INTEGER PRIMARY KEY,
+    hotel_id INTEGER NOT NULL REFERENCES hotels (hotel_id),
+    room_number VARCHAR(50) NOT NULL,
+    floor INTEGER,
     room_type VARCHAR(100),
     room_category VARCHAR(100),
-    check_in_date DATE,
-    check_out_date DATE,
+    guests INTEGER,
+    price_off_season DECIMAL(10, 2),
+    price_peak_season DECIMAL(10, 2),
+    UNIQUE (hotel_id, room_number)
+);
+
+-- Price factor of each meal plan, applied to the room price (1.18 is a 18% charge)
+CREATE TABLE IF NOT EXISTS hotel_meal_plans (
+    hotel_id INTEGER NOT NULL REFERENCES hotels (hotel_id),
+    meal_plan VARCHAR(50) NOT NULL,
+    price_factor DECIMAL(6, 2),
+    PRIMARY KEY (hotel_id, meal_plan)
+);
+
+CREATE TABLE IF NOT EXISTS guests (
+    guest_id INTEGER PRIMARY KEY,
+    first_name VARCHAR(100),
+    last_name VARCHAR(100),
+    email VARCHAR(255),
+    phone VARCHAR(50),
+    country VARCHAR(100),
+    city VARCHAR(100),
+    address TEXT,
+    zip_code VARCHAR(20)
+);
+
+-- Create the bookings table. hotel_id repeats the hotel of the room so that the
+-- per-hotel date range queries use the (hotel_id, check_in_date) index alone.
+-- bookings_partitioned.sql creates it partitioned by month of check-in instead.
+CREATE TABLE IF NOT EXISTS bookings (
+    id SERIAL PRIMARY KEY,
+    hotel_id INTEGER NOT NULL REFERENCES hotels (hotel_id),
+    room_id INTEGER NOT NULL REFERENCES rooms (room_id),
+    guest_id INTEGER REFERENCES guests (guest_id),
+    check_in_date DATE NOT NULL,
+    check_out_date DATE NOT NULL,
     total_nights INTEGER,
-    guest_first_name VARCHAR(100),
-    guest_last_name VARCHAR(100),
-    guest_email VARCHAR(255),
-    guest_phone VARCHAR(50),
-    guest_country VARCHAR(100),
-    guest_city VARCHAR(100),
-    guest_address TEXT,
-    guest_zip_code VARCHAR(20),
     meal_plan VARCHAR(50),
-    total_price DECIMAL(10, 2)
-);
\ No newline at end of file
+    total_price DECIMAL(10, 2),
+    FOREIGN KEY (hotel_id, meal_plan) REFERENCES hotel_meal_plans (hotel_id, meal_plan)
+);
+
+-- Per-hotel occupancy and price aggregations over a date range
+CREATE INDEX IF NOT EXISTS bookings_hotel_check_in_idx ON bookings (hotel_id, check_in_date);
+-- Availability of a room: its bookings overlapping a date range
+CREATE INDEX IF NOT EXISTS bookings_room_check_in_idx ON bookings (room_id, check_in_date);
+CREATE INDEX IF NOT EXISTS bookings_guest_idx ON bookings (guest_id);
+-- Rooms of a hotel by type and category
+CREATE INDEX IF NOT EXISTS rooms_hotel_type_idx ON rooms (hotel_id, room_type, room_category);
+
+-- Pre-aggregated answers to the common hotel questions, maintained by load_data.py.
+-- Rooms and room prices per hotel, room type and category, rebuilt with the rooms.
+CREATE TABLE IF NOT EXISTS hotel_room_summary (
+    hotel_id INTEGER NOT NULL REFERENCES hotels (hotel_id),
+    room_type VARCHAR(100) NOT NULL,
+    room_category VARCHAR(100) NOT NULL,
+    rooms INTEGER NOT NULL,
+    min_price_off_season DECIMAL(10, 2),
+    max_price_off_season DECIMAL(10, 2),
+    avg_price_off_season DOUBLE PRECISION,
+    min_price_peak_season DECIMAL(10, 2),
+    max_price_peak_season DECIMAL(10, 2),
+    avg_price_peak_season DOUBLE PRECISION,
+    PRIMARY KEY (hotel_id, room_type, room_category)
+);
+
+-- Bookings, nights and revenue per hotel and month of check-in date, updated with
+-- every chunk of loaded bookings. With the room counts, the monthly occupancy.
+CREATE TABLE IF NOT EXISTS hotel_monthly_bookings (
+    hotel_id INTEGER NOT NULL REFERENCES hotels (hotel_id),
+    month DATE NOT NULL,
+    bookings INTEGER NOT NULL,
+    nights INTEGER NOT NULL,
+    revenue DECIMAL(14, 2) NOT NULL,
+    PRIMARY KEY (hotel_id, month)
+);
+
+-- The bookings with the columns of the former single bookings table
+DROP VIEW IF EXISTS booking_details;
+CREATE VIEW booking_details AS
+SELECT
+    b.id,
+    h.hotel_name,
+    r.room_number AS room_id,
+    r.room_type,
+    r.room_category,
+    b.check_in_date,
+    b.check_out_date,
+    b.total_nights,
+    g.first_name AS guest_first_name,
+    g.last_name AS guest_last_name,
+    g.email AS guest_email,
+    g.phone AS guest_phone,
+    g.country AS guest_country,
+    g.city AS guest_city,
+    g.address AS guest_address,
+    g.zip_code AS guest_zip_code,
+    b.meal_plan,
+    b.total_price
+FROM bookings b
+JOIN hotels h ON h.hotel_id = b.hotel_id
+JOIN rooms r ON r.room_id = b.room_id
+LEFT JOIN guests g ON g.guest_id = b.guest_id;
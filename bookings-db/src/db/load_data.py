@@ -1,88 +1,667 @@
 #!/usr/bin/env python3
-"""Script to load booking data from Excel into PostgreSQL database."""
+"""Script to load booking data into PostgreSQL database.
 
+Bookings are read from ``BOOKINGS_FILE`` (default ``/app/data/all_bookings.parquet``).
+Parquet is the hand-off format written by the generator; ``.xlsx`` files are
+still accepted. Parquet files are read and loaded ``LOAD_BATCH_SIZE`` rows at a
+time, all in one transaction.
+
+The schema (``init.sql``) is normalized: ``hotels``, ``rooms`` and
+``hotel_meal_plans`` are loaded from ``HOTELS_FILE`` (default
+``/app/data/hotels.json``) first, replacing the hotels, guests and bookings of a
+previous load, then every booking is split into a ``guests`` row
+and a ``bookings`` row referencing its hotel, room and guest by id. The
+``booking_details`` view joins them back into the columns of the former single
+bookings table.
+
+Summary tables pre-aggregate the common hotel questions: ``hotel_room_summary``
+(rooms and price ranges per hotel, room type and category) is rebuilt with the rooms,
+and ``hotel_monthly_bookings`` (bookings, nights and revenue per hotel and month of
+check-in date) is updated incrementally with every chunk of loaded bookings.
+
+The loader supports three insertion modes, selected with the ``LOAD_MODE``
+environment variable:
+
+- ``copy`` (default): streams the rows through ``COPY ... FROM STDIN``.
+  Connections without COPY support (e.g. a SQLite stand-in) fall back to ``batch``.
+- ``batch``: multi-row inserts (``execute_values`` on psycopg2, ``executemany``
+  elsewhere).
+- ``row``: the original one ``INSERT`` per row path.
+
+``LOAD_BATCH_SIZE`` controls how many rows are sent per COPY chunk / insert batch.
+
+``BOOKINGS_PARTITIONING=monthly`` creates the bookings table partitioned by month
+of check-in date (``bookings_partitioned.sql``), with one partition per month of
+the loaded bookings.
+"""
+
+import csv
+import io
+import json
 import os
+import sys
+import time
+from contextlib import contextmanager
+
 import pandas as pd
 import psycopg2
-from psycopg2 import OperationalError, DatabaseError
+import pyarrow.parquet as pq
+from psycopg2 import DatabaseError, OperationalError
+from psycopg2.extras import execute_values
+
+DEFAULT_BATCH_SIZE = 10000
+LOAD_MODES = ("copy", "batch", "row")
+PARTITIONING_MODES = ("none", "monthly")
+
+# Columns of the hotel reference tables, in the order of the rows built by ``hotel_rows``
+HOTEL_TABLE_COLUMNS = {
+    'hotels': ('hotel_id', 'hotel_key', 'hotel_name', 'country', 'city', 'zip_code',
+               'address', 'occupancy_discount_percentage', 'extra_bed_charge_percentage',
+               'promotion_discount_percentage'),
+    'rooms': ('room_id', 'hotel_id', 'room_number', 'floor', 'room_type', 'room_category',
+              'guests', 'price_off_season', 'price_peak_season'),
+    'hotel_meal_plans': ('hotel_id', 'meal_plan', 'price_factor'),
+}
+
+# Target columns of the guests table and the source column they are read from
+GUEST_SOURCE_COLUMNS = {
+    'first_name': 'Guest First Name',
+    'last_name': 'Guest Last Name',
+    'email': 'Guest Email',
+    'phone': 'Guest Phone',
+    'country': 'Guest Country',
+    'city': 'Guest City',
+    'address': 'Guest Address',
+    'zip_code': 'Guest Zip Code'
+}
+GUEST_COLUMNS = ('guest_id', *GUEST_SOURCE_COLUMNS)
+
+# Columns of the bookings table, in the order of the rows built by ``booking_rows``
+BOOKING_COLUMNS = ('hotel_id', 'room_id', 'guest_id', 'check_in_date', 'check_out_date',
+                   'total_nights', 'meal_plan', 'total_price')
+
+# Summary tables, rebuilt or updated by the loader
+SUMMARY_TABLES = ('hotel_room_summary', 'hotel_monthly_bookings')
+
+# Tables of init.sql
+SCHEMA_TABLES = (*HOTEL_TABLE_COLUMNS, 'guests', 'bookings', *SUMMARY_TABLES)
+
+# Tables emptied by a load of the hotels, referencing tables before referenced ones
+LOADED_TABLES = ('bookings', 'guests', *SUMMARY_TABLES, *reversed(list(HOTEL_TABLE_COLUMNS)))
+
+ROOM_SUMMARY_SQL = """
+    INSERT INTO hotel_room_summary (
+        hotel_id, room_type, room_category, rooms,
+        min_price_off_season, max_price_off_season, avg_price_off_season,
+        min_price_peak_season, max_price_peak_season, avg_price_peak_season)
+    SELECT hotel_id, room_type, room_category, COUNT(*),
+           MIN(price_off_season), MAX(price_off_season), AVG(price_off_season),
+           MIN(price_peak_season), MAX(price_peak_season), AVG(price_peak_season)
+    FROM rooms
+    GROUP BY hotel_id, room_type, room_category
+"""
+
+# Adds the bookings of a chunk to the monthly totals
+MONTHLY_BOOKINGS_UPSERT_SQL = """
+    INSERT INTO hotel_monthly_bookings (hotel_id, month, bookings, nights, revenue)
+    VALUES ({placeholders})
+    ON CONFLICT (hotel_id, month) DO UPDATE SET
+        bookings = hotel_monthly_bookings.bookings + excluded.bookings,
+        nights = hotel_monthly_bookings.nights + excluded.nights,
+        revenue = hotel_monthly_bookings.revenue + excluded.revenue
+"""
+
+COPY_NULL = r'\N'
+
+SQL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class PhaseTimer:
+    """Collect wall-clock timings for the phases of a load."""
+
+    def __init__(self):
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block and accumulate it under ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self, rows=None):
+        """Print the timing of every phase and, optionally, the insert throughput."""
+        total = sum(self.phases.values())
+        print("Load timing report:")
+        for name, elapsed in self.phases.items():
+            print(f"  {name:<12} {elapsed:8.3f} s")
+        print(f"  {'total':<12} {total:8.3f} s")
+        if rows and self.phases.get('insert'):
+            print(f"  {rows} rows, {rows / self.phases['insert']:.0f} rows/s inserted")
+
+
+class BookingKeys:
+    """Ids of the hotels, rooms and guests referenced by the bookings of a load.
+
+    Rooms are read from the database, so the hotel reference tables must be loaded
+    first. Guests get consecutive ids after the largest one in the database; a guest
+    appearing in several bookings of the load is stored once.
+    """
+
+    def __init__(self, conn):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT h.hotel_name, r.room_number, r.hotel_id, r.room_id "
+                "FROM rooms r JOIN hotels h ON h.hotel_id = r.hotel_id"
+            )
+            self.rooms = {(hotel, room): (hotel_id, room_id)
+                          for hotel, room, hotel_id, room_id in cursor.fetchall()}
+            cursor.execute("SELECT MAX(guest_id) FROM guests")
+            self.next_guest_id = (cursor.fetchone()[0] or 0) + 1
+        finally:
+            cursor.close()
+        self.guests = {}
+
+    def room(self, hotel_name, room_number):
+        """Return the hotel id and room id of a room of the bookings file."""
+        try:
+            return self.rooms[(hotel_name, room_number)]
+        except KeyError:
+            raise ValueError(
+                f"Room '{room_number}' of hotel '{hotel_name}' is not in the rooms table: "
+                "load the hotels.json file generated with the bookings."
+            ) from None
+
+    def guest(self, guest):
+        """Return the id of a guest and whether it is new to this load."""
+        guest_id = self.guests.get(guest)
+        if guest_id is not None:
+            return guest_id, False
+        guest_id = self.guests[guest] = self.next_guest_id
+        self.next_guest_id += 1
+        return guest_id, True
+
 
 def check_table_exists(cursor, table_name):
     """Check if a table exists in the database."""
     cursor.execute("""
         SELECT EXISTS (
-            SELECT FROM information_schema.tables 
+            SELECT FROM information_schema.tables
             WHERE table_name = %s
         );
     """, (table_name,))
     return cursor.fetchone()[0]
 
+def check_table_partitioned(cursor, table_name):
+    """Check if a table is a partitioned table."""
+    cursor.execute("SELECT relkind FROM pg_class WHERE relname = %s;", (table_name,))
+    row = cursor.fetchone()
+    return row is not None and row[0] == 'p'
+
 def execute_sql_file(cursor, file_path):
     """Execute SQL commands from a file."""
     with open(file_path, 'r', encoding='utf-8') as file:
         sql_commands = file.read()
         cursor.execute(sql_commands)
 
-def load_excel_to_postgres():
-    """Load booking data from Excel file into PostgreSQL database."""
-    try:
-        # Connect to PostgreSQL using environment variables
-        conn = psycopg2.connect(
-            host="bookings-db",
-            database=os.getenv('POSTGRES_DB'),
-            user=os.getenv('POSTGRES_USER'),
-            password=os.getenv('POSTGRES_PASSWORD')
+def create_schema(conn, partitioning="none"):
+    """Create the tables, indexes and views of init.sql that do not exist yet.
+
+    With monthly partitioning, an empty unpartitioned bookings table is replaced by
+    the partitioned one of bookings_partitioned.sql.
+
+    Args:
+        conn: psycopg2 connection
+        partitioning (str): One of ``PARTITIONING_MODES``
+    """
+    if partitioning not in PARTITIONING_MODES:
+        raise ValueError(
+            f"Unknown partitioning '{partitioning}'. Expected one of {PARTITIONING_MODES}."
         )
+    init_sql = os.path.join(SQL_DIR, 'init.sql')
+    cursor = conn.cursor()
+    try:
+        if not all(check_table_exists(cursor, table) for table in SCHEMA_TABLES):
+            print("Tables do not exist. Creating them...")
+            execute_sql_file(cursor, init_sql)
+        if partitioning == "monthly" and not check_table_partitioned(cursor, 'bookings'):
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM bookings);")
+            if cursor.fetchone()[0]:
+                raise ValueError("The bookings table already contains data: "
+                                 "it cannot be partitioned by the loader.")
+            print("Partitioning the bookings table by month of check-in date...")
+            execute_sql_file(cursor, os.path.join(SQL_DIR, 'bookings_partitioned.sql'))
+            execute_sql_file(cursor, init_sql)
+        conn.commit()
+    finally:
+        cursor.close()
 
-        # Create a cursor
-        cursor = conn.cursor()
+def create_monthly_partitions(conn, check_in_dates):
+    """Create the missing monthly partitions of the bookings for some check-in dates.
 
-        # Check if table exists and create it if it doesn't
-        if not check_table_exists(cursor, 'bookings'):
-            print("Table 'bookings' does not exist. Creating it...")
-            execute_sql_file(cursor, '/app/db/init.sql')
-            conn.commit()
+    Args:
+        conn: psycopg2 connection to a database with a partitioned bookings table
+        check_in_dates (pd.Series): Check-in dates of the bookings about to be loaded
+    """
+    months = sorted({(day.year, day.month) for day in check_in_dates.dropna()})
+    with conn.cursor() as cursor:
+        for year, month in months:
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS bookings_{year}_{month:02d} PARTITION OF bookings "
+                f"FOR VALUES FROM ('{year}-{month:02d}-01') "
+                f"TO ('{next_year}-{next_month:02d}-01');"
+            )
+
+def prepare_bookings(df):
+    """Parse the dates of a bookings DataFrame and derive its 'Total Nights' column.
+
+    Args:
+        df (pd.DataFrame): Bookings with the all_bookings columns
+
+    Returns:
+        pd.DataFrame: The same DataFrame, with parsed dates and 'Total Nights'
+    """
+    # Convert date columns to datetime
+    df['Check-in Date'] = pd.to_datetime(df['Check-in Date'])
+    df['Check-out Date'] = pd.to_datetime(df['Check-out Date'])
+
+    # Calculate total nights
+    df['Total Nights'] = (df['Check-out Date'] - df['Check-in Date']).dt.days
+    return df
+
+def read_bookings(bookings_file):
+    """Read the bookings file and derive the columns stored in the database.
+
+    Args:
+        bookings_file (str): Path to the all_bookings Parquet (or Excel) file
+
+    Returns:
+        pd.DataFrame: Bookings with parsed dates and a 'Total Nights' column
+    """
+    if bookings_file.endswith(".parquet"):
+        df = pd.read_parquet(bookings_file)
+    elif bookings_file.endswith(".xlsx"):
+        df = pd.read_excel(bookings_file)
+    else:
+        raise ValueError(f"Unsupported bookings file format: '{bookings_file}'")
+    return prepare_bookings(df)
+
+def iter_bookings(bookings_file, batch_size=DEFAULT_BATCH_SIZE):
+    """Read the bookings file in chunks of at most ``batch_size`` bookings.
+
+    Parquet files are read one record batch at a time, so memory stays bounded
+    whatever the size of the file. Excel files are read at once and yield a
+    single chunk.
+
+    Args:
+        bookings_file (str): Path to the all_bookings Parquet (or Excel) file
+        batch_size (int): Maximum number of bookings per chunk
+
+    Yields:
+        pd.DataFrame: Bookings with parsed dates and a 'Total Nights' column
+    """
+    if not bookings_file.endswith(".parquet"):
+        yield read_bookings(bookings_file)
+        return
+    if not os.path.exists(bookings_file):
+        raise FileNotFoundError(f"The bookings file '{bookings_file}' does not exist.")
+    parquet_file = pq.ParquetFile(bookings_file)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield prepare_bookings(batch.to_pandas())
+
+def column_values(df, source):
+    """Convert a column of the bookings DataFrame into plain Python values.
 
-        # Read the Excel file
-        excel_file = "/app/data/all_bookings.xlsx"
-        df = pd.read_excel(excel_file)
-
-        # Convert date columns to datetime
-        df['Check-in Date'] = pd.to_datetime(df['Check-in Date'])
-        df['Check-out Date'] = pd.to_datetime(df['Check-out Date'])
-        
-        # Calculate total nights
-        df['Total Nights'] = (df['Check-out Date'] - df['Check-in Date']).dt.days
-
-        # Insert data into the database
-        for _, row in df.iterrows():
-            cursor.execute("""
-                INSERT INTO bookings (
-                    hotel_name, room_id, room_type, room_category,
-                    check_in_date, check_out_date, total_nights, guest_first_name,
-                    guest_last_name, guest_email, guest_phone,
-                    guest_country, guest_city, guest_address,
-                    guest_zip_code, meal_plan, total_price
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                row['Hotel Name'], row['Room ID'], row['Room Type'],
-                row['Room Category'], row['Check-in Date'], row['Check-out Date'],
-                row['Total Nights'], row['Guest First Name'], row['Guest Last Name'], row['Guest Email'],
-                row['Guest Phone'], row['Guest Country'], row['Guest City'],
-                row['Guest Address'], row['Guest Zip Code'], row['Meal Plan'],
-                row['Total Price']
+    Args:
+        df (pd.DataFrame): Bookings as returned by ``read_bookings``
+        source (str): Column name
+
+    Returns:
+        list: The values of the column; missing values become ``None``
+    """
+    series = df[source]
+    if source in ('Check-in Date', 'Check-out Date'):
+        return [None if pd.isna(v) else v.date() for v in series]
+    if source == 'Total Nights':
+        return [None if pd.isna(v) else int(v) for v in series]
+    if source == 'Total Price':
+        return [None if pd.isna(v) else float(v) for v in series]
+    return [None if pd.isna(v) else str(v) for v in series]
+
+def booking_rows(df, keys):
+    """Split the bookings DataFrame into guest rows and booking rows.
+
+    Args:
+        df (pd.DataFrame): Bookings as returned by ``read_bookings``
+        keys (BookingKeys): Ids of the rooms, and of the guests already seen
+
+    Returns:
+        tuple: The rows of the new guests, ordered as ``GUEST_COLUMNS``, and one row
+        per booking, ordered as ``BOOKING_COLUMNS``
+    """
+    guests = zip(*(column_values(df, source) for source in GUEST_SOURCE_COLUMNS.values()),
+                 strict=True)
+    bookings = zip(
+        column_values(df, 'Hotel Name'), column_values(df, 'Room ID'),
+        column_values(df, 'Check-in Date'), column_values(df, 'Check-out Date'),
+        column_values(df, 'Total Nights'), column_values(df, 'Meal Plan'),
+        column_values(df, 'Total Price'), strict=True
+    )
+    guest_rows, rows = [], []
+    for guest, (hotel_name, room_number, *booking) in zip(guests, bookings, strict=True):
+        guest_id, new_guest = keys.guest(guest)
+        if new_guest:
+            guest_rows.append((guest_id, *guest))
+        hotel_id, room_id = keys.room(hotel_name, room_number)
+        rows.append((hotel_id, room_id, guest_id, *booking))
+    return guest_rows, rows
+
+def _batches(rows, batch_size):
+    """Yield consecutive slices of ``rows`` with at most ``batch_size`` items."""
+    for start in range(0, len(rows), batch_size):
+        yield rows[start:start + batch_size]
+
+def _placeholder(conn):
+    """Return the DB-API parameter placeholder used by the connection's driver."""
+    driver = sys.modules[type(conn).__module__.split('.')[0]]
+    return '?' if getattr(driver, 'paramstyle', 'pyformat') == 'qmark' else '%s'
+
+def _insert_sql(conn, table, columns):
+    """Build the single-row INSERT statement of a table for the connection's driver."""
+    placeholders = ', '.join([_placeholder(conn)] * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+def _quoted_csv_line(row):
+    """Serialize a row as a CSV line of COPY with every value but None quoted."""
+    return ",".join(
+        COPY_NULL if value is None else '"' + str(value).replace('"', '""') + '"'
+        for value in row
+    )
+
+def copy_rows(conn, table, columns, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """Stream rows into a table with ``COPY ... FROM STDIN``.
+
+    Each batch is serialized as CSV into an in-memory buffer and sent as one COPY.
+    None is written as the unquoted ``COPY_NULL`` marker; a text value spelled as the
+    marker is quoted, so that it is not read back as NULL.
+
+    Args:
+        conn: psycopg2 connection
+        table (str): Table name
+        columns (tuple): Columns of the rows
+        rows (list): Tuples ordered as ``columns``
+        batch_size (int): Number of rows per COPY statement
+    """
+    copy_sql = (
+        f"COPY {table} ({', '.join(columns)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+    )
+    with conn.cursor() as cursor:
+        for batch in _batches(rows, batch_size):
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in batch:
+                if COPY_NULL in row:
+                    buffer.write(_quoted_csv_line(row) + writer.dialect.lineterminator)
+                else:
+                    writer.writerow([COPY_NULL if value is None else value for value in row])
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+
+def insert_rows_batched(conn, table, columns, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """Insert rows with multi-row statements.
+
+    Uses ``execute_values`` for psycopg2 connections and ``executemany`` for any
+    other DB-API connection (e.g. ``sqlite3``).
+
+    Args:
+        conn: DB-API connection
+        table (str): Table name
+        columns (tuple): Columns of the rows
+        rows (list): Tuples ordered as ``columns``
+        batch_size (int): Number of rows per statement
+    """
+    cursor = conn.cursor()
+    try:
+        if isinstance(conn, psycopg2.extensions.connection):
+            execute_values(
+                cursor,
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s",
+                rows,
+                page_size=batch_size
+            )
+        else:
+            insert_sql = _insert_sql(conn, table, columns)
+            for batch in _batches(rows, batch_size):
+                cursor.executemany(insert_sql, batch)
+    finally:
+        cursor.close()
+
+def insert_rows_rowwise(conn, table, columns, rows):
+    """Insert rows one ``INSERT`` statement at a time (original loader behavior)."""
+    cursor = conn.cursor()
+    try:
+        insert_sql = _insert_sql(conn, table, columns)
+        for row in rows:
+            cursor.execute(insert_sql, row)
+    finally:
+        cursor.close()
+
+def load_bookings(conn, df, mode="copy", batch_size=DEFAULT_BATCH_SIZE, timer=None,
+                  keys=None):
+    """Load a bookings DataFrame into the guests and bookings tables.
+
+    The monthly totals of ``hotel_monthly_bookings`` are updated with the bookings.
+    The caller owns the transaction: this function does not commit.
+
+    Args:
+        conn: DB-API connection (psycopg2, or a stand-in such as sqlite3)
+        df (pd.DataFrame): Bookings as returned by ``read_bookings``
+        mode (str): One of ``LOAD_MODES``
+        batch_size (int): Rows per COPY chunk or insert batch
+        timer (PhaseTimer): Optional timer receiving the 'prepare', 'insert' and
+            'summaries' phases
+        keys (BookingKeys): Ids of the rooms and guests, shared by the chunks of a load
+            (read from the database if not given)
+
+    Returns:
+        int: Number of bookings loaded
+    """
+    if mode not in LOAD_MODES:
+        raise ValueError(f"Unknown load mode '{mode}'. Expected one of {LOAD_MODES}.")
+    if batch_size < 1:
+        raise ValueError("The batch size must be a positive integer.")
+    timer = timer or PhaseTimer()
+
+    with timer.phase('prepare'):
+        keys = keys or BookingKeys(conn)
+        guest_rows, rows = booking_rows(df, keys)
+
+    if mode == "copy" and not isinstance(conn, psycopg2.extensions.connection):
+        print("Connection does not support COPY. Falling back to batched inserts.")
+        mode = "batch"
+
+    with timer.phase('insert'):
+        for table, columns, table_rows in (('guests', GUEST_COLUMNS, guest_rows),
+                                           ('bookings', BOOKING_COLUMNS, rows)):
+            if mode == "copy":
+                copy_rows(conn, table, columns, table_rows, batch_size)
+            elif mode == "batch":
+                insert_rows_batched(conn, table, columns, table_rows, batch_size)
+            else:
+                insert_rows_rowwise(conn, table, columns, table_rows)
+
+    with timer.phase('summaries'):
+        update_monthly_bookings(conn, rows)
+    return len(rows)
+
+def monthly_booking_rows(rows):
+    """Total the bookings per hotel and month of check-in date.
+
+    Args:
+        rows (list): Booking rows, ordered as ``BOOKING_COLUMNS``
+
+    Returns:
+        list: One (hotel_id, month, bookings, nights, revenue) row per hotel and month,
+        the month being its first day; bookings without a check-in date are left out
+    """
+    totals = {}
+    for hotel_id, _, _, check_in_date, _, total_nights, _, total_price in rows:
+        if check_in_date is None:
+            continue
+        key = (hotel_id, check_in_date.replace(day=1))
+        bookings, nights, revenue = totals.get(key, (0, 0, 0.0))
+        totals[key] = (bookings + 1, nights + (total_nights or 0),
+                       revenue + (total_price or 0.0))
+    return [(hotel_id, month, bookings, nights, round(revenue, 2))
+            for (hotel_id, month), (bookings, nights, revenue) in sorted(totals.items())]
+
+def update_monthly_bookings(conn, rows):
+    """Add bookings to the monthly totals of ``hotel_monthly_bookings``.
+
+    Args:
+        conn: DB-API connection (psycopg2, or a stand-in such as sqlite3)
+        rows (list): Booking rows just inserted, ordered as ``BOOKING_COLUMNS``
+    """
+    upsert_sql = MONTHLY_BOOKINGS_UPSERT_SQL.format(
+        placeholders=', '.join([_placeholder(conn)] * 5)
+    )
+    cursor = conn.cursor()
+    try:
+        cursor.executemany(upsert_sql, monthly_booking_rows(rows))
+    finally:
+        cursor.close()
+
+def hotel_rows(hotels):
+    """Convert the hotels of hotels.json into the rows of the hotel reference tables.
+
+    Hotels and rooms are numbered in the order of the file.
+
+    Args:
+        hotels (list): Hotels, as in the 'Hotels' list of hotels.json
+
+    Returns:
+        dict: Rows of each table of ``HOTEL_TABLE_COLUMNS``, as lists of tuples
+    """
+    rows = {table: [] for table in HOTEL_TABLE_COLUMNS}
+    for hotel_id, hotel in enumerate(hotels, start=1):
+        address = hotel['Address']
+        params = hotel['SyntheticParams']
+        rows['hotels'].append((
+            hotel_id, str(hotel['hotelkey']), hotel['Name'], address['Country'],
+            address['City'], str(address['ZipCode']), address['Address'],
+            params['OccupancyBaseDiscountPercentage'], params['ExtraBedChargePercentage'],
+            params['PromotionPriceDiscount']
+        ))
+        for room in hotel['Rooms']:
+            rows['rooms'].append((
+                len(rows['rooms']) + 1, hotel_id, room['RoomId'], int(room['Floor']),
+                room['Type'], room['Category'], room['Guests'], room['PriceOffSeason'],
+                room['PricePeakSeason']
             ))
+        for meal_plan, price_factor in params['MealPlanPrices'].items():
+            rows['hotel_meal_plans'].append((hotel_id, meal_plan, price_factor))
+    return rows
+
+def load_hotels(conn, hotels_file):
+    """Replace the contents of the hotel reference tables with the hotels of hotels.json.
+
+    The bookings reference the hotels and rooms, and are generated with them: the
+    bookings, guests and summary tables are emptied too, so that a database can be
+    reloaded, and ``hotel_room_summary`` is rebuilt from the rooms. The bookings are
+    then loaded with ``load_bookings``, which adds them to ``hotel_monthly_bookings``.
+    The caller owns the transaction: this function does not commit.
+
+    Args:
+        conn: DB-API connection (psycopg2, or a stand-in such as sqlite3)
+        hotels_file (str): Path to the hotels.json file written by the generator
+
+    Returns:
+        int: Number of hotels loaded
+    """
+    if not os.path.exists(hotels_file):
+        raise FileNotFoundError(f"The hotels file '{hotels_file}' does not exist.")
+    with open(hotels_file, encoding='utf-8') as file:
+        rows = hotel_rows(json.load(file)['Hotels'])
+
+    placeholder = _placeholder(conn)
+    cursor = conn.cursor()
+    try:
+        # Children first on delete, parents first on insert
+        if isinstance(conn, psycopg2.extensions.connection):
+            cursor.execute(f"TRUNCATE {', '.join(LOADED_TABLES)}")
+        else:
+            for table in LOADED_TABLES:
+                cursor.execute(f"DELETE FROM {table}")
+        for table, columns in HOTEL_TABLE_COLUMNS.items():
+            cursor.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES ({', '.join([placeholder] * len(columns))})",
+                rows[table]
+            )
+        cursor.execute(ROOM_SUMMARY_SQL)
+    finally:
+        cursor.close()
+    return len(rows['hotels'])
+
+def load_bookings_to_postgres():
+    """Load booking data from the bookings file into PostgreSQL database."""
+    conn = None
+    timer = PhaseTimer()
+    bookings_file = os.getenv('BOOKINGS_FILE', '/app/data/all_bookings.parquet')
+    hotels_file = os.getenv('HOTELS_FILE', '/app/data/hotels.json')
+    load_mode = os.getenv('LOAD_MODE', 'copy').lower()
+    batch_size = int(os.getenv('LOAD_BATCH_SIZE', str(DEFAULT_BATCH_SIZE)))
+    partitioning = os.getenv('BOOKINGS_PARTITIONING', 'none').lower()
+    try:
+        # Connect to PostgreSQL using environment variables
+        with timer.phase('connect'):
+            conn = psycopg2.connect(
+                host="bookings-db",
+                database=os.getenv('POSTGRES_DB'),
+                user=os.getenv('POSTGRES_USER'),
+                password=os.getenv('POSTGRES_PASSWORD')
+            )
+
+        # Create the tables that don't exist, partitioned if requested
+        create_schema(conn, partitioning)
+
+        # Load the hotel reference tables
+        with timer.phase('hotels'):
+            hotels = load_hotels(conn, hotels_file)
+            keys = BookingKeys(conn)
+        print(f"Hotels loaded successfully into the database ({hotels} hotels).")
+
+        # Read the bookings file chunk by chunk and insert each chunk into the database
+        rows = 0
+        chunks = iter_bookings(bookings_file, batch_size)
+        while True:
+            with timer.phase('read'):
+                df = next(chunks, None)
+            if df is None:
+                break
+            if partitioning == "monthly":
+                create_monthly_partitions(conn, df['Check-in Date'])
+            rows += load_bookings(conn, df, mode=load_mode, batch_size=batch_size,
+                                  timer=timer, keys=keys)
 
         # Commit the transaction
-        conn.commit()
-        print("Data loaded successfully into the database.")
+        with timer.phase('commit'):
+            conn.commit()
+        print(f"Data loaded successfully into the database ({rows} rows, mode '{load_mode}', "
+              f"{len(keys.guests)} guests).")
+        timer.report(rows)
 
     except (OperationalError, DatabaseError, FileNotFoundError, ValueError) as error:
         print(f"Error while connecting to PostgreSQL: {error}")
     finally:
         if conn:
-            cursor.close()
             conn.close()
             print("PostgreSQL connection is closed.")
 
 if __name__ == "__main__":
-    load_excel_to_postgres()
+    load_bookings_to_postgres()
@@ -1,27 +1,22 @@
 """Module for generating synthetic hotel and booking data."""
 
+import argparse
 import os
+import random
 import sys
 import time
 import yaml
+from faker import Faker
 
 # Add parent directory to path to allow running directly: python gen_synthetic_hotels.py
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.generator.hotel_generator import generate_hotels
-from src.generator.booking_generator import generate_hotel_bookings
-from src.generator.hotel_query_generator import HotelQueryGenerator
-from src.output.booking_output_writer import \
-    generate_file_md_hotel_bookings, \
-    generate_file_excel_all_bookings
-from src.output.hotel_output_writer import \
-    generate_file_json_for_hotels, \
-    generate_file_excel_for_hotels, \
-    generate_file_csv_for_hotels, \
-    generate_file_csv_for_all_hotels, \
-    generate_file_md_hotel_details, \
-    generate_file_md_hotel_rooms
-from src.output.hotel_query_writer import generate_file_csv_for_queries_room_hotels
+from src.output.booking_stream_writer import DEFAULT_CHUNK_SIZE
+from src.pipeline.generation_pipeline import run_generation_pipeline
+from src.pipeline.stage_cache import StageCache
+
+# Cache of the pipeline stages, relative to bookings-db/ unless absolute
+DEFAULT_CACHE_PATH = "output_files/.cache/"
 
 
 def load_config(config_path="../config/generate_hotels_param.yaml"):
@@ -75,8 +70,35 @@ def load_config_queries(config_path="../config/hotel_queries.yaml"):
 
     return config
 
+def parse_args(argv=None):
+    """Parse the command line arguments of the generator.
+
+    Args:
+        argv (list): Arguments to parse (defaults to sys.argv)
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Generate synthetic hotel and booking data.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of processes generating hotel bookings (default: 1)")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="Master random seed of the generation run (default: 42)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Number of bookings written per chunk "
+                             f"(default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Directory of the cached pipeline stages (default: "
+                             f"process.cache_path of the configuration, or {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Run every pipeline stage, ignoring the cached stages")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
     start_time = time.time()
+    args = parse_args()
+    random.seed(args.seed)
+    Faker.seed(args.seed)
     # Get absolute paths based on script location
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)  # bookings-db/
@@ -84,13 +106,12 @@ if __name__ == "__main__":
     print(f"script_dir: {script_dir}")
     print(f"project_root: {project_root}")
     
-    hotelGenerationConfig = load_config(os.path.join(script_dir,
-                                         "../config/generate_hotels_param.yaml"))
-    queries_config = load_config_queries(os.path.join(script_dir,
-                                        "../config/hotel_queries.yaml"))
-    print(f"hotelGenerationConfig: {os.path.join(script_dir,
-                                        "../config/generate_hotels_param.yaml")}")
-    print(f"queries_config: {os.path.join(script_dir, "../config/hotel_queries.yaml")}")
+    hotel_config_path = os.path.join(script_dir, "../config/generate_hotels_param.yaml")
+    queries_config_path = os.path.join(script_dir, "../config/hotel_queries.yaml")
+    hotelGenerationConfig = load_config(hotel_config_path)
+    queries_config = load_config_queries(queries_config_path)
+    print(f"hotelGenerationConfig: {hotel_config_path}")
+    print(f"queries_config: {queries_config_path}")
     
     # Resolve output paths from config (relative paths are resolved from project_root)
     config_hotels_path = hotelGenerationConfig["process"]["output_path_hotels"]
@@ -102,35 +123,28 @@ if __name__ == "__main__":
     print(f"OUTPUT_PATH_HOTELS: {OUTPUT_PATH_HOTELS}")
     print(f"OUTPUT_PATH_BOOKINGS: {OUTPUT_PATH_BOOKINGS}")
     
+    config_cache_path = args.cache_dir or hotelGenerationConfig["process"].get(
+        "cache_path", DEFAULT_CACHE_PATH)
+    CACHE_PATH = config_cache_path if os.path.isabs(config_cache_path) \
+        else os.path.join(project_root, config_cache_path)
+    print(f"CACHE_PATH: {CACHE_PATH}")
+
     os.makedirs(OUTPUT_PATH_HOTELS, exist_ok=True)
     os.makedirs(OUTPUT_PATH_BOOKINGS, exist_ok=True)
-    hotel_list = generate_hotels(hotelGenerationConfig)
-    generate_file_excel_for_hotels(hotel_list,OUTPUT_PATH_HOTELS)
-    generate_file_json_for_hotels(hotel_list,OUTPUT_PATH_HOTELS)
-    generate_file_csv_for_hotels(hotel_list,OUTPUT_PATH_HOTELS)
-    generate_file_csv_for_all_hotels(hotel_list, OUTPUT_PATH_HOTELS)
-    # Generate queries using the generator
-    query_generator = HotelQueryGenerator(queries_config)
-    hotel_names = [hotel["Name"] for hotel in hotel_list]
-    queries = query_generator.get_room_queries(hotel_names)
-    generate_file_csv_for_queries_room_hotels(queries, OUTPUT_PATH_HOTELS)
-    generate_file_md_hotel_details(hotel_list, OUTPUT_PATH_HOTELS)
-    generate_file_md_hotel_rooms(hotel_list, OUTPUT_PATH_HOTELS)
-
-
-    hotel_booking_list = []
-
-    for hotel_to_book in hotel_list:
-        hotel_bookings = generate_hotel_bookings(hotel_to_book, hotelGenerationConfig)
-        # generate_file_json_for_bookings(hotel_bookings, hotel_to_book["hotelkey"],
-        #       hotel_to_book["Name"], OUTPUT_PATH_BOOKINGS)
-        # generate_file_excel_for_bookings(hotel_bookings, hotel_to_book["hotelkey"],
-        #           hotel_to_book["Name"], OUTPUT_PATH_BOOKINGS)
-        hotel_booking_list.append(hotel_bookings)
-
-    generate_file_md_hotel_bookings(hotel_booking_list, OUTPUT_PATH_HOTELS)
-    generate_file_excel_all_bookings(hotel_booking_list,
-                                     os.path.join(OUTPUT_PATH_BOOKINGS, "all_bookings.xlsx"))
+    # Stages whose inputs did not change since the previous run are reused from the cache
+    stage_cache = StageCache(CACHE_PATH, rebuild=args.rebuild)
+    num_bookings = run_generation_pipeline(hotelGenerationConfig,
+                                           queries_config,
+                                           OUTPUT_PATH_HOTELS,
+                                           OUTPUT_PATH_BOOKINGS,
+                                           stage_cache,
+                                           master_seed=args.seed,
+                                           workers=args.workers,
+                                           chunk_size=args.chunk_size)
+    if num_bookings is not None:
+        print(f"{num_bookings} bookings generated for {hotelGenerationConfig['num_of_hotels']} "
+              f"hotels with {args.workers} worker(s)")
+    print(stage_cache.format_report())
 
     end_time = time.time()
     elapsed_time = end_time - start_time
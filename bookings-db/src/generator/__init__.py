@@ -1,7 +1,32 @@
 """Generator package for creating synthetic hotel and booking data."""
 
-from .hotel_generator import generate_hotels
-from .booking_generator import generate_hotel_bookings, all_date_slots, adjust_slots_forecast
+from .hotel_generator import (
+    generate_hotels,
+    generate_hotel_identities,
+    generate_hotel_rooms,
+    generate_hotel_parametrizations,
+    assemble_hotels
+)
+from .booking_generator import (
+    generate_hotel_bookings,
+    generate_all_hotel_bookings,
+    generate_room_bookings,
+    iter_hotel_bookings,
+    iter_all_hotel_bookings,
+    flatten_booking,
+    generate_room_columns,
+    generate_hotel_booking_table,
+    generate_all_hotel_booking_table,
+    generate_all_room_slots,
+    get_hotel_seed,
+    all_date_slots,
+    adjust_slots_occupancy,
+    adjust_slots_forecast
+)
+from .booking_calendar import BookingCalendar, get_booking_calendar
+from .guest_pool import GuestPool, get_guest_pool
+from .booking_table import BookingTable
+from .room_availability import RoomAvailability
 from .hotel_query_generator import HotelQueryGenerator
 from .hotel_name_location_generator import HotelNameLocationGenerator
 from .parametric_utils import *
@@ -29,18 +54,42 @@ from .parametric_utils import (
     get_number_of_guests,
     get_extra_bed,
     get_meal_plan_prices,
-    get_total_price
+    get_total_price,
+    get_peak_season_days,
+    get_total_prices,
+    get_bookings_total_prices
 )
 
 __all__ = [
     # Hotel generation
     'generate_hotels',
+    'generate_hotel_identities',
+    'generate_hotel_rooms',
+    'generate_hotel_parametrizations',
+    'assemble_hotels',
     'HotelNameLocationGenerator',
 
     # Booking generation
     'generate_hotel_bookings',
+    'generate_all_hotel_bookings',
+    'generate_room_bookings',
+    'iter_hotel_bookings',
+    'iter_all_hotel_bookings',
+    'flatten_booking',
+    'generate_room_columns',
+    'generate_hotel_booking_table',
+    'generate_all_hotel_booking_table',
+    'generate_all_room_slots',
+    'get_hotel_seed',
     'all_date_slots',
+    'adjust_slots_occupancy',
     'adjust_slots_forecast',
+    'BookingCalendar',
+    'get_booking_calendar',
+    'GuestPool',
+    'get_guest_pool',
+    'BookingTable',
+    'RoomAvailability',
 
     # Query generation
     'HotelQueryGenerator',
@@ -67,5 +116,8 @@ __all__ = [
     'get_number_of_guests',
     'get_extra_bed',
     'get_meal_plan_prices',
-    'get_total_price'
+    'get_total_price',
+    'get_peak_season_days',
+    'get_total_prices',
+    'get_bookings_total_prices'
 ]
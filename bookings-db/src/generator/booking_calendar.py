@@ -0,0 +1,126 @@
+"""Module with the day-indexed calendar shared by the booking slot functions."""
+
+import calendar
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+class BookingCalendar:
+    """
+    Calendar of a booking date range indexed by day offset.
+
+    Every day of the range is identified by its offset from the start date
+    (0 for the start date). The per-day and per-month attributes are computed
+    once, so slot functions can represent slots as integer (start, end) offset
+    pairs and resolve weekdays, months and seasons with list lookups.
+
+    Attributes:
+        start_date (pd.Timestamp): First day of the range (offset 0)
+        num_days (int): Number of days in the range
+        weekday (List[int]): Weekday of each day (0=Monday ... 6=Sunday)
+        month_index (List[int]): Index in ``months`` of the month of each day
+        months (List[str]): Month keys ("YYYY-MM") of the range, in order
+        month_start (List[int]): Offset of the first day of each month (may be
+            negative if the range starts mid-month)
+        days_in_month (List[int]): Number of days of each calendar month
+        is_peak_month (List[bool]): Whether each month is peak season
+        is_peak (np.ndarray): Boolean peak season flag of each day
+        weekend_days_before (List[int]): Number of weekend days (Friday to Sunday)
+            before each offset, with one extra entry for ``num_days``
+    """
+
+    def __init__(self, start_date, end_date, peak_season_months):
+        """
+        Build the calendar for the days from start_date to end_date (inclusive).
+
+        Args:
+            start_date: First day of the range (Timestamp, datetime or "YYYY-MM-DD")
+            end_date: Last day of the range
+            peak_season_months (list): Names of the peak season months
+        """
+        self.start_date = pd.Timestamp(start_date).normalize()
+        end_day = np.datetime64(pd.Timestamp(end_date).normalize(), "D")
+        start_day = np.datetime64(self.start_date, "D")
+        if end_day < start_day:
+            raise ValueError("The end date of the booking calendar is before its start date.")
+
+        days = np.arange(start_day, end_day + np.timedelta64(1, "D"))
+        self.num_days = len(days)
+        # 1970-01-01 was a Thursday (weekday 3)
+        self.weekday = ((days.astype(np.int64) + 3) % 7).tolist()
+
+        month_numbers = days.astype("datetime64[M]").astype(np.int64)
+        first_month = int(month_numbers[0])
+        self.month_index = (month_numbers - first_month).tolist()
+
+        self.months = []
+        self.month_start = []
+        self.days_in_month = []
+        self.is_peak_month = []
+        for month_number in range(first_month, int(month_numbers[-1]) + 1):
+            year, month = 1970 + month_number // 12, month_number % 12 + 1
+            self.months.append(f"{year:04d}-{month:02d}")
+            first_day = np.datetime64(f"{year:04d}-{month:02d}-01", "D")
+            self.month_start.append(int((first_day - start_day).astype(np.int64)))
+            self.days_in_month.append(calendar.monthrange(year, month)[1])
+            self.is_peak_month.append(calendar.month_name[month] in peak_season_months)
+
+        self.is_peak = np.array(self.is_peak_month, dtype=bool)[self.month_index]
+        self.weekend_days_before = np.concatenate(
+            ([0], np.cumsum(np.array(self.weekday) >= 4))
+        ).tolist()
+        self._dates = [datetime(d.year, d.month, d.day) for d in days.tolist()]
+        self._date_strings = np.datetime_as_string(days, unit="D").tolist()
+
+    def offset(self, date) -> int:
+        """Return the day offset of a date."""
+        return (pd.Timestamp(date).normalize() - self.start_date).days
+
+    def date(self, offset: int) -> datetime:
+        """Return the date of a day offset as a datetime (midnight)."""
+        return self._dates[offset]
+
+    def date_str(self, offset: int) -> str:
+        """Return the date of a day offset formatted as "YYYY-MM-DD"."""
+        return self._date_strings[offset]
+
+    def epoch_days(self, offsets) -> np.ndarray:
+        """Convert day offsets, inside the range or not, to days since 1970-01-01."""
+        start_day = np.datetime64(self.start_date, "D").astype(np.int64)
+        return start_day + np.asarray(offsets, dtype=np.int64)
+
+    def dates_str(self, offsets) -> list:
+        """Format the dates of day offsets, inside the range or not, as "YYYY-MM-DD"."""
+        days = self.epoch_days(offsets).astype("datetime64[D]")
+        return np.datetime_as_string(days, unit="D").tolist()
+
+    def is_weekend_slot(self, start: int, end: int) -> bool:
+        """Return True if every day from start to end (inclusive) is a Friday to Sunday."""
+        weekend_days = self.weekend_days_before[end + 1] - self.weekend_days_before[start]
+        return weekend_days == end - start + 1
+
+    def month_key(self, offset: int) -> str:
+        """Return the "YYYY-MM" key of the month of a day offset."""
+        return self.months[self.month_index[offset]]
+
+
+def get_booking_calendar(config):
+    """
+    Build the booking calendar of a generation run from its configuration.
+
+    Args:
+        config (dict): Configuration with 'hotel_occupancy.booking_year' and
+            'peak_season_months'
+
+    Returns:
+        BookingCalendar: Calendar from January 1st of the start year to
+        December 31st of the end year
+    """
+    booking_year = config["hotel_occupancy"]["booking_year"]
+    return BookingCalendar(
+        pd.Timestamp(year=booking_year["start"], month=1, day=1),
+        pd.Timestamp(year=booking_year["end"], month=12, day=31),
+        tuple(config["peak_season_months"])
+    )
@@ -1,22 +1,31 @@
 """Module for generating synthetic hotel booking data with realistic patterns and parameters."""
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
+import hashlib
+import os
 import random
-import calendar
-import pandas as pd
+import numpy as np
 from faker import Faker
 from . import parametric_utils as ParUt
 from . import hotel_name_location_generator
+from .booking_calendar import BookingCalendar, get_booking_calendar
+from .booking_table import BookingTable
+from .guest_pool import get_guest_pool
+
+# Reservations are made up to six months before check-in
+RESERVATION_WINDOW_DAYS = 6 * 30
 
 # Name and entity generation
 fake = Faker()
 Faker.seed(42)
 random.seed(42)
 
-def calculate_slot_duration(slot_params: dict, current_date):
+def calculate_slot_duration(slot_params: dict, weekday: int):
     """
     Calculate the duration of a slot based on the current slot count, weekend count, 
-    and the current date.
+    and the weekday of the current date.
 
     Parameters:
     - slot_params (dict): Dictionary containing slot parameters:
@@ -25,8 +34,7 @@ def calculate_slot_duration(slot_params: dict, current_date):
         - weekend_count (int): The number of weekend slots that have been processed so far
         - min_duration (int): The minimum possible duration for a slot
         - max_duration (int): The maximum possible duration for a slot
-    - current_date (datetime): The current date for which the slot duration is being 
-      calculated
+    - weekday (int): Weekday of the current date (0=Monday ... 6=Sunday)
 
     Returns:
     - int: The calculated duration for the slot
@@ -46,29 +54,29 @@ def calculate_slot_duration(slot_params: dict, current_date):
         if (slot_params['weekend_count']/slot_params['week_count']) > 1:
             slot_duration = random.randint(slot_params['min_duration'], slot_params['max_duration'])
         else:
-            if current_date.weekday() < 4:  # Before Friday
+            if weekday < 4:  # Before Friday
                 slot_duration = random.randint(1, 4)
             else:  # Friday
                 slot_duration = 3  # Duration of 3 days
     return slot_duration
 
-def all_date_slots(start_date: pd.Timestamp,
-                end_date: pd.Timestamp,
+def all_date_slots(booking_calendar: BookingCalendar,
                 min_slot: int = 1,
                 max_slot: int = 13):
     """
-    Generate a list of date slots between start_date and end_date.
+    Generate a list of date slots covering the whole booking calendar.
 
     Parameters:
-    - start_date (pd.Timestamp): The start date for slot generation
-    - end_date (pd.Timestamp): The end date for slot generation
+    - booking_calendar (BookingCalendar): Calendar of the booking date range
     - min_slot (int): Minimum slot duration in days
     - max_slot (int): Maximum slot duration in days
 
     Returns:
-    - List[Tuple[pd.Timestamp, pd.Timestamp]]: List of (start, end) date tuples for each slot
+    - List[Tuple[int, int]]: List of (start, end) day offsets (inclusive) for each slot
     """
-    current_date = start_date
+    current_day = 0
+    end_day = booking_calendar.num_days - 1
+    weekdays = booking_calendar.weekday
     slots = []
 
     slot_params = {
@@ -79,64 +87,102 @@ def all_date_slots(start_date: pd.Timestamp,
         'max_duration': max_slot
     }
 
-    while current_date <= end_date:
-        max_possible_duration = min(max_slot, (end_date - current_date).days + 1)
+    while current_day <= end_day:
+        max_possible_duration = min(max_slot, end_day - current_day + 1)
         slot_params['max_duration'] = max_possible_duration
 
-        slot_duration = calculate_slot_duration(slot_params, current_date)
-
-        slot_end = current_date + pd.Timedelta(days=slot_duration - 1)
+        slot_duration = calculate_slot_duration(slot_params, weekdays[current_day])
 
-        # Calculate slot end date
-        slot_end = min(slot_end, end_date)
+        # Calculate slot end day
+        slot_end = min(current_day + slot_duration - 1, end_day)
 
-        if current_date.weekday() == 4 and slot_duration == 1:
+        if weekdays[current_day] == 4 and slot_duration == 1:
             slot_params['weekend_count'] += 1
 
-        slots.append((current_date, slot_end))
+        slots.append((current_day, slot_end))
 
         # Move to the next day after the current slot ends
-        current_date = slot_end + pd.Timedelta(days=1)
+        current_day = slot_end + 1
         slot_params['number_count'] += 1
 
         # Calculate week count
-        days_since_start = (current_date - start_date).days + 1
+        days_since_start = current_day + 1
         slot_params['week_count'] += (days_since_start // 7) - slot_params['week_count']
 
     # Verify if there are remaining days and add single-day slots to cover them
-    remaining_days = (end_date - current_date).days + 1
-    for _ in range(remaining_days):
-        slots.append((current_date, current_date))
-        current_date += pd.Timedelta(days=1)
+    for day in range(current_day, end_day + 1):
+        slots.append((day, day))
 
     return slots
 
 
-def adjust_slots_occupancy(all_slots, peak_season_months, occupancy_peak, occupancy_offseason):
+def _remove_excess_slots(slots, weekend_slots, excess_days, is_peak, rng):
+    """
+    Remove random slots of a month until its excess days are gone.
+
+    Non-weekend slots are drawn uniformly without replacement from an index pool
+    (swap-remove, O(1) per draw) and dropped through a kept-mask, so the month is
+    trimmed in linear time and the remaining slots keep their order. Off-season
+    months also lose one random weekend-only slot.
+
+    Parameters:
+    - slots (List[Tuple[int, int]]): Slots of the month
+    - weekend_slots (List[bool]): Whether each slot only covers Friday to Sunday
+    - excess_days (int): Number of booked days to remove
+    - is_peak (bool): Whether the month is peak season
+    - rng (random.Random): Random number generator
+
+    Returns:
+    - List[Tuple[int, int]]: Remaining slots of the month
+    """
+    kept = [True] * len(slots)
+    pool = [index for index, is_weekend in enumerate(weekend_slots) if not is_weekend]
+
+    # Remove slots to match target occupancy
+    while excess_days > 0 and pool:
+        pick = rng.randrange(len(pool))
+        index = pool[pick]
+        pool[pick] = pool[-1]
+        pool.pop()
+        kept[index] = False
+        excess_days -= slots[index][1] - slots[index][0] + 1
+
+    if not is_peak:
+        weekend_pool = [index for index, is_weekend in enumerate(weekend_slots) if is_weekend]
+        if weekend_pool:
+            kept[rng.choice(weekend_pool)] = False
+
+    return [slot for slot, keep in zip(slots, kept, strict=True) if keep]
+
+
+def adjust_slots_occupancy(all_slots, booking_calendar, occupancy_peak, occupancy_offseason,
+                           rng=None):
     """
     Adjust slot occupancy based on peak and off-season parameters.
 
     Parameters:
-    - all_slots (List[Tuple[pd.Timestamp, pd.Timestamp]]): List of date slots
-    - peak_season_months (Tuple[str]): Months considered peak season
+    - all_slots (List[Tuple[int, int]]): List of (start, end) day offset slots
+    - booking_calendar (BookingCalendar): Calendar the slots refer to
     - occupancy_peak (int): Target occupancy percentage for peak season
     - occupancy_offseason (int): Target occupancy percentage for off-season
+    - rng (random.Random): Random number generator used to pick the removed slots.
+      Defaults to the module-level ``random`` (seeded at import); pass a seeded
+      ``random.Random`` for results independent of any other random draw.
 
     Returns:
-    - List[Tuple[pd.Timestamp, pd.Timestamp]]: Adjusted list of date slots
+    - List[Tuple[int, int]]: Adjusted list of date slots
     """
-    slots_by_month = get_slots_by_month(all_slots)
+    rng = rng or random
+    slots_by_month = get_slots_by_month(all_slots, booking_calendar)
     adjusted_slots = []
 
-    for month, slots in slots_by_month.items():
+    for slots in slots_by_month.values():
         # Calculate month parameters
+        month_index = booking_calendar.month_index[slots[0][0]]
         month_params = {
-            'year': int(month.split('-')[0]),
-            'month_num': int(month.split('-')[1]),
-            'is_peak': calendar.month_name[int(month.split('-')[1])] in peak_season_months,
-            'total_days': calendar.monthrange(int(month.split('-')[0]),
-                                              int(month.split('-')[1]))[1],
-            'current_days': sum((end - start).days + 1 for start, end in slots)
+            'is_peak': booking_calendar.is_peak_month[month_index],
+            'total_days': booking_calendar.days_in_month[month_index],
+            'current_days': sum(end - start + 1 for start, end in slots)
         }
         month_params['target_occupancy'] = (
             occupancy_peak if month_params['is_peak'] else occupancy_offseason
@@ -146,55 +192,33 @@ def adjust_slots_occupancy(all_slots, peak_season_months, occupancy_peak, occupa
         )
 
         if month_params['current_days'] > month_params['target_days']:
-            # Calculate excess days and slot types
-            excess_days = month_params['current_days'] - month_params['target_days']
-            slot_types = {
-                'non_weekend': [
-                    slot for slot in slots
-                    if not all(
-                        (slot[0] + timedelta(days=i)).weekday() in [4, 5, 6]
-                        for i in range((slot[1] - slot[0]).days + 1)
-                    )
-                ],
-                'weekend': [
-                    slot for slot in slots
-                    if all(
-                        (slot[0] + timedelta(days=i)).weekday() in [4, 5, 6]
-                        for i in range((slot[1] - slot[0]).days + 1)
-                    )
-                ]
-            }
-
-            # Remove slots to match target occupancy
-            while excess_days > 0 and slot_types['non_weekend']:
-                slot_to_remove = random.choice(slot_types['non_weekend'])
-                slot_types['non_weekend'].remove(slot_to_remove)
-                slots.remove(slot_to_remove)
-                excess_days -= (slot_to_remove[1] - slot_to_remove[0]).days + 1
-
-            if not month_params['is_peak'] and slot_types['weekend']:
-                slot_to_remove = random.choice(slot_types['weekend'])
-                slot_types['weekend'].remove(slot_to_remove)
-                slots.remove(slot_to_remove)
+            slots = _remove_excess_slots(
+                slots,
+                [booking_calendar.is_weekend_slot(start, end) for start, end in slots],
+                month_params['current_days'] - month_params['target_days'],
+                month_params['is_peak'],
+                rng
+            )
 
         adjusted_slots.extend(slots)
 
     return adjusted_slots
 
 
-def adjust_slots_forecast(all_slots, current_month, reduce_booking_list):
+def adjust_slots_forecast(all_slots, current_month, reduce_booking_list, booking_calendar):
     """
     Adjust the slots to reduce the occupancy progressively starting from the current month.
 
     Parameters:
-    - all_slots (List[Tuple[pd.Timestamp, pd.Timestamp]]): List of slots.
+    - all_slots (List[Tuple[int, int]]): List of (start, end) day offset slots.
     - current_month (str): The current month in "YYYY-MM" format.
     - reduce_booking_list (List[int]): List of reduction percentages for each month.
+    - booking_calendar (BookingCalendar): Calendar the slots refer to.
 
     Returns:
-    - List[Tuple[pd.Timestamp, pd.Timestamp]]: Adjusted list of slots.
+    - List[Tuple[int, int]]: Adjusted list of slots.
     """
-    slots_by_month = get_slots_by_month(all_slots)
+    slots_by_month = get_slots_by_month(all_slots, booking_calendar)
     adjusted_slots, current_month_num, current_year = get_slots_till_current_month(current_month,
                                                                                    slots_by_month)
     adjust_future_slots(slots_by_month, adjusted_slots,
@@ -204,19 +228,25 @@ def adjust_slots_forecast(all_slots, current_month, reduce_booking_list):
     return adjusted_slots
 
 
-def get_slots_by_month(all_slots):
+def get_slots_by_month(all_slots, booking_calendar):
     """
-    Group slots by month.
+    Group slots by the month of their start day.
 
     Parameters:
-    - all_slots (List[Tuple[pd.Timestamp, pd.Timestamp]]): List of date slots
+    - all_slots (List[Tuple[int, int]]): List of (start, end) day offset slots
+    - booking_calendar (BookingCalendar): Calendar the slots refer to
+
+    Returns:
+    - Dict[str, List[Tuple[int, int]]]: Slots grouped by "YYYY-MM" month key
     """
     slots_by_month = {}
-    for start, end in all_slots:
-        month = start.strftime("%Y-%m")
+    months = booking_calendar.months
+    month_index = booking_calendar.month_index
+    for slot in all_slots:
+        month = months[month_index[slot[0]]]
         if month not in slots_by_month:
             slots_by_month[month] = []
-        slots_by_month[month].append((start, end))
+        slots_by_month[month].append(slot)
     return slots_by_month
 
 
@@ -226,11 +256,11 @@ def get_slots_till_current_month(current_month, slots_by_month):
 
     Parameters:
     - current_month (str): The current month in "YYYY-MM" format
-    - slots_by_month (Dict[str, List[Tuple[pd.Timestamp, pd.Timestamp]]]): 
+    - slots_by_month (Dict[str, List[Tuple[int, int]]]):
         Dictionary of slots grouped by month
 
     Returns:
-    - List[Tuple[pd.Timestamp, pd.Timestamp]]: List of slots from months before
+    - List[Tuple[int, int]]: List of slots from months before
         and including the current month
     - int: Current month number
     - int: Current year
@@ -253,9 +283,9 @@ def adjust_future_slots(slots_by_month,
     Adjust future slots based on the reduction percentage for each month.
 
     Parameters:
-    - slots_by_month (Dict[str, List[Tuple[pd.Timestamp, pd.Timestamp]]]): 
+    - slots_by_month (Dict[str, List[Tuple[int, int]]]):
         Dictionary of slots grouped by month
-    - adjusted_slots (List[Tuple[pd.Timestamp, pd.Timestamp]]): List of adjusted slots
+    - adjusted_slots (List[Tuple[int, int]]): List of adjusted slots
     - current_month_num (int): Current month number
     - current_year (int): Current year
     - reduce_booking_list (List[int]): List of reduction percentages for each month
@@ -272,7 +302,7 @@ def adjust_future_slots(slots_by_month,
 
         if month_params['str'] in slots_by_month:
             slots = slots_by_month[month_params['str']]
-            total_days = sum((end - start).days + 1 for start, end in slots)
+            total_days = sum(end - start + 1 for start, end in slots)
             slot_stats = {
                 'total_days': total_days,
                 'target_days': int(total_days * (1 - (reduction / 100))),
@@ -285,10 +315,10 @@ def adjust_future_slots(slots_by_month,
             for slot in slots:
                 if slot_stats['current_days'] >= slot_stats['target_days']:
                     break
-                slot_days = (slot[1] - slot[0]).days + 1
+                slot_days = slot[1] - slot[0] + 1
                 if slot_stats['current_days'] + slot_days > slot_stats['target_days']:
                     slot_days = slot_stats['target_days'] - slot_stats['current_days']
-                    slot = (slot[0], slot[0] + pd.Timedelta(days=slot_days - 1))
+                    slot = (slot[0], slot[0] + slot_days - 1)
                 adjusted_slots.append(slot)
                 slot_stats['current_days'] += slot_days
 
@@ -307,18 +337,43 @@ def _generate_guest_info():
         "Phone": fake.phone_number()
     }
 
-def _generate_booking_params(room, check_in_date):
-    """Generate booking parameters."""
-    params = {
-        'six_months_before': check_in_date - timedelta(days=6 * 30),
-        'room_type_guests': room["Guests"],
-        'non_refundable': ParUt.get_non_refundable(),
-        'extra_bed': ParUt.get_extra_bed(room["Guests"]),
-        'number_of_guests': ParUt.get_number_of_guests(room["Guests"])
+# Booking fields drawn at random, as named in the BookingTable columns
+DRAWN_FIELDS = ('reservation_id', 'number_of_guests', 'extra_bed', 'work_travel', 'meal_plan',
+                'free_cancellation', 'promotion', 'non_refundable', 'cancellation_fee',
+                'cancellation_status')
+
+def _draw_booking_fields(room, synthetic_params):
+    """
+    Draw the random fields of one booking.
+
+    The booking dictionaries and the BookingTable columns are both built from
+    these draws, so every generation path draws the same random numbers in the
+    same order.
+
+    Parameters:
+    - room (dict): Room information
+    - synthetic_params (dict): Synthetic parameters of the hotel
+
+    Returns:
+    - dict: Value of each field of DRAWN_FIELDS
+    """
+    non_refundable = ParUt.get_non_refundable()
+    extra_bed = ParUt.get_extra_bed(room["Guests"])
+    number_of_guests = ParUt.get_number_of_guests(room["Guests"])
+    if extra_bed == "Yes":
+        number_of_guests += 1
+    return {
+        'reservation_id': random.randint(1, 999999),
+        'number_of_guests': number_of_guests,
+        'extra_bed': extra_bed,
+        'work_travel': ParUt.get_work_travel(),
+        'meal_plan': ParUt.get_meal_plan(synthetic_params["MealPlanWeights"]),
+        'free_cancellation': ParUt.get_free_cancellation(),
+        'promotion': ParUt.get_promotion(),
+        'non_refundable': non_refundable,
+        'cancellation_fee': ParUt.get_cancellation_fee(non_refundable),
+        'cancellation_status': ParUt.get_cancellation_status()
     }
-    if params['extra_bed'] == "Yes":
-        params['number_of_guests'] += 1
-    return params
 
 def _create_booking_dict(booking_data: dict):
     """
@@ -327,66 +382,63 @@ def _create_booking_dict(booking_data: dict):
     Parameters:
     - booking_data (dict): Dictionary containing booking information:
         - guest (dict): Guest information
-        - params (dict): Booking parameters
+        - fields (dict): Drawn booking fields (see _draw_booking_fields)
         - room (dict): Room information
-        - check_in_date (pd.Timestamp): Check-in date
-        - check_out_date (pd.Timestamp): Check-out date
-        - synthetic_params (dict): Synthetic parameters
+        - reservation_date (str): Reservation date ("YYYY-MM-DD")
+        - check_in_date (str): Check-in date ("YYYY-MM-DD")
+        - check_out_date (str): Check-out date ("YYYY-MM-DD")
 
     Returns:
-    - dict: Complete booking dictionary
+    - dict: Complete booking dictionary, without its 'TotalPrice'
     """
+    fields = booking_data['fields']
     return {
-        "ReservationID": str(random.randint(1, 999999)).zfill(6),
-        "ReservationDate": fake.date_time_between_dates(
-            booking_data['params']['six_months_before'],
-            booking_data['check_in_date']
-        ).strftime("%Y-%m-%d"),
+        "ReservationID": str(fields['reservation_id']).zfill(6),
+        "ReservationDate": booking_data['reservation_date'],
         "Guest": booking_data['guest'],
-        "NumberOfGuests": booking_data['params']['number_of_guests'],
-        "ExtraBed": booking_data['params']['extra_bed'],
-        "WorkTravel": ParUt.get_work_travel(),
-        "CheckInDate": booking_data['check_in_date'].strftime("%Y-%m-%d"),
-        "CheckOutDate": booking_data['check_out_date'].strftime("%Y-%m-%d"),
+        "NumberOfGuests": fields['number_of_guests'],
+        "ExtraBed": fields['extra_bed'],
+        "WorkTravel": fields['work_travel'],
+        "CheckInDate": booking_data['check_in_date'],
+        "CheckOutDate": booking_data['check_out_date'],
         "RoomAssigned": booking_data['room']["RoomId"],
         "RoomCategory": booking_data['room']["Category"],
         "RoomType": booking_data['room']["Type"],
-        "MealPlan": ParUt.get_meal_plan(booking_data['synthetic_params']["MealPlanWeights"]),
-        "FreeCancellation": ParUt.get_free_cancellation(),
-        "Promotion": ParUt.get_promotion(),
-        "NonRefundable": booking_data['params']['non_refundable'],
-        "CancellationFee": ParUt.get_cancellation_fee(booking_data['params']['non_refundable']),
-        "CancellationStatus": ParUt.get_cancellation_status()
+        "MealPlan": fields['meal_plan'],
+        "FreeCancellation": fields['free_cancellation'],
+        "Promotion": fields['promotion'],
+        "NonRefundable": fields['non_refundable'],
+        "CancellationFee": fields['cancellation_fee'],
+        "CancellationStatus": fields['cancellation_status']
     }
 
 def generate_booking(room, check_in_date, check_out_date, synthetic_params, config):
     """
     Generate a synthetic booking record.
 
+    The guest and the reservation date are generated with Faker.
+
     Parameters:
     - room (dict): Room information
-    - check_in_date (pd.Timestamp): Check-in date
-    - check_out_date (pd.Timestamp): Check-out date
+    - check_in_date (datetime): Check-in date
+    - check_out_date (datetime): Check-out date
     - synthetic_params (dict): Synthetic parameters
     - config (dict): Configuration
 
     Returns:
     - dict: Synthetic booking record
     """
-    # Generate guest information and booking parameters
-    guest = _generate_guest_info()
-    params = _generate_booking_params(room, check_in_date)
-
-    # Create booking dictionary
-    booking_data = {
-        'guest': guest,
-        'params': params,
+    booking = _create_booking_dict({
+        'guest': _generate_guest_info(),
+        'fields': _draw_booking_fields(room, synthetic_params),
         'room': room,
-        'check_in_date': check_in_date,
-        'check_out_date': check_out_date,
-        'synthetic_params': synthetic_params
-    }
-    booking = _create_booking_dict(booking_data)
+        'reservation_date': fake.date_time_between_dates(
+            check_in_date - timedelta(days=RESERVATION_WINDOW_DAYS),
+            check_in_date
+        ).strftime("%Y-%m-%d"),
+        'check_in_date': check_in_date.strftime("%Y-%m-%d"),
+        'check_out_date': check_out_date.strftime("%Y-%m-%d")
+    })
 
     # Calculate and add total price
     booking["TotalPrice"] = ParUt.get_total_price(
@@ -399,17 +451,132 @@ def generate_booking(room, check_in_date, check_out_date, synthetic_params, conf
     return booking
 
 
-def generate_hotel_bookings(hotel, config):
+def _new_numpy_rng():
+    """Create a numpy random generator seeded from the ``random`` module state."""
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def _sample_reservation_days(check_in_days, rng):
+    """
+    Draw the reservation day of bookings uniformly in the six months before check-in.
+
+    Parameters:
+    - check_in_days (list): Check-in day offsets in the booking calendar
+    - rng (np.random.Generator): Random generator
+
+    Returns:
+    - np.ndarray: Reservation day offsets, from 180 days to 1 day before check-in
+    """
+    days_before = rng.integers(1, RESERVATION_WINDOW_DAYS + 1, size=len(check_in_days))
+    return np.asarray(check_in_days, dtype=np.int64) - days_before
+
+
+def _generate_room_slots(hotel, config, booking_calendar):
+    """Generate the booked (start, end) day offset slots of one room of a hotel."""
+    synthetic_params = hotel["SyntheticParams"]
+
+    # Generate and adjust slots
+    all_slots = all_date_slots(booking_calendar)
+
+    adjusted_slots = adjust_slots_occupancy(
+        all_slots,
+        booking_calendar,
+        synthetic_params["OccupancyPeakSeasonWeight"],
+        synthetic_params["OccupancyOffSeasonWeight"]
+    )
+
+    forecast_adjust_slots = adjust_slots_forecast(
+        adjusted_slots,
+        config["hotel_occupancy"]["current_month"],
+        config["hotel_occupancy"]["forecast_reduction_percentage"],
+        booking_calendar
+    )
+
+    return forecast_adjust_slots
+
+
+def _room_column_bookings(columns, room, guest_pool):
+    """
+    Build the booking dictionaries of the columns of generate_room_columns.
+
+    Parameters:
+    - columns (dict): Columns of the bookings of one room
+    - room (dict): Room information
+    - guest_pool (GuestPool): Pool the 'guest' indexes refer to
+
+    Returns:
+    - list: Priced booking dictionaries, in the order of the columns
+    """
+    dates = {
+        name: np.datetime_as_string(np.asarray(columns[name]).astype("datetime64[D]"),
+                                    unit="D").tolist()
+        for name in ('reservation_date', 'check_in_date', 'check_out_date')
+    }
+    bookings = []
+    for i, guest in enumerate(guest_pool.guests(columns['guest'])):
+        booking = _create_booking_dict({
+            'guest': guest,
+            'fields': {name: columns[name][i] for name in DRAWN_FIELDS},
+            'room': room,
+            'reservation_date': dates['reservation_date'][i],
+            'check_in_date': dates['check_in_date'][i],
+            'check_out_date': dates['check_out_date'][i]
+        })
+        booking["TotalPrice"] = columns['total_price'][i]
+        bookings.append(booking)
+    return bookings
+
+
+def generate_room_bookings(room, hotel, config, booking_calendar, guest_pool,
+                           regular_guests=None, slots=None):
+    """
+    Generate the priced synthetic bookings of one room of a hotel.
+
+    The bookings are generated as columns by generate_room_columns, then turned
+    into booking dictionaries.
+
+    Parameters:
+    - room (dict): Room information
+    - hotel (dict): Hotel information
+    - config (dict): Configuration
+    - booking_calendar (BookingCalendar): Calendar of the booking years
+    - guest_pool (GuestPool): Pool the guests of the bookings are sampled from
+    - regular_guests (np.ndarray): Regular guests of the hotel in the pool, if any
+    - slots (list): Booked (start, end) day offset slots of the room, generated
+      here when not given
+
+    Returns:
+    - list: Bookings of the room, in check-in order
+    """
+    columns = generate_room_columns(room, hotel, config, booking_calendar, guest_pool,
+                                    regular_guests, slots)
+    return _room_column_bookings(columns, room, guest_pool)
+
+
+def generate_hotel_bookings(hotel, config, booking_calendar=None, guest_pool=None,
+                            master_seed=42):
     """
     Generate synthetic hotel bookings for a given hotel.
 
     Parameters:
     - hotel (dict): Hotel information
     - config (dict): Configuration
+    - booking_calendar (BookingCalendar): Calendar of the booking years, built from
+      the configuration when not given (build it once to share it between hotels)
+    - guest_pool (GuestPool): Pool of guests, built from the configuration when
+      not given (build it once to share it between hotels)
+    - master_seed (int): Seed of the generation run, seeding the guest pool built
+      when not given
 
     Returns:
     - dict: Synthetic hotel bookings list
     """
+    if booking_calendar is None:
+        booking_calendar = get_booking_calendar(config)
+    if guest_pool is None:
+        guest_pool = get_guest_pool(config, seed=master_seed)
+    regular_guests = guest_pool.sample_regular_guests(_new_numpy_rng())
+
     # Initialize hotel bookings list
     hotel_bookings_list = {
         "HotelKey": hotel["hotelkey"],
@@ -417,50 +584,445 @@ def generate_hotel_bookings(hotel, config):
         "Bookings": []
     }
 
-    # Extract configuration parameters
-    booking_config = {
-        'synthetic_params': hotel["SyntheticParams"],
-        'start_year': config["hotel_occupancy"]["booking_year"]["start"],
-        'end_year': config["hotel_occupancy"]["booking_year"]["end"],
-        'current_month': config["hotel_occupancy"]["current_month"],
-        'forecast_reduction': config["hotel_occupancy"]["forecast_reduction_percentage"],
-        'peak_season_months': tuple(config["peak_season_months"])
+    # Process each room
+    for room in hotel["Rooms"]:
+        hotel_bookings_list["Bookings"].extend(
+            generate_room_bookings(room, hotel, config, booking_calendar, guest_pool,
+                                   regular_guests)
+        )
+
+    return hotel_bookings_list
+
+
+def flatten_booking(hotel_name, booking):
+    """
+    Flatten a booking into the record stored in the all bookings files.
+
+    Parameters:
+    - hotel_name (str): Name of the booked hotel
+    - booking (dict): Booking as generated by generate_hotel_bookings
+
+    Returns:
+    - dict: Booking record keyed by the all bookings column names
+    """
+    guest = booking['Guest']
+    return {
+        'Hotel Name': hotel_name,
+        'Room ID': booking['RoomAssigned'],
+        'Room Type': booking['RoomType'],
+        'Room Category': booking['RoomCategory'],
+        'Check-in Date': booking['CheckInDate'],
+        'Check-out Date': booking['CheckOutDate'],
+        'Guest First Name': guest['FirstName'],
+        'Guest Last Name': guest['LastName'],
+        'Guest Email': guest['Email'],
+        'Guest Phone': guest['Phone'],
+        'Guest Country': guest['Country'],
+        'Guest City': guest['City'],
+        'Guest Address': guest['Address'],
+        'Guest Zip Code': guest['ZipCode'],
+        'Meal Plan': booking['MealPlan'],
+        'Total Price': booking['TotalPrice']
     }
 
-    # Set date range
-    date_range = {
-        'start': pd.Timestamp(year=booking_config['start_year'], month=1, day=1),
-        'end': pd.Timestamp(year=booking_config['end_year'], month=12, day=31)
+
+def iter_hotel_bookings(hotel, config, booking_calendar=None, guest_pool=None,
+                        room_slots=None, master_seed=42):
+    """
+    Generate the bookings of a hotel lazily, as flat booking records.
+
+    Streaming variant of generate_hotel_bookings: the bookings are generated and
+    priced one room at a time, so only the bookings of one room are held in memory.
+    Consuming the iterator draws the same random numbers as generate_hotel_bookings.
+
+    Parameters:
+    - hotel (dict): Hotel information
+    - config (dict): Configuration
+    - booking_calendar (BookingCalendar): Calendar of the booking years, built from
+      the configuration when not given
+    - guest_pool (GuestPool): Pool of guests, built from the configuration when
+      not given
+    - room_slots (list): Slots of each room of the hotel, in room order, generated
+      room by room when not given
+    - master_seed (int): Seed of the generation run, seeding the guest pool built
+      when not given
+
+    Yields:
+    - dict: Booking record (see flatten_booking)
+    """
+    if booking_calendar is None:
+        booking_calendar = get_booking_calendar(config)
+    if guest_pool is None:
+        guest_pool = get_guest_pool(config, seed=master_seed)
+    regular_guests = guest_pool.sample_regular_guests(_new_numpy_rng())
+
+    if room_slots is None:
+        room_slots = [None] * len(hotel["Rooms"])
+    for room, slots in zip(hotel["Rooms"], room_slots, strict=True):
+        for booking in generate_room_bookings(room, hotel, config, booking_calendar,
+                                              guest_pool, regular_guests, slots):
+            yield flatten_booking(hotel["Name"], booking)
+
+
+def generate_room_columns(room, hotel, config, booking_calendar, guest_pool,
+                          regular_guests=None, slots=None):
+    """
+    Generate the priced synthetic bookings of one room as BookingTable columns.
+
+    The fields of each booking are drawn with _draw_booking_fields, one booking
+    after another; generate_room_bookings builds its dictionaries from these
+    columns.
+
+    Parameters:
+    - room (dict): Room information
+    - hotel (dict): Hotel information
+    - config (dict): Configuration
+    - booking_calendar (BookingCalendar): Calendar of the booking years
+    - guest_pool (GuestPool): Pool the guests of the bookings are sampled from
+    - regular_guests (np.ndarray): Regular guests of the hotel in the pool, if any
+    - slots (list): Booked (start, end) day offset slots of the room, generated
+      here when not given (see generate_all_room_slots)
+
+    Returns:
+    - dict: Columns of the room bookings, as accepted by BookingTable.append
+    """
+    synthetic_params = hotel["SyntheticParams"]
+    if slots is None:
+        slots = _generate_room_slots(hotel, config, booking_calendar)
+    start_days = [start_day for start_day, _ in slots]
+    end_days = [end_day for _, end_day in slots]
+
+    # Sample the guests and reservation dates of all the slots at once
+    rng = _new_numpy_rng()
+    guests = guest_pool.sample(len(slots), rng, regular_guests)
+    reservation_days = _sample_reservation_days(start_days, rng)
+
+    # Draw the other fields booking by booking
+    drawn = [_draw_booking_fields(room, synthetic_params) for _ in slots]
+    columns = {name: [fields[name] for fields in drawn] for name in DRAWN_FIELDS}
+
+    check_in_days = booking_calendar.epoch_days(start_days)
+    check_out_days = booking_calendar.epoch_days(end_days)
+
+    # Calculate total prices
+    stays = {
+        'check_in': check_in_days.astype("datetime64[D]"),
+        'check_out': check_out_days.astype("datetime64[D]"),
+        'num_guests': columns['number_of_guests'],
+        'extra_bed': columns['extra_bed'],
+        'meal_plan': columns['meal_plan'],
+        'promotion': columns['promotion']
+    }
+    rooms = {
+        'price_off': [room["PriceOffSeason"]] * len(slots),
+        'price_peak': [room["PricePeakSeason"]] * len(slots),
+        'type': [room["Type"]] * len(slots)
     }
+    total_prices = ParUt.get_total_prices(stays, rooms, config["peak_season_months"],
+                                          synthetic_params)
+
+    columns.update({
+        'hotel_key': hotel["hotelkey"],
+        'hotel_name': hotel["Name"],
+        'room_id': room["RoomId"],
+        'room_type': room["Type"],
+        'room_category': room["Category"],
+        'guest': guests,
+        'reservation_date': booking_calendar.epoch_days(reservation_days),
+        'check_in_date': check_in_days,
+        'check_out_date': check_out_days,
+        'total_price': total_prices
+    })
+    return columns
+
+
+def generate_hotel_booking_table(hotel, config, booking_calendar=None, guest_pool=None,
+                                 booking_table=None, room_slots=None, master_seed=42):
+    """
+    Generate the synthetic bookings of a hotel into a BookingTable.
 
-    # Process each room
-    for room in hotel["Rooms"]:
-        # Generate and adjust slots
-        all_slots = all_date_slots(date_range['start'], date_range['end'])
-
-        adjusted_slots = adjust_slots_occupancy(
-            all_slots,
-            booking_config['peak_season_months'],
-            booking_config['synthetic_params']["OccupancyPeakSeasonWeight"],
-            booking_config['synthetic_params']["OccupancyOffSeasonWeight"]
-        )
+    Columnar variant of generate_hotel_bookings, with the same random draws: the
+    bookings are appended to the table one room at a time.
 
-        forecast_adjust_slots = adjust_slots_forecast(
-            adjusted_slots,
-            booking_config['current_month'],
-            booking_config['forecast_reduction']
-        )
+    Parameters:
+    - hotel (dict): Hotel information
+    - config (dict): Configuration
+    - booking_calendar (BookingCalendar): Calendar of the booking years, built from
+      the configuration when not given
+    - guest_pool (GuestPool): Pool of guests, built from the configuration when
+      not given (ignored when booking_table is given)
+    - booking_table (BookingTable): Table to append the bookings to, a new one
+      when not given
+    - room_slots (list): Slots of each room of the hotel, in room order, generated
+      room by room when not given
+    - master_seed (int): Seed of the generation run, seeding the guest pool built
+      when not given
 
-        # Generate bookings for each slot
-        for slot in forecast_adjust_slots:
-            check_in_date, check_out_date = slot
-            booking = generate_booking(
-                room,
-                check_in_date,
-                check_out_date,
-                hotel["SyntheticParams"],
-                config
-            )
-            hotel_bookings_list["Bookings"].append(booking)
+    Returns:
+    - BookingTable: Table with the bookings of the hotel appended
+    """
+    if booking_calendar is None:
+        booking_calendar = get_booking_calendar(config)
+    if booking_table is None:
+        booking_table = BookingTable(guest_pool if guest_pool is not None
+                                     else get_guest_pool(config, seed=master_seed))
+    guest_pool = booking_table.guest_pool
+    regular_guests = guest_pool.sample_regular_guests(_new_numpy_rng())
+
+    if room_slots is None:
+        room_slots = [None] * len(hotel["Rooms"])
+    for room, slots in zip(hotel["Rooms"], room_slots, strict=True):
+        booking_table.append(generate_room_columns(room, hotel, config, booking_calendar,
+                                                   guest_pool, regular_guests, slots))
+    return booking_table
+
+
+def generate_all_room_slots(hotels, config, booking_calendar=None, master_seed=42,
+                            workers=1):
+    """
+    Generate the booked slots of every room of many hotels, optionally in parallel
+    processes.
 
-    return hotel_bookings_list
+    The slots of each hotel are generated with ``random`` seeded from the master
+    seed and the hotel key, apart from the other booking fields, so they can be
+    generated once and reused (see src/pipeline) when only the pricing, the meal
+    plans or the guests change. They are the same whatever the number of workers.
+
+    Parameters:
+    - hotels (list): Hotels to book
+    - config (dict): Configuration
+    - booking_calendar (BookingCalendar): Calendar of the booking years, built
+      from the configuration when not given
+    - master_seed (int): Seed of the generation run
+    - workers (int): Number of worker processes (1 generates in this process)
+
+    Returns:
+    - dict: Slots of each room (list of (start, end) day offsets, in room order)
+      of each hotel key
+    """
+    if booking_calendar is None:
+        booking_calendar = get_booking_calendar(config)
+    seeds = [get_hotel_seed(master_seed, f"slots:{hotel['hotelkey']}") for hotel in hotels]
+
+    if workers <= 1:
+        _init_booking_worker(config, booking_calendar, None)
+        hotel_slots = [_generate_seeded_hotel_slots(hotel, seed)
+                       for hotel, seed in zip(hotels, seeds, strict=True)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_booking_worker,
+                                 initargs=(config, booking_calendar, None)) as executor:
+            hotel_slots = list(executor.map(_generate_seeded_hotel_slots, hotels, seeds))
+    return {hotel["hotelkey"]: room_slots
+            for hotel, room_slots in zip(hotels, hotel_slots, strict=True)}
+
+
+def get_hotel_seed(master_seed, hotel_key):
+    """
+    Derive the random seed used to generate the bookings of one hotel.
+
+    Parameters:
+    - master_seed (int): Seed of the generation run
+    - hotel_key (str): Hotel key
+
+    Returns:
+    - int: Seed depending only on the master seed and the hotel key
+    """
+    digest = hashlib.sha256(f"{master_seed}:{hotel_key}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+# Configuration and calendar shared by the tasks of a booking worker process
+_worker_context = {}
+
+def _init_booking_worker(config, booking_calendar, guest_pool):
+    """Prepare a worker process for generate_all_hotel_bookings."""
+    _worker_context['config'] = config
+    _worker_context['booking_calendar'] = booking_calendar
+    _worker_context['guest_pool'] = guest_pool
+    # Guests locations come from the naming configuration (loaded as in generate_hotels)
+    hotel_name_location_generator.HotelNameLocationGenerator(
+        base_path=os.path.join(os.path.dirname(os.path.dirname(__file__)), "../config"),
+        config_filename="hotel_naming_location.yaml"
+    )
+
+def _generate_seeded_hotel_slots(hotel, seed):
+    """Generate the slots of the rooms of one hotel after seeding ``random``."""
+    random.seed(seed)
+    return [_generate_room_slots(hotel, _worker_context['config'],
+                                 _worker_context['booking_calendar'])
+            for _ in hotel["Rooms"]]
+
+def _generate_seeded_hotel_bookings(hotel, seed):
+    """Generate the bookings of one hotel after seeding ``random`` and Faker."""
+    random.seed(seed)
+    Faker.seed(seed)
+    return generate_hotel_bookings(hotel,
+                                   _worker_context['config'],
+                                   _worker_context['booking_calendar'],
+                                   _worker_context['guest_pool'])
+
+def generate_all_hotel_bookings(hotels, config, booking_calendar=None, workers=1,
+                                master_seed=42, guest_pool=None):
+    """
+    Generate the bookings of many hotels, optionally in parallel processes.
+
+    Each hotel is generated with ``random`` and Faker seeded from the master seed
+    and its hotel key, so the bookings are the same whatever the number of
+    workers and are returned in the order of ``hotels``.
+
+    Parameters:
+    - hotels (list): Hotels to book
+    - config (dict): Configuration
+    - booking_calendar (BookingCalendar): Calendar of the booking years, built
+      from the configuration when not given
+    - workers (int): Number of worker processes (1 generates in this process)
+    - master_seed (int): Seed of the generation run
+    - guest_pool (GuestPool): Pool of guests, built from the configuration (and
+      the master seed) when not given
+
+    Returns:
+    - list: Synthetic hotel bookings list of each hotel
+    """
+    if booking_calendar is None:
+        booking_calendar = get_booking_calendar(config)
+    if guest_pool is None:
+        guest_pool = get_guest_pool(config, seed=master_seed)
+    seeds = [get_hotel_seed(master_seed, hotel["hotelkey"]) for hotel in hotels]
+
+    if workers <= 1:
+        _init_booking_worker(config, booking_calendar, guest_pool)
+        return [
+            _generate_seeded_hotel_bookings(hotel, seed)
+            for hotel, seed in zip(hotels, seeds, strict=True)
+        ]
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_booking_worker,
+                             initargs=(config, booking_calendar, guest_pool)) as executor:
+        return list(executor.map(_generate_seeded_hotel_bookings, hotels, seeds))
+
+
+def _generate_seeded_hotel_table(hotel, seed, room_slots=None):
+    """Generate the BookingTable of one hotel after seeding ``random`` and Faker."""
+    random.seed(seed)
+    Faker.seed(seed)
+    return generate_hotel_booking_table(hotel,
+                                        _worker_context['config'],
+                                        _worker_context['booking_calendar'],
+                                        _worker_context['guest_pool'],
+                                        room_slots=room_slots)
+
+def _booking_table_records(booking_table, guest_pool):
+    """Return the booking records of a BookingTable received from a worker."""
+    booking_table.guest_pool = guest_pool
+    return booking_table.records()
+
+def iter_all_hotel_bookings(hotels, config, booking_calendar=None, workers=1,
+                            master_seed=42, guest_pool=None, slots=None):
+    """
+    Generate the bookings of many hotels lazily, as flat booking records.
+
+    Streaming variant of generate_all_hotel_bookings, with the same per hotel
+    seeds: the records are the ones of generate_all_hotel_bookings, flattened and
+    in the same order. In a single process the records are generated room by
+    room as they are consumed. With several workers, each worker returns the
+    BookingTable of a whole hotel and at most two hotels per worker are pending
+    at any time, so memory stays bounded whatever the number of hotels.
+
+    Parameters:
+    - hotels (iterable): Hotels to book
+    - config (dict): Configuration
+    - booking_calendar (BookingCalendar): Calendar of the booking years, built
+      from the configuration when not given
+    - workers (int): Number of worker processes (1 generates in this process)
+    - master_seed (int): Seed of the generation run
+    - guest_pool (GuestPool): Pool of guests, built from the configuration (and
+      the master seed) when not given
+    - slots (dict): Slots of the rooms of each hotel key, from
+      generate_all_room_slots, generated with the other booking fields when not
+      given
+
+    Yields:
+    - dict: Booking record (see flatten_booking)
+    """
+    if booking_calendar is None:
+        booking_calendar = get_booking_calendar(config)
+    if guest_pool is None:
+        guest_pool = get_guest_pool(config, seed=master_seed)
+
+    if workers <= 1:
+        _init_booking_worker(config, booking_calendar, guest_pool)
+        for hotel in hotels:
+            seed = get_hotel_seed(master_seed, hotel["hotelkey"])
+            random.seed(seed)
+            Faker.seed(seed)
+            yield from iter_hotel_bookings(hotel, config, booking_calendar, guest_pool,
+                                           None if slots is None else slots[hotel["hotelkey"]])
+        return
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_booking_worker,
+                             initargs=(config, booking_calendar, guest_pool)) as executor:
+        pending = deque()
+        for hotel in hotels:
+            pending.append(executor.submit(_generate_seeded_hotel_table,
+                                           hotel,
+                                           get_hotel_seed(master_seed, hotel["hotelkey"]),
+                                           None if slots is None else slots[hotel["hotelkey"]]))
+            if len(pending) >= 2 * workers:
+                yield from _booking_table_records(pending.popleft().result(), guest_pool)
+        while pending:
+            yield from _booking_table_records(pending.popleft().result(), guest_pool)
+
+
+def generate_all_hotel_booking_table(hotels, config, booking_calendar=None, workers=1,
+                                     master_seed=42, guest_pool=None, slots=None):
+    """
+    Generate the bookings of many hotels into one BookingTable.
+
+    Columnar variant of generate_all_hotel_bookings, with the same per hotel
+    seeds and bookings. Workers send back the compact table of each hotel,
+    which is appended to the result in the order of ``hotels``.
+
+    Parameters:
+    - hotels (list): Hotels to book
+    - config (dict): Configuration
+    - booking_calendar (BookingCalendar): Calendar of the booking years, built
+      from the configuration when not given
+    - workers (int): Number of worker processes (1 generates in this process)
+    - master_seed (int): Seed of the generation run
+    - guest_pool (GuestPool): Pool of guests, built from the configuration (and
+      the master seed) when not given
+    - slots (dict): Slots of the rooms of each hotel key, from
+      generate_all_room_slots, generated with the other booking fields when not
+      given
+
+    Returns:
+    - BookingTable: Bookings of all the hotels
+    """
+    if booking_calendar is None:
+        booking_calendar = get_booking_calendar(config)
+    if guest_pool is None:
+        guest_pool = get_guest_pool(config, seed=master_seed)
+    seeds = [get_hotel_seed(master_seed, hotel["hotelkey"]) for hotel in hotels]
+    hotel_slots = [None if slots is None else slots[hotel["hotelkey"]] for hotel in hotels]
+    booking_table = BookingTable(guest_pool)
+
+    if workers <= 1:
+        _init_booking_worker(config, booking_calendar, guest_pool)
+        for hotel, seed, room_slots in zip(hotels, seeds, hotel_slots, strict=True):
+            random.seed(seed)
+            Faker.seed(seed)
+            generate_hotel_booking_table(hotel, config, booking_calendar,
+                                         booking_table=booking_table, room_slots=room_slots)
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_booking_worker,
+                                 initargs=(config, booking_calendar, guest_pool)) as executor:
+            for hotel_table in executor.map(_generate_seeded_hotel_table, hotels, seeds,
+                                            hotel_slots):
+                booking_table.extend(hotel_table)
+
+    booking_table.compact()
+    return booking_table
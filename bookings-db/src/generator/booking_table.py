@@ -0,0 +1,258 @@
+"""Module with the column-oriented in-memory store of generated bookings."""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+_INITIAL_CAPACITY = 1024
+
+# Low-cardinality columns, stored as integer codes into a list of values
+CATEGORY_COLUMNS = {
+    'hotel_key': np.int32,
+    'hotel_name': np.int32,
+    'room_id': np.int32,
+    'room_type': np.int8,
+    'room_category': np.int8,
+    'meal_plan': np.int8,
+    'extra_bed': np.int8,
+    'cancellation_fee': np.int8,
+    'cancellation_status': np.int8
+}
+
+# "Yes"/"No" columns, stored as booleans
+FLAG_COLUMNS = ('work_travel', 'free_cancellation', 'promotion', 'non_refundable')
+
+# Date columns, stored as days since 1970-01-01
+DATE_COLUMNS = ('reservation_date', 'check_in_date', 'check_out_date')
+
+# Remaining columns and their dtypes ('guest' is an index in the guest pool)
+VALUE_COLUMNS = {
+    'reservation_id': np.int32,
+    'guest': np.int32,
+    'number_of_guests': np.int8,
+    'total_price': np.float64
+}
+
+_COLUMN_DTYPES = {
+    **CATEGORY_COLUMNS,
+    **{name: np.bool_ for name in FLAG_COLUMNS},
+    **{name: np.int32 for name in DATE_COLUMNS},
+    **VALUE_COLUMNS
+}
+
+
+class BookingTable:
+    """
+    Column store of generated bookings.
+
+    Every booking field is kept in one NumPy array: low-cardinality strings as
+    codes into per-column category lists, "Yes"/"No" flags as booleans, dates
+    as day ordinals (days since 1970-01-01) and the guest as an index in a
+    ``GuestPool``. Bookings are appended in batches (see ``append``) and read
+    back as DataFrames or flat booking records for the writers and the loader.
+
+    Attributes:
+        guest_pool (GuestPool): Pool the 'guest' indexes refer to
+    """
+
+    def __init__(self, guest_pool):
+        """
+        Args:
+            guest_pool (GuestPool): Pool the guests of the bookings are sampled from
+        """
+        self.guest_pool = guest_pool
+        self._size = 0
+        self._data = {
+            name: np.empty(_INITIAL_CAPACITY, dtype=dtype)
+            for name, dtype in _COLUMN_DTYPES.items()
+        }
+        self._categories = {name: [] for name in CATEGORY_COLUMNS}
+        self._category_codes = {name: {} for name in CATEGORY_COLUMNS}
+
+    def __len__(self):
+        return self._size
+
+    def __getstate__(self):
+        # The guest pool is shared: it is not copied with the table (see extend)
+        self.compact()
+        state = self.__dict__.copy()
+        state['guest_pool'] = None
+        return state
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated by the column arrays."""
+        return sum(array.nbytes for array in self._data.values())
+
+    def categories(self, name: str) -> list[str]:
+        """Return the values of a category column, in code order."""
+        return self._categories[name]
+
+    def codes(self, name: str, start: int = 0, stop: int = None) -> np.ndarray:
+        """Return the codes of a category column for the bookings [start, stop)."""
+        return self._data[name][start:self._stop(stop)]
+
+    def _stop(self, stop):
+        """Clip a slice end to the number of bookings."""
+        return self._size if stop is None else min(stop, self._size)
+
+    def _reserve(self, size):
+        """Grow the column arrays, doubling their capacity, to hold size bookings."""
+        capacity = len(self._data['total_price'])
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name, array in self._data.items():
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[:self._size] = array[:self._size]
+            self._data[name] = grown
+
+    def compact(self):
+        """Release the capacity not used by the bookings."""
+        capacity = max(self._size, 1)
+        for name, array in self._data.items():
+            if len(array) != capacity:
+                self._data[name] = array[:capacity].copy()
+
+    def _encode(self, name, values) -> np.ndarray:
+        """Return the codes of category values, adding the new values."""
+        codes = self._category_codes[name]
+        categories = self._categories[name]
+        encoded = np.empty(len(values), dtype=CATEGORY_COLUMNS[name])
+        for i, value in enumerate(values):
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(categories)
+                categories.append(value)
+            encoded[i] = code
+        return encoded
+
+    def append(self, columns: dict[str, Any]) -> None:
+        """
+        Append a batch of bookings.
+
+        Args:
+            columns (dict): One equal-length array-like per column of the table:
+                category values, "Yes"/"No" (or boolean) flags, day ordinals for
+                the dates. A category column may also be given as a single value
+                shared by the whole batch.
+
+        Raises:
+            ValueError: If a column is missing or the columns differ in length
+        """
+        missing = set(_COLUMN_DTYPES) - set(columns)
+        if missing:
+            raise ValueError(f"Missing booking columns: {sorted(missing)}")
+        count = len(columns['check_in_date'])
+
+        encoded = {}
+        for name in _COLUMN_DTYPES:
+            values = columns[name]
+            if name in CATEGORY_COLUMNS:
+                if isinstance(values, str):
+                    values = np.full(count, self._encode(name, [values])[0])
+                else:
+                    values = self._encode(name, values)
+            elif name in FLAG_COLUMNS:
+                values = np.asarray(values)
+                if values.dtype.kind in "US":
+                    values = values == "Yes"
+            encoded[name] = values
+        self._append_encoded(encoded, count)
+
+    def _append_encoded(self, columns, count):
+        """Append a batch of bookings whose category columns are already codes."""
+        self._reserve(self._size + count)
+        end = self._size + count
+        for name in _COLUMN_DTYPES:
+            values = np.asarray(columns[name])
+            if len(values) != count:
+                raise ValueError(f"Booking column '{name}' has {len(values)} values "
+                                 f"instead of {count}.")
+            self._data[name][self._size:end] = values
+        self._size = end
+
+    def extend(self, other: "BookingTable") -> None:
+        """Append the bookings of another table sharing the same guest pool."""
+        columns = {name: other._data[name][:len(other)] for name in _COLUMN_DTYPES}
+        for name in CATEGORY_COLUMNS:
+            # Map the codes of the other table to the codes of this one
+            remap = self._encode(name, other._categories[name])
+            columns[name] = remap[columns[name]]
+        self._append_encoded(columns, len(other))
+
+    def column(self, name: str, start: int = 0, stop: int = None):
+        """
+        Return the values of a column for the bookings [start, stop).
+
+        Returns:
+            pd.Categorical for category columns, datetime64[D] arrays for dates,
+            NumPy arrays otherwise
+        """
+        values = self._data[name][start:self._stop(stop)]
+        if name in CATEGORY_COLUMNS:
+            return pd.Categorical.from_codes(values, categories=self._categories[name])
+        if name in DATE_COLUMNS:
+            return values.astype("datetime64[D]")
+        return values
+
+    def to_dataframe(self, start: int = 0, stop: int = None) -> pd.DataFrame:
+        """
+        Return the bookings [start, stop) with the all_bookings columns.
+
+        Low-cardinality columns are categoricals and dates are datetime64, so the
+        frame can be written to Parquet or loaded into the database directly.
+
+        Returns:
+            pd.DataFrame: One row per booking, columns as in ``flatten_booking``
+        """
+        stop = self._stop(stop)
+        guests = self.guest_pool.columns(self._data['guest'][start:stop])
+        return pd.DataFrame({
+            'Hotel Name': self.column('hotel_name', start, stop),
+            'Room ID': self.column('room_id', start, stop),
+            'Room Type': self.column('room_type', start, stop),
+            'Room Category': self.column('room_category', start, stop),
+            'Check-in Date': self.column('check_in_date', start, stop),
+            'Check-out Date': self.column('check_out_date', start, stop),
+            'Guest First Name': guests['FirstName'],
+            'Guest Last Name': guests['LastName'],
+            'Guest Email': guests['Email'],
+            'Guest Phone': guests['Phone'],
+            'Guest Country': guests['Country'],
+            'Guest City': guests['City'],
+            'Guest Address': guests['Address'],
+            'Guest Zip Code': guests['ZipCode'],
+            'Meal Plan': self.column('meal_plan', start, stop),
+            'Total Price': self.column('total_price', start, stop)
+        })
+
+    def records(self, start: int = 0, stop: int = None) -> list[dict[str, Any]]:
+        """
+        Return the bookings [start, stop) as flat booking records.
+
+        The records are the ones of ``flatten_booking``: dates are "YYYY-MM-DD"
+        strings and prices floats, except the integer 0 of the stays without
+        nights or promotion (see ``get_total_prices``).
+        """
+        stop = self._stop(stop)
+        df = self.to_dataframe(start, stop)
+        columns = {}
+        for name, series in df.items():
+            if name in ('Check-in Date', 'Check-out Date'):
+                columns[name] = np.datetime_as_string(series.to_numpy(), unit="D").tolist()
+            else:
+                columns[name] = series.tolist()
+        unpriced = (
+            (self._data['check_out_date'][start:stop] <= self._data['check_in_date'][start:stop])
+            & ~self._data['promotion'][start:stop]
+        )
+        columns['Total Price'] = [
+            0 if is_unpriced else price
+            for price, is_unpriced in zip(columns['Total Price'], unpriced.tolist(), strict=True)
+        ]
+        names = list(columns)
+        return [dict(zip(names, values, strict=True))
+                for values in zip(*columns.values(), strict=True)]
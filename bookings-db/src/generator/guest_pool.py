@@ -0,0 +1,220 @@
+"""Module with the pre-generated pool of guest profiles sampled by the bookings."""
+
+import os
+import re
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from faker import Faker
+
+from . import hotel_name_location_generator
+
+DEFAULT_POOL_SIZE = 20000
+DEFAULT_REPEAT_GUEST_RATIO = 0.1
+DEFAULT_REGULAR_GUESTS_PER_HOTEL = 100
+
+# Number of distinct values generated with Faker for each guest field
+VALUES_PER_FIELD = 2000
+
+# Guest fields generated with Faker, and the provider generating each of them
+_FAKER_FIELDS = {
+    "FirstName": "first_name",
+    "LastName": "last_name",
+    "ZipCode": "zipcode",
+    "Address": "street_address",
+    "Phone": "phone_number",
+    "EmailDomain": "safe_domain_name"
+}
+
+
+class GuestPool:
+    """
+    Column-oriented pool of synthetic guest profiles.
+
+    Guest profiles are generated once, when the pool is built: Faker generates
+    up to ``VALUES_PER_FIELD`` values of each field and every profile combines
+    randomly picked values, stored as one index array per field. The email of
+    a guest is built from its name and its index, so it is unique. Bookings
+    pick guests by index, so the cost of a guest per booking is a few list
+    lookups instead of a call to every Faker provider.
+
+    Each hotel may have a set of regular guests (``sample_regular_guests``): a
+    share ``repeat_guest_ratio`` of its bookings is made by one of them, the
+    rest by any guest of the pool.
+
+    Attributes:
+        size (int): Number of guest profiles
+        repeat_guest_ratio (float): Share of the bookings of a hotel made by its
+            regular guests
+        regular_guests_per_hotel (int): Number of regular guests of each hotel
+        countries (List[str]): Guest countries
+        cities (List[str]): Guest cities
+    """
+
+    def __init__(self, size, guest_locations, repeat_guest_ratio=0.0,
+                 regular_guests_per_hotel=DEFAULT_REGULAR_GUESTS_PER_HOTEL, seed=None):
+        """
+        Generate the guest profiles of the pool.
+
+        Args:
+            size (int): Number of guest profiles
+            guest_locations (Dict[str, List[str]]): Cities of each guest country
+            repeat_guest_ratio (float): Share of the bookings of a hotel made by
+                its regular guests (0 disables regular guests)
+            regular_guests_per_hotel (int): Number of regular guests of each hotel
+            seed (int): Seed of the guest profiles
+
+        Raises:
+            ValueError: If a parameter is out of range or there are no guest locations
+        """
+        if size < 1:
+            raise ValueError("The size of the guest pool must be a positive integer.")
+        if not 0.0 <= repeat_guest_ratio <= 1.0:
+            raise ValueError("The repeat guest ratio must be between 0 and 1.")
+        if regular_guests_per_hotel < 1:
+            raise ValueError("The number of regular guests per hotel must be positive.")
+        if not guest_locations:
+            raise ValueError("The list of guest locations is empty.")
+
+        self.size = size
+        self.repeat_guest_ratio = repeat_guest_ratio
+        self.regular_guests_per_hotel = min(regular_guests_per_hotel, size)
+
+        fake = Faker()
+        fake.seed_instance(seed)
+        rng = np.random.default_rng(seed)
+
+        num_values = min(size, VALUES_PER_FIELD)
+        self._values = {
+            field: np.array([getattr(fake, provider)() for _ in range(num_values)], dtype=object)
+            for field, provider in _FAKER_FIELDS.items()
+        }
+        self._indexes = {
+            field: rng.integers(num_values, size=size, dtype=np.int32)
+            for field in _FAKER_FIELDS
+        }
+
+        # Guest locations: a country, then one of its cities, both uniformly
+        self.countries = list(guest_locations)
+        self.cities = [city for cities in guest_locations.values() for city in cities]
+        num_cities = np.array([len(cities) for cities in guest_locations.values()])
+        first_city = np.concatenate(([0], np.cumsum(num_cities)[:-1]))
+        self._country = rng.integers(len(self.countries), size=size)
+        self._city = first_city[self._country] + (
+            rng.random(size) * num_cities[self._country]
+        ).astype(np.int64)
+
+    def _field(self, field: str, index: int) -> str:
+        """Return the value of a Faker generated field of a guest."""
+        return self._values[field][self._indexes[field][index]]
+
+    @staticmethod
+    def _email(first_name: str, last_name: str, index: int, domain: str) -> str:
+        """Build the unique email of a guest from its name and index."""
+        user = re.sub(r"[^a-z0-9.]", "", f"{first_name}.{last_name}".lower())
+        return f"{user}{index}@{domain}"
+
+    def guest(self, index: int) -> dict[str, str]:
+        """Return the profile of a guest as a booking 'Guest' dictionary."""
+        first_name = self._field("FirstName", index)
+        last_name = self._field("LastName", index)
+        return {
+            "FirstName": first_name,
+            "LastName": last_name,
+            "Email": self._email(first_name, last_name, index,
+                                 self._field("EmailDomain", index)),
+            "Country": self.countries[self._country[index]],
+            "City": self.cities[self._city[index]],
+            "ZipCode": self._field("ZipCode", index),
+            "Address": self._field("Address", index),
+            "Phone": self._field("Phone", index)
+        }
+
+    def sample_regular_guests(self, rng: np.random.Generator) -> np.ndarray:
+        """Pick the regular guests of a hotel (distinct guest indexes)."""
+        return rng.choice(self.size, size=self.regular_guests_per_hotel, replace=False)
+
+    def sample(self, count: int, rng: np.random.Generator,
+               regular_guests: np.ndarray | None = None) -> np.ndarray:
+        """
+        Pick the guests of ``count`` bookings.
+
+        Args:
+            count (int): Number of bookings
+            rng (np.random.Generator): Random generator
+            regular_guests (np.ndarray): Regular guests of the hotel, if any
+
+        Returns:
+            np.ndarray: Guest index of each booking
+        """
+        indexes = rng.integers(self.size, size=count)
+        if regular_guests is not None and self.repeat_guest_ratio > 0:
+            repeat = rng.random(count) < self.repeat_guest_ratio
+            indexes[repeat] = rng.choice(regular_guests, size=int(repeat.sum()))
+        return indexes
+
+    def guests(self, indexes) -> list[dict[str, str]]:
+        """Return the 'Guest' dictionaries of several guest indexes."""
+        return [self.guest(index) for index in indexes]
+
+    def location_codes(self, indexes) -> tuple[np.ndarray, np.ndarray]:
+        """Return the codes in ``countries`` and ``cities`` of several guest indexes."""
+        indexes = np.asarray(indexes, dtype=np.int64)
+        return self._country[indexes], self._city[indexes]
+
+    def columns(self, indexes) -> dict[str, Any]:
+        """
+        Return the guest fields of several guest indexes, one column per field.
+
+        Args:
+            indexes (array-like): Guest indexes
+
+        Returns:
+            dict: Object arrays keyed by 'Guest' dictionary field, with 'Country'
+            and 'City' as pd.Categorical
+        """
+        indexes = np.asarray(indexes, dtype=np.int64)
+        columns = {
+            field: values[self._indexes[field][indexes]]
+            for field, values in self._values.items()
+        }
+        columns["Email"] = np.array([
+            self._email(first_name, last_name, index, domain)
+            for first_name, last_name, index, domain in zip(
+                columns["FirstName"], columns["LastName"], indexes.tolist(),
+                columns.pop("EmailDomain"), strict=True
+            )
+        ], dtype=object)
+        columns["Country"] = pd.Categorical.from_codes(self._country[indexes],
+                                                       categories=self.countries)
+        columns["City"] = pd.Categorical.from_codes(self._city[indexes], categories=self.cities)
+        return columns
+
+
+def get_guest_pool(config, seed=None):
+    """
+    Build the guest pool of a generation run from its configuration.
+
+    Args:
+        config (dict): Configuration, with an optional 'guest_pool' section
+            ('size', 'repeat_guest_ratio', 'regular_guests_per_hotel')
+        seed (int): Seed of the guest profiles
+
+    Returns:
+        GuestPool: Pool of guests located in the configured guest locations
+    """
+    pool_config = config.get("guest_pool") or {}
+    name_location_gen = hotel_name_location_generator.HotelNameLocationGenerator(
+        base_path=os.path.join(os.path.dirname(os.path.dirname(__file__)), "../config"),
+        config_filename="hotel_naming_location.yaml"
+    )
+    return GuestPool(
+        pool_config.get("size", DEFAULT_POOL_SIZE),
+        name_location_gen.guest_locations,
+        repeat_guest_ratio=pool_config.get("repeat_guest_ratio", DEFAULT_REPEAT_GUEST_RATIO),
+        regular_guests_per_hotel=pool_config.get(
+            "regular_guests_per_hotel", DEFAULT_REGULAR_GUESTS_PER_HOTEL
+        ),
+        seed=seed
+    )
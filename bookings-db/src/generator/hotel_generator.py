@@ -5,6 +5,10 @@ import re
 import os
 from . import parametric_utils as ParUt
 from . import hotel_name_location_generator
+from .booking_generator import get_hotel_seed
+
+# Every hotel takes one of the unique 4-digit hotel keys
+MAX_HOTELS = hotel_name_location_generator.HOTEL_KEY_COUNT
 
 def generate_parametrization(config):
     """
@@ -128,12 +132,12 @@ def generate_hotels(config):
         list: List of generated hotels
     """
     num_hotels = config["num_of_hotels"]
-    if num_hotels > 200:
+    if num_hotels > MAX_HOTELS:
         print(
-            "The number of hotels exceeds the limit of 200. "
-            "Only 200 hotels will be generated."
+            f"The number of hotels exceeds the limit of {MAX_HOTELS}. "
+            f"Only {MAX_HOTELS} hotels will be generated."
         )
-        num_hotels = 200
+        num_hotels = MAX_HOTELS
     hotels = []
 
     config_base_path = os.path.dirname(os.path.dirname(__file__))
@@ -159,3 +163,90 @@ def generate_hotels(config):
         hotels.append(hotel)
 
     return hotels
+
+def generate_hotel_identities(config):
+    """
+    Generate the key, name and address of the hotels, without rooms nor parameters.
+
+    First stage of the staged generation (see src/pipeline): the rooms and the
+    synthetic parameters of the hotels are generated apart, each with its own seeds,
+    so that changing one of them does not change the other.
+
+    Args:
+        config (dict): Configuration dictionary
+
+    Returns:
+        list: Hotels with their 'hotelkey', 'Name' and 'Address'
+    """
+    num_hotels = min(config["num_of_hotels"], MAX_HOTELS)
+    config_base_path = os.path.dirname(os.path.dirname(__file__))
+    name_location_gen = hotel_name_location_generator.HotelNameLocationGenerator(
+        base_path=os.path.join(config_base_path, "../config"),
+        config_filename="hotel_naming_location.yaml"
+    )
+    return [
+        {
+            "hotelkey": name_location_gen.generate_hotel_key(),
+            "Name": name_location_gen.generate_hotel_name(),
+            "Address": name_location_gen.generate_address(),
+        }
+        for _ in range(num_hotels)
+    ]
+
+def generate_hotel_rooms(hotel_keys, config, master_seed=42):
+    """
+    Generate the rooms of hotels, seeding ``random`` per hotel.
+
+    Args:
+        hotel_keys (list): Keys of the hotels
+        config (dict): Configuration dictionary
+        master_seed (int): Seed of the generation run
+
+    Returns:
+        dict: List of room configurations of each hotel key
+    """
+    rooms = {}
+    for hotel_key in hotel_keys:
+        random.seed(get_hotel_seed(master_seed, f"rooms:{hotel_key}"))
+        rooms[hotel_key] = generate_rooms(config)
+    return rooms
+
+def generate_hotel_parametrizations(hotel_keys, config, master_seed=42):
+    """
+    Generate the synthetic parameters of hotels, seeding ``random`` per hotel.
+
+    Args:
+        hotel_keys (list): Keys of the hotels
+        config (dict): Configuration dictionary
+        master_seed (int): Seed of the generation run
+
+    Returns:
+        dict: Hotel parametrization of each hotel key
+    """
+    parametrizations = {}
+    for hotel_key in hotel_keys:
+        random.seed(get_hotel_seed(master_seed, f"params:{hotel_key}"))
+        parametrizations[hotel_key] = generate_parametrization(config)
+    return parametrizations
+
+def assemble_hotels(identities, rooms, parametrizations):
+    """
+    Build the hotels from their staged parts, as returned by generate_hotels.
+
+    Args:
+        identities (list): Hotels from generate_hotel_identities
+        rooms (dict): Rooms of each hotel key, from generate_hotel_rooms
+        parametrizations (dict): Parameters of each hotel key, from
+            generate_hotel_parametrizations
+
+    Returns:
+        list: List of hotels
+    """
+    return [
+        {
+            **identity,
+            "SyntheticParams": parametrizations[identity["hotelkey"]],
+            "Rooms": rooms[identity["hotelkey"]],
+        }
+        for identity in identities
+    ]
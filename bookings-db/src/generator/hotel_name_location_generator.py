@@ -2,11 +2,14 @@
 
 import os
 import random
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 import yaml
 from faker import Faker
 
+# Hotel keys are the 4-digit numbers from 0001 to 9999
+HOTEL_KEY_COUNT = 9999
+
 
 class HotelNameLocationGenerator:
     """Generator class for hotel names, locations and guest information."""
@@ -24,7 +27,10 @@ class HotelNameLocationGenerator:
         if not hasattr(self, 'initialized'):
             self._state = {
                 'current_hotel_index': 0,
+                'hotel_name_round': 0,
                 'existing_keys': set(),
+                # Keys not taken yet, listed once half of the keys are taken
+                'free_keys': None,
                 'existing_addresses': set()
             }
             self._load_hotel_naming_location(base_path, config_filename)
@@ -52,9 +58,9 @@ class HotelNameLocationGenerator:
             with open(file_path, 'r', encoding='utf-8') as file:
                 config = yaml.safe_load(file)
 
-                # hotel names
+                # hotel names (without duplicates, in configuration order)
                 name_list = [
-                    name for name in config.get('hotel_names', [])
+                    name for name in dict.fromkeys(config.get('hotel_names', []))
                     if "'" not in name
                 ]
                 self._hotel_names = name_list
@@ -76,6 +82,10 @@ class HotelNameLocationGenerator:
         """
         Generate a unique hotel name.
 
+        Names are taken in order from the configured list. Once the list is
+        exhausted it is reused with a numeric suffix ("Obsidian Tower 2", ...),
+        so the names stay unique whatever the number of hotels.
+
         Returns:
             Optional[str]: A hotel name or None if no names are available
         """
@@ -83,23 +93,51 @@ class HotelNameLocationGenerator:
             return None
 
         hotel_name = self._hotel_names[self._state['current_hotel_index']]
+        if self._state['hotel_name_round'] > 0:
+            hotel_name = f"{hotel_name} {self._state['hotel_name_round'] + 1}"
         self._state['current_hotel_index'] = (
             self._state['current_hotel_index'] + 1
         ) % len(self._hotel_names)
+        if self._state['current_hotel_index'] == 0:
+            self._state['hotel_name_round'] += 1
         return hotel_name
 
     def generate_hotel_key(self) -> str:
         """
         Generate a unique hotel key.
 
+        Keys are drawn at random until a free one comes up while most keys are free.
+        Once half of them are taken, the key is drawn from the list of the free keys
+        instead, so that a key never takes more than a couple of draws.
+
         Returns:
             str: A unique 4-digit hotel key
+
+        Raises:
+            RuntimeError: If every hotel key is taken
         """
-        while True:
-            key = str(random.randint(1, 9999)).zfill(4)
-            if key not in self._state['existing_keys']:
-                self._state['existing_keys'].add(key)
-                return key
+        existing_keys = self._state['existing_keys']
+        if len(existing_keys) < HOTEL_KEY_COUNT // 2:
+            while True:
+                key = str(random.randint(1, HOTEL_KEY_COUNT)).zfill(4)
+                if key not in existing_keys:
+                    existing_keys.add(key)
+                    return key
+
+        if self._state['free_keys'] is None:
+            self._state['free_keys'] = [
+                key for key in (str(number).zfill(4) for number in range(1, HOTEL_KEY_COUNT + 1))
+                if key not in existing_keys
+            ]
+        free_keys = self._state['free_keys']
+        if not free_keys:
+            raise RuntimeError(f"All the {HOTEL_KEY_COUNT} hotel keys are taken.")
+        # Swap the drawn key with the last one to remove it in O(1)
+        index = random.randrange(len(free_keys))
+        free_keys[index], free_keys[-1] = free_keys[-1], free_keys[index]
+        key = free_keys.pop()
+        existing_keys.add(key)
+        return key
 
     def generate_address(self) -> Dict[str, str]:
         """
@@ -133,6 +171,11 @@ class HotelNameLocationGenerator:
         city = random.choice(self._hotel_locations[country])
         return country, city
 
+    @property
+    def guest_locations(self) -> Dict[str, List[str]]:
+        """Cities of each guest country."""
+        return self._guest_locations
+
     def generate_guest_location(self) -> Tuple[str, str]:
         """
         Generate a guest location.
@@ -1,7 +1,9 @@
 """Utility functions for generating parametric hotel and booking data."""
 
+import calendar
 import random
 
+import numpy as np
 import pandas as pd
 
 
@@ -501,3 +503,139 @@ def get_total_price(booking, room, peak_season_months, hotel_synthetic_params):
         total_price *= (1 - (hotel_synthetic_params["PromotionPriceDiscount"] / 100))
 
     return round(total_price, 2)
+
+
+def get_peak_season_days(first_day, last_day, peak_season_months):
+    """
+    Build the per-day peak season mask of a date range.
+
+    Args:
+        first_day (np.datetime64): First day of the range
+        last_day (np.datetime64): Last day of the range (inclusive)
+        peak_season_months (list): Names of the peak season months
+
+    Returns:
+        np.ndarray: Boolean array with one entry per day, True for peak season days
+    """
+    days = np.arange(np.datetime64(first_day, "D"),
+                     np.datetime64(last_day, "D") + np.timedelta64(1, "D"))
+    month_numbers = days.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    peak_month_numbers = [
+        number for number, name in enumerate(calendar.month_name) if name in peak_season_months
+    ]
+    return np.isin(month_numbers, peak_month_numbers)
+
+
+def _get_stay_offsets(check_in_dates, check_out_dates):
+    """Convert stays to day offsets from their earliest date.
+
+    Returns:
+        tuple: (first_day, last_day, start offsets, end offsets); a stay whose
+        check-out is before its check-in gets end == start (no nights)
+    """
+    check_in = np.asarray(check_in_dates, dtype="datetime64[D]")
+    check_out = np.asarray(check_out_dates, dtype="datetime64[D]")
+    first_day = check_in.min()
+    last_day = max(check_in.max(), check_out.max())
+    start = (check_in - first_day).astype(np.int64)
+    end = np.maximum((check_out - first_day).astype(np.int64), start)
+    return first_day, last_day, start, end
+
+
+def get_total_prices(stays, rooms, peak_season_months, hotel_synthetic_params):
+    """
+    Calculate the total price of many bookings of one hotel at once.
+
+    Vectorized equivalent of ``get_total_price``: the same adjustments are applied
+    in the same order and the daily prices are accumulated night by night (across
+    all bookings at once), so results are identical to the cent.
+
+    Args:
+        stays (dict): Equal-length array-likes describing each booking:
+            - check_in / check_out: Check-in and check-out dates
+            - num_guests (int): Number of guests
+            - extra_bed (str): "Yes", "No" or "N/A"
+            - meal_plan (str): Meal plan name
+            - promotion (str): "Yes" or "No"
+        rooms (dict): Array-likes aligned with stays describing the booked room:
+            - price_off / price_peak (float): Daily off and peak season prices
+            - type (str): Room type name ("Single", "Double", "Triple")
+        peak_season_months (list): List of peak season months
+        hotel_synthetic_params (dict): Hotel parameters
+
+    Returns:
+        list: Total price (float) of each booking
+    """
+    if len(stays["check_in"]) == 0:
+        return []
+
+    room_capacity = {"Single": 1, "Double": 2, "Triple": 3}
+    capacity = np.array([room_capacity.get(room_type, 0) for room_type in rooms["type"]])
+
+    # Apply occupancy discount, extra bed and meal plan increases (a factor of 1.0 is exact)
+    occupancy_discount = 1 - (hotel_synthetic_params["OccupancyBaseDiscountPercentage"] / 100)
+    extra_bed_increase = 1 + (hotel_synthetic_params["ExtraBedChargePercentage"] / 100)
+    adjustments = [
+        np.where(np.asarray(stays["num_guests"]) < capacity, occupancy_discount, 1.0),
+        np.where(np.asarray(stays["extra_bed"]) == "Yes", extra_bed_increase, 1.0),
+        np.array([hotel_synthetic_params["MealPlanPrices"][plan] for plan in stays["meal_plan"]],
+                 dtype=np.float64)
+    ]
+    price_off = np.asarray(rooms["price_off"], dtype=np.float64)
+    price_peak = np.asarray(rooms["price_peak"], dtype=np.float64)
+    for factor in adjustments:
+        price_off = price_off * factor
+        price_peak = price_peak * factor
+
+    # Calculate total price, adding the n-th night of every stay in the same step
+    first_day, last_day, start, end = _get_stay_offsets(stays["check_in"], stays["check_out"])
+    peak_days = get_peak_season_days(first_day, last_day, peak_season_months)
+    nights = end - start
+    total_prices = np.zeros(len(nights), dtype=np.float64)
+    for night in range(int(nights.max())):
+        staying = night < nights
+        day = np.where(staying, start + night, 0)
+        daily_prices = np.where(peak_days[day], price_peak, price_off)
+        total_prices += np.where(staying, daily_prices, 0.0)
+
+    # Apply promotion discount
+    promotion_discount = 1 - (hotel_synthetic_params["PromotionPriceDiscount"] / 100)
+    total_prices = np.where(np.asarray(stays["promotion"]) == "Yes",
+                            total_prices * promotion_discount, total_prices)
+
+    # Python's round() is used so results match get_total_price exactly, including
+    # its integer 0 for stays without nights or promotion
+    unpriced = ((nights == 0) & (np.asarray(stays["promotion"]) != "Yes")).tolist()
+    return [
+        0 if is_unpriced else round(total_price, 2)
+        for total_price, is_unpriced in zip(total_prices.tolist(), unpriced, strict=True)
+    ]
+
+
+def get_bookings_total_prices(bookings, rooms, peak_season_months, hotel_synthetic_params):
+    """
+    Calculate the total price of a list of booking dictionaries with ``get_total_prices``.
+
+    Args:
+        bookings (list): Booking dictionaries as created by the booking generator
+        rooms (list): Room dictionary booked by each booking
+        peak_season_months (list): List of peak season months
+        hotel_synthetic_params (dict): Hotel parameters
+
+    Returns:
+        list: Total price (float) of each booking
+    """
+    stays = {
+        'check_in': [booking["CheckInDate"] for booking in bookings],
+        'check_out': [booking["CheckOutDate"] for booking in bookings],
+        'num_guests': [booking["NumberOfGuests"] for booking in bookings],
+        'extra_bed': [booking["ExtraBed"] for booking in bookings],
+        'meal_plan': [booking["MealPlan"] for booking in bookings],
+        'promotion': [booking["Promotion"] for booking in bookings]
+    }
+    room_arrays = {
+        'price_off': [room["PriceOffSeason"] for room in rooms],
+        'price_peak': [room["PricePeakSeason"] for room in rooms],
+        'type': [room["Type"] for room in rooms]
+    }
+    return get_total_prices(stays, room_arrays, peak_season_months, hotel_synthetic_params)
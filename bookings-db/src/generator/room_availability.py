@@ -0,0 +1,383 @@
+"""Module with the room x night availability bitmaps of hotels."""
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .booking_calendar import BookingCalendar
+
+# Nights per word of the bitmaps
+WORD_BITS = 64
+_ALL_BITS = (1 << WORD_BITS) - 1
+
+# Rooms expanded to one byte per night at a time when loading bookings in bulk
+_LOAD_BLOCK_ROOMS = 4096
+
+# Columns of the all_bookings files read by from_dataframe
+BOOKING_COLUMNS = ("Hotel Name", "Room ID", "Check-in Date", "Check-out Date")
+
+
+@lru_cache(maxsize=4096)
+def _night_masks(start: int, stop: int):
+    """
+    Return the words [first, last) covering the nights [start, stop) of a bitmap,
+    and the mask of those nights in each word (a read-only uint64 array).
+    """
+    first, last = start // WORD_BITS, (stop - 1) // WORD_BITS + 1
+    masks = [_ALL_BITS] * (last - first)
+    masks[0] &= _ALL_BITS << (start % WORD_BITS)
+    masks[-1] &= _ALL_BITS >> (WORD_BITS - 1 - (stop - 1) % WORD_BITS)
+    masks = np.array(masks, dtype=np.uint64)
+    masks.flags.writeable = False
+    return first, last, masks
+
+
+class RoomAvailability:
+    """
+    Availability of the rooms of hotels, night by night, over a booking calendar.
+
+    Every room has a packed bit array with one bit per night of the calendar (night
+    d is the night from day d to day d + 1), set when the room is booked for that
+    night. A booking from check-in day a to check-out day b takes the nights
+    [a, b), so a room is free from a to b when none of these bits is set. The rooms
+    of a hotel are consecutive rows of one uint64 matrix, so hotel-wide queries are
+    a few vectorized operations on the words of the queried nights.
+
+    Attributes:
+        booking_calendar (BookingCalendar): Calendar of the bitmaps
+        room_types (List[str]): Room types, in code order
+        categories (List[str]): Room categories, in code order
+    """
+
+    def __init__(self, hotels: Sequence[dict], booking_calendar: BookingCalendar):
+        """
+        Build the bitmaps of hotels, with every room free.
+
+        Args:
+            hotels: Hotels as in the 'Hotels' list of hotels.json (or as returned by
+                generate_hotels)
+            booking_calendar: Calendar of the nights of the bitmaps
+
+        Raises:
+            ValueError: If two hotels have the same name
+        """
+        self.booking_calendar = booking_calendar
+        self.num_nights = booking_calendar.num_days
+        self.room_types = sorted({room["Type"] for hotel in hotels for room in hotel["Rooms"]})
+        self.categories = sorted({room["Category"] for hotel in hotels
+                                  for room in hotel["Rooms"]})
+        type_codes = {name: code for code, name in enumerate(self.room_types)}
+        category_codes = {name: code for code, name in enumerate(self.categories)}
+
+        self._room_ids: list[str] = []
+        type_column: list[int] = []
+        category_column: list[int] = []
+        # Rows [start, stop) and name of each hotel, by name and by key, and row of
+        # each room by hotel name and room id
+        self._hotel_rows: dict[str, tuple] = {}
+        self._hotel_names: dict[str, str] = {}
+        self._room_rows: dict[tuple, int] = {}
+        for hotel in hotels:
+            if hotel["Name"] in self._hotel_rows:
+                raise ValueError(f"Duplicate hotel name: {hotel['Name']}")
+            start = len(self._room_ids)
+            for room in hotel["Rooms"]:
+                self._room_rows[(hotel["Name"], room["RoomId"])] = len(self._room_ids)
+                self._room_ids.append(room["RoomId"])
+                type_column.append(type_codes[room["Type"]])
+                category_column.append(category_codes[room["Category"]])
+            self._hotel_rows[hotel["Name"]] = (start, len(self._room_ids))
+            self._hotel_rows.setdefault(str(hotel["hotelkey"]), (start, len(self._room_ids)))
+            self._hotel_names[hotel["Name"]] = hotel["Name"]
+            self._hotel_names.setdefault(str(hotel["hotelkey"]), hotel["Name"])
+        self._types = np.array(type_column, dtype=np.int8)
+        self._categories = np.array(category_column, dtype=np.int8)
+        self._bits = np.zeros((len(self._room_ids), -(-self.num_nights // WORD_BITS)),
+                              dtype=np.uint64)
+
+    @classmethod
+    def from_slots(cls, hotels: Sequence[dict], slots: dict[str, list],
+                   booking_calendar: BookingCalendar) -> "RoomAvailability":
+        """
+        Build the bitmaps of generated slots (see generate_all_room_slots).
+
+        A (start, end) slot is a booking checking in on day start and out on day end.
+
+        Args:
+            hotels: Hotels of the slots
+            slots: Slots of each room, in room order, of each hotel key
+            booking_calendar: Calendar the slots refer to
+        """
+        availability = cls(hotels, booking_calendar)
+        rows, check_ins, check_outs = [], [], []
+        for hotel in hotels:
+            start, _ = availability._hotel_rows[hotel["Name"]]
+            for row, room_slots in enumerate(slots[hotel["hotelkey"]], start):
+                rows.extend([row] * len(room_slots))
+                check_ins.extend(slot_start for slot_start, _ in room_slots)
+                check_outs.extend(slot_end for _, slot_end in room_slots)
+        availability.add_bookings(rows, check_ins, check_outs)
+        return availability
+
+    @classmethod
+    def from_dataframe(cls, hotels: Sequence[dict], bookings: pd.DataFrame,
+                       booking_calendar: BookingCalendar,
+                       columns: Sequence[str] = BOOKING_COLUMNS) -> "RoomAvailability":
+        """
+        Build the bitmaps of a frame of bookings.
+
+        Args:
+            hotels: Hotels of the bookings
+            bookings: Bookings, e.g. all_bookings.parquet or the rows of the
+                booking_details view of the bookings database
+            booking_calendar: Calendar of the bitmaps
+            columns: Hotel name, room id, check-in date and check-out date columns
+
+        Raises:
+            ValueError: If a booking is of an unknown hotel room
+        """
+        hotel_column, room_column, check_in_column, check_out_column = columns
+        availability = cls(hotels, booking_calendar)
+        rows = availability.room_rows(bookings[hotel_column], bookings[room_column])
+        check_ins = availability.day_offsets(bookings[check_in_column])
+        check_outs = availability.day_offsets(bookings[check_out_column])
+        availability.add_bookings(rows, check_ins, check_outs)
+        return availability
+
+    @classmethod
+    def from_booking_table(cls, hotels: Sequence[dict], booking_table,
+                           booking_calendar: BookingCalendar) -> "RoomAvailability":
+        """
+        Build the bitmaps of the bookings of a BookingTable.
+
+        Args:
+            hotels: Hotels of the bookings
+            booking_table (BookingTable): Generated bookings
+            booking_calendar: Calendar of the bitmaps
+        """
+        return cls.from_dataframe(hotels, pd.DataFrame({
+            name: booking_table.column(column) for name, column in zip(
+                BOOKING_COLUMNS, ('hotel_name', 'room_id', 'check_in_date', 'check_out_date'),
+                strict=True)
+        }), booking_calendar)
+
+    def __len__(self) -> int:
+        """Number of rooms."""
+        return len(self._room_ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of the bitmaps."""
+        return self._bits.nbytes
+
+    def room_rows(self, hotel_names, room_ids) -> np.ndarray:
+        """
+        Return the bitmap rows of hotel rooms.
+
+        Raises:
+            ValueError: If a room is unknown
+        """
+        index = pd.MultiIndex.from_tuples(list(self._room_rows), names=("hotel", "room"))
+        rows = pd.Series(list(self._room_rows.values()), index=index).reindex(
+            pd.MultiIndex.from_arrays([np.asarray(hotel_names, dtype=object),
+                                       np.asarray(room_ids, dtype=object)]))
+        if rows.isna().any():
+            hotel, room = rows.index[rows.isna().to_numpy()][0]
+            raise ValueError(f"Unknown room {room} of hotel {hotel}")
+        return rows.to_numpy(dtype=np.int64)
+
+    def day_offsets(self, dates) -> np.ndarray:
+        """Return the day offsets of dates in the calendar (outside of it or not)."""
+        days = pd.to_datetime(pd.Series(dates)).to_numpy().astype("datetime64[D]")
+        return (days - np.datetime64(self.booking_calendar.start_date, "D")).astype(np.int64)
+
+    def add_bookings(self, rows, check_ins, check_outs) -> None:
+        """
+        Mark the nights of many bookings as booked, vectorized.
+
+        Nights outside of the calendar are ignored, as are bookings without nights.
+
+        Args:
+            rows: Bitmap row of the room of each booking (see room_rows)
+            check_ins: Day offset of the check-in of each booking
+            check_outs: Day offset of the check-out of each booking
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = np.clip(np.asarray(check_ins, dtype=np.int64), 0, self.num_nights)
+        stops = np.clip(np.asarray(check_outs, dtype=np.int64), 0, self.num_nights)
+        keep = starts < stops
+        rows, starts, stops = rows[keep], starts[keep], stops[keep]
+        order = np.argsort(rows, kind="stable")
+        rows, starts, stops = rows[order], starts[order], stops[order]
+
+        width = self._bits.shape[1] * WORD_BITS
+        for block in range(0, len(self._room_ids), _LOAD_BLOCK_ROOMS):
+            first, last = np.searchsorted(rows, [block, block + _LOAD_BLOCK_ROOMS])
+            if first == last:
+                continue
+            # +1 at the first night of each booking and -1 after its last night
+            changes = np.zeros((min(_LOAD_BLOCK_ROOMS, len(self._room_ids) - block),
+                                width + 1), dtype=np.int32)
+            np.add.at(changes, (rows[first:last] - block, starts[first:last]), 1)
+            np.add.at(changes, (rows[first:last] - block, stops[first:last]), -1)
+            booked = np.cumsum(changes[:, :width], axis=1) > 0
+            words = np.packbits(booked, axis=1, bitorder="little").view("<u8")
+            self._bits[block:block + len(booked)] |= words.astype(np.uint64)
+
+    def _nights(self, check_in, check_out):
+        """Return the night range [start, stop) of a stay, validated."""
+        start = check_in if isinstance(check_in, (int, np.integer)) \
+            else self.booking_calendar.offset(check_in)
+        stop = check_out if isinstance(check_out, (int, np.integer)) \
+            else self.booking_calendar.offset(check_out)
+        if not 0 <= start < stop <= self.num_nights:
+            raise ValueError(f"Invalid stay from {check_in} to {check_out}: the check-out "
+                             "must follow the check-in, within the booking calendar")
+        return int(start), int(stop)
+
+    def _rows(self, hotel: str | None) -> tuple:
+        """Return the rows [start, stop) of a hotel (by name or key), or of all rooms."""
+        if hotel is None:
+            return 0, len(self._room_ids)
+        rows = self._hotel_rows.get(str(hotel))
+        if rows is None:
+            raise ValueError(f"Unknown hotel: {hotel}")
+        return rows
+
+    def _room_row(self, hotel: str, room_id: str) -> int:
+        """Return the row of a room of a hotel (by name or key)."""
+        row = self._room_rows.get((self._hotel_names.get(str(hotel)), room_id))
+        if row is None:
+            raise ValueError(f"Unknown room {room_id} of hotel {hotel}")
+        return row
+
+    def is_free(self, hotel: str, room_id: str, check_in, check_out) -> bool:
+        """
+        Tell whether a room is free for a stay.
+
+        Args:
+            hotel: Hotel name or key
+            room_id: Room id ("01-001")
+            check_in: Check-in date ("YYYY-MM-DD", date or day offset)
+            check_out: Check-out date
+
+        Returns:
+            True when none of the nights of the stay is booked
+        """
+        first, last, masks = _night_masks(*self._nights(check_in, check_out))
+        row = self._room_row(hotel, room_id)
+        return not (self._bits[row, first:last] & masks).any()
+
+    def book(self, hotel: str, room_id: str, check_in, check_out) -> None:
+        """
+        Book a room for a stay.
+
+        Raises:
+            ValueError: If a night of the stay is already booked
+        """
+        first, last, masks = _night_masks(*self._nights(check_in, check_out))
+        row = self._room_row(hotel, room_id)
+        words = self._bits[row, first:last]
+        if (words & masks).any():
+            raise ValueError(f"Room {room_id} of hotel {hotel} is not free from "
+                             f"{check_in} to {check_out}")
+        words |= masks
+
+    def release(self, hotel: str, room_id: str, check_in, check_out) -> None:
+        """Free the nights of a stay in a room (e.g. a cancelled booking)."""
+        first, last, masks = _night_masks(*self._nights(check_in, check_out))
+        row = self._room_row(hotel, room_id)
+        self._bits[row, first:last] &= ~masks
+
+    def _matching(self, start: int, stop: int, room_type: str | None,
+                  category: str | None) -> np.ndarray | None:
+        """Return the rooms [start, stop) of a room type and category, None if all."""
+        matching = None
+        for value, names, codes in ((room_type, self.room_types, self._types),
+                                    (category, self.categories, self._categories)):
+            if value is None:
+                continue
+            code = names.index(value) if value in names else -1
+            selected = codes[start:stop] == code
+            matching = selected if matching is None else matching & selected
+        return matching
+
+    def free_rooms(self, hotel: str, check_in, check_out, room_type: str | None = None,
+                   category: str | None = None) -> list[str]:
+        """
+        Find the rooms of a hotel free for a stay.
+
+        Args:
+            hotel: Hotel name or key
+            check_in: Check-in date ("YYYY-MM-DD", date or day offset)
+            check_out: Check-out date
+            room_type: Only rooms of this type
+            category: Only rooms of this category
+
+        Returns:
+            Ids of the free rooms, in room order
+        """
+        start, stop = self._rows(hotel)
+        first, last, masks = _night_masks(*self._nights(check_in, check_out))
+        free = ~(self._bits[start:stop, first:last] & masks).any(axis=1)
+        matching = self._matching(start, stop, room_type, category)
+        if matching is not None:
+            free &= matching
+        return [self._room_ids[start + row] for row in np.flatnonzero(free).tolist()]
+
+    def booked_nights(self, check_in, check_out, hotel: str | None = None,
+                      room_type: str | None = None, category: str | None = None) -> int:
+        """Count the booked room nights of a period, of a hotel or of all the hotels."""
+        start, stop = self._rows(hotel)
+        first, last, masks = _night_masks(*self._nights(check_in, check_out))
+        counts = np.bitwise_count(self._bits[start:stop, first:last] & masks)
+        matching = self._matching(start, stop, room_type, category)
+        if matching is not None:
+            counts = counts[matching]
+        return int(counts.sum())
+
+    def occupancy(self, check_in, check_out, hotel: str | None = None,
+                  room_type: str | None = None, category: str | None = None) -> float:
+        """
+        Get the occupancy rate of a period: booked room nights over room nights.
+
+        Args:
+            check_in: First night of the period ("YYYY-MM-DD", date or day offset)
+            check_out: Day after the last night of the period
+            hotel: Hotel name or key, all the hotels when not given
+            room_type: Only rooms of this type
+            category: Only rooms of this category
+
+        Returns:
+            Occupancy rate between 0 and 1 (0 without rooms)
+        """
+        start, stop = self._rows(hotel)
+        nights = self._nights(check_in, check_out)
+        matching = self._matching(start, stop, room_type, category)
+        rooms = stop - start if matching is None else int(matching.sum())
+        if not rooms:
+            return 0.0
+        return self.booked_nights(*nights, hotel, room_type, category) / (
+            rooms * (nights[1] - nights[0]))
+
+    def monthly_occupancy(self, hotel: str | None = None) -> dict[str, float]:
+        """
+        Get the occupancy rate of every month of the calendar.
+
+        Args:
+            hotel: Hotel name or key, all the hotels when not given
+
+        Returns:
+            Occupancy rate of each month ("YYYY-MM"), for the nights of the month
+            inside the calendar
+        """
+        calendar = self.booking_calendar
+        occupancy = {}
+        for month, month_start, days in zip(calendar.months, calendar.month_start,
+                                            calendar.days_in_month, strict=True):
+            start = max(month_start, 0)
+            stop = min(month_start + days, self.num_nights)
+            occupancy[month] = self.occupancy(start, stop, hotel)
+        return occupancy
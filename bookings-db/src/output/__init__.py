@@ -4,7 +4,20 @@ from .booking_output_writer import (
     generate_file_json_for_bookings,
     generate_file_excel_for_bookings,
     generate_file_md_hotel_bookings,
-    generate_file_excel_all_bookings
+    generate_file_excel_all_bookings,
+    generate_file_parquet_all_bookings,
+    get_all_bookings_dataframe,
+    get_all_bookings_table,
+    write_all_bookings_parquet
+)
+from .booking_stream_writer import (
+    BookingSink,
+    BookingCsvSink,
+    BookingMarkdownSink,
+    BookingParquetSink,
+    BookingExcelSink,
+    write_booking_stream,
+    write_booking_table
 )
 from .hotel_output_writer import (
     generate_file_json_for_hotels,
@@ -15,6 +28,12 @@ from .hotel_output_writer import (
     generate_file_md_hotel_rooms
 )
 from .hotel_query_writer import generate_file_csv_for_queries_room_hotels
+from .markdown_writer import (
+    HotelBookingsMarkdown,
+    booking_table_md_rows,
+    markdown_path,
+    open_markdown
+)
 
 __all__ = [
     # Booking output functions
@@ -22,6 +41,19 @@ __all__ = [
     'generate_file_excel_for_bookings',
     'generate_file_md_hotel_bookings',
     'generate_file_excel_all_bookings',
+    'generate_file_parquet_all_bookings',
+    'get_all_bookings_dataframe',
+    'get_all_bookings_table',
+    'write_all_bookings_parquet',
+
+    # Booking stream output
+    'BookingSink',
+    'BookingCsvSink',
+    'BookingMarkdownSink',
+    'BookingParquetSink',
+    'BookingExcelSink',
+    'write_booking_stream',
+    'write_booking_table',
 
     # Hotel output functions
     'generate_file_json_for_hotels',
@@ -32,5 +64,11 @@ __all__ = [
     'generate_file_md_hotel_rooms',
 
     # Query output functions
-    'generate_file_csv_for_queries_room_hotels'
+    'generate_file_csv_for_queries_room_hotels',
+
+    # Markdown output
+    'HotelBookingsMarkdown',
+    'booking_table_md_rows',
+    'markdown_path',
+    'open_markdown'
 ]
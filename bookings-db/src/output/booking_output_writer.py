@@ -1,10 +1,41 @@
-"""Module for writing booking data to output files in various formats (JSON, Excel, MD)."""
+"""Module for writing booking data to output files (JSON, Excel, Parquet, MD)."""
 
 import json
 import re
 from io import TextIOWrapper
-from typing import cast, Dict, List, Any
+from typing import cast, Dict, List, Any, Optional, TextIO
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..generator.booking_generator import flatten_booking
+from .markdown_writer import (
+    HotelBookingsMarkdown,
+    hotel_bookings_md_rows,
+    md_hotel_bookings_header
+)
+
+_CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+# Columns of the all_bookings hand-off file, in order
+ALL_BOOKINGS_SCHEMA = pa.schema([
+    ('Hotel Name', _CATEGORY),
+    ('Room ID', pa.string()),
+    ('Room Type', _CATEGORY),
+    ('Room Category', _CATEGORY),
+    ('Check-in Date', pa.date32()),
+    ('Check-out Date', pa.date32()),
+    ('Guest First Name', pa.string()),
+    ('Guest Last Name', pa.string()),
+    ('Guest Email', pa.string()),
+    ('Guest Phone', pa.string()),
+    ('Guest Country', _CATEGORY),
+    ('Guest City', _CATEGORY),
+    ('Guest Address', pa.string()),
+    ('Guest Zip Code', pa.string()),
+    ('Meal Plan', _CATEGORY),
+    ('Total Price', pa.float64())
+])
 
 def generate_file_json_for_bookings(
     bookings: Dict[str, Any],
@@ -55,45 +86,93 @@ def generate_file_excel_for_bookings(
     )
     df.to_excel(filename, index=False)
 
+def get_all_bookings_dataframe(booking_list: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Flatten the bookings of every hotel into a single DataFrame.
+
+    The columns are the ones stored in ``all_bookings`` files and loaded into the
+    database (see ``db/load_data.py``).
+
+    Args:
+        booking_list: List of hotel booking dictionaries with 'HotelName' and
+            'Bookings' keys
+
+    Returns:
+        One row per booking
+    """
+    all_bookings = [
+        flatten_booking(hotel_bookings["HotelName"], booking)
+        for hotel_bookings in booking_list
+        for booking in hotel_bookings["Bookings"]
+    ]
+
+    return pd.DataFrame(all_bookings, columns=list(ALL_BOOKINGS_SCHEMA.names))
+
 def generate_file_excel_all_bookings(booking_list, output_path):
     """Generate an Excel file with all booking data.
-    
+
+    Excel is an optional export; the pipeline hands bookings over to the
+    database loader through ``generate_file_parquet_all_bookings``.
+
     Args:
         booking_list (list): List of booking dictionaries
         output_path (str): Path to write the Excel file
     """
-    # Create a list to store all booking data
-    all_bookings = []
-
-    # Extract data from each booking
-    for hotel_bookings in booking_list:
-        hotel_name = hotel_bookings["HotelName"]
-        for booking in hotel_bookings["Bookings"]:
-            booking_data = {
-                'Hotel Name': hotel_name,
-                'Room ID': booking['RoomAssigned'],
-                'Room Type': booking['RoomType'],
-                'Room Category': booking['RoomCategory'],
-                'Check-in Date': booking['CheckInDate'],
-                'Check-out Date': booking['CheckOutDate'],
-                'Guest First Name': booking['Guest']['FirstName'],
-                'Guest Last Name': booking['Guest']['LastName'],
-                'Guest Email': booking['Guest']['Email'],
-                'Guest Phone': booking['Guest']['Phone'],
-                'Guest Country': booking['Guest']['Country'],
-                'Guest City': booking['Guest']['City'],
-                'Guest Address': booking['Guest']['Address'],
-                'Guest Zip Code': booking['Guest']['ZipCode'],
-                'Meal Plan': booking['MealPlan'],
-                'Total Price': booking['TotalPrice']
-            }
-            all_bookings.append(booking_data)
-
     # Create DataFrame and write to Excel
-    df = pd.DataFrame(all_bookings)
+    df = get_all_bookings_dataframe(booking_list)
     df.to_excel(output_path, index=False)
     print(f"Excel file with all bookings written to: {output_path}")
 
+def get_all_bookings_table(df: pd.DataFrame) -> pa.Table:
+    """Convert an all-bookings DataFrame into an Arrow table with ``ALL_BOOKINGS_SCHEMA``.
+
+    Args:
+        df: DataFrame with the ``ALL_BOOKINGS_SCHEMA`` columns
+
+    Returns:
+        Typed Arrow table
+    """
+    columns = {}
+    for field in ALL_BOOKINGS_SCHEMA:
+        values = df[field.name]
+        if pa.types.is_dictionary(field.type) and isinstance(values.dtype, pd.CategoricalDtype):
+            # Reuse the codes of categorical columns (e.g. from a BookingTable)
+            columns[field.name] = pa.DictionaryArray.from_arrays(
+                pa.array(values.cat.codes.to_numpy(), type=pa.int32()),
+                pa.array(values.cat.categories.astype("string"), type=pa.string())
+            )
+            continue
+        if pa.types.is_date32(field.type):
+            values = pd.to_datetime(values).dt.date
+        elif pa.types.is_string(field.type) or pa.types.is_dictionary(field.type):
+            values = values.astype("string")
+        columns[field.name] = pa.array(values, type=field.type, from_pandas=True)
+    return pa.Table.from_pydict(columns, schema=ALL_BOOKINGS_SCHEMA)
+
+def write_all_bookings_parquet(df: pd.DataFrame, output_path: str) -> None:
+    """Write an all-bookings DataFrame as a typed Parquet file.
+
+    Dates are stored as ``date32``, prices as ``float64`` and the low-cardinality
+    string columns (hotel, room type/category, guest country/city, meal plan)
+    as dictionary-encoded columns.
+
+    Args:
+        df: DataFrame with the ``ALL_BOOKINGS_SCHEMA`` columns
+        output_path: Path to write the Parquet file
+    """
+    pq.write_table(get_all_bookings_table(df), output_path, compression="zstd")
+
+def generate_file_parquet_all_bookings(booking_list, output_path):
+    """Generate a Parquet file with all booking data.
+
+    This is the hand-off format read by the database loader.
+
+    Args:
+        booking_list (list): List of booking dictionaries
+        output_path (str): Path to write the Parquet file
+    """
+    write_all_bookings_parquet(get_all_bookings_dataframe(booking_list), output_path)
+    print(f"Parquet file with all bookings written to: {output_path}")
+
 def generate_hotel_bookings_filename(hotel_key: str, hotel_name: str) -> str:
     """Generate a standardized filename for hotel booking data.
 
@@ -112,50 +191,45 @@ def generate_hotel_bookings_filename(hotel_key: str, hotel_name: str) -> str:
     filename = f"hotel_{hotel_key}_{camel_case_name}_bookings"
     return filename
 
+def write_md_hotel_bookings_header(file: TextIO, hotel_name: str) -> None:
+    """Write the title and table header of the bookings of a hotel in Markdown.
+
+    Args:
+        file: Open text file of the Markdown document
+        hotel_name: Name of the hotel
+    """
+    file.write(md_hotel_bookings_header(hotel_name))
+
 def generate_file_md_hotel_bookings(
     hotel_bookings_list: List[Dict[str, Any]],
-    output_path: str
+    output_path: str,
+    compression: Optional[str] = None,
+    split_by_hotel: bool = False,
+    workers: int = 1
 ) -> None:
     """Generate a Markdown file containing booking data for multiple hotels.
 
     Creates a markdown table with booking details including guest information,
-    check-in/out dates, room details, and pricing.
+    check-in/out dates, room details, and pricing. The rows of each hotel are
+    formatted in one batch and written with a large buffer (see
+    ``markdown_writer.HotelBookingsMarkdown``).
 
     Args:
         hotel_bookings_list: List of dictionaries containing booking data for
             multiple hotels. Each dict must have 'HotelName' and 'Bookings' keys
         output_path: Directory path where the file will be saved
+        compression: None, 'gzip' (hotel_bookings.md.gz) or 'zstd' (hotel_bookings.md.zst)
+        split_by_hotel: Write one file per hotel to the hotel_bookings/ directory
+            instead of hotel_bookings.md
+        workers: Number of threads writing (and compressing) the files
 
     Returns:
         None
     """
-    filename = f"{output_path}hotel_bookings.md"
+    filename = f"{output_path}hotel_bookings" if split_by_hotel \
+        else f"{output_path}hotel_bookings.md"
 
-    with open(filename, "w", encoding="utf-8") as file:
+    with HotelBookingsMarkdown(filename, compression, split_by_hotel, workers) as writer:
         for hotel_bookings in hotel_bookings_list:
-            hotel_name = hotel_bookings["HotelName"]
-
-            file.write(f"# HOTEL - Name: {hotel_name}\n\n")
-            file.write("## Bookings\n\n")
-            file.write(
-                "| Country of Guest | City of Guest | Check-In Date | "
-                "Check-Out Date | Room Assigned | Room Category | Room Type | "
-                "Meal Plan | Total Price |\n"
-            )
-            file.write(
-                "|------------------|---------------|---------------|"
-                "----------------|---------------|---------------|-----------|"
-                "-----------|-------------|\n"
-            )
-
-            for booking in hotel_bookings["Bookings"]:
-                guest_country = booking["Guest"]["Country"]
-                guest_city = booking["Guest"]["City"]
-                file.write(
-                    f"| {guest_country} | {guest_city} | "
-                    f"{booking['CheckInDate']} | {booking['CheckOutDate']} | "
-                    f"{booking['RoomAssigned']} | {booking['RoomCategory']} | "
-                    f"{booking['RoomType']} | {booking['MealPlan']} | "
-                    f"{booking['TotalPrice']} |\n"
-                )
-            file.write("\n---\n\n")
+            writer.write_rows(hotel_bookings["HotelName"],
+                              hotel_bookings_md_rows(hotel_bookings["Bookings"]))
@@ -0,0 +1,271 @@
+"""Module for writing streams of booking records to output files chunk by chunk.
+
+The writers of ``booking_output_writer`` receive the bookings of every hotel at
+once. The sinks of this module receive flat booking records (see
+``generator.booking_generator.flatten_booking``) in chunks instead, so a booking
+stream such as ``iter_all_hotel_bookings`` can be written with bounded memory.
+Sinks also write slices of a ``BookingTable`` (see ``write_booking_table``).
+"""
+
+import csv
+from collections.abc import Iterable
+from itertools import groupby, islice, pairwise
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+
+from ..generator.booking_table import BookingTable
+from .booking_output_writer import ALL_BOOKINGS_SCHEMA, get_all_bookings_table
+from .markdown_writer import (
+    DEFAULT_BUFFER_SIZE,
+    HotelBookingsMarkdown,
+    booking_records_md_rows,
+    booking_table_md_rows,
+)
+
+DEFAULT_CHUNK_SIZE = 50000
+
+# Columns of the booking records, in file order
+BOOKING_RECORD_COLUMNS = list(ALL_BOOKINGS_SCHEMA.names)
+
+# Maximum number of rows of an Excel worksheet (header included)
+EXCEL_MAX_ROWS = 1048576
+
+
+class BookingSink:
+    """Base class of the writers of booking record chunks."""
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Write a chunk of booking records."""
+        raise NotImplementedError
+
+    def write_table(self, booking_table: BookingTable, start: int, stop: int) -> None:
+        """Write the bookings [start, stop) of a BookingTable."""
+        self.write(booking_table.records(start, stop))
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class BookingCsvSink(BookingSink):
+    """Write booking records to a CSV file with the all bookings columns."""
+
+    def __init__(self, output_path: str):
+        """
+        Args:
+            output_path: Path of the CSV file
+        """
+        self.output_path = output_path
+        self._file = open(output_path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(BOOKING_RECORD_COLUMNS)
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        self._writer.writerows(
+            [record[column] for column in BOOKING_RECORD_COLUMNS] for record in records
+        )
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            print(f"CSV file with all bookings written to: {self.output_path}")
+
+
+class BookingMarkdownSink(BookingSink):
+    """Write booking records to a Markdown file with one table per hotel.
+
+    The layout is the one of ``generate_file_md_hotel_bookings``; the records of
+    a hotel must be consecutive in the stream. The rows of a chunk are formatted
+    in one batch (from the columns of a BookingTable, see ``write_table``) and
+    written with a large buffer, optionally compressed or split by hotel.
+    """
+
+    def __init__(self, output_path: str, compression: str | None = None,
+                 split_by_hotel: bool = False, workers: int = 1,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            output_path: Path of the Markdown file, without the suffix of its
+                compression, or directory of the hotel files when split_by_hotel
+            compression: None, 'gzip' or 'zstd'
+            split_by_hotel: Write the bookings of each hotel to its own file
+            workers: Number of threads writing (and compressing) the files
+            buffer_size: Size of the write buffer of each file in bytes
+        """
+        self.output_path = output_path
+        self._writer = HotelBookingsMarkdown(output_path, compression, split_by_hotel,
+                                             workers, buffer_size)
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        for hotel_name, hotel_records in groupby(records, key=itemgetter('Hotel Name')):
+            self._writer.write_rows(hotel_name, booking_records_md_rows(list(hotel_records)))
+
+    def write_table(self, booking_table: BookingTable, start: int, stop: int) -> None:
+        rows = booking_table_md_rows(booking_table, start, stop)
+        hotels = booking_table.codes('hotel_name', start, stop)
+        hotel_names = booking_table.categories('hotel_name')
+        bounds = [0, *(np.flatnonzero(np.diff(hotels)) + 1).tolist(), len(hotels)]
+        for first, last in pairwise(bounds):
+            self._writer.write_rows(hotel_names[hotels[first]], rows[first:last])
+
+    @property
+    def paths(self) -> list[str]:
+        """Files written, in order."""
+        return self._writer.paths
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class BookingParquetSink(BookingSink):
+    """Write booking records to a Parquet file, one row group per chunk.
+
+    The file has the ``ALL_BOOKINGS_SCHEMA`` of ``write_all_bookings_parquet``.
+    """
+
+    def __init__(self, output_path: str):
+        """
+        Args:
+            output_path: Path of the Parquet file
+        """
+        self.output_path = output_path
+        self._writer = pq.ParquetWriter(output_path, ALL_BOOKINGS_SCHEMA, compression="zstd")
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        df = pd.DataFrame(records, columns=BOOKING_RECORD_COLUMNS)
+        self._writer.write_table(get_all_bookings_table(df))
+
+    def write_table(self, booking_table: BookingTable, start: int, stop: int) -> None:
+        # The categorical columns of the table are written without decoding them
+        self._writer.write_table(get_all_bookings_table(booking_table.to_dataframe(start, stop)))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            print(f"Parquet file with all bookings written to: {self.output_path}")
+
+
+class BookingExcelSink(BookingSink):
+    """Write booking records to an Excel file using a write-only workbook.
+
+    Raises:
+        ValueError: If the bookings do not fit in one worksheet
+    """
+
+    def __init__(self, output_path: str):
+        """
+        Args:
+            output_path: Path of the Excel file
+        """
+        self.output_path = output_path
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet()
+        self._sheet.append(BOOKING_RECORD_COLUMNS)
+        self._rows = 1
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        self._rows += len(records)
+        if self._rows > EXCEL_MAX_ROWS:
+            raise ValueError(
+                f"The bookings exceed the {EXCEL_MAX_ROWS} rows of an Excel worksheet. "
+                "Disable the Excel export of the bookings."
+            )
+        for record in records:
+            self._sheet.append([record[column] for column in BOOKING_RECORD_COLUMNS])
+
+    def close(self) -> None:
+        if self._workbook is not None:
+            self._workbook.save(self.output_path)
+            self._workbook = None
+            print(f"Excel file with all bookings written to: {self.output_path}")
+
+
+def iter_booking_chunks(
+    records: Iterable[dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+):
+    """Split a stream of booking records into lists of at most chunk_size records.
+
+    Args:
+        records: Booking records
+        chunk_size: Maximum number of records per chunk
+
+    Yields:
+        Lists of booking records
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be a positive integer.")
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def write_booking_stream(
+    records: Iterable[dict[str, Any]],
+    sinks: list[BookingSink],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """Write a stream of booking records to every sink, chunk by chunk.
+
+    At most one chunk of records is held in memory. The sinks are closed when
+    the stream is exhausted or on error.
+
+    Args:
+        records: Booking records, e.g. from ``iter_all_hotel_bookings``
+        sinks: Sinks receiving every chunk
+        chunk_size: Number of records per chunk
+
+    Returns:
+        Number of records written
+    """
+    num_records = 0
+    try:
+        for chunk in iter_booking_chunks(records, chunk_size):
+            for sink in sinks:
+                sink.write(chunk)
+            num_records += len(chunk)
+    finally:
+        for sink in sinks:
+            sink.close()
+    return num_records
+
+def write_booking_table(
+    booking_table: BookingTable,
+    sinks: list[BookingSink],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """Write the bookings of a BookingTable to every sink, chunk by chunk.
+
+    The sinks are closed when the table is written or on error.
+
+    Args:
+        booking_table: Bookings to write
+        sinks: Sinks receiving every chunk
+        chunk_size: Number of bookings per chunk
+
+    Returns:
+        Number of bookings written
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be a positive integer.")
+    try:
+        for start in range(0, len(booking_table), chunk_size):
+            for sink in sinks:
+                sink.write_table(booking_table, start, start + chunk_size)
+    finally:
+        for sink in sinks:
+            sink.close()
+    return len(booking_table)
@@ -2,10 +2,12 @@
 
 import json
 from io import TextIOWrapper
-from typing import cast, Dict, List, Any
+from typing import cast, Dict, List, Any, Optional
 
 import pandas as pd
 
+from .markdown_writer import format_md_rows, markdown_path, open_markdown
+
 def generate_file_json_for_hotels(hotels: List[Dict[str, Any]], output_path: str) -> None:
     """Generate a JSON file containing hotel data.
 
@@ -50,50 +52,58 @@ def generate_file_csv_for_all_hotels(hotels: List[Dict[str, Any]], output_path:
     filename = f"{output_path}all_hotels.csv"
     df.to_csv(filename, index=False, encoding='utf-8')
 
-def generate_file_md_hotel_details(hotels: List[Dict[str, Any]], output_path: str) -> None:
+def generate_file_md_hotel_details(hotels: List[Dict[str, Any]], output_path: str,
+                                   compression: Optional[str] = None) -> None:
     """Generate a Markdown file containing hotel details.
 
     Args:
         hotels: List of hotel dictionaries
         output_path: Directory path where the file will be saved
+        compression: None, 'gzip' (hotel_details.md.gz) or 'zstd' (hotel_details.md.zst)
     """
-    filename = f"{output_path}hotel_details.md"
-    with open(filename, "w", encoding="utf-8") as file:
+    filename = markdown_path(f"{output_path}hotel_details.md", compression)
+    with open_markdown(filename, compression) as file:
         for hotel in hotels:
-            file.write(f"# {hotel['Name']}\n\n")
-            file.write(f"**Hotel Key:** {hotel['hotelkey']}\n\n")
-            file.write(
+            lines = [
+                f"# {hotel['Name']}\n\n",
+                f"**Hotel Key:** {hotel['hotelkey']}\n\n",
                 f"**Location:** {hotel['Address']['Country']}, "
-                f"{hotel['Address']['City']}\n\n")
-            file.write(f"**Address:** {hotel['Address']['Address']}\n\n")
-            file.write(f"**Zip Code:** {hotel['Address']['ZipCode']}\n\n")
-            file.write("## Rooms\n\n")
-            for room in hotel['Rooms']:
-                file.write(f"### Room {room['RoomId']}\n\n")
-                file.write(f"- **Floor:** {room['Floor']}\n")
-                file.write(f"- **Category:** {room['Category']}\n")
-                file.write(f"- **Type:** {room['Type']}\n")
-                file.write(f"- **Guests:** {room['Guests']}\n")
-                file.write(f"- **Price (Off Season):** {room['PriceOffSeason']}\n")
-                file.write(f"- **Price (Peak Season):** {room['PricePeakSeason']}\n\n")
-            file.write("---\n\n")
+                f"{hotel['Address']['City']}\n\n",
+                f"**Address:** {hotel['Address']['Address']}\n\n",
+                f"**Zip Code:** {hotel['Address']['ZipCode']}\n\n",
+                "## Rooms\n\n"
+            ]
+            lines.extend(
+                f"### Room {room['RoomId']}\n\n"
+                f"- **Floor:** {room['Floor']}\n"
+                f"- **Category:** {room['Category']}\n"
+                f"- **Type:** {room['Type']}\n"
+                f"- **Guests:** {room['Guests']}\n"
+                f"- **Price (Off Season):** {room['PriceOffSeason']}\n"
+                f"- **Price (Peak Season):** {room['PricePeakSeason']}\n\n"
+                for room in hotel['Rooms']
+            )
+            lines.append("---\n\n")
+            file.write("".join(lines))
 
-def generate_file_md_hotel_rooms(hotels: List[Dict[str, Any]], output_path: str) -> None:
+def generate_file_md_hotel_rooms(hotels: List[Dict[str, Any]], output_path: str,
+                                 compression: Optional[str] = None) -> None:
     """Generate a Markdown file containing hotel room details.
 
     Args:
         hotels: List of hotel dictionaries
         output_path: Directory path where the file will be saved
+        compression: None, 'gzip' (hotel_rooms.md.gz) or 'zstd' (hotel_rooms.md.zst)
     """
-    filename = f"{output_path}hotel_rooms.md"
-    with open(filename, "w", encoding="utf-8") as file:
+    filename = markdown_path(f"{output_path}hotel_rooms.md", compression)
+    with open_markdown(filename, compression) as file:
         for hotel in hotels:
-            file.write(f"# {hotel['Name']}\n\n")
-            file.write("| Room ID | Category | Type | Price Off Season | Price Peak Season |\n")
-            file.write("|---------|----------|------|------------------|-------------------|\n")
-            for room in hotel['Rooms']:
-                file.write(
-                    f"| {room['RoomId']} | {room['Category']} | {room['Type']} | "
-                    f"{room['PriceOffSeason']} | {room['PricePeakSeason']} |\n"
-                )
-            file.write("\n---\n\n")
+            rooms = hotel['Rooms']
+            file.write("".join([
+                f"# {hotel['Name']}\n\n",
+                "| Room ID | Category | Type | Price Off Season | Price Peak Season |\n",
+                "|---------|----------|------|------------------|-------------------|\n",
+                *format_md_rows([[room[name] for room in rooms] for name in (
+                    'RoomId', 'Category', 'Type', 'PriceOffSeason', 'PricePeakSeason')]),
+                "\n---\n\n"
+            ]))
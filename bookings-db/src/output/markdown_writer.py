@@ -0,0 +1,348 @@
+"""Module with the buffered, optionally compressed, Markdown output of the writers.
+
+The Markdown writers build the rows of their tables in batches and write them with
+large buffers, as plain files or compressed with gzip or zstd (the zstd codec of
+pyarrow, already needed for the Parquet files). The rows of the booking tables
+are formatted from columns: a cell shared by many rows (a guest location, a room
+and its meal plan, a price) is formatted once per distinct value and looked up by
+code, so a row costs one string format of five cells.
+"""
+
+import gzip
+import io
+import os
+import re
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TextIO
+
+import numpy as np
+import pyarrow as pa
+
+# Write buffer of the Markdown files
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# File name suffix of each compression of the Markdown files
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+# Compression level of the gzip files (9, the gzip default, is several times slower)
+GZIP_LEVEL = 6
+
+MD_HOTEL_BOOKINGS_FOOTER = "\n---\n\n"
+
+
+def markdown_path(path: str, compression: str | None = None) -> str:
+    """Return the path of a Markdown file with the suffix of its compression.
+
+    Args:
+        path: Path of the uncompressed file ("hotel_bookings.md")
+        compression: None, 'gzip' or 'zstd'
+
+    Raises:
+        ValueError: If the compression is not supported
+    """
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported Markdown compression: {compression}. "
+                         f"Use one of {[name for name in COMPRESSION_SUFFIXES if name]}.")
+    return f"{path}{COMPRESSION_SUFFIXES[compression]}"
+
+
+def open_markdown(path: str, compression: str | None = None,
+                  buffer_size: int = DEFAULT_BUFFER_SIZE) -> TextIO:
+    """Open a Markdown file for writing, as UTF-8 text.
+
+    Args:
+        path: Path of the file, suffix included (see markdown_path)
+        compression: None, 'gzip' or 'zstd'
+        buffer_size: Size of the write buffer in bytes
+
+    Returns:
+        Text file to write and close
+
+    Raises:
+        ValueError: If the compression is not supported
+        RuntimeError: If pyarrow was built without the zstd codec
+    """
+    markdown_path(path, compression)
+    if compression is None:
+        return open(path, "w", encoding="utf-8", buffering=buffer_size)
+    if compression == "gzip":
+        raw = gzip.GzipFile(path, "wb", compresslevel=GZIP_LEVEL)
+    else:
+        if not pa.Codec.is_available("zstd"):
+            raise RuntimeError("The zstd codec is not available in this pyarrow build.")
+        raw = pa.CompressedOutputStream(path, "zstd")
+    return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size), encoding="utf-8")
+
+
+def md_hotel_bookings_filename(hotel_name: str, compression: str | None = None) -> str:
+    """Return the name of the Markdown file of the bookings of one hotel.
+
+    Args:
+        hotel_name: Name of the hotel
+        compression: None, 'gzip' or 'zstd'
+
+    Returns:
+        'hotel_bookings_{CamelCaseName}.md', with the suffix of the compression
+    """
+    camel_case_name = ''.join(word.capitalize() for word in re.findall(r'\w+', hotel_name))
+    return markdown_path(f"hotel_bookings_{camel_case_name}.md", compression)
+
+
+def md_hotel_bookings_header(hotel_name: str) -> str:
+    """Return the title and table header of the bookings of a hotel in Markdown."""
+    return (
+        f"# HOTEL - Name: {hotel_name}\n\n"
+        "## Bookings\n\n"
+        "| Country of Guest | City of Guest | Check-In Date | "
+        "Check-Out Date | Room Assigned | Room Category | Room Type | "
+        "Meal Plan | Total Price |\n"
+        "|------------------|---------------|---------------|"
+        "----------------|---------------|---------------|-----------|"
+        "-----------|-------------|\n"
+    )
+
+
+def format_md_rows(cells: Sequence[Iterable[str]]) -> list[str]:
+    """Format the rows of a Markdown table.
+
+    Args:
+        cells: One sequence of cell values per column (a cell may hold several
+            columns already joined with ' | ')
+
+    Returns:
+        One '| a | b |' line per row, newline included
+    """
+    row_format = "| " + " | ".join(["{}"] * len(cells)) + " |\n"
+    return list(map(row_format.format, *cells))
+
+
+def _coded_cells(codes: np.ndarray, format_code) -> list[str]:
+    """Format the cells of integer codes, once per distinct code."""
+    unique, inverse = np.unique(codes, return_inverse=True)
+    return np.array([format_code(code) for code in unique.tolist()],
+                    dtype=object)[inverse].tolist()
+
+
+def _combined_codes(*columns: np.ndarray) -> tuple:
+    """Combine code columns into one int64 code, with the function splitting it back."""
+    sizes = [int(column.max()) + 1 if len(column) else 1 for column in columns]
+    combined = np.zeros(len(columns[0]), dtype=np.int64)
+    for column, size in zip(columns, sizes, strict=True):
+        combined = combined * size + column
+
+    def split(code: int) -> list[int]:
+        parts = []
+        for size in reversed(sizes):
+            code, part = divmod(code, size)
+            parts.append(part)
+        return parts[::-1]
+
+    return combined, split
+
+
+def booking_table_md_rows(booking_table, start: int = 0, stop: int | None = None) -> list[str]:
+    """Format the bookings [start, stop) of a BookingTable as Markdown table rows.
+
+    The rows are the ones of ``generate_file_md_hotel_bookings``, formatted from
+    the codes of the table without building booking records.
+
+    Args:
+        booking_table (BookingTable): Bookings to format
+        start: First booking
+        stop: End of the bookings (the end of the table when None)
+
+    Returns:
+        One row per booking, newline included
+    """
+    if stop is None or stop > len(booking_table):
+        stop = len(booking_table)
+    if stop <= start:
+        return []
+    column = booking_table.column
+    guest_pool = booking_table.guest_pool
+
+    countries, cities = guest_pool.location_codes(column('guest', start, stop))
+    locations, split_location = _combined_codes(countries, cities)
+
+    def format_location(code):
+        country, city = split_location(code)
+        return f"{guest_pool.countries[country]} | {guest_pool.cities[city]}"
+
+    names = {name: booking_table.categories(name)
+             for name in ('room_id', 'room_category', 'room_type', 'meal_plan')}
+    rooms, split_room = _combined_codes(*[booking_table.codes(name, start, stop)
+                                          for name in names])
+
+    def format_room(code):
+        return " | ".join(values[part] for values, part in zip(names.values(),
+                                                               split_room(code), strict=True))
+
+    check_ins = column('check_in_date', start, stop).astype(np.int64)
+    check_outs = column('check_out_date', start, stop).astype(np.int64)
+    first_day = int(min(check_ins.min(), check_outs.min()))
+    last_day = int(max(check_ins.max(), check_outs.max()))
+    day_strings = np.datetime_as_string(
+        np.arange(first_day, last_day + 1).astype("datetime64[D]"), unit="D").astype(object)
+
+    # The stays without nights nor promotion are priced with the integer 0, as in
+    # the booking records (see BookingTable.records)
+    prices = column('total_price', start, stop)
+    unpriced = (check_outs <= check_ins) & ~column('promotion', start, stop)
+    unique_prices, price_codes = np.unique(prices, return_inverse=True)
+    price_cells = np.array(list(map(repr, unique_prices.tolist())) + ["0"], dtype=object)
+    price_codes[unpriced] = len(unique_prices)
+
+    return format_md_rows([
+        _coded_cells(locations, format_location),
+        day_strings[check_ins - first_day].tolist(),
+        day_strings[check_outs - first_day].tolist(),
+        _coded_cells(rooms, format_room),
+        price_cells[price_codes].tolist(),
+    ])
+
+
+def booking_records_md_rows(records: Sequence[dict]) -> list[str]:
+    """Format flat booking records (see flatten_booking) as Markdown table rows."""
+    return format_md_rows([[record[name] for record in records] for name in (
+        'Guest Country', 'Guest City', 'Check-in Date', 'Check-out Date', 'Room ID',
+        'Room Category', 'Room Type', 'Meal Plan', 'Total Price')])
+
+
+def hotel_bookings_md_rows(bookings: Sequence[dict]) -> list[str]:
+    """Format the 'Bookings' dictionaries of a hotel as Markdown table rows."""
+    return format_md_rows([
+        [booking["Guest"]["Country"] for booking in bookings],
+        [booking["Guest"]["City"] for booking in bookings],
+        *([booking[name] for booking in bookings] for name in (
+            'CheckInDate', 'CheckOutDate', 'RoomAssigned', 'RoomCategory', 'RoomType',
+            'MealPlan', 'TotalPrice'))
+    ])
+
+
+def _write_text(previous: Future | None, file: TextIO, text: str, close: bool) -> None:
+    """Write text to a file (and close it) once the previous write to the file is done."""
+    if previous is not None:
+        previous.result()
+    if text:
+        file.write(text)
+    if close:
+        file.close()
+
+
+class HotelBookingsMarkdown:
+    """Writer of the booking tables of hotels, in one Markdown file or one file per hotel.
+
+    The tables have the layout of ``generate_file_md_hotel_bookings``. The rows of
+    a hotel are written in batches (see ``write_rows``), and the batches of a hotel
+    must be consecutive. With several workers, the writes (and their compression)
+    run in a thread pool while the caller formats the next rows; the writes to a
+    file keep their order.
+
+    Attributes:
+        paths (list[str]): Files written, in order
+    """
+
+    def __init__(self, output_path: str, compression: str | None = None,
+                 split_by_hotel: bool = False, workers: int = 1,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            output_path: Path of the Markdown file, without the suffix of its
+                compression, or directory of the hotel files when split_by_hotel
+            compression: None, 'gzip' or 'zstd'
+            split_by_hotel: Write the bookings of each hotel to its own file
+                (see md_hotel_bookings_filename)
+            workers: Number of threads writing the files (1 writes them in the
+                calling thread)
+            buffer_size: Size of the write buffer of each file in bytes
+
+        Raises:
+            ValueError: If the compression is not supported or workers is not positive
+        """
+        markdown_path(output_path, compression)
+        if workers < 1:
+            raise ValueError("The number of Markdown writer workers must be positive.")
+        self.output_path = output_path
+        self.compression = compression
+        self.split_by_hotel = split_by_hotel
+        self.buffer_size = buffer_size
+        self.paths: list[str] = []
+        self._executor = ThreadPoolExecutor(workers) if workers > 1 else None
+        self._max_pending = 2 * workers
+        self._pending = deque()
+        self._file = None
+        self._last_write = None
+        self._hotel_name = None
+        if split_by_hotel:
+            os.makedirs(output_path, exist_ok=True)
+
+    def _open(self, path: str) -> None:
+        self._file = open_markdown(path, self.compression, self.buffer_size)
+        self._last_write = None
+        self.paths.append(path)
+
+    def _submit(self, text: str, close: bool = False) -> None:
+        """Write text to the current file, in the thread pool if any."""
+        if self._executor is None:
+            _write_text(None, self._file, text, close)
+            return
+        self._last_write = self._executor.submit(_write_text, self._last_write, self._file,
+                                                 text, close)
+        self._pending.append(self._last_write)
+        # Bound the text held by the queued writes
+        while len(self._pending) > self._max_pending:
+            self._pending.popleft().result()
+
+    def _end_hotel(self, close: bool) -> None:
+        """Close the table of the current hotel, and its file if asked."""
+        if self._hotel_name is not None:
+            self._submit(MD_HOTEL_BOOKINGS_FOOTER, close)
+
+    def write_rows(self, hotel_name: str, rows: list[str]) -> None:
+        """Write Markdown table rows of the bookings of a hotel.
+
+        Args:
+            hotel_name: Name of the hotel
+            rows: Formatted rows (see booking_table_md_rows)
+
+        Raises:
+            ValueError: If the bookings of a hotel split by hotel are not consecutive
+        """
+        text = "".join(rows)
+        if hotel_name != self._hotel_name:
+            if self.split_by_hotel:
+                path = os.path.join(self.output_path,
+                                    md_hotel_bookings_filename(hotel_name, self.compression))
+                if path in self.paths:
+                    raise ValueError(f"The bookings of hotel {hotel_name} are not consecutive.")
+                self._end_hotel(close=True)
+                self._open(path)
+            else:
+                self._end_hotel(close=False)
+                if self._file is None:
+                    self._open(markdown_path(self.output_path, self.compression))
+            self._hotel_name = hotel_name
+            text = md_hotel_bookings_header(hotel_name) + text
+        self._submit(text)
+
+    def close(self) -> None:
+        """Close the table of the last hotel and wait for the writes to finish."""
+        try:
+            if self._file is not None:
+                self._end_hotel(close=False)
+                self._submit("", close=True)
+                self._file = None
+            while self._pending:
+                self._pending.popleft().result()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,22 @@
+"""Pipeline package for the staged, incremental generation of the synthetic data."""
+
+from .generation_pipeline import (
+    PIPELINE_VERSION,
+    config_values,
+    load_naming_config,
+    run_generation_pipeline,
+)
+from .stage_cache import Stage, StageCache, stage_key
+
+__all__ = [
+    # Stage cache
+    'Stage',
+    'StageCache',
+    'stage_key',
+
+    # Generation pipeline
+    'PIPELINE_VERSION',
+    'config_values',
+    'load_naming_config',
+    'run_generation_pipeline'
+]
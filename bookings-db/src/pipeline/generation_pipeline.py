@@ -0,0 +1,291 @@
+"""Module with the staged, incremental pipeline of gen_synthetic_hotels.
+
+The generation is split into stages, each seeded from the master seed (and the
+hotel key) only, so the result of a stage depends on its inputs alone and can be
+cached (see stage_cache):
+
+==================  =====================================================  ==========
+Stage               Inputs                                                 Depends on
+==================  =====================================================  ==========
+hotels              num_of_hotels, hotel names and locations               -
+rooms               rooms_per_hotel, room prices                           hotels
+params              occupancy weights, meal plans, discounts and charges   hotels
+slots               booking years, peak season months, forecast,           rooms, params
+                    occupancy weights of each hotel
+guest_pool          guest_pool, guest locations                            -
+bookings            booking years, peak season months                      all above
+writers             output path                                            see below
+==================  =====================================================  ==========
+
+The hotel files (hotels.json, hotels.xlsx, hotels.csv, all_hotels.csv) depend on
+the hotels, rooms and params stages, the hotel Markdown files on the hotels and
+rooms stages only, hotel_room_queries.csv on the hotels stage and the queries
+configuration, and the booking files on the bookings stage. The Markdown files are
+compressed (process.markdown_compression) and the booking tables split by hotel
+(process.split_markdown_bookings) as configured.
+
+For instance, a change to hotel_queries.yaml only rewrites hotel_room_queries.csv,
+and a change to the meal plan weights regenerates the hotel parameters, the
+bookings and their files, but neither the rooms nor the slots.
+
+The slots and the bookings are generated hotel by hotel by the worker processes.
+Above ``process.cache_max_bookings`` bookings (one per slot), the bookings are not
+cached: they are streamed from the workers to the booking files, with bounded
+memory, and generated again by the next run that writes a booking file.
+"""
+
+import os
+import random
+import time
+from functools import partial
+
+import yaml
+from faker import Faker
+
+from ..generator.booking_calendar import get_booking_calendar
+from ..generator.booking_generator import (
+    generate_all_hotel_booking_table,
+    generate_all_room_slots,
+    get_hotel_seed,
+    iter_all_hotel_bookings,
+)
+from ..generator.guest_pool import get_guest_pool
+from ..generator.hotel_generator import (
+    assemble_hotels,
+    generate_hotel_identities,
+    generate_hotel_parametrizations,
+    generate_hotel_rooms,
+)
+from ..generator.hotel_query_generator import HotelQueryGenerator
+from ..output.booking_stream_writer import (
+    DEFAULT_CHUNK_SIZE,
+    BookingCsvSink,
+    BookingExcelSink,
+    BookingMarkdownSink,
+    BookingParquetSink,
+    write_booking_stream,
+    write_booking_table,
+)
+from ..output.hotel_output_writer import (
+    generate_file_csv_for_all_hotels,
+    generate_file_csv_for_hotels,
+    generate_file_excel_for_hotels,
+    generate_file_json_for_hotels,
+    generate_file_md_hotel_details,
+    generate_file_md_hotel_rooms,
+)
+from ..output.hotel_query_writer import generate_file_csv_for_queries_room_hotels
+from ..output.markdown_writer import markdown_path, md_hotel_bookings_filename
+from .stage_cache import GENERATED, REUSED, STREAMED
+
+# Bump when a change of the generator code changes the result of a stage
+PIPELINE_VERSION = 1
+
+# Bookings above which the bookings stage is streamed to the files instead of cached
+DEFAULT_CACHE_MAX_BOOKINGS = 2000000
+
+NAMING_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                                  "../config/hotel_naming_location.yaml")
+
+# Configuration values read by each stage, as dotted paths
+ROOMS_CONFIG = ("rooms_per_hotel",
+                "pricing.single_room_standard_low_season",
+                "pricing.double_room_standard_low_season",
+                "pricing.triple_room_standard_low_season",
+                "pricing.premium_price_increase_percentage",
+                "pricing.peak_season_price_increase_percentage")
+PARAMS_CONFIG = ("hotel_occupancy.occupancy_weight",
+                 "hotel_occupancy.meal_plans_weight",
+                 "pricing.reduce_hosts_price_discount_percentage",
+                 "pricing.extra_bed_price_increase_percentage",
+                 "pricing.promotion_price_discount_percentage")
+CALENDAR_CONFIG = ("hotel_occupancy.booking_year", "peak_season_months")
+FORECAST_CONFIG = ("hotel_occupancy.current_month",
+                   "hotel_occupancy.forecast_reduction_percentage")
+
+
+def config_values(config, paths):
+    """Return the configuration values of dotted paths ("pricing.x"), None if missing.
+
+    Args:
+        config (dict): Configuration
+        paths (iterable): Dotted paths of the values
+
+    Returns:
+        dict: Value of each path
+    """
+    values = {}
+    for path in paths:
+        value = config
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        values[path] = value
+    return values
+
+def load_naming_config(config_path=NAMING_CONFIG_PATH):
+    """Load the hotel naming and location configuration (hotel_naming_location.yaml).
+
+    Args:
+        config_path (str): Path to the configuration file
+
+    Returns:
+        dict: The loaded configuration
+    """
+    with open(config_path, encoding="utf-8") as file:
+        return yaml.safe_load(file)
+
+def run_generation_pipeline(config, queries_config, output_path_hotels, output_path_bookings,
+                            cache, master_seed=42, workers=1,
+                            chunk_size=DEFAULT_CHUNK_SIZE):
+    """Generate the hotel and booking files, running only the stages that changed.
+
+    Args:
+        config (dict): Generation configuration (generate_hotels_param.yaml)
+        queries_config (dict): Queries configuration (hotel_queries.yaml)
+        output_path_hotels (str): Directory of the hotel files, ending with a separator
+        output_path_bookings (str): Directory of the booking files
+        cache (StageCache): Cache of the stages, which receives the report of the run
+        master_seed (int): Master random seed of the run
+        workers (int): Number of processes generating the bookings
+        chunk_size (int): Number of bookings written per chunk
+
+    Returns:
+        int: Number of bookings, None when the bookings were not needed (every
+        booking file was current)
+    """
+    naming_config = load_naming_config()
+    base = {"version": PIPELINE_VERSION, "seed": master_seed}
+    calendar = []
+
+    def booking_calendar():
+        if not calendar:
+            calendar.append(get_booking_calendar(config))
+        return calendar[0]
+
+    def generate_identities():
+        random.seed(master_seed)
+        Faker.seed(master_seed)
+        return generate_hotel_identities(config)
+
+    hotels = cache.stage("hotels", {
+        **base,
+        "num_of_hotels": config["num_of_hotels"],
+        "hotel_names": naming_config.get("hotel_names"),
+        "hotel_location": naming_config.get("hotel_location"),
+    }, generate_identities)
+    rooms = cache.stage("rooms", {
+        **base, "hotels": hotels.key, **config_values(config, ROOMS_CONFIG)
+    }, lambda: generate_hotel_rooms([hotel["hotelkey"] for hotel in hotels.value],
+                                    config, master_seed))
+    params = cache.stage("params", {
+        **base, "hotels": hotels.key, **config_values(config, PARAMS_CONFIG)
+    }, lambda: generate_hotel_parametrizations([hotel["hotelkey"] for hotel in hotels.value],
+                                               config, master_seed))
+
+    def hotel_list():
+        return assemble_hotels(hotels.value, rooms.value, params.value)
+
+    # Slots only depend on the number of rooms and the occupancy weights of the hotels
+    slots = cache.stage("slots", {
+        **base,
+        **config_values(config, CALENDAR_CONFIG + FORECAST_CONFIG),
+        "hotels": {
+            key: [len(rooms.value[key]), parametrization["OccupancyPeakSeasonWeight"],
+                  parametrization["OccupancyOffSeasonWeight"]]
+            for key, parametrization in params.value.items()
+        },
+    }, lambda: generate_all_room_slots(hotel_list(), config, booking_calendar(),
+                                       master_seed, workers))
+    guest_pool = cache.stage("guest_pool", {
+        **base,
+        "guest_pool": config.get("guest_pool"),
+        "booking_guest_location": naming_config.get("booking_guest_location"),
+    }, lambda: get_guest_pool(config, seed=master_seed))
+    bookings = cache.stage("bookings", {
+        **base,
+        **config_values(config, CALENDAR_CONFIG),
+        "stages": [hotels.key, rooms.key, params.key, slots.key, guest_pool.key],
+    }, lambda: generate_all_hotel_booking_table(hotel_list(), config, booking_calendar(),
+                                                workers=workers, master_seed=master_seed,
+                                                guest_pool=guest_pool.value,
+                                                slots=slots.value))
+
+    # Hotel files
+    hotel_stages = [hotels.key, rooms.key, params.key]
+    for name, write in (("hotels.xlsx", generate_file_excel_for_hotels),
+                        ("hotels.json", generate_file_json_for_hotels),
+                        ("hotels.csv", generate_file_csv_for_hotels),
+                        ("all_hotels.csv", generate_file_csv_for_all_hotels)):
+        cache.output(name, hotel_stages, [f"{output_path_hotels}{name}"],
+                     lambda write=write: write(hotel_list(), output_path_hotels))
+
+    def write_queries():
+        random.seed(get_hotel_seed(master_seed, "queries"))
+        query_generator = HotelQueryGenerator(queries_config)
+        queries = query_generator.get_room_queries([hotel["Name"] for hotel in hotels.value])
+        generate_file_csv_for_queries_room_hotels(queries, output_path_hotels)
+
+    cache.output("hotel_room_queries.csv", [base, hotels.key, queries_config],
+                 [f"{output_path_hotels}hotel_room_queries.csv"], write_queries)
+    markdown = config["process"].get("markdown_compression")
+    for name, write in (("hotel_details.md", generate_file_md_hotel_details),
+                        ("hotel_rooms.md", generate_file_md_hotel_rooms)):
+        cache.output(name, [hotels.key, rooms.key],
+                     [markdown_path(f"{output_path_hotels}{name}", markdown)],
+                     lambda write=write: write(
+                         [{**hotel, "Rooms": rooms.value[hotel["hotelkey"]]}
+                          for hotel in hotels.value], output_path_hotels, markdown))
+
+    # Booking files, the stale ones written in one pass over the bookings
+    if config["process"].get("split_markdown_bookings", False):
+        markdown_dir = os.path.join(output_path_hotels, "hotel_bookings")
+        booking_files = [("hotel_bookings.md", [
+            os.path.join(markdown_dir, md_hotel_bookings_filename(hotel["Name"], markdown))
+            for hotel in hotels.value
+        ], partial(BookingMarkdownSink, markdown_dir, markdown, split_by_hotel=True,
+                   workers=workers))]
+    else:
+        markdown_file = os.path.join(output_path_hotels, "hotel_bookings.md")
+        booking_files = [("hotel_bookings.md", [markdown_path(markdown_file, markdown)],
+                          partial(BookingMarkdownSink, markdown_file, markdown,
+                                  workers=workers))]
+    parquet_file = os.path.join(output_path_bookings, "all_bookings.parquet")
+    booking_files.append(("all_bookings.parquet", [parquet_file],
+                          partial(BookingParquetSink, parquet_file)))
+    if config["process"].get("export_csv_bookings", False):
+        csv_file = os.path.join(output_path_bookings, "all_bookings.csv")
+        booking_files.append(("all_bookings.csv", [csv_file], partial(BookingCsvSink, csv_file)))
+    if config["process"].get("export_excel_bookings", False):
+        excel_file = os.path.join(output_path_bookings, "all_bookings.xlsx")
+        booking_files.append(("all_bookings.xlsx", [excel_file],
+                              partial(BookingExcelSink, excel_file)))
+    stale = []
+    for name, paths, sink in booking_files:
+        key = cache.output_key(name, bookings.key, paths)
+        if cache.outputs_current(name, key, paths):
+            cache.mark(name, REUSED, 0.0)
+        else:
+            stale.append((name, key, paths, sink))
+    if not stale:
+        return None
+
+    max_cached = config["process"].get("cache_max_bookings", DEFAULT_CACHE_MAX_BOOKINGS)
+    if bookings.cached or sum(len(room_slots) for hotel_slots in slots.value.values()
+                              for room_slots in hotel_slots) <= max_cached:
+        booking_table = bookings.value
+        booking_table.guest_pool = guest_pool.value
+        start = time.perf_counter()
+        num_bookings = write_booking_table(booking_table, [sink() for *_, sink in stale],
+                                           chunk_size)
+    else:
+        start = time.perf_counter()
+        num_bookings = write_booking_stream(iter_all_hotel_bookings(
+            hotel_list(), config, booking_calendar(), workers=workers,
+            master_seed=master_seed, guest_pool=guest_pool.value, slots=slots.value
+        ), [sink() for *_, sink in stale], chunk_size)
+        # The time of the bookings is counted in the time of the files they are streamed to
+        cache.mark("bookings", STREAMED, 0.0)
+    for name, key, paths, _ in stale:
+        cache.record_outputs(name, key, paths)
+        cache.mark(name, GENERATED, time.perf_counter() - start)
+    return num_bookings
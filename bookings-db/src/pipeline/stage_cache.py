@@ -0,0 +1,261 @@
+"""Module with the on-disk cache of the stages of the generation pipeline.
+
+A stage is identified by a key, the SHA-256 of its name and of its inputs: the
+configuration values it reads, the keys of the stages it depends on and the seed
+of the run. The same key means the same result, so a stage whose key did not
+change since the previous run is not run again:
+
+- data stages (hotels, rooms, slots, bookings...) are pickled to
+  ``<cache_dir>/<stage>-<key>.pkl`` and loaded back
+- output stages (the writers) are recorded in ``<cache_dir>/manifest.json`` with
+  the size and modification time of the files they wrote, and are skipped while
+  their files are unchanged
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# Bump to invalidate every cached stage
+CACHE_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+REUSED = "reused"
+GENERATED = "generated"
+NOT_NEEDED = "not needed"
+# Generated without being cached, while writing the files that use it
+STREAMED = "streamed"
+
+
+def stage_key(name: str, inputs: Any) -> str:
+    """Return the cache key of a stage.
+
+    Args:
+        name: Name of the stage
+        inputs: JSON serializable inputs of the stage
+
+    Returns:
+        Hexadecimal SHA-256 of the name and the inputs
+    """
+    payload = json.dumps([CACHE_VERSION, name, inputs], sort_keys=True, default=str,
+                         separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write a file under a temporary name, then rename it into place."""
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, path)
+
+
+def _file_state(path: str):
+    """Return the [size, modification time] of a file, None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class Stage:
+    """A data stage of the pipeline, computed or loaded on first use of its value.
+
+    Attributes:
+        name (str): Name of the stage
+        key (str): Cache key of the stage
+    """
+
+    def __init__(self, cache: "StageCache", name: str, inputs: Any,
+                 compute: Callable[[], Any]):
+        """
+        Args:
+            cache: Cache of the stage
+            name: Name of the stage
+            inputs: JSON serializable inputs of the stage (see stage_key)
+            compute: Function computing the value of the stage
+        """
+        self.name = name
+        self.key = stage_key(name, inputs)
+        self._cache = cache
+        self._compute = compute
+        self._loaded = False
+        self._value = None
+        cache.report[name] = {"status": NOT_NEEDED, "seconds": 0.0}
+
+    @property
+    def cached(self) -> bool:
+        """Whether the value of the stage is in the cache (and would not be computed)."""
+        return self._cache.cached(self.name, self.key)
+
+    @property
+    def value(self) -> Any:
+        """Value of the stage, from the cache when available."""
+        if not self._loaded:
+            self._value = self._cache.load_or_compute(self.name, self.key, self._compute)
+            self._loaded = True
+        return self._value
+
+
+class StageCache:
+    """On-disk cache of the data and output stages of a pipeline run.
+
+    Attributes:
+        cache_dir (str): Directory of the cache
+        rebuild (bool): Run every stage, ignoring (and refreshing) the cache
+        report (dict): Status ('reused', 'generated', 'streamed' or 'not needed') and
+            time in seconds of every stage of the run, in stage order
+    """
+
+    def __init__(self, cache_dir: str, rebuild: bool = False):
+        """
+        Args:
+            cache_dir: Directory of the cache, created if needed
+            rebuild: Run every stage, ignoring the cached results
+        """
+        self.cache_dir = cache_dir
+        self.rebuild = rebuild
+        self.report: dict[str, dict[str, Any]] = {}
+        # Time of the stages run while computing another stage, not counted twice
+        self._nested_seconds = 0.0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._manifest = self._read_manifest()
+
+    def _read_manifest(self) -> dict[str, Any]:
+        try:
+            with open(os.path.join(self.cache_dir, MANIFEST_FILE),
+                      encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return manifest.get("outputs", {}) if manifest.get("version") == CACHE_VERSION else {}
+
+    def _write_manifest(self) -> None:
+        _write_atomic(os.path.join(self.cache_dir, MANIFEST_FILE), json.dumps(
+            {"version": CACHE_VERSION, "outputs": self._manifest}, indent=2,
+            sort_keys=True).encode("utf-8"))
+
+    def _data_path(self, name: str, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}-{key[:16]}.pkl")
+
+    def stage(self, name: str, inputs: Any, compute: Callable[[], Any]) -> Stage:
+        """Declare a data stage (see Stage).
+
+        Args:
+            name: Name of the stage
+            inputs: JSON serializable inputs of the stage
+            compute: Function computing the value of the stage
+
+        Returns:
+            The stage, whose value is only loaded or computed when used
+        """
+        return Stage(self, name, inputs, compute)
+
+    def cached(self, name: str, key: str) -> bool:
+        """Tell whether the value of a data stage would be loaded from the cache."""
+        return not self.rebuild and os.path.exists(self._data_path(name, key))
+
+    def load_or_compute(self, name: str, key: str, compute: Callable[[], Any]) -> Any:
+        """Load the value of a data stage from the cache, or compute and store it.
+
+        Args:
+            name: Name of the stage
+            key: Cache key of the stage
+            compute: Function computing the value of the stage
+
+        Returns:
+            Value of the stage
+        """
+        start = time.perf_counter()
+        path = self._data_path(name, key)
+        if self.cached(name, key):
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+            self.mark(name, REUSED, time.perf_counter() - start)
+            self._nested_seconds += time.perf_counter() - start
+            return value
+
+        outer_seconds, self._nested_seconds = self._nested_seconds, 0.0
+        value = compute()
+        _write_atomic(path, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        # Only the latest result of a stage is kept
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.startswith(f"{name}-") and file_name.endswith(".pkl") \
+                    and os.path.join(self.cache_dir, file_name) != path:
+                os.remove(os.path.join(self.cache_dir, file_name))
+        seconds = time.perf_counter() - start
+        self.mark(name, GENERATED, seconds - self._nested_seconds)
+        self._nested_seconds = outer_seconds + seconds
+        return value
+
+    @staticmethod
+    def output_key(name: str, inputs: Any, paths: list[str]) -> str:
+        """Return the cache key of an output stage, which covers its output files."""
+        return stage_key(name, [inputs, paths])
+
+    def outputs_current(self, name: str, key: str, paths: Iterable[str]) -> bool:
+        """Tell whether the files of an output stage were written with this key.
+
+        Args:
+            name: Name of the output stage
+            key: Cache key of the stage
+            paths: Files written by the stage
+
+        Returns:
+            True when the stage wrote these files with the same key and none of
+            them was modified or deleted since
+        """
+        entry = self._manifest.get(name)
+        if self.rebuild or entry is None or entry["key"] != key:
+            return False
+        paths = list(paths)
+        return sorted(entry["files"]) == sorted(paths) and all(
+            entry["files"][path] == _file_state(path) for path in paths)
+
+    def record_outputs(self, name: str, key: str, paths: Iterable[str]) -> None:
+        """Record the files written by an output stage (see outputs_current).
+
+        Args:
+            name: Name of the output stage
+            key: Cache key of the stage
+            paths: Files written by the stage
+        """
+        self._manifest[name] = {"key": key,
+                                "files": {path: _file_state(path) for path in paths}}
+        self._write_manifest()
+
+    def output(self, name: str, inputs: Any, paths: list[str],
+               write: Callable[[], None]) -> None:
+        """Run an output stage unless its files are current.
+
+        Args:
+            name: Name of the output stage
+            inputs: JSON serializable inputs of the stage
+            paths: Files written by the stage
+            write: Function writing the files
+        """
+        start = time.perf_counter()
+        key = self.output_key(name, inputs, paths)
+        if self.outputs_current(name, key, paths):
+            self.mark(name, REUSED, time.perf_counter() - start)
+            return
+        write()
+        self.record_outputs(name, key, paths)
+        self.mark(name, GENERATED, time.perf_counter() - start)
+
+    def mark(self, name: str, status: str, seconds: float) -> None:
+        """Record the status ('reused', 'generated' or 'streamed') and time of a stage."""
+        self.report[name] = {"status": status, "seconds": seconds}
+
+    def format_report(self) -> str:
+        """Return the status and time of every stage, one line per stage."""
+        lines = [f"{'stage':<24} {'status':<11} {'time (s)':>9}"]
+        lines.extend(f"{name:<24} {entry['status']:<11} {entry['seconds']:>9.2f}"
+                     for name, entry in self.report.items())
+        return "\n".join(lines)
@@ -0,0 +1,51 @@
+"""Shared fixtures of the tests of the bookings generator, loader and API."""
+
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+import yaml
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BOOKINGS_DB_DIR = os.path.join(ROOT_DIR, "bookings-db")
+API_DIR = os.path.join(ROOT_DIR, "ai_agents_hospitality-api")
+
+# The generator and loader are imported as ``src.*``, the API modules as ``util.*``
+for path in (BOOKINGS_DB_DIR, API_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from src.generator.booking_calendar import get_booking_calendar  # noqa: E402
+
+OUTPUT_DIR = os.path.join(BOOKINGS_DB_DIR, "output_files")
+HOTELS_FILE = os.path.join(OUTPUT_DIR, "hotels", "hotels.json")
+BOOKINGS_FILE = os.path.join(OUTPUT_DIR, "bookings", "all_bookings.parquet")
+CONFIG_FILE = os.path.join(BOOKINGS_DB_DIR, "config", "generate_hotels_param.yaml")
+
+
+@pytest.fixture(scope="session")
+def hotels():
+    """Hotels of the committed generator output (hotels.json)."""
+    with open(HOTELS_FILE, encoding="utf-8") as file:
+        return json.load(file)["Hotels"]
+
+
+@pytest.fixture(scope="session")
+def bookings():
+    """Bookings of the committed generator output (all_bookings.parquet)."""
+    return pd.read_parquet(BOOKINGS_FILE)
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Generation configuration of the committed generator output."""
+    with open(CONFIG_FILE, encoding="utf-8") as file:
+        return yaml.safe_load(file)
+
+
+@pytest.fixture(scope="session")
+def booking_calendar(config):
+    """Booking calendar of the generation configuration."""
+    return get_booking_calendar(config)
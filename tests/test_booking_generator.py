@@ -0,0 +1,69 @@
+"""The booking generation paths produce the same bookings from the same seeds."""
+
+import random
+
+import pytest
+from src.generator import booking_generator as BG
+from src.generator import parametric_utils as ParUt
+from src.generator.guest_pool import get_guest_pool
+
+MASTER_SEED = 42
+
+
+@pytest.fixture(scope="module")
+def guest_pool(config):
+    return get_guest_pool(config, seed=MASTER_SEED)
+
+
+def test_dictionaries_stream_and_table_have_the_same_bookings(hotels, config, booking_calendar,
+                                                              guest_pool):
+    hotels = hotels[:2]
+    hotel_bookings = BG.generate_all_hotel_bookings(hotels, config, booking_calendar,
+                                                    master_seed=MASTER_SEED,
+                                                    guest_pool=guest_pool)
+    records = [BG.flatten_booking(bookings["HotelName"], booking)
+               for bookings in hotel_bookings for booking in bookings["Bookings"]]
+
+    assert records
+    assert list(BG.iter_all_hotel_bookings(hotels, config, booking_calendar,
+                                           master_seed=MASTER_SEED,
+                                           guest_pool=guest_pool)) == records
+    assert BG.generate_all_hotel_booking_table(hotels, config, booking_calendar,
+                                               master_seed=MASTER_SEED,
+                                               guest_pool=guest_pool).records() == records
+
+
+def test_booking_dictionaries_are_priced_with_get_total_price(hotels, config, booking_calendar,
+                                                              guest_pool):
+    hotel = hotels[0]
+    rooms = {room["RoomId"]: room for room in hotel["Rooms"]}
+    bookings = BG.generate_hotel_bookings(hotel, config, booking_calendar, guest_pool)
+    for booking in bookings["Bookings"][:500]:
+        assert booking["TotalPrice"] == ParUt.get_total_price(
+            booking, rooms[booking["RoomAssigned"]], config["peak_season_months"],
+            hotel["SyntheticParams"])
+
+
+def test_slots_are_the_same_in_worker_processes(hotels, config, booking_calendar, guest_pool):
+    hotels = hotels[:3]
+    slots = BG.generate_all_room_slots(hotels, config, booking_calendar, MASTER_SEED)
+    assert BG.generate_all_room_slots(hotels, config, booking_calendar, MASTER_SEED,
+                                      workers=2) == slots
+
+    records = BG.generate_all_hotel_booking_table(hotels, config, booking_calendar,
+                                                  master_seed=MASTER_SEED, guest_pool=guest_pool,
+                                                  slots=slots).records()
+    for workers in (1, 2):
+        assert list(BG.iter_all_hotel_bookings(hotels, config, booking_calendar, workers,
+                                               master_seed=MASTER_SEED, guest_pool=guest_pool,
+                                               slots=slots)) == records
+
+
+def test_hotel_guest_pool_is_seeded_when_not_given(hotels, config, booking_calendar,
+                                                   guest_pool):
+    hotel = dict(hotels[0], Rooms=hotels[0]["Rooms"][:5])
+    random.seed(7)
+    records = BG.generate_hotel_booking_table(hotel, config, booking_calendar,
+                                              master_seed=MASTER_SEED).records()
+    random.seed(7)
+    assert list(BG.iter_hotel_bookings(hotel, config, booking_calendar, guest_pool)) == records
@@ -0,0 +1,65 @@
+"""The generation pipeline writes the same files whether the bookings are cached or streamed."""
+
+import os
+import shutil
+
+import pandas as pd
+import pytest
+import yaml
+from conftest import BOOKINGS_DB_DIR, CONFIG_FILE
+from src.gen_synthetic_hotels import load_config_queries
+from src.pipeline.generation_pipeline import run_generation_pipeline
+from src.pipeline.stage_cache import GENERATED, REUSED, STREAMED, StageCache
+
+QUERIES_CONFIG_FILE = os.path.join(BOOKINGS_DB_DIR, "config", "hotel_queries.yaml")
+
+
+def run_pipeline(directory, workers=1, **process):
+    """Run the pipeline into a directory; return the cache and the number of bookings."""
+    with open(CONFIG_FILE, encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+    config["process"].update(process)
+    hotels_dir, bookings_dir = directory / "hotels", directory / "bookings"
+    hotels_dir.mkdir(parents=True, exist_ok=True)
+    bookings_dir.mkdir(exist_ok=True)
+    cache = StageCache(str(directory / "cache"))
+    bookings = run_generation_pipeline(config, load_config_queries(QUERIES_CONFIG_FILE),
+                                       f"{hotels_dir}{os.sep}", str(bookings_dir), cache,
+                                       workers=workers)
+    return cache, bookings
+
+
+@pytest.fixture(scope="module")
+def cached_run(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("cached")
+    cache, bookings = run_pipeline(directory)
+    return directory, cache, bookings
+
+
+def test_bookings_above_the_cache_limit_are_streamed(tmp_path, cached_run):
+    cached_dir, cached, bookings = cached_run
+    assert cached.report["bookings"]["status"] == GENERATED
+    # The hotel names are drawn once per process: reuse the hotels of the cached run
+    shutil.copytree(cached_dir / "cache", tmp_path / "cache")
+    for name in os.listdir(tmp_path / "cache"):
+        if name.startswith("bookings-"):
+            os.remove(tmp_path / "cache" / name)
+
+    cache, streamed_bookings = run_pipeline(tmp_path, workers=2, cache_max_bookings=0)
+    assert cache.report["bookings"]["status"] == STREAMED
+    assert cache.report["all_bookings.parquet"]["status"] == GENERATED
+    assert streamed_bookings == bookings
+    assert not [name for name in os.listdir(tmp_path / "cache") if name.startswith("bookings-")]
+
+    for name in ("hotel_bookings.md", "hotels.json"):
+        assert (tmp_path / "hotels" / name).read_bytes() == \
+            (cached_dir / "hotels" / name).read_bytes()
+    # Same values; the dictionaries of the categorical columns may be ordered differently
+    streamed_df, cached_df = (pd.read_parquet(directory / "bookings" / "all_bookings.parquet")
+                              for directory in (tmp_path, cached_dir))
+    pd.testing.assert_frame_equal(streamed_df.astype(str), cached_df.astype(str))
+
+    # The files are current: the next run neither streams nor caches the bookings
+    cache, streamed_bookings = run_pipeline(tmp_path, workers=2, cache_max_bookings=0)
+    assert streamed_bookings is None
+    assert cache.report["all_bookings.parquet"]["status"] == REUSED
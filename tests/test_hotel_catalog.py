@@ -0,0 +1,67 @@
+"""The hotel catalog finds the hotels and rooms a scan of hotels.json finds."""
+
+import statistics
+from itertools import product
+
+import pytest
+from util.hotel_catalog import HotelCatalog
+
+
+@pytest.fixture(scope="module")
+def catalog(hotels):
+    return HotelCatalog(hotels)
+
+
+def scan_rooms(hotels, **filters):
+    """(hotel key, room id) of the rooms matching the filters, by scan."""
+    return sorted(
+        (str(hotel["hotelkey"]), room["RoomId"])
+        for hotel in hotels for room in hotel["Rooms"]
+        if filters.get("city") in (None, hotel["Address"]["City"])
+        and filters.get("country") in (None, hotel["Address"]["Country"])
+        and filters.get("room_type") in (None, room["Type"])
+        and filters.get("category") in (None, room["Category"])
+    )
+
+
+def test_hotels_by_key_and_place(catalog, hotels):
+    assert len(catalog) == len(hotels)
+    for hotel in hotels:
+        found = catalog.hotel(hotel["hotelkey"])
+        assert (found.name, found.city, found.rooms) == (
+            hotel["Name"], hotel["Address"]["City"], len(hotel["Rooms"]))
+        assert found in catalog.find_hotels(name=hotel["Name"].upper())
+        assert found in catalog.find_hotels(city=hotel["Address"]["City"].lower(),
+                                            country=hotel["Address"]["Country"])
+    assert catalog.hotel("missing") is None
+    assert catalog.find_hotels(city="Atlantis") == []
+
+
+@pytest.mark.parametrize("room_type, category", list(product([None, "Single", "Triple"],
+                                                              [None, "Premium"])))
+def test_rooms_match_a_scan(catalog, hotels, room_type, category):
+    cities = sorted({hotel["Address"]["City"] for hotel in hotels})
+    for city in [None] + cities:
+        rooms = catalog.rooms(city=city, room_type=room_type, category=category)
+        expected = scan_rooms(hotels, city=city, room_type=room_type, category=category)
+        assert sorted((room.hotel_key, room.room_id) for room in rooms) == expected
+        assert catalog.count_rooms(city=city, room_type=room_type,
+                                   category=category) == len(expected)
+
+
+def test_room_stats_match_the_rooms(catalog, hotels):
+    for hotel in hotels:
+        stats = catalog.room_stats(hotel["hotelkey"])
+        assert sum(group.rooms for group in stats.values()) == len(hotel["Rooms"])
+        for (room_type, category), group in stats.items():
+            prices = [room["PricePeakSeason"] for room in hotel["Rooms"]
+                      if (room["Type"], room["Category"]) == (room_type, category)]
+            assert group.rooms == len(prices)
+            assert (group.min_price_peak_season, group.max_price_peak_season) == (
+                min(prices), max(prices))
+            assert group.avg_price_peak_season == pytest.approx(statistics.fmean(prices))
+
+
+def test_duplicate_keys_are_rejected(hotels):
+    with pytest.raises(ValueError):
+        HotelCatalog([hotels[0], hotels[0]])
@@ -0,0 +1,32 @@
+"""Hotel keys are unique, up to the last free 4-digit key."""
+
+import os
+import random
+
+import pytest
+from conftest import BOOKINGS_DB_DIR
+from src.generator import hotel_name_location_generator as HNLG
+
+
+@pytest.fixture
+def name_location_gen(monkeypatch):
+    """A new generator, leaving the shared instance of the other tests untouched."""
+    monkeypatch.setattr(HNLG.HotelNameLocationGenerator, "_instance", None)
+    return HNLG.HotelNameLocationGenerator(base_path=os.path.join(BOOKINGS_DB_DIR, "config"))
+
+
+def test_every_hotel_key_is_drawn_once(name_location_gen):
+    random.seed(3)
+    keys = [name_location_gen.generate_hotel_key() for _ in range(HNLG.HOTEL_KEY_COUNT)]
+    assert sorted(keys) == [str(number).zfill(4)
+                            for number in range(1, HNLG.HOTEL_KEY_COUNT + 1)]
+    with pytest.raises(RuntimeError):
+        name_location_gen.generate_hotel_key()
+
+
+def test_first_keys_are_drawn_as_before(name_location_gen):
+    random.seed(3)
+    keys = [name_location_gen.generate_hotel_key() for _ in range(100)]
+    random.seed(3)
+    expected = list(dict.fromkeys(str(random.randint(1, 9999)).zfill(4) for _ in range(200)))
+    assert keys == expected[:100]
@@ -0,0 +1,78 @@
+"""The knowledge index finds the chunks of the files and rebuilds only what changed."""
+
+import pytest
+from util.knowledge_index import KnowledgeIndex, chunk_markdown
+
+ROOMS = """# Hotel Rooms
+
+## Obsidian Tower
+
+| Room | Type | Category |
+|------|------|----------|
+| 01-001 | Single | Standard |
+| 01-002 | Triple | Premium |
+
+## Royal Sovereign
+
+Every room of the Royal Sovereign has a balcony.
+"""
+
+DETAILS = """# Hotel Details
+
+## Grand Victoria
+
+Address: Promenade des Anglais, Nice
+"""
+
+
+@pytest.fixture
+def files(tmp_path):
+    rooms, details = tmp_path / "hotel_rooms.md", tmp_path / "hotel_details.md"
+    rooms.write_text(ROOMS, encoding="utf-8")
+    details.write_text(DETAILS, encoding="utf-8")
+    return rooms, details
+
+
+def test_tables_are_chunked_with_their_header_and_headings():
+    chunks = chunk_markdown(ROOMS)
+    table = next(chunk for chunk in chunks if "01-002" in chunk.text)
+    assert table.heading == "Hotel Rooms > Obsidian Tower"
+    assert table.text.startswith("| Room | Type | Category |")
+
+
+def test_search_finds_the_chunk_of_a_hotel(tmp_path, files):
+    with KnowledgeIndex(str(tmp_path / "index"), [str(file) for file in files]) as index:
+        index.update()
+        results = index.search("balcony at the royal sovereign", k=2)
+        assert results[0].heading == "Hotel Rooms > Royal Sovereign"
+        assert "balcony" in results[0].text
+        assert index.search("promenade")[0].source == str(files[1])
+        assert index.search("unknown words") == []
+
+
+def test_update_rebuilds_the_changed_files_only(tmp_path, files):
+    rooms, details = files
+    index_dir = tmp_path / "index"
+    index_dir.mkdir()
+    # Files of the directory that are not segments are left alone
+    (index_dir / "notes.json").write_text("{}", encoding="utf-8")
+    (index_dir / "hotel-rooms.text").write_text("kept", encoding="utf-8")
+
+    with KnowledgeIndex(str(index_dir), [str(rooms), str(details)]) as index:
+        assert set(index.update().values()) == {"built"}
+        segments = {path.name for path in index_dir.iterdir()}
+        rooms.write_text(ROOMS + "\n## Imperial Crown\n\nA rooftop pool.\n", encoding="utf-8")
+        assert index.update() == {str(rooms.resolve()): "built",
+                                  str(details.resolve()): "reused"}
+        assert index.search("rooftop")[0].heading == "Hotel Rooms > Imperial Crown"
+
+    remaining = {path.name for path in index_dir.iterdir()}
+    assert {"notes.json", "hotel-rooms.text", "manifest.json"} <= remaining
+    old_rooms = {name for name in segments - remaining if name.startswith("hotel_rooms-")}
+    assert len(old_rooms) == 3
+    assert len([name for name in remaining if name.startswith("hotel_rooms-")]) == 3
+
+    with KnowledgeIndex(str(index_dir), [str(details)]) as index:
+        assert index.update() == {str(details.resolve()): "reused",
+                                  str(rooms.resolve()): "removed"}
+    assert not any(path.name.startswith("hotel_rooms-") for path in index_dir.iterdir())
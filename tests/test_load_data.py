@@ -0,0 +1,179 @@
+"""The loader stores the bookings file unchanged, whatever the load mode."""
+
+import csv
+import io
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from conftest import BOOKINGS_FILE, HOTELS_FILE
+from src.db import load_data
+
+DETAIL_COLUMNS = {
+    "hotel_name": "Hotel Name",
+    "room_id": "Room ID",
+    "room_type": "Room Type",
+    "room_category": "Room Category",
+    "check_in_date": "Check-in Date",
+    "check_out_date": "Check-out Date",
+    "total_nights": "Total Nights",
+    "guest_first_name": "Guest First Name",
+    "guest_last_name": "Guest Last Name",
+    "guest_email": "Guest Email",
+    "guest_phone": "Guest Phone",
+    "guest_country": "Guest Country",
+    "guest_city": "Guest City",
+    "guest_address": "Guest Address",
+    "guest_zip_code": "Guest Zip Code",
+    "meal_plan": "Meal Plan",
+    "total_price": "Total Price",
+}
+
+
+def create_database():
+    """Return an in-memory SQLite database with the schema of init.sql."""
+    conn = sqlite3.connect(":memory:")
+    with open(os.path.join(load_data.SQL_DIR, "init.sql"), encoding="utf-8") as file:
+        conn.executescript(file.read())
+    return conn
+
+
+def load(mode, batch_size=load_data.DEFAULT_BATCH_SIZE, conn=None):
+    """Load the committed hotels and bookings files with a load mode."""
+    conn = conn or create_database()
+    load_data.load_hotels(conn, HOTELS_FILE)
+    keys = load_data.BookingKeys(conn)
+    for df in load_data.iter_bookings(BOOKINGS_FILE, batch_size):
+        load_data.load_bookings(conn, df, mode=mode, batch_size=batch_size, keys=keys)
+    conn.commit()
+    return conn
+
+
+def booking_details(conn):
+    """Rows of the booking_details view, sorted (SQLite leaves the SERIAL id NULL)."""
+    rows = conn.execute(f"SELECT {', '.join(DETAIL_COLUMNS)} FROM booking_details")
+    return sorted(rows.fetchall(), key=repr)
+
+
+@pytest.fixture(scope="module")
+def row_load():
+    conn = load("row")
+    yield conn
+    conn.close()
+
+
+def test_booking_details_match_bookings_file(row_load):
+    df = load_data.read_bookings(BOOKINGS_FILE)
+    expected = list(zip(*(
+        [None if value is None else str(value) if source.endswith("Date") else value
+         for value in load_data.column_values(df, source)]
+        for source in DETAIL_COLUMNS.values()
+    ), strict=True))
+    assert booking_details(row_load) == sorted(expected, key=repr)
+
+
+@pytest.mark.parametrize("mode, batch_size", [("batch", 1000), ("copy", 4096)])
+def test_load_modes_store_identical_rows(row_load, mode, batch_size):
+    conn = load(mode, batch_size)
+    try:
+        assert_same_tables(conn, row_load)
+    finally:
+        conn.close()
+
+
+def test_reload_replaces_the_previous_load(row_load):
+    conn = create_database()
+    try:
+        conn.execute("PRAGMA foreign_keys = ON")
+        load("batch", 4096, conn)
+        load("batch", 1000, conn)
+        assert_same_tables(conn, row_load)
+    finally:
+        conn.close()
+
+
+def assert_same_tables(conn, expected):
+    """Check that two loads stored the same guests, bookings and monthly totals."""
+    # The monthly revenue is DECIMAL on PostgreSQL, a float adding up chunks on SQLite
+    for query in ("SELECT * FROM guests ORDER BY guest_id",
+                  "SELECT * FROM bookings ORDER BY rowid",
+                  "SELECT hotel_id, month, bookings, nights, ROUND(revenue, 2) "
+                  "FROM hotel_monthly_bookings ORDER BY hotel_id, month",
+                  "SELECT * FROM hotel_room_summary ORDER BY hotel_id, room_type, room_category"):
+        assert conn.execute(query).fetchall() == expected.execute(query).fetchall()
+
+
+def test_repeated_guests_are_stored_once(row_load, bookings):
+    guests = row_load.execute("SELECT COUNT(*) FROM guests").fetchone()[0]
+    assert guests == len(bookings.drop_duplicates(
+        list(load_data.GUEST_SOURCE_COLUMNS.values())))
+
+
+def test_monthly_totals_leave_out_bookings_without_check_in_date():
+    rows = [(1, 10, 1, date(2025, 3, 14), date(2025, 3, 16), 2, "Room Only", 200.0),
+            (1, 11, 2, date(2025, 3, 1), date(2025, 3, 4), 3, "Room Only", 150.5),
+            (1, 12, 3, None, None, None, "Room Only", 99.0)]
+    assert load_data.monthly_booking_rows(rows) == [(1, date(2025, 3, 1), 2, 5, 350.5)]
+
+
+class CopyConnection:
+    """Connection recording the statement and CSV data of each COPY."""
+
+    def __init__(self):
+        self.copies = []
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    def copy_expert(self, sql, file):
+        self.copies.append((sql, file.read()))
+
+
+def read_copy_csv(data):
+    """Rows of COPY CSV data, the NULL marker read as None (no text value spells it)."""
+    return [[None if value == load_data.COPY_NULL else value for value in row]
+            for row in csv.reader(io.StringIO(data))]
+
+
+def test_copy_escapes_quotes_newlines_and_nulls():
+    conn = CopyConnection()
+    load_data.copy_rows(conn, "guests", ("guest_id", "first_name", "city"), [
+        (1, 'Anne "Annie"', None),
+        (2, "Line\nbreak, comma", ""),
+        (3, load_data.COPY_NULL, "Lyon"),
+    ])
+    assert conn.copies == [(
+        "COPY guests (guest_id, first_name, city) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        '1,"Anne ""Annie""",\\N\r\n'
+        '2,"Line\nbreak, comma",\r\n'
+        '"3","\\N","Lyon"\r\n'
+    )]
+
+
+def test_copy_sends_one_statement_per_batch():
+    conn = CopyConnection()
+    rows = [(number, f"Guest {number}", None) for number in range(5)]
+    load_data.copy_rows(conn, "guests", ("guest_id", "first_name", "city"), rows, batch_size=2)
+    assert [len(read_copy_csv(data)) for _, data in conn.copies] == [2, 2, 1]
+    assert [row for _, data in conn.copies for row in read_copy_csv(data)] == [
+        [str(number), name, city] for number, name, city in rows]
+
+
+def test_copy_data_round_trips_the_booking_rows():
+    conn = create_database()
+    try:
+        load_data.load_hotels(conn, HOTELS_FILE)
+        df = next(load_data.iter_bookings(BOOKINGS_FILE, 2000))
+        guest_rows, rows = load_data.booking_rows(df, load_data.BookingKeys(conn))
+    finally:
+        conn.close()
+    for table, columns, table_rows in (("guests", load_data.GUEST_COLUMNS, guest_rows),
+                                       ("bookings", load_data.BOOKING_COLUMNS, rows)):
+        copy = CopyConnection()
+        load_data.copy_rows(copy, table, columns, table_rows, batch_size=300)
+        assert len(copy.copies) == -(-len(table_rows) // 300)
+        assert [row for _, data in copy.copies for row in read_copy_csv(data)] == [
+            [None if value is None else str(value) for value in row] for row in table_rows]
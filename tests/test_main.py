@@ -0,0 +1,79 @@
+"""Answers standing in for a failed bookings database are not cached."""
+
+import asyncio
+import json
+import sqlite3
+
+import main
+import pytest
+from util.response_cache import ResponseCache
+
+
+class FlakyEngine:
+    """Answer engine whose database fails until it is repaired."""
+
+    started = True
+
+    def __init__(self):
+        self.failing = True
+
+    async def answer(self, query):
+        if self.failing:
+            raise sqlite3.OperationalError("database is locked")
+        return "From the database"
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = FlakyEngine()
+    monkeypatch.setattr(main, "answer_engine", engine)
+    monkeypatch.setattr(main, "response_cache", ResponseCache(max_size=10, ttl_seconds=0))
+    return engine
+
+
+def test_fallback_answer_is_not_cached(engine):
+    fallback = asyncio.run(main.get_response_payload("How many rooms?"))
+    assert "From the database" not in fallback
+    assert len(main.response_cache) == 0
+    engine.failing = False
+    answer = asyncio.run(main.get_response_payload("How many rooms?"))
+    assert "From the database" in answer
+    assert main.response_cache.get("How many rooms?", main.FRAMED_PAYLOAD) == answer
+
+
+def test_engine_not_started_is_not_cached(engine):
+    engine.started = False
+    engine.failing = False
+    answer = asyncio.run(main.answer_query("How many rooms?"))
+    assert answer == main.Answer(main.find_matching_response("How many rooms?"), False)
+
+
+class FakeWebSocket:
+    """WebSocket recording the frames sent."""
+
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, frame):
+        self.frames.append(frame)
+
+
+def test_streamed_fallback_answer_is_not_cached(engine):
+    asyncio.run(main.send_streamed_response(FakeWebSocket(), "How many rooms?"))
+    assert len(main.response_cache) == 0
+    engine.failing = False
+    asyncio.run(main.send_streamed_response(FakeWebSocket(), "How many rooms?"))
+    assert len(main.response_cache) == 1
+
+
+def test_framed_and_streamed_answers_are_cached_apart(engine):
+    engine.failing = False
+    websocket = FakeWebSocket()
+    asyncio.run(main.send_streamed_response(websocket, "How many rooms?"))
+    payload = asyncio.run(main.get_response_payload("How many rooms?"))
+    assert payload.startswith("JSONSTART")
+    assert main.response_cache.get("How many rooms?", main.ANSWER_TEXT) == "From the database"
+    websocket = FakeWebSocket()
+    asyncio.run(main.send_streamed_response(websocket, "How many rooms?"))
+    chunk = json.loads(websocket.frames[0].removeprefix("JSONSTART").removesuffix("JSONEND"))
+    assert chunk["content"] == "From the database"
@@ -0,0 +1,174 @@
+"""The batched Markdown writers keep the output of the former dictionary writer."""
+
+import gzip
+import os
+
+import pyarrow as pa
+import pytest
+from src.generator import booking_generator as BG
+from src.generator.guest_pool import get_guest_pool
+from src.output import BookingMarkdownSink, generate_file_md_hotel_bookings
+from src.output.markdown_writer import (
+    HotelBookingsMarkdown,
+    booking_table_md_rows,
+    hotel_bookings_md_rows,
+    markdown_path,
+    md_hotel_bookings_filename,
+    open_markdown,
+)
+
+MASTER_SEED = 42
+
+
+def reference_md_hotel_bookings(hotel_bookings_list):
+    """The former writer of hotel_bookings.md, one write per row of the dictionaries."""
+    lines = []
+    for hotel_bookings in hotel_bookings_list:
+        lines.append(f"# HOTEL - Name: {hotel_bookings['HotelName']}\n\n")
+        lines.append("## Bookings\n\n")
+        lines.append(
+            "| Country of Guest | City of Guest | Check-In Date | "
+            "Check-Out Date | Room Assigned | Room Category | Room Type | "
+            "Meal Plan | Total Price |\n"
+        )
+        lines.append(
+            "|------------------|---------------|---------------|"
+            "----------------|---------------|---------------|-----------|"
+            "-----------|-------------|\n"
+        )
+        for booking in hotel_bookings["Bookings"]:
+            lines.append(
+                f"| {booking['Guest']['Country']} | {booking['Guest']['City']} | "
+                f"{booking['CheckInDate']} | {booking['CheckOutDate']} | "
+                f"{booking['RoomAssigned']} | {booking['RoomCategory']} | "
+                f"{booking['RoomType']} | {booking['MealPlan']} | "
+                f"{booking['TotalPrice']} |\n"
+            )
+        lines.append("\n---\n\n")
+    return "".join(lines).encode("utf-8")
+
+
+def read_markdown(path, compression=None):
+    """Bytes of a Markdown file, decompressed."""
+    if compression == "gzip":
+        with gzip.open(path, "rb") as file:
+            return file.read()
+    if compression == "zstd":
+        with pa.input_stream(path, compression="zstd") as file:
+            return file.read()
+    with open(path, "rb") as file:
+        return file.read()
+
+
+@pytest.fixture(scope="module")
+def guest_pool(config):
+    return get_guest_pool(config, seed=MASTER_SEED)
+
+
+@pytest.fixture(scope="module")
+def hotel_bookings(hotels, config, booking_calendar, guest_pool):
+    return BG.generate_all_hotel_bookings(hotels[:3], config, booking_calendar,
+                                          master_seed=MASTER_SEED, guest_pool=guest_pool)
+
+
+@pytest.fixture(scope="module")
+def booking_table(hotels, config, booking_calendar, guest_pool):
+    return BG.generate_all_hotel_booking_table(hotels[:3], config, booking_calendar,
+                                               master_seed=MASTER_SEED, guest_pool=guest_pool)
+
+
+@pytest.fixture(scope="module")
+def expected(hotel_bookings):
+    return reference_md_hotel_bookings(hotel_bookings)
+
+
+def test_dictionary_writer_matches_reference(tmp_path, hotel_bookings, expected):
+    generate_file_md_hotel_bookings(hotel_bookings, f"{tmp_path}{os.sep}")
+    assert read_markdown(tmp_path / "hotel_bookings.md") == expected
+
+
+@pytest.mark.parametrize("chunk_size", [None, 997])
+def test_table_writer_matches_reference(tmp_path, booking_table, expected, chunk_size):
+    sink = BookingMarkdownSink(str(tmp_path / "hotel_bookings.md"))
+    chunk_size = chunk_size or len(booking_table)
+    for start in range(0, len(booking_table), chunk_size):
+        sink.write_table(booking_table, start, start + chunk_size)
+    sink.close()
+    assert read_markdown(tmp_path / "hotel_bookings.md") == expected
+
+
+def test_table_rows_match_dictionary_rows(booking_table, hotel_bookings):
+    rows = [row for bookings in hotel_bookings
+            for row in hotel_bookings_md_rows(bookings["Bookings"])]
+    assert booking_table_md_rows(booking_table) == rows
+    assert booking_table_md_rows(booking_table, 10, 20) == rows[10:20]
+    assert booking_table_md_rows(booking_table, 20, 10) == []
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_compressed_files_round_trip(tmp_path, hotel_bookings, expected, compression):
+    if compression == "zstd" and not pa.Codec.is_available("zstd"):
+        pytest.skip("pyarrow was built without the zstd codec")
+    generate_file_md_hotel_bookings(hotel_bookings, f"{tmp_path}{os.sep}", compression)
+    path = markdown_path(str(tmp_path / "hotel_bookings.md"), compression)
+    assert path.endswith({"gzip": ".md.gz", "zstd": ".md.zst"}[compression])
+    assert read_markdown(path, compression) == expected
+
+
+def test_open_markdown_writes_utf8_text(tmp_path):
+    path = str(tmp_path / "notes.md.gz")
+    with open_markdown(path, "gzip") as file:
+        file.write("Hôtel Zürich — 5★\n")
+    assert read_markdown(path, "gzip").decode("utf-8") == "Hôtel Zürich — 5★\n"
+
+
+def test_unsupported_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        markdown_path("hotel_bookings.md", "bz2")
+    with pytest.raises(ValueError):
+        HotelBookingsMarkdown(str(tmp_path / "hotel_bookings.md"), workers=0)
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_split_by_hotel_writes_one_file_per_hotel(tmp_path, hotel_bookings, compression):
+    generate_file_md_hotel_bookings(hotel_bookings, f"{tmp_path}{os.sep}", compression,
+                                    split_by_hotel=True)
+    directory = tmp_path / "hotel_bookings"
+    names = [md_hotel_bookings_filename(bookings["HotelName"], compression)
+             for bookings in hotel_bookings]
+    assert sorted(os.listdir(directory)) == sorted(names)
+    for bookings, name in zip(hotel_bookings, names, strict=True):
+        assert read_markdown(directory / name, compression) == \
+            reference_md_hotel_bookings([bookings])
+
+
+def test_split_by_hotel_rejects_non_consecutive_hotels(tmp_path):
+    with HotelBookingsMarkdown(str(tmp_path), split_by_hotel=True) as writer:
+        writer.write_rows("Hotel A", ["| a |\n"])
+        writer.write_rows("Hotel B", ["| b |\n"])
+        with pytest.raises(ValueError, match="Hotel A"):
+            writer.write_rows("Hotel A", ["| c |\n"])
+    assert writer.paths == [str(tmp_path / md_hotel_bookings_filename(name))
+                            for name in ("Hotel A", "Hotel B")]
+
+
+@pytest.mark.parametrize("compression, split_by_hotel",
+                         [(None, False), ("gzip", False), ("gzip", True)])
+def test_workers_write_the_same_files(tmp_path, booking_table, expected, compression,
+                                      split_by_hotel):
+    contents = []
+    for workers in (1, 3):
+        directory = tmp_path / f"workers_{workers}"
+        directory.mkdir()
+        name = "hotel_bookings" if split_by_hotel else "hotel_bookings.md"
+        output_path = str(directory / name)
+        # Small chunks and buffers queue many writes per file
+        sink = BookingMarkdownSink(output_path, compression, split_by_hotel, workers,
+                                   buffer_size=4096)
+        for start in range(0, len(booking_table), 500):
+            sink.write_table(booking_table, start, start + 500)
+        sink.close()
+        contents.append([(os.path.basename(path), read_markdown(path, compression))
+                         for path in sink.paths])
+    assert contents[0] == contents[1]
+    assert b"".join(content for _, content in contents[0]) == expected
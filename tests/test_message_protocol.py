@@ -0,0 +1,96 @@
+"""Streamed frames reassemble into the complete answer, as static/scripts.js does."""
+
+import asyncio
+import json
+
+import main
+import pytest
+from util.message_protocol import chunk_frame, final_frame, frame_message, split_text_chunks
+from util.response_cache import ResponseCache
+
+
+def parse_frame(frame):
+    """Message of a JSONSTART...JSONEND frame."""
+    assert frame.startswith("JSONSTART") and frame.endswith("JSONEND")
+    return json.loads(frame.removeprefix("JSONSTART").removesuffix("JSONEND"))
+
+
+def test_frame_message_keeps_non_ascii_text():
+    frame = frame_message({"role": "assistant", "content": "Hôtel à Zürich — 5★"})
+    assert parse_frame(frame) == {"role": "assistant", "content": "Hôtel à Zürich — 5★"}
+
+
+@pytest.mark.parametrize("text, words_per_chunk, chunks", [
+    ("one two three four five", 2, ["one two ", "three four ", "five"]),
+    ("  leading and trailing  ", 2, ["  leading and ", "trailing  "]),
+    ("line\nbreaks\tand  tabs", 3, ["line\nbreaks\tand  ", "tabs"]),
+    ("Hôtel Zürich — 5★ 日本の ホテル", 2, ["Hôtel Zürich ", "— 5★ ", "日本の ホテル"]),
+    ("single", 4, ["single"]),
+    ("   ", 4, ["   "]),
+    ("", 4, []),
+])
+def test_split_text_chunks(text, words_per_chunk, chunks):
+    assert list(split_text_chunks(text, words_per_chunk)) == chunks
+    assert "".join(split_text_chunks(text, words_per_chunk)) == text
+
+
+def test_split_text_chunks_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        list(split_text_chunks("some text", 0))
+
+
+def test_chunk_and_final_frames():
+    assert parse_frame(chunk_frame("abc", "Here are ")) == {
+        "type": "chunk", "message_id": "abc", "role": "assistant", "content": "Here are "}
+    assert parse_frame(final_frame("abc", "Here are the hotels", 2)) == {
+        "type": "final", "message_id": "abc", "role": "assistant",
+        "content": "Here are the hotels", "chunks": 2}
+
+
+class TextEngine:
+    """Answer engine answering every query with a fixed text."""
+
+    started = True
+
+    def __init__(self, text):
+        self.text = text
+
+    async def answer(self, query):
+        return self.text
+
+
+class FakeWebSocket:
+    """WebSocket recording the messages of the frames sent."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, frame):
+        self.messages.append(parse_frame(frame))
+
+
+def stream(monkeypatch, text):
+    """Messages of the streamed answer to a query answered with a text."""
+    monkeypatch.setattr(main, "answer_engine", TextEngine(text))
+    monkeypatch.setattr(main, "response_cache", ResponseCache(max_size=10, ttl_seconds=0))
+    monkeypatch.setattr(main.settings, "RESPONSE_STREAM_CHUNK_WORDS", 2)
+    websocket = FakeWebSocket()
+    asyncio.run(main.send_streamed_response(websocket, "Where is the hotel?"))
+    return websocket.messages
+
+
+def test_final_frame_carries_the_reassembled_answer(monkeypatch):
+    text = "L'hôtel Zürich — 5★ est à 日本の ホテル."
+    *chunks, final = stream(monkeypatch, text)
+    assert [chunk["type"] for chunk in chunks] == ["chunk"] * 4
+    assert {message["message_id"] for message in chunks + [final]} == {final["message_id"]}
+    # Concatenated in order, as the client does, the chunks give the final content
+    assert "".join(chunk["content"] for chunk in chunks) == text
+    assert final == {"type": "final", "message_id": final["message_id"],
+                     "role": "assistant", "content": text, "chunks": 4}
+
+
+def test_empty_answer_sends_only_the_final_frame(monkeypatch):
+    messages = stream(monkeypatch, "")
+    assert messages == [{"type": "final", "message_id": messages[0]["message_id"],
+                         "role": "assistant", "content": "", "chunks": 0}]
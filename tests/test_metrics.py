@@ -0,0 +1,34 @@
+"""The metrics are rendered in the Prometheus text exposition format."""
+
+from util.metrics import MetricsRegistry
+
+
+def test_counters_read_from_a_function_are_rendered_as_counters():
+    hits = [0]
+    metrics = MetricsRegistry()
+    metrics.counter("cache_hits_total", "Cache hits", lambda: hits[0])
+    requests = metrics.counter("requests_total", "Requests")
+    hits[0] = 3
+    requests.inc()
+    assert metrics.render() == (
+        "# HELP cache_hits_total Cache hits\n"
+        "# TYPE cache_hits_total counter\n"
+        "cache_hits_total 3\n"
+        "# HELP requests_total Requests\n"
+        "# TYPE requests_total counter\n"
+        "requests_total 1\n"
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = MetricsRegistry()
+    latency = metrics.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 2.0):
+        latency.observe(value)
+    assert metrics.render().splitlines()[2:] == [
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.05",
+        "latency_seconds_count 4",
+    ]
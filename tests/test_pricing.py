@@ -0,0 +1,46 @@
+"""The vectorized booking prices are identical to ``get_total_price`` to the cent."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+from src.generator import parametric_utils as ParUt
+
+BOOKINGS_PER_HOTEL = 2000
+FIRST_DAY = date(2025, 1, 1)
+
+
+def random_bookings(hotel, rng, count):
+    """Random booking dictionaries of a hotel, and the room booked by each of them."""
+    bookings, rooms = [], []
+    for _ in range(count):
+        room = rng.choice(hotel["Rooms"])
+        check_in = FIRST_DAY + timedelta(days=rng.randrange(365))
+        bookings.append({
+            "CheckInDate": check_in.isoformat(),
+            "CheckOutDate": (check_in + timedelta(days=rng.randrange(0, 22))).isoformat(),
+            "NumberOfGuests": rng.randint(1, room["Guests"]),
+            "ExtraBed": rng.choice(("Yes", "No", "N/A")),
+            "MealPlan": rng.choice(list(hotel["SyntheticParams"]["MealPlanPrices"])),
+            "Promotion": rng.choice(("Yes", "No")),
+        })
+        rooms.append(room)
+    return bookings, rooms
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_batch_prices_match_get_total_price(hotels, config, seed):
+    rng = random.Random(seed)
+    peak_season_months = config["peak_season_months"]
+    for hotel in hotels:
+        bookings, rooms = random_bookings(hotel, rng, BOOKINGS_PER_HOTEL)
+        params = hotel["SyntheticParams"]
+        expected = [ParUt.get_total_price(booking, room, peak_season_months, params)
+                    for booking, room in zip(bookings, rooms, strict=True)]
+        prices = ParUt.get_bookings_total_prices(bookings, rooms, peak_season_months, params)
+        assert prices == expected
+
+
+def test_batch_prices_of_no_bookings(hotels, config):
+    params = hotels[0]["SyntheticParams"]
+    assert ParUt.get_bookings_total_prices([], [], config["peak_season_months"], params) == []
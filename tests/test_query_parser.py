@@ -0,0 +1,66 @@
+"""The query parser recognizes the questions and the names of the hotels they are about."""
+
+import pytest
+from util.query_parser import QueryParser
+
+HOTELS = [
+    ("Grand Victoria", "Nice", "France"),
+    ("Royal Sovereign", "Paris", "France"),
+    ("Obsidian Tower", "Cannes", "France"),
+]
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return QueryParser(HOTELS)
+
+
+def test_names_and_filters_are_recognized(parser):
+    intent = parser.parse("Price of a premium double room at the Grand Victoria in peak season "
+                          "with half board")
+    assert intent.kind == "room_prices"
+    assert intent.hotels == ["Grand Victoria"]
+    assert (intent.cities, intent.countries) == ([], [])
+    assert (intent.room_type, intent.room_category) == ("Double", "Premium")
+    assert (intent.season, intent.meal_plan) == ("peak", "Half Board")
+    assert intent.unresolved == []
+
+    intent = parser.parse("How many singles are there in the hotels in Paris and in France?")
+    assert intent.kind == "room_counts"
+    assert (intent.cities, intent.countries) == (["Paris"], ["France"])
+    assert intent.room_type == "Single"
+    assert intent.unresolved == []
+
+
+def test_occupancy_month_and_year(parser):
+    intent = parser.parse("What is the occupancy of Obsidian Tower in March 2025?")
+    assert (intent.kind, intent.hotels, intent.month, intent.year) == (
+        "occupancy", ["Obsidian Tower"], 3, 2025)
+
+
+@pytest.mark.parametrize("query, unresolved", [
+    ("price of a double room standard category in g victoria for peak and off season",
+     ["victoria", "g"]),
+    ("lowest price for a standard sigle room in nice considering no meal plan", ["sigle"]),
+    ("room prices in the hotels in Berlin", ["berlin"]),
+    ("rooms per type for hotels in Sovereign Tower", ["sovereign", "tower"]),
+])
+def test_names_that_match_no_data_are_unresolved(parser, query, unresolved):
+    assert parser.parse(query).unresolved == unresolved
+
+
+@pytest.mark.parametrize("query, season", [
+    ("double room prices in peak season", "peak"),
+    ("double room prices in high season", "peak"),
+    ("double room prices in the off-season", "off"),
+    ("double room prices in low season", "off"),
+    ("double room prices for peak and off season", None),
+    ("double room prices at the peaked roof hotels", None),
+    ("double room prices in the takeoff season", None),
+])
+def test_season_is_matched_on_whole_words(parser, query, season):
+    assert parser.parse(query).season == season
+
+
+def test_other_questions_are_not_recognized(parser):
+    assert parser.parse("What is the weather like in Nice?") is None
@@ -0,0 +1,67 @@
+"""The response cache evicts the least recently used entries and expires old ones."""
+
+import pytest
+from util import response_cache
+from util.response_cache import ResponseCache, normalize_query
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic of the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_normalize_query():
+    assert normalize_query("  List the\tHOTELS  in\nFrance ") == "list the hotels in france"
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResponseCache(max_size=2, ttl_seconds=0)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+    cache.put("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("A ") == "A"
+    assert cache.get("c") == "C"
+    assert len(cache) == 2
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = ResponseCache(max_size=10, ttl_seconds=60)
+    cache.put("query", "payload")
+    clock[0] += 59
+    assert cache.get("query") == "payload"
+    clock[0] += 1
+    assert cache.get("query") is None
+    assert len(cache) == 0
+
+
+def test_stats_count_hits_and_misses():
+    cache = ResponseCache(max_size=10, ttl_seconds=0)
+    assert cache.get("query") is None
+    cache.put("query", "payload")
+    assert cache.get("Query") == "payload"
+    assert cache.get("query") == "payload"
+    assert cache.stats() == {"size": 1, "hits": 2, "misses": 1, "hit_ratio": 2 / 3}
+
+
+def test_size_zero_disables_the_cache():
+    cache = ResponseCache(max_size=0, ttl_seconds=60)
+    cache.put("query", "payload")
+    assert not cache.enabled
+    assert cache.get("query") is None
+    with pytest.raises(ValueError):
+        ResponseCache(max_size=-1, ttl_seconds=60)
+
+
+def test_entries_are_kept_per_kind():
+    cache = ResponseCache(max_size=10, ttl_seconds=0)
+    cache.put("query", "JSONSTART{}JSONEND", "framed")
+    assert cache.get("query", "text") is None
+    cache.put("query", "text", "text")
+    assert cache.get("query", "framed") == "JSONSTART{}JSONEND"
+    assert cache.get("Query", "text") == "text"
+    assert len(cache) == 2
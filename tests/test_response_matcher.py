@@ -0,0 +1,72 @@
+"""The indexed response matcher finds the key a scan of every key finds."""
+
+import random
+
+import pytest
+from util.response_matcher import DEFAULT_MATCH_THRESHOLD, ResponseMatcher
+
+VOCABULARY = ["the", "in", "for", "of", "room", "price", "hotels", "paris", "nice", "season"] + [
+    f"word{i}" for i in range(60)
+]
+
+
+def scan_best_match(responses, query, threshold=DEFAULT_MATCH_THRESHOLD):
+    """Score every key against the query: the best key and its score, first key on ties."""
+    query = query.lower().strip()
+    if query in responses:
+        return query, 1.0
+    query_words = set(query.split())
+    best = None
+    for key in responses:
+        key_words = set(key.split())
+        score = len(key_words & query_words) / len(key_words)
+        if score >= threshold and (best is None or score > best[1]):
+            best = key, score
+    return best
+
+
+def make_responses(rng, size):
+    responses = {}
+    while len(responses) < size:
+        key = " ".join(rng.choices(VOCABULARY, k=rng.randint(1, 8)))
+        responses[key] = f"Response {len(responses)}"
+    return responses
+
+
+def make_query(rng, keys):
+    words = rng.choice(keys).split()
+    kept = rng.sample(words, rng.randint(1, len(words)))
+    return " ".join(kept + rng.choices(VOCABULARY, k=rng.randint(0, 4)))
+
+
+@pytest.mark.parametrize("threshold", [DEFAULT_MATCH_THRESHOLD, 0.5, 1.0])
+def test_best_match_is_the_best_key_of_a_scan(threshold):
+    rng = random.Random(threshold)
+    responses = make_responses(rng, 400)
+    matcher = ResponseMatcher(responses, threshold)
+    keys = list(responses)
+    for _ in range(2000):
+        query = make_query(rng, keys)
+        assert matcher.best_match(query) == scan_best_match(responses, query, threshold)
+
+
+def test_match_is_case_and_space_insensitive():
+    matcher = ResponseMatcher({"List the hotels in France": "hotels"})
+    assert matcher.match("  list THE hotels in france ") == "hotels"
+    assert matcher.best_match("list hotels in france please") == ("list the hotels in france",
+                                                                  0.8)
+    assert matcher.match("hotels in spain") is None
+
+
+def test_add_indexes_new_keys_and_replaces_responses():
+    matcher = ResponseMatcher({"room prices in paris": "paris"})
+    matcher.add("room prices in nice", "nice")
+    matcher.add("Room prices in Paris", "paris, updated")
+    assert len(matcher) == 2
+    assert matcher.match("what are the room prices in nice") == "nice"
+    assert matcher.match("room prices in paris") == "paris, updated"
+
+
+def test_invalid_threshold():
+    with pytest.raises(ValueError):
+        ResponseMatcher({}, threshold=0.0)
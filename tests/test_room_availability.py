@@ -0,0 +1,84 @@
+"""The availability bitmaps answer as a scan of the bookings does."""
+
+import random
+
+import pandas as pd
+import pytest
+from src.generator.room_availability import RoomAvailability
+
+
+@pytest.fixture(scope="module")
+def availability(hotels, bookings, booking_calendar):
+    return RoomAvailability.from_dataframe(hotels, bookings, booking_calendar)
+
+
+@pytest.fixture(scope="module")
+def stays(bookings):
+    return bookings.assign(**{column: pd.to_datetime(bookings[column])
+                              for column in ("Check-in Date", "Check-out Date")})
+
+
+def scan_nights(stays, hotel, start, end):
+    """Booked nights between start and end of the bookings of a hotel staying in that time."""
+    stays = stays[(stays["Hotel Name"] == hotel) & (stays["Check-in Date"] < end)
+                  & (stays["Check-out Date"] > start)]
+    nights = (stays["Check-out Date"].clip(upper=end)
+              - stays["Check-in Date"].clip(lower=start)).dt.days
+    # Bookings checking out the day they check in hold no night
+    return stays.assign(nights=nights)[nights > 0]
+
+
+def periods(booking_calendar, count, seed=0):
+    """Random periods of 1 to 60 nights inside the calendar."""
+    rng = random.Random(seed)
+    first = pd.Timestamp(booking_calendar.start_date)
+    for _ in range(count):
+        start = first + pd.Timedelta(days=rng.randrange(booking_calendar.num_days - 60))
+        yield start, start + pd.Timedelta(days=rng.randint(1, 60))
+
+
+def test_free_rooms_and_occupancy_match_a_scan(availability, hotels, stays, booking_calendar):
+    rng = random.Random(1)
+    for start, end in periods(booking_calendar, 200):
+        hotel = rng.choice(hotels)
+        room_type = rng.choice([None, "Single", "Double", "Triple"])
+        category = rng.choice([None, "Standard", "Premium"])
+        scanned = scan_nights(stays, hotel["Name"], start, end)
+        busy = set(scanned["Room ID"])
+        rooms = [room for room in hotel["Rooms"] if room_type in (None, room["Type"])
+                 and category in (None, room["Category"])]
+        assert availability.free_rooms(hotel["Name"], start.date(), end.date(), room_type,
+                                       category) == [room["RoomId"] for room in rooms
+                                                     if room["RoomId"] not in busy]
+        nights = int(scanned["nights"].sum())
+        assert availability.booked_nights(start.date(), end.date(), hotel["Name"]) == nights
+        assert availability.occupancy(start.date(), end.date(), hotel["hotelkey"]) == \
+            pytest.approx(nights / (len(hotel["Rooms"]) * (end - start).days))
+
+
+def test_monthly_occupancy_matches_a_scan(availability, hotels, stays, booking_calendar):
+    hotel = hotels[0]
+    first = pd.Timestamp(booking_calendar.start_date)
+    last = first + pd.Timedelta(days=booking_calendar.num_days)
+    for month, occupancy in availability.monthly_occupancy(hotel["Name"]).items():
+        start = max(pd.Timestamp(f"{month}-01"), first)
+        end = min(pd.Timestamp(f"{month}-01") + pd.offsets.MonthBegin(1), last)
+        nights = scan_nights(stays, hotel["Name"], start, end)["nights"].sum()
+        assert occupancy == pytest.approx(nights / (len(hotel["Rooms"]) * (end - start).days))
+
+
+def test_book_and_release(hotels, booking_calendar):
+    hotel = hotels[0]
+    room_id = hotel["Rooms"][0]["RoomId"]
+    availability = RoomAvailability(hotels, booking_calendar)
+    availability.book(hotel["Name"], room_id, 10, 13)
+    assert not availability.is_free(hotel["Name"], room_id, 12, 20)
+    assert availability.is_free(hotel["Name"], room_id, 13, 20)
+    assert availability.is_free(hotel["Name"], room_id, 0, 10)
+    with pytest.raises(ValueError):
+        availability.book(hotel["Name"], room_id, 5, 11)
+    assert availability.booked_nights(0, 100, hotel["Name"]) == 3
+    availability.release(hotel["Name"], room_id, 10, 13)
+    assert availability.is_free(hotel["Name"], room_id, 0, 100)
+    with pytest.raises(ValueError):
+        availability.is_free(hotel["Name"], "99-999", 0, 1)
@@ -0,0 +1,27 @@
+"""The command line options of the server override the settings."""
+
+import pytest
+from util.configuration import Settings
+from util.server_config import get_uvicorn_options, parse_server_args
+
+
+def test_options_override_the_settings():
+    settings = Settings(API_PORT=8001, API_WORKERS=2, API_LOOP="asyncio")
+    options = get_uvicorn_options(parse_server_args(
+        settings, ["--port", "9000", "--workers", "4", "--ws-max-size", "1024"]))
+    assert options["port"] == 9000
+    assert options["workers"] == 4
+    assert options["ws_max_size"] == 1024
+    assert options["loop"] == "asyncio"
+    assert parse_server_args(settings, []) == settings
+
+
+def test_reload_can_be_switched_on_and_off():
+    assert parse_server_args(Settings(API_RELOAD=False), ["--reload"]).API_RELOAD
+    assert not parse_server_args(Settings(API_RELOAD=True), ["--no-reload"]).API_RELOAD
+
+
+@pytest.mark.parametrize("args", [["--workers", "0"], ["--loop", "trio"], ["--unknown"]])
+def test_invalid_options_are_refused(args):
+    with pytest.raises(SystemExit):
+        parse_server_args(Settings(), args)
@@ -0,0 +1,82 @@
+"""The linear slot removal of ``adjust_slots_occupancy`` keeps the occupancy statistics."""
+
+import random
+import statistics
+
+import pytest
+from src.generator import booking_generator as BG
+
+SEEDS = range(300)
+
+
+def reference_adjust_slots_occupancy(all_slots, booking_calendar, occupancy_peak,
+                                     occupancy_offseason, rng):
+    """The former quadratic removal (``random.choice`` then ``list.remove``), on day offsets."""
+    adjusted_slots = []
+    for slots in BG.get_slots_by_month(all_slots, booking_calendar).values():
+        month_index = booking_calendar.month_index[slots[0][0]]
+        is_peak = booking_calendar.is_peak_month[month_index]
+        target = occupancy_peak if is_peak else occupancy_offseason
+        target_days = int((target / 100) * booking_calendar.days_in_month[month_index])
+        excess_days = sum(end - start + 1 for start, end in slots) - target_days
+        if excess_days > 0:
+            non_weekend = [slot for slot in slots if not booking_calendar.is_weekend_slot(*slot)]
+            weekend = [slot for slot in slots if booking_calendar.is_weekend_slot(*slot)]
+            while excess_days > 0 and non_weekend:
+                slot = rng.choice(non_weekend)
+                non_weekend.remove(slot)
+                slots.remove(slot)
+                excess_days -= slot[1] - slot[0] + 1
+            if not is_peak and weekend:
+                slots.remove(rng.choice(weekend))
+        adjusted_slots.extend(slots)
+    return adjusted_slots
+
+
+def monthly_days(slots, booking_calendar):
+    """Booked days of each month of the slots."""
+    return {month: sum(end - start + 1 for start, end in month_slots)
+            for month, month_slots in BG.get_slots_by_month(slots, booking_calendar).items()}
+
+
+@pytest.fixture(scope="module")
+def all_slots(booking_calendar):
+    random.seed(7)
+    return [BG.all_date_slots(booking_calendar) for _ in SEEDS]
+
+
+@pytest.mark.parametrize("occupancy_peak, occupancy_offseason", [(83, 40), (60, 25)])
+def test_occupancy_statistics_match_reference(booking_calendar, all_slots,
+                                              occupancy_peak, occupancy_offseason):
+    new_days, reference_days = {}, {}
+    for seed, slots in zip(SEEDS, all_slots, strict=True):
+        adjusted = BG.adjust_slots_occupancy(list(slots), booking_calendar, occupancy_peak,
+                                             occupancy_offseason, rng=random.Random(seed))
+        reference = reference_adjust_slots_occupancy(list(slots), booking_calendar,
+                                                     occupancy_peak, occupancy_offseason,
+                                                     random.Random(seed))
+        # The remaining slots keep their order and are a subset of the input
+        kept = set(adjusted)
+        assert adjusted == [slot for slot in slots if slot in kept]
+        for days, result in ((new_days, adjusted), (reference_days, reference)):
+            for month, booked in monthly_days(result, booking_calendar).items():
+                days.setdefault(month, []).append(booked)
+
+    assert new_days.keys() == reference_days.keys()
+    for month, booked in new_days.items():
+        assert abs(statistics.mean(booked) - statistics.mean(reference_days[month])) < 1.0
+        assert abs(statistics.pstdev(booked) - statistics.pstdev(reference_days[month])) < 1.0
+
+
+def test_months_are_trimmed_to_their_target(booking_calendar, all_slots):
+    for seed, slots in zip(SEEDS, all_slots, strict=True):
+        adjusted = BG.adjust_slots_occupancy(list(slots), booking_calendar, 83, 40,
+                                             rng=random.Random(seed))
+        for month, month_slots in BG.get_slots_by_month(adjusted, booking_calendar).items():
+            month_index = booking_calendar.months.index(month)
+            target = 83 if booking_calendar.is_peak_month[month_index] else 40
+            target_days = int(target / 100 * booking_calendar.days_in_month[month_index])
+            booked = sum(end - start + 1 for start, end in month_slots)
+            # Only weekend slots are left when removing every other slot is not enough
+            assert booked <= target_days or all(
+                booking_calendar.is_weekend_slot(*slot) for slot in month_slots)
@@ -0,0 +1,89 @@
+"""The SQL answer engine answers the hotel questions, and leaves the others to the matcher."""
+
+import asyncio
+import csv
+import os
+import sqlite3
+
+import pytest
+from conftest import BOOKINGS_FILE, HOTELS_FILE, OUTPUT_DIR
+from src.db import load_data
+from util.hotel_catalog import HotelCatalog
+from util.sql_answer_engine import SqlAnswerEngine, create_backend
+
+QUERIES_FILE = os.path.join(OUTPUT_DIR, "hotels", "hotel_room_queries.csv")
+
+
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory):
+    """SQLite copy of the committed hotels and of a chunk of their bookings."""
+    path = tmp_path_factory.mktemp("engine") / "bookings.db"
+    conn = sqlite3.connect(path)
+    with open(os.path.join(load_data.SQL_DIR, "init.sql"), encoding="utf-8") as file:
+        conn.executescript(file.read())
+    load_data.load_hotels(conn, HOTELS_FILE)
+    df = next(load_data.iter_bookings(BOOKINGS_FILE))
+    load_data.load_bookings(conn, df, mode="batch", keys=load_data.BookingKeys(conn))
+    conn.commit()
+    conn.close()
+    return f"sqlite:///{path}"
+
+
+def answer_all(url, queries, catalog=None, uses_catalog=False):
+    """Answers of the engine to the queries."""
+    async def run():
+        engine = SqlAnswerEngine(create_backend(url, 1, 2), catalog)
+        await engine.start()
+        try:
+            assert engine.uses_catalog == uses_catalog
+            return [await engine.answer(query) for query in queries]
+        finally:
+            await engine.close()
+
+    return asyncio.run(run())
+
+
+def room_queries():
+    """The generated room queries, and questions of the other kinds."""
+    with open(QUERIES_FILE, newline="", encoding="utf-8") as file:
+        queries = [row["Query"] for row in csv.DictReader(file)]
+    return queries + [
+        "What are the meal charges for Half Board in the hotels in Paris?",
+        "What is the full address of the hotels in France?",
+        "What is the occupancy of Grand Victoria in March?",
+        "How many rooms are there in the hotels in France?",
+        "Prices of premium rooms in the hotels in Cannes and Paris",
+    ]
+
+
+def test_generated_room_queries_are_answered(database_url):
+    queries = room_queries()
+    answers = answer_all(database_url, queries)
+    assert [query for query, answer in zip(queries, answers, strict=True) if answer is None] == []
+
+
+def test_catalog_of_the_database_gives_the_same_answers(database_url, hotels):
+    queries = room_queries()
+    assert answer_all(database_url, queries, HotelCatalog(hotels), uses_catalog=True) == \
+        answer_all(database_url, queries)
+
+
+def test_catalog_of_other_hotels_is_not_used(database_url, hotels):
+    answer_all(database_url, [], HotelCatalog(hotels[1:]), uses_catalog=False)
+
+
+def test_scoped_answers(database_url):
+    nice, every_hotel = answer_all(database_url, [
+        "What are the prices of a double room in Nice?",
+        "What are the prices of a double room?",
+    ])
+    assert "in the hotels in Nice" in nice and "Grand Victoria" in nice
+    assert "in all hotels" in every_hotel and "Royal Sovereign" in every_hotel
+
+
+def test_questions_naming_no_data_are_not_answered(database_url):
+    assert answer_all(database_url, [
+        "price of a double room standard category in g victoria for peak and off season",
+        "lowest price for a standard sigle room in nice considering no meal plan",
+        "What is the weather like in Nice?",
+    ]) == [None, None, None]